@@ -1,9 +1,11 @@
 import asyncio
-from typing import AsyncGenerator
+from collections.abc import AsyncGenerator
 
 import httpx
 
 from app.config.setting import settings
+from app.core.metrics import LLMStreamMetrics
+from app.core.profiler import RequestProfiler
 
 
 class AIService:
@@ -13,13 +15,17 @@ class AIService:
     生产中请抽象适配器与错误/重试/熔断策略。
     """
 
-    OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+    # 配置 OPENAI_BASE_URL 时使用 OpenAI 兼容接口(私有化部署、基准测试模拟服务等)
+    OPENAI_URL = (
+        f"{(settings.OPENAI_BASE_URL or 'https://api.openai.com/v1').rstrip('/')}/chat/completions"
+    )
 
     async def call_completion(self, body: dict) -> dict:
         """同步调用模型，返回完整响应 JSON"""
         headers = {"Authorization": f"Bearer {settings.OPENAI_API_KEY}"}
         async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(self.OPENAI_URL, json=body, headers=headers)
+            async with RequestProfiler.span("http", f"POST {self.OPENAI_URL}"):
+                resp = await client.post(self.OPENAI_URL, json=body, headers=headers)
             resp.raise_for_status()
             return resp.json()
 
@@ -31,20 +37,30 @@ class AIService:
 
         headers = {"Authorization": f"Bearer {settings.OPENAI_API_KEY}"}
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("POST", self.OPENAI_URL, json=body, headers=headers) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line:
-                        continue
-                    # OpenAI stream 格式通常为 'data: {...}' 或 'data: [DONE]'
-                    if line.startswith("data: "):
-                        payload = line.removeprefix("data: ")
-                        if payload.strip() == "[DONE]":
-                            break
-                        # 解析可能的 JSON，简单转发原始字符串为 MVP
-                        yield payload
-                    else:
-                        yield line
-                    # 防止单一请求阻塞过久，可做心跳
-                    await asyncio.sleep(0)
+        # 模型标签不直接使用客户端传入的值(见 LLMStreamMetrics)
+        metrics = LLMStreamMetrics("openai", str(body.get("model", "")))
+        success = False
+        try:
+            async with httpx.AsyncClient(timeout=None) as client:
+                async with client.stream(
+                    "POST", self.OPENAI_URL, json=body, headers=headers
+                ) as resp:
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if not line:
+                            continue
+                        # OpenAI stream 格式通常为 'data: {...}' 或 'data: [DONE]'
+                        if line.startswith("data: "):
+                            payload = line.removeprefix("data: ")
+                            if payload.strip() == "[DONE]":
+                                break
+                            metrics.on_token()
+                            # 解析可能的 JSON，简单转发原始字符串为 MVP
+                            yield payload
+                        else:
+                            yield line
+                        # 防止单一请求阻塞过久，可做心跳
+                        await asyncio.sleep(0)
+            success = True
+        finally:
+            metrics.finish(success=success)
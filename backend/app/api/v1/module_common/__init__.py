@@ -2,8 +2,10 @@ from fastapi import APIRouter
 
 from .file.controller import FileRouter
 from .health.controller import HealthRouter
+from .task.controller import TaskRouter
 
 common_router = APIRouter(prefix="/common")
 
 common_router.include_router(FileRouter)
 common_router.include_router(HealthRouter)
+common_router.include_router(TaskRouter)
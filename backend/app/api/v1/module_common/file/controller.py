@@ -7,16 +7,22 @@ from fastapi import (
     Body,
     Depends,
     Request,
+    Response,
     UploadFile,
 )
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse
+from redis.asyncio.client import Redis
 
-from app.common.response import ResponseSchema, SuccessResponse, UploadFileResponse
-from app.core.dependencies import AuthPermission
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.response import ResponseSchema, SuccessResponse
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
+from app.utils.download_util import DownloadUtil
+from app.utils.multipart_upload_util import MultipartUploadUtil
 from app.utils.upload_util import UploadUtil
 
+from .schema import MultipartInitSchema
 from .service import FileService
 
 FileRouter = APIRouter(route_class=OperationLogRoute, prefix="/file", tags=["文件管理"])
@@ -55,23 +61,229 @@ async def upload_controller(
     dependencies=[Depends(AuthPermission(["module_common:file:download"]))],
 )
 async def download_controller(
+    request: Request,
     background_tasks: BackgroundTasks,
     file_path: Annotated[str, Body(description="文件路径")],
+    redis: Annotated[Redis, Depends(redis_getter)],
     delete: Annotated[bool, Body(description="是否删除文件")] = False,
-) -> FileResponse:
+) -> Response:
     """
     下载文件
 
     参数:
+    - request (Request): 请求对象
     - background_tasks (BackgroundTasks): 后台任务对象
     - file_path (str): 文件路径
+    - redis (Redis): Redis 客户端实例
     - delete (bool): 是否删除文件
 
     返回:
-    - FileResponse: 包含下载文件的响应
+    - Response: 文件响应（支持 Range 分段与 304 协商缓存）
     """
     result = await FileService.download_service(file_path=file_path)
+    is_object = MultipartUploadUtil.is_object(file_path)
     if delete:
-        background_tasks.add_task(UploadUtil.delete_file, Path(file_path))
+        # 内容寻址存储中的文件可能被多处引用，只释放一次引用
+        if is_object:
+            background_tasks.add_task(MultipartUploadUtil.release_object, redis, file_path)
+        else:
+            background_tasks.add_task(UploadUtil.delete_file, Path(file_path))
     log.info("下载文件成功")
-    return UploadFileResponse(file_path=result.file_path, filename=result.file_name)
+    response = await DownloadUtil.file_response(
+        request=request,
+        file_path=result.file_path,
+        filename=result.file_name,
+        media_type="application/octet-stream",
+        content_hash=Path(file_path).stem if is_object else None,
+    )
+    response.background = background_tasks
+    return response
+
+
+@FileRouter.post(
+    "/multipart/init",
+    summary="初始化分片上传",
+    description="初始化分片上传，提供sha256且内容已存在时直接秒传",
+    response_model=ResponseSchema[dict],
+)
+async def multipart_init_controller(
+    data: MultipartInitSchema,
+    request: Request,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    初始化分片上传
+
+    参数:
+    - data (MultipartInitSchema): 分片上传初始化模型
+    - request (Request): 请求对象
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含上传会话信息的JSON响应
+    """
+    result_dict = await FileService.multipart_init_service(
+        redis=redis,
+        base_url=str(request.base_url),
+        data=data,
+        user_id=auth.user.id if auth.user else None,
+    )
+    log.info(f"初始化分片上传成功 {data.file_name}")
+    return SuccessResponse(data=result_dict, msg="初始化分片上传成功")
+
+
+@FileRouter.get(
+    "/multipart/{upload_id}",
+    summary="查询分片上传进度",
+    description="查询已上传的分片，用于断点续传",
+    response_model=ResponseSchema[dict],
+)
+async def multipart_detail_controller(
+    upload_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    查询分片上传进度
+
+    参数:
+    - upload_id (str): 上传会话ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含已上传分片的JSON响应
+    """
+    result_dict = await FileService.multipart_detail_service(
+        redis=redis, upload_id=upload_id, user_id=auth.user.id if auth.user else None
+    )
+    return SuccessResponse(data=result_dict, msg="查询分片上传进度成功")
+
+
+@FileRouter.put(
+    "/multipart/{upload_id}/{part_no}",
+    summary="上传分片",
+    description="上传单个分片，请求体为分片的原始二进制内容",
+    response_model=ResponseSchema[dict],
+)
+async def multipart_part_controller(
+    request: Request,
+    upload_id: str,
+    part_no: int,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    上传分片
+
+    参数:
+    - request (Request): 请求对象，请求体为分片内容
+    - upload_id (str): 上传会话ID
+    - part_no (int): 分片号
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含分片信息的JSON响应
+    """
+    result_dict = await FileService.multipart_part_service(
+        redis=redis,
+        upload_id=upload_id,
+        part_no=part_no,
+        request=request,
+        user_id=auth.user.id if auth.user else None,
+    )
+    return SuccessResponse(data=result_dict, msg="上传分片成功")
+
+
+@FileRouter.post(
+    "/multipart/{upload_id}/complete",
+    summary="完成分片上传",
+    description="合并分片并按内容去重存储",
+    response_model=ResponseSchema[dict],
+)
+async def multipart_complete_controller(
+    request: Request,
+    upload_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    完成分片上传
+
+    参数:
+    - request (Request): 请求对象
+    - upload_id (str): 上传会话ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含上传文件详情的JSON响应
+    """
+    result_dict = await FileService.multipart_complete_service(
+        redis=redis,
+        base_url=str(request.base_url),
+        upload_id=upload_id,
+        user_id=auth.user.id if auth.user else None,
+    )
+    log.info(f"分片上传完成 {result_dict}")
+    return SuccessResponse(data=result_dict, msg="上传文件成功")
+
+
+@FileRouter.delete(
+    "/multipart/{upload_id}",
+    summary="取消分片上传",
+    description="取消分片上传并清理已上传分片",
+    response_model=ResponseSchema[None],
+)
+async def multipart_abort_controller(
+    upload_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_common:file:upload"]))],
+) -> JSONResponse:
+    """
+    取消分片上传
+
+    参数:
+    - upload_id (str): 上传会话ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 取消结果的JSON响应
+    """
+    await FileService.multipart_abort_service(
+        redis=redis, upload_id=upload_id, user_id=auth.user.id if auth.user else None
+    )
+    log.info(f"取消分片上传 {upload_id}")
+    return SuccessResponse(msg="取消分片上传成功")
+
+
+@FileRouter.get(
+    "/import/{job_id}",
+    summary="查询导入进度",
+    description="查询数据导入任务进度(导入接口传入的 job_id)",
+    response_model=ResponseSchema[dict],
+)
+async def import_progress_controller(
+    job_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission())],
+) -> JSONResponse:
+    """
+    查询导入进度
+
+    参数:
+    - job_id (str): 导入任务ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含导入进度的JSON响应
+    """
+    result_dict = await FileService.import_progress_service(
+        redis=redis, job_id=job_id, user_id=auth.user.id if auth.user else None
+    )
+    return SuccessResponse(data=result_dict, msg="查询导入进度成功")
@@ -61,3 +61,24 @@ class ImportModel(BaseModel):
                         raise ValueError("excel字段名存在重复")
                     seen.add(key)
         return self
+
+
+class MultipartInitSchema(BaseModel):
+    """分片上传初始化模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    file_name: str = Field(..., max_length=255, description="原始文件名")
+    file_size: int = Field(..., gt=0, description="文件大小(字节)")
+    sha256: str | None = Field(
+        default=None,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description="文件SHA-256，当前用户已上传过相同内容时直接秒传",
+    )
+    part_size: int | None = Field(default=None, gt=0, description="分片大小(字节)")
+
+    @model_validator(mode="after")
+    def _validate(self):
+        if ".." in self.file_name or "/" in self.file_name or "\\" in self.file_name:
+            raise ValueError("文件名包含不安全字符")
+        return self
@@ -1,9 +1,16 @@
-from fastapi import UploadFile
+from pathlib import Path
 
+from fastapi import Request, UploadFile
+from redis.asyncio.client import Redis
+
+from app.core.base_import import ImportProgress
 from app.core.base_schema import DownloadFileSchema, UploadResponseSchema
 from app.core.exceptions import CustomException
+from app.utils.multipart_upload_util import MultipartUploadUtil
 from app.utils.upload_util import UploadUtil
 
+from .schema import MultipartInitSchema
+
 
 class FileService:
     """
@@ -60,9 +67,125 @@ class FileService:
             raise CustomException(msg="请选择要下载的文件")
         if not UploadUtil.check_file_exists(file_path):
             raise CustomException(msg="文件不存在")
-        file_name = UploadUtil.download_file(file_path)
-
         return DownloadFileSchema(
             file_path=file_path,
-            file_name=str(file_name),
+            file_name=Path(file_path).name,
+        )
+
+    @classmethod
+    async def multipart_init_service(
+        cls, redis: Redis, base_url: str, data: MultipartInitSchema, user_id: int | None
+    ) -> dict:
+        """
+        初始化分片上传。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - base_url (str): 基础访问 URL。
+        - data (MultipartInitSchema): 分片上传初始化模型。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 上传会话信息，秒传时直接返回文件信息。
+        """
+        return await MultipartUploadUtil.init_upload(
+            redis=redis,
+            file_name=data.file_name,
+            file_size=data.file_size,
+            base_url=base_url,
+            sha256=data.sha256,
+            part_size=data.part_size,
+            user_id=user_id,
         )
+
+    @classmethod
+    async def multipart_detail_service(
+        cls, redis: Redis, upload_id: str, user_id: int | None
+    ) -> dict:
+        """
+        查询分片上传进度。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 上传会话信息及已上传分片号。
+        """
+        return await MultipartUploadUtil.get_upload(
+            redis=redis, upload_id=upload_id, user_id=user_id
+        )
+
+    @classmethod
+    async def multipart_part_service(
+        cls, redis: Redis, upload_id: str, part_no: int, request: Request, user_id: int | None
+    ) -> dict:
+        """
+        上传单个分片。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - part_no (int): 分片号。
+        - request (Request): 请求对象，请求体为分片内容。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 分片信息。
+        """
+        return await MultipartUploadUtil.upload_part(
+            redis=redis, upload_id=upload_id, part_no=part_no, request=request, user_id=user_id
+        )
+
+    @classmethod
+    async def multipart_complete_service(
+        cls, redis: Redis, base_url: str, upload_id: str, user_id: int | None
+    ) -> dict:
+        """
+        完成分片上传。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - base_url (str): 基础访问 URL。
+        - upload_id (str): 上传会话ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 上传文件信息。
+        """
+        return await MultipartUploadUtil.complete_upload(
+            redis=redis, upload_id=upload_id, base_url=base_url, user_id=user_id
+        )
+
+    @classmethod
+    async def multipart_abort_service(
+        cls, redis: Redis, upload_id: str, user_id: int | None
+    ) -> None:
+        """
+        取消分片上传。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - None
+        """
+        await MultipartUploadUtil.abort_upload(redis=redis, upload_id=upload_id, user_id=user_id)
+
+    @classmethod
+    async def import_progress_service(cls, redis: Redis, job_id: str, user_id: int | None) -> dict:
+        """
+        查询数据导入进度。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - job_id (str): 导入任务ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 导入进度。
+        """
+        return await ImportProgress.get(redis=redis, job_id=job_id, user_id=user_id)
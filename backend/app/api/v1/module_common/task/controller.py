@@ -0,0 +1,140 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Path, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.response import ResponseSchema, SuccessResponse
+from app.core.dependencies import AuthPermission, redis_getter
+from app.core.logger import log
+from app.core.router_class import OperationLogRoute
+from app.utils.download_util import DownloadUtil
+
+from .service import TaskService
+
+TaskRouter = APIRouter(route_class=OperationLogRoute, prefix="/task", tags=["后台任务"])
+
+
+@TaskRouter.get(
+    "/{task_id}",
+    summary="查询后台任务",
+    description="查询后台任务状态、进度、结果与产物下载地址",
+    response_model=ResponseSchema[dict],
+)
+async def task_detail_controller(
+    task_id: Annotated[str, Path(description="任务ID")],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission())],
+) -> JSONResponse:
+    """
+    查询后台任务
+
+    参数:
+    - task_id (str): 任务ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskService.detail_service(
+        redis=redis, task_id=task_id, user_id=auth.user.id if auth.user else None
+    )
+    return SuccessResponse(data=result_dict, msg="查询后台任务成功")
+
+
+@TaskRouter.delete(
+    "/{task_id}",
+    summary="取消后台任务",
+    description="取消排队中或执行中的后台任务",
+    response_model=ResponseSchema[dict],
+)
+async def task_cancel_controller(
+    task_id: Annotated[str, Path(description="任务ID")],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission())],
+) -> JSONResponse:
+    """
+    取消后台任务
+
+    参数:
+    - task_id (str): 任务ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskService.cancel_service(
+        redis=redis, task_id=task_id, user_id=auth.user.id if auth.user else None
+    )
+    log.info(f"取消后台任务 {task_id}")
+    return SuccessResponse(data=result_dict, msg="取消后台任务成功")
+
+
+@TaskRouter.get(
+    "/{task_id}/artifact",
+    summary="下载后台任务产物",
+    description="下载本人提交的已完成后台任务的产物文件",
+)
+async def task_artifact_controller(
+    request: Request,
+    task_id: Annotated[str, Path(description="任务ID")],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission())],
+) -> Response:
+    """
+    下载后台任务产物
+
+    参数:
+    - request (Request): 请求对象
+    - task_id (str): 任务ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+
+    返回:
+    - Response: 文件响应（支持 Range 分段与 304 协商缓存）
+    """
+    artifact = await TaskService.artifact_service(
+        redis=redis, task_id=task_id, user_id=auth.user.id if auth.user else None
+    )
+    log.info(f"下载后台任务产物 {task_id}")
+    return await DownloadUtil.file_response(request=request, file_path=str(artifact))
+
+
+@TaskRouter.get(
+    "/{task_id}/events",
+    summary="订阅后台任务进度",
+    description="以 SSE 推送后台任务进度事件，任务结束后关闭连接",
+)
+async def task_events_controller(
+    task_id: Annotated[str, Path(description="任务ID")],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    auth: Annotated[AuthSchema, Depends(AuthPermission())],
+    last_event_id: Annotated[str | None, Header(description="断线重连时的最后事件ID")] = None,
+) -> StreamingResponse:
+    """
+    订阅后台任务进度
+
+    参数:
+    - task_id (str): 任务ID
+    - redis (Redis): Redis 客户端实例
+    - auth (AuthSchema): 认证信息模型
+    - last_event_id (str | None): Last-Event-ID 请求头
+
+    返回:
+    - StreamingResponse: SSE 事件流
+    """
+    user_id = auth.user.id if auth.user else None
+    # 鉴权完成后释放数据库连接，推送期间只占用 Redis
+    await auth.db.close()
+    events = await TaskService.events_service(
+        redis=redis, task_id=task_id, user_id=user_id, last_event_id=last_event_id
+    )
+    return StreamingResponse(
+        events,
+        # text/event-stream 不经过 GZip 压缩(见 GZIP_EXCLUDED_MEDIA_TYPES)，逐条推送
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
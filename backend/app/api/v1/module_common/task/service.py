@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from redis.asyncio.client import Redis
+
+from app.core.task_queue import TaskQueue
+
+
+class TaskService:
+    """
+    后台任务服务层
+    """
+
+    @classmethod
+    async def detail_service(cls, redis: Redis, task_id: str, user_id: int | None) -> dict:
+        """
+        查询任务状态。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 任务状态(含进度、结果与产物下载地址)。
+        """
+        return await TaskQueue.get(redis=redis, task_id=task_id, user_id=user_id)
+
+    @classmethod
+    async def cancel_service(cls, redis: Redis, task_id: str, user_id: int | None) -> dict:
+        """
+        取消任务。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - dict: 任务状态。
+        """
+        return await TaskQueue.cancel(redis=redis, task_id=task_id, user_id=user_id)
+
+    @classmethod
+    async def artifact_service(cls, redis: Redis, task_id: str, user_id: int | None) -> Path:
+        """
+        获取任务产物文件。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - Path: 产物文件路径。
+        """
+        return await TaskQueue.artifact(redis=redis, task_id=task_id, user_id=user_id)
+
+    @classmethod
+    async def events_service(
+        cls, redis: Redis, task_id: str, user_id: int | None, last_event_id: str | None
+    ) -> AsyncIterator[str]:
+        """
+        订阅任务进度事件(SSE)。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID。
+        - last_event_id (str | None): 断线重连时的最后事件ID。
+
+        返回:
+        - AsyncIterator[str]: SSE 消息流。
+        """
+        # 先校验任务归属，不存在时直接返回错误而不是建立长连接
+        await TaskQueue.get(redis=redis, task_id=task_id, user_id=user_id)
+        return TaskQueue.events(redis=redis, task_id=task_id, last_event_id=last_event_id)
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from .cache.controller import CacheRouter
 from .online.controller import OnlineRouter
+from .profile.controller import ProfileRouter
 from .resource.controller import ResourceRouter
 from .server.controller import ServerRouter
 
@@ -9,5 +10,6 @@ monitor_router = APIRouter(prefix="/monitor")
 
 monitor_router.include_router(CacheRouter)
 monitor_router.include_router(OnlineRouter)
+monitor_router.include_router(ProfileRouter)
 monitor_router.include_router(ResourceRouter)
 monitor_router.include_router(ServerRouter)
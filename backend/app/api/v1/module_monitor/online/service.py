@@ -1,11 +1,10 @@
-import json
 
 from redis.asyncio.client import Redis
 
 from app.common.enums import RedisInitKeyConfig
 from app.core.logger import log
 from app.core.redis_crud import RedisCURD
-from app.core.security import decode_access_token
+from app.core.security import TokenCache, decode_token_session
 
 from .schema import OnlineQueryParam
 
@@ -36,8 +35,7 @@ class OnlineService:
             if not token:
                 continue
             try:
-                payload = decode_access_token(token=token)
-                session_info = json.loads(payload.sub)
+                _, session_info = decode_token_session(token=token)
                 if cls._match_search_conditions(session_info, search):
                     online_users.append(session_info)
             except Exception as e:
@@ -63,6 +61,7 @@ class OnlineService:
         # 删除 token
         await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
         await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
+        TokenCache.invalidate_session(session_id)
 
         log.info(f"强制下线用户会话: {session_id}")
         return True
@@ -81,6 +80,7 @@ class OnlineService:
         # 删除 token
         await RedisCURD(redis).clear(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:*")
         await RedisCURD(redis).clear(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:*")
+        TokenCache.clear()
 
         log.info("清除所有在线用户会话成功")
         return True
@@ -0,0 +1,132 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse, Response
+from redis.asyncio.client import Redis
+
+from app.common.request import PaginationService
+from app.common.response import ResponseSchema, StreamResponse, SuccessResponse
+from app.core.base_params import PaginationQueryParam
+from app.core.dependencies import AuthPermission, redis_getter
+from app.core.logger import log
+from app.core.router_class import OperationLogRoute
+from app.utils.common_util import bytes2file_response
+
+from .schema import ProfileDetailSchema, ProfileOutSchema, ProfileQueryParam
+from .service import ProfileService
+
+ProfileRouter = APIRouter(route_class=OperationLogRoute, prefix="/profile", tags=["请求剖析"])
+
+
+@ProfileRouter.get(
+    "/list",
+    dependencies=[Depends(AuthPermission(["module_monitor:profile:query"]))],
+    summary="获取请求剖析记录列表",
+    description="获取请求剖析记录列表",
+    response_model=ResponseSchema[list[ProfileOutSchema]],
+)
+async def get_profile_list_controller(
+    redis: Annotated[Redis, Depends(redis_getter)],
+    paging_query: Annotated[PaginationQueryParam, Depends()],
+    search: Annotated[ProfileQueryParam, Depends()],
+) -> JSONResponse:
+    """
+    获取请求剖析记录列表
+
+    参数:
+    - redis (Redis): Redis异步客户端实例。
+    - paging_query (PaginationQueryParam): 分页查询参数模型。
+    - search (ProfileQueryParam): 查询参数模型。
+
+    返回:
+    - JSONResponse: 包含剖析记录列表的JSON响应。
+    """
+    result_dict_list = await ProfileService.get_profile_list_service(redis=redis, search=search)
+    result_dict = await PaginationService.paginate(
+        data_list=result_dict_list,
+        page_no=paging_query.page_no,
+        page_size=paging_query.page_size,
+    )
+    log.info("获取请求剖析记录列表成功")
+    return SuccessResponse(data=result_dict, msg="获取请求剖析记录列表成功")
+
+
+@ProfileRouter.get(
+    "/detail/{profile_id}",
+    dependencies=[Depends(AuthPermission(["module_monitor:profile:query"]))],
+    summary="获取请求剖析详情",
+    description="获取请求剖析详情(含DB/Redis/HTTP耗时时间线)",
+    response_model=ResponseSchema[ProfileDetailSchema],
+)
+async def get_profile_detail_controller(
+    profile_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    获取请求剖析详情
+
+    参数:
+    - profile_id (str): 剖析编号。
+    - redis (Redis): Redis异步客户端实例。
+
+    返回:
+    - JSONResponse: 包含剖析详情的JSON响应。
+    """
+    result_dict = await ProfileService.get_profile_detail_service(
+        redis=redis, profile_id=profile_id
+    )
+    log.info(f"获取请求剖析详情成功: {profile_id}")
+    return SuccessResponse(data=result_dict, msg="获取请求剖析详情成功")
+
+
+@ProfileRouter.get(
+    "/flamegraph/{profile_id}",
+    dependencies=[Depends(AuthPermission(["module_monitor:profile:download"]))],
+    summary="下载火焰图",
+    description="下载火焰图",
+)
+async def download_profile_flamegraph_controller(
+    profile_id: str,
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> Response:
+    """
+    下载请求剖析火焰图
+
+    参数:
+    - profile_id (str): 剖析编号。
+    - redis (Redis): Redis异步客户端实例。
+
+    返回:
+    - Response: 火焰图 HTML 文件流响应。
+    """
+    content = await ProfileService.get_flamegraph_service(redis=redis, profile_id=profile_id)
+    log.info(f"下载火焰图成功: {profile_id}")
+    return StreamResponse(
+        data=bytes2file_response(content),
+        media_type="text/html",
+        headers={"Content-Disposition": f"attachment; filename=profile_{profile_id}.html"},
+    )
+
+
+@ProfileRouter.delete(
+    "/clear",
+    dependencies=[Depends(AuthPermission(["module_monitor:profile:delete"]))],
+    summary="清空请求剖析记录",
+    description="清空请求剖析记录",
+    response_model=ResponseSchema[None],
+)
+async def clear_profile_controller(
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    清空请求剖析记录
+
+    参数:
+    - redis (Redis): Redis异步客户端实例。
+
+    返回:
+    - JSONResponse: 包含操作结果的JSON响应。
+    """
+    await ProfileService.clear_profile_service(redis=redis)
+    log.info("清空请求剖析记录成功")
+    return SuccessResponse(msg="清空请求剖析记录成功")
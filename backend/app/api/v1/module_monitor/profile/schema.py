@@ -0,0 +1,53 @@
+from fastapi import Query
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ProfileSpanSchema(BaseModel):
+    """请求剖析耗时片段模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    kind: str = Field(..., description="类型 db | redis | http")
+    name: str = Field(..., description="名称(SQL语句、Redis命令、请求地址)")
+    start_ms: float = Field(..., description="相对请求开始的时间(毫秒)")
+    duration_ms: float = Field(..., description="耗时(毫秒)")
+
+
+class ProfileOutSchema(BaseModel):
+    """请求剖析记录模型"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str = Field(..., description="剖析编号")
+    method: str = Field(..., description="请求方法")
+    path: str = Field(..., description="请求路径")
+    route: str | None = Field(default=None, description="路由模板")
+    status_code: int = Field(..., description="响应状态码")
+    trigger: str = Field(..., description="触发方式 header | sample")
+    duration_ms: float = Field(..., description="处理耗时(毫秒)")
+    totals_ms: dict[str, float] = Field(
+        default_factory=dict, description="各类型等待耗时合计(毫秒)"
+    )
+    span_count: int = Field(default=0, description="耗时片段数")
+    has_flamegraph: bool = Field(default=False, description="是否有火焰图")
+    created_time: str = Field(..., description="记录时间")
+
+
+class ProfileDetailSchema(ProfileOutSchema):
+    """请求剖析详情模型"""
+
+    spans: list[ProfileSpanSchema] = Field(default_factory=list, description="耗时时间线")
+
+
+class ProfileQueryParam:
+    """请求剖析查询参数"""
+
+    def __init__(
+        self,
+        path: str | None = Query(None, description="请求路径"),
+        method: str | None = Query(None, description="请求方法"),
+        min_duration: float | None = Query(None, description="最小耗时(毫秒)"),
+    ) -> None:
+        self.path = path
+        self.method = method.upper() if method else None
+        self.min_duration = min_duration
@@ -0,0 +1,103 @@
+import json
+
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+from .schema import ProfileDetailSchema, ProfileOutSchema, ProfileQueryParam
+
+
+class ProfileService:
+    """请求剖析监控模块服务层"""
+
+    @classmethod
+    async def _get_records(cls, redis: Redis) -> list[dict]:
+        """读取环形列表中的全部剖析记录(按时间倒序)"""
+        records = []
+        for item in await redis.lrange(RedisInitKeyConfig.REQUEST_PROFILE.key, 0, -1):
+            try:
+                records.append(json.loads(item))
+            except (TypeError, ValueError) as e:
+                log.error(f"解析请求剖析记录失败: {e}")
+        return records
+
+    @classmethod
+    async def get_profile_list_service(
+        cls, redis: Redis, search: ProfileQueryParam | None = None
+    ) -> list[dict]:
+        """
+        获取请求剖析记录列表(不含耗时时间线)。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - search (ProfileQueryParam | None): 查询参数模型。
+
+        返回:
+        - list[dict]: 剖析记录字典列表。
+        """
+        result = []
+        for record in await cls._get_records(redis):
+            if search:
+                if search.path and search.path not in record.get("path", ""):
+                    continue
+                if search.method and search.method != record.get("method"):
+                    continue
+                if search.min_duration and record.get("duration_ms", 0) < search.min_duration:
+                    continue
+            result.append(ProfileOutSchema.model_validate(record).model_dump())
+        return result
+
+    @classmethod
+    async def get_profile_detail_service(cls, redis: Redis, profile_id: str) -> dict:
+        """
+        获取请求剖析详情(含耗时时间线)。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - profile_id (str): 剖析编号。
+
+        返回:
+        - dict: 剖析详情字典。
+        """
+        for record in await cls._get_records(redis):
+            if record.get("id") == profile_id:
+                return ProfileDetailSchema.model_validate(record).model_dump()
+        raise CustomException(msg="剖析记录不存在或已过期")
+
+    @classmethod
+    async def get_flamegraph_service(cls, redis: Redis, profile_id: str) -> bytes:
+        """
+        获取请求剖析火焰图。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+        - profile_id (str): 剖析编号。
+
+        返回:
+        - bytes: 火焰图 HTML 内容。
+        """
+        html = await redis.get(f"{RedisInitKeyConfig.REQUEST_PROFILE.key}:{profile_id}")
+        if not html:
+            raise CustomException(msg="火焰图不存在或已过期")
+        return html.encode("utf-8") if isinstance(html, str) else html
+
+    @classmethod
+    async def clear_profile_service(cls, redis: Redis) -> bool:
+        """
+        清空请求剖析记录与火焰图。
+
+        参数:
+        - redis (Redis): Redis异步客户端实例。
+
+        返回:
+        - bool: 是否清除成功。
+        """
+        key = RedisInitKeyConfig.REQUEST_PROFILE.key
+        keys = [key]
+        async for flamegraph_key in redis.scan_iter(match=f"{key}:*", count=500):
+            keys.append(flamegraph_key)
+        await redis.delete(*keys)
+        log.info(f"清空请求剖析记录 {len(keys) - 1} 条火焰图")
+        return True
@@ -1,15 +1,15 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Form, Query, Request, UploadFile
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi import APIRouter, Body, Depends, Form, Query, Request, Response, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.common.request import PaginationService
-from app.common.response import ResponseSchema, StreamResponse, SuccessResponse, UploadFileResponse
+from app.common.response import ResponseSchema, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.dependencies import AuthPermission
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
+from app.utils.download_util import DownloadUtil
 
 from .schema import (
     ResourceCopySchema,
@@ -46,15 +46,12 @@ async def get_directory_list_controller(
     返回:
     - JSONResponse: 包含目录列表的JSON响应。
     """
-    # 获取资源列表（与案例模块保持一致的分页实现）
-    result_dict_list = await ResourceService.get_resources_list_service(
-        search=search, base_url=str(request.base_url)
-    )
-    # 使用分页服务进行分页处理（与案例模块保持一致）
-    result_dict = await PaginationService.paginate(
-        data_list=result_dict_list,
+    # 在目录索引上完成过滤、排序和分页，仅为当前页生成资源详情
+    result_dict = await ResourceService.page_resources_service(
         page_no=page.page_no,
         page_size=page.page_size,
+        search=search,
+        base_url=str(request.base_url),
     )
 
     log.info(f"获取目录列表成功: {getattr(search, 'name', None) or ''}")
@@ -99,7 +96,7 @@ async def upload_file_controller(
 )
 async def download_file_controller(
     request: Request, path: Annotated[str, Query(description="文件路径")]
-) -> FileResponse:
+) -> Response:
     """
     下载文件
 
@@ -108,7 +105,7 @@ async def download_file_controller(
     - path (str): 文件路径。
 
     返回:
-    - FileResponse: 包含文件内容的文件响应。
+    - Response: 文件响应（支持 Range 分段与 304 协商缓存）。
     """
     file_path = await ResourceService.download_file_service(
         file_path=path, base_url=str(request.base_url)
@@ -120,7 +117,9 @@ async def download_file_controller(
     filename = os.path.basename(file_path)
 
     log.info(f"下载文件成功: {filename}")
-    return UploadFileResponse(
+    # 支持 Range 断点续传、多段下载和 If-None-Match 协商缓存
+    return await DownloadUtil.file_response(
+        request=request,
         file_path=file_path,
         filename=filename,
         media_type="application/octet-stream",
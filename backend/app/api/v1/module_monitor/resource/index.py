@@ -0,0 +1,221 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.config.setting import settings
+from app.core.logger import log
+
+
+class ResourceIndex:
+    """
+    资源目录元数据索引
+
+    基于 os.scandir 在线程池中扫描目录（一次系统调用拿到类型，stat 结果由 DirEntry 缓存），
+    按目录缓存扫描结果并用目录 mtime 校验是否过期，LRU 限制缓存目录数。
+    同一目录的并发扫描只执行一次；目录统计（递归）同样在线程池中计算并缓存。
+    开启 RESOURCE_INDEX_WATCH 且安装了 watchfiles 时，通过 inotify 监听变更主动失效。
+    """
+
+    _dirs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    _stats: dict[tuple[str, bool], tuple[float, dict[str, int]]] = {}
+    _pending: dict[str, asyncio.Future] = {}
+    _watch_task: asyncio.Task | None = None
+    _watch_stop: asyncio.Event | None = None
+
+    @staticmethod
+    def _scan(path: str) -> tuple[int, list[dict[str, Any]]]:
+        """
+        扫描单个目录（同步，在线程池中执行）
+
+        参数:
+        - path (str): 目录绝对路径。
+
+        返回:
+        - tuple[int, list[dict[str, Any]]]: (扫描前的目录 mtime_ns, 目录项列表)
+        """
+        # 先取 mtime 再扫描：扫描期间发生的变更会让下一次校验失败而重新扫描
+        mtime_ns = os.stat(path).st_mtime_ns
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                    stat = entry.stat()
+                except OSError:
+                    # 扫描过程中被删除或无效的软链接
+                    continue
+                entries.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "is_dir": is_dir,
+                    "is_file": is_file,
+                    "size": stat.st_size if is_file else None,
+                    "created_time": stat.st_ctime,
+                    "modified_time": stat.st_mtime,
+                })
+        return mtime_ns, entries
+
+    @staticmethod
+    def _walk_stats(path: str, include_hidden: bool) -> dict[str, int]:
+        """递归统计目录下的文件数、目录数和总大小（同步，在线程池中执行）"""
+        stats = {"files": 0, "dirs": 0, "size": 0}
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if not include_hidden and entry.name.startswith("."):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stats["dirs"] += 1
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                stats["files"] += 1
+                                stats["size"] += entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return stats
+
+    @classmethod
+    async def list_dir(cls, path: str) -> list[dict[str, Any]]:
+        """
+        获取目录项列表（命中缓存且目录未变更时不扫描磁盘）
+
+        参数:
+        - path (str): 目录绝对路径。
+
+        返回:
+        - list[dict[str, Any]]: 目录项列表（调用方不可修改）。
+        """
+        path = os.path.normpath(path)
+        mtime_ns = (await asyncio.to_thread(os.stat, path)).st_mtime_ns
+        cached = cls._dirs.get(path)
+        if (
+            cached
+            and cached["mtime_ns"] == mtime_ns
+            and time.monotonic() - cached["scanned_at"] < settings.RESOURCE_INDEX_TTL
+        ):
+            cls._dirs.move_to_end(path)
+            return cached["entries"]
+
+        future = cls._pending.get(path)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(cls._scan, path))
+            cls._pending[path] = future
+            future.add_done_callback(lambda _: cls._pending.pop(path, None))
+        scanned_mtime_ns, entries = await asyncio.shield(future)
+
+        cls._dirs[path] = {
+            "mtime_ns": scanned_mtime_ns,
+            "scanned_at": time.monotonic(),
+            "entries": entries,
+        }
+        cls._dirs.move_to_end(path)
+        while len(cls._dirs) > settings.RESOURCE_INDEX_MAX_DIRS:
+            cls._dirs.popitem(last=False)
+        return entries
+
+    @classmethod
+    async def dir_stats(cls, path: str, include_hidden: bool = False) -> dict[str, int]:
+        """
+        获取目录递归统计信息（缓存 RESOURCE_INDEX_TTL 秒，变更时主动失效）
+
+        参数:
+        - path (str): 目录绝对路径。
+        - include_hidden (bool): 是否包含隐藏文件。
+
+        返回:
+        - dict[str, int]: 包含文件数、目录数和总大小的字典。
+        """
+        key = (os.path.normpath(path), include_hidden)
+        cached = cls._stats.get(key)
+        if cached and time.monotonic() - cached[0] < settings.RESOURCE_INDEX_TTL:
+            return cached[1]
+        stats = await asyncio.to_thread(cls._walk_stats, key[0], include_hidden)
+        cls._stats[key] = (time.monotonic(), stats)
+        return stats
+
+    @classmethod
+    def invalidate(cls, *paths: str) -> None:
+        """
+        失效路径相关的索引：路径本身、其父目录以及包含它的目录统计。
+
+        参数:
+        - paths (str): 发生变更的文件或目录路径。
+
+        返回:
+        - None
+        """
+        for path in paths:
+            path = os.path.normpath(path)
+            cls._dirs.pop(path, None)
+            cls._dirs.pop(os.path.dirname(path), None)
+            prefix = path + os.sep
+            # 目录被删除/移动时，其子目录的缓存一并失效
+            for cached_path in [p for p in cls._dirs if p.startswith(prefix)]:
+                cls._dirs.pop(cached_path, None)
+            for key in [
+                k
+                for k in cls._stats
+                if path == k[0] or path.startswith(k[0] + os.sep) or k[0].startswith(prefix)
+            ]:
+                cls._stats.pop(key, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空全部索引"""
+        cls._dirs.clear()
+        cls._stats.clear()
+
+    @classmethod
+    def start_watch(cls, root: str) -> None:
+        """
+        启动文件变更监听（需开启 RESOURCE_INDEX_WATCH 并安装 watchfiles）。
+
+        参数:
+        - root (str): 监听的根目录。
+
+        返回:
+        - None
+        """
+        if not settings.RESOURCE_INDEX_WATCH or (cls._watch_task and not cls._watch_task.done()):
+            return
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            log.warning("未安装 watchfiles，资源目录索引仅使用 mtime 校验")
+            return
+        cls._watch_stop = asyncio.Event()
+        cls._watch_task = asyncio.create_task(cls._watch(awatch, root))
+
+    @classmethod
+    async def _watch(cls, awatch: Any, root: str) -> None:
+        """监听循环：收到变更后失效对应目录"""
+        try:
+            async for changes in awatch(root, stop_event=cls._watch_stop, recursive=True):
+                cls.invalidate(*(changed_path for _, changed_path in changes))
+        except Exception as e:
+            # 监听失败时退回 mtime 校验，不影响正常访问
+            log.error(f"资源目录监听异常: {e!s}")
+
+    @classmethod
+    async def stop_watch(cls) -> None:
+        """
+        停止文件变更监听。
+
+        返回:
+        - None
+        """
+        if cls._watch_stop:
+            cls._watch_stop.set()
+        if cls._watch_task:
+            await asyncio.gather(cls._watch_task, return_exceptions=True)
+        cls._watch_task = None
+        cls._watch_stop = None
@@ -1,3 +1,4 @@
+import ast
 import os
 import shutil
 from datetime import datetime
@@ -7,11 +8,13 @@ from urllib.parse import urlparse
 
 from fastapi import UploadFile
 
+from app.common.request import PaginationService
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.utils.excel_util import ExcelUtil
 
+from .index import ResourceIndex
 from .schema import (
     ResourceCopySchema,
     ResourceCreateDirSchema,
@@ -222,6 +225,57 @@ class ResourceService:
             log.error(f"获取文件信息失败: {e!s}")
             return {}
 
+    @classmethod
+    def _build_item(cls, entry: dict[str, Any], base_url: str | None = None) -> dict:
+        """
+        由索引中的目录项构建资源详情字典（字段与 _get_file_info 一致，不再访问磁盘）。
+
+        参数:
+        - entry (dict[str, Any]): 目录索引项。
+        - base_url (str | None): 基础URL，用于生成完整URL。
+
+        返回:
+        - dict: 文件或目录的详细信息字典。
+        """
+        try:
+            relative_path = os.path.relpath(entry["path"], cls._get_resource_root())
+        except ValueError:
+            relative_path = entry["name"]
+
+        return {
+            "name": entry["name"],
+            "file_url": cls._generate_http_url(entry["path"], base_url),
+            "relative_path": relative_path,
+            "is_file": entry["is_file"],
+            "is_dir": entry["is_dir"],
+            "size": entry["size"],
+            "created_time": datetime.fromtimestamp(entry["created_time"]).isoformat(),
+            "modified_time": datetime.fromtimestamp(entry["modified_time"]).isoformat(),
+            "is_hidden": entry["name"].startswith("."),
+        }
+
+    @classmethod
+    async def _list_entries(cls, path: str) -> list[dict[str, Any]]:
+        """
+        从目录索引获取目录项
+
+        参数:
+        - path (str): 目录绝对路径。
+
+        返回:
+        - list[dict[str, Any]]: 目录索引项列表。
+        """
+        if not os.path.exists(path):
+            raise CustomException(msg="目录不存在")
+
+        if not os.path.isdir(path):
+            raise CustomException(msg="路径不是目录")
+
+        try:
+            return await ResourceIndex.list_dir(path)
+        except PermissionError:
+            raise CustomException(msg="没有权限访问此目录")
+
     @classmethod
     async def get_directory_list_service(
         cls,
@@ -242,44 +296,28 @@ class ResourceService:
         """
         try:
             # 如果没有指定路径，使用静态文件根目录
-            if path is None:
-                safe_path = cls._get_resource_root()
-                display_path = cls._generate_http_url(safe_path, base_url)
-            else:
-                safe_path = cls._get_safe_path(path)
-                display_path = cls._generate_http_url(safe_path, base_url)
+            safe_path = cls._get_resource_root() if path is None else cls._get_safe_path(path)
+            display_path = cls._generate_http_url(safe_path, base_url)
 
-            if not os.path.exists(safe_path):
-                raise CustomException(msg="目录不存在")
-
-            if not os.path.isdir(safe_path):
-                raise CustomException(msg="路径不是目录")
+            entries = await cls._list_entries(safe_path)
 
             items = []
             total_files = 0
             total_dirs = 0
             total_size = 0
 
-            try:
-                for item_name in os.listdir(safe_path):
-                    # 跳过隐藏文件
-                    if not include_hidden and item_name.startswith("."):
-                        continue
-
-                    item_path = os.path.join(safe_path, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
-
-                    if file_info:
-                        items.append(ResourceItemSchema(**file_info))
+            for entry in entries:
+                # 跳过隐藏文件
+                if not include_hidden and entry["name"].startswith("."):
+                    continue
 
-                        if file_info["is_file"]:
-                            total_files += 1
-                            total_size += file_info.get("size", 0) or 0
-                        elif file_info["is_dir"]:
-                            total_dirs += 1
+                items.append(ResourceItemSchema(**cls._build_item(entry, base_url)))
 
-            except PermissionError:
-                raise CustomException(msg="没有权限访问此目录")
+                if entry["is_file"]:
+                    total_files += 1
+                    total_size += entry["size"] or 0
+                elif entry["is_dir"]:
+                    total_dirs += 1
 
             return ResourceDirectorySchema(
                 path=display_path,  # 返回HTTP URL路径而不是文件系统路径
@@ -297,78 +335,116 @@ class ResourceService:
             raise CustomException(msg=f"获取目录列表失败: {e!s}")
 
     @classmethod
-    async def get_resources_list_service(
+    async def _search_entries(
         cls,
         search: ResourceSearchQueryParam | None = None,
         order_by: str | None = None,
-        base_url: str | None = None,
-    ) -> list[dict]:
+    ) -> list[dict[str, Any]]:
         """
-        搜索资源列表（用于分页和导出）
+        在目录索引上执行过滤和排序
 
         参数:
         - search (ResourceSearchQueryParam | None): 查询参数模型。
         - order_by (str | None): 排序参数。
-        - base_url (str | None): 基础URL，用于生成完整URL。
 
         返回:
-        - list[dict]: 资源详情字典列表。
+        - list[dict[str, Any]]: 排序后的目录索引项列表。
         """
-        try:
-            # 确定搜索路径
-            resource_root = (
-                cls._get_safe_path(search.path)
-                if search and hasattr(search, "path") and search.path
-                else cls._get_resource_root()
-            )
+        # 确定搜索路径
+        resource_root = (
+            cls._get_safe_path(search.path)
+            if search and hasattr(search, "path") and search.path
+            else cls._get_resource_root()
+        )
 
-            # 检查路径是否存在
-            if not os.path.exists(resource_root):
-                raise CustomException(msg="目录不存在")
+        entries = await cls._list_entries(resource_root)
 
-            if not os.path.isdir(resource_root):
-                raise CustomException(msg="路径不是目录")
+        # 应用名称过滤，跳过隐藏文件
+        search_keyword = (
+            search.name[1].lower()
+            if search and hasattr(search, "name") and search.name and search.name[1]
+            else None
+        )
+        matched = [
+            entry
+            for entry in entries
+            if not entry["name"].startswith(".")
+            and (not search_keyword or search_keyword in entry["name"].lower())
+        ]
 
-            # 收集资源
-            all_resources = []
+        # 应用排序
+        sorted_entries = cls._sort_results(matched, order_by)
 
-            try:
-                for item_name in os.listdir(resource_root):
-                    # 跳过隐藏文件
-                    if item_name.startswith("."):
-                        continue
+        if not sorted_entries:
+            raise CustomException(msg="没有符合条件的资源")
 
-                    item_path = os.path.join(resource_root, item_name)
-                    file_info = cls._get_file_info(item_path, base_url)
+        return sorted_entries
 
-                    if file_info:
-                        # 应用名称过滤
-                        if search and hasattr(search, "name") and search.name and search.name[1]:
-                            search_keyword = search.name[1].lower()
-                            if search_keyword not in file_info.get("name", "").lower():
-                                continue
+    @classmethod
+    async def get_resources_list_service(
+        cls,
+        search: ResourceSearchQueryParam | None = None,
+        order_by: str | None = None,
+        base_url: str | None = None,
+    ) -> list[dict]:
+        """
+        搜索资源列表（用于导出）
 
-                        all_resources.append(file_info)
+        参数:
+        - search (ResourceSearchQueryParam | None): 查询参数模型。
+        - order_by (str | None): 排序参数。
+        - base_url (str | None): 基础URL，用于生成完整URL。
 
-            except PermissionError:
-                raise CustomException(msg="没有权限访问此目录")
+        返回:
+        - list[dict]: 资源详情字典列表。
+        """
+        try:
+            sorted_entries = await cls._search_entries(search=search, order_by=order_by)
 
-            # 应用排序
-            sorted_resources = cls._sort_results(all_resources, order_by)
+            # 限制最大结果数
+            return [
+                cls._build_item(entry, base_url)
+                for entry in sorted_entries[: cls.MAX_SEARCH_RESULTS]
+            ]
 
-            if not sorted_resources:
-                raise CustomException(msg="没有符合条件的资源")
+        except Exception as e:
+            log.error(f"搜索资源失败: {e!s}")
+            raise CustomException(msg=f"搜索资源失败: {e!s}")
 
-            # 限制最大结果数
-            if len(sorted_resources) > cls.MAX_SEARCH_RESULTS:
-                sorted_resources = sorted_resources[: cls.MAX_SEARCH_RESULTS]
+    @classmethod
+    async def page_resources_service(
+        cls,
+        page_no: int,
+        page_size: int,
+        search: ResourceSearchQueryParam | None = None,
+        order_by: str | None = None,
+        base_url: str | None = None,
+    ) -> dict:
+        """
+        分页搜索资源列表，只为当前页生成资源详情。
 
-            return sorted_resources
+        参数:
+        - page_no (int): 页码。
+        - page_size (int): 每页数量。
+        - search (ResourceSearchQueryParam | None): 查询参数模型。
+        - order_by (str | None): 排序参数。
+        - base_url (str | None): 基础URL，用于生成完整URL。
 
+        返回:
+        - dict: 分页数据对象。
+        """
+        try:
+            sorted_entries = await cls._search_entries(search=search, order_by=order_by)
         except Exception as e:
             log.error(f"搜索资源失败: {e!s}")
             raise CustomException(msg=f"搜索资源失败: {e!s}")
 
+        result = await PaginationService.paginate(
+            data_list=sorted_entries, page_no=page_no, page_size=page_size
+        )
+        result["items"] = [cls._build_item(entry, base_url) for entry in result["items"]]
+        return result
+
     @classmethod
     async def export_resource_service(cls, data_list: list[dict]) -> bytes:
         """
@@ -411,29 +487,10 @@ class ResourceService:
         返回:
         - dict[str, int]: 包含文件数、目录数和总大小的字典。
         """
-        stats = {"files": 0, "dirs": 0, "size": 0}
-
         try:
-            for root, dirs, files in os.walk(path):
-                # 过滤隐藏目录
-                if not include_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith(".")]
-                    files = [f for f in files if not f.startswith(".")]
-
-                stats["dirs"] += len(dirs)
-                stats["files"] += len(files)
-
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        stats["size"] += os.path.getsize(file_path)
-                    except OSError:
-                        continue
-
+            return await ResourceIndex.dir_stats(path, include_hidden)
         except Exception:
-            pass
-
-        return stats
+            return {"files": 0, "dirs": 0, "size": 0}
 
     @classmethod
     def _sort_results(
@@ -443,11 +500,11 @@ class ResourceService:
         排序搜索结果
 
         参数:
-        - results (list[dict]): 资源详情字典列表。
+        - results (list[dict]): 目录索引项列表（时间字段为时间戳）。
         - order_by (str | None): 排序参数。
 
         返回:
-        - list[dict]: 排序后的资源详情字典列表。
+        - list[dict]: 排序后的目录索引项列表。
         """
         try:
             # 默认按名称升序排序
@@ -456,29 +513,13 @@ class ResourceService:
 
             # 解析order_by参数，格式: [{'field':'asc/desc'}]
 
-            sort_conditions = eval(order_by)
+            sort_conditions = ast.literal_eval(order_by)
             if isinstance(sort_conditions, list):
-                # 构建排序键函数
+                fields = [cond.get("field", "name") for cond in sort_conditions]
+
+                # 构建排序键函数，空值统一按0/空字符串比较
                 def sort_key(item):
-                    keys = []
-                    for cond in sort_conditions:
-                        field = cond.get("field", "name")
-                        cond.get("direction", "asc")
-                        # 获取字段值，默认为空字符串
-                        value = item.get(field, "")
-                        # 如果是日期字段，转换为可比较的格式
-                        if (
-                            field
-                            in [
-                                "created_time",
-                                "modified_time",
-                                "accessed_time",
-                            ]
-                            and value
-                        ):
-                            value = datetime.fromisoformat(value)
-                        keys.append(value)
-                    return keys
+                    return [item.get(field) or ("" if field == "name" else 0) for field in fields]
 
                 # 确定排序方向（这里只支持单一方向，多个条件时使用第一个条件的方向）
                 reverse = False
@@ -549,6 +590,7 @@ class ResourceService:
 
             # 保存文件（使用已读取的内容）
             Path(file_path).write_bytes(content)
+            ResourceIndex.invalidate(file_path)
 
             # 获取文件信息
             file_info = cls._get_file_info(file_path, base_url)
@@ -628,6 +670,7 @@ class ResourceService:
                 elif os.path.isdir(safe_path):
                     shutil.rmtree(safe_path)
                     log.info(f"删除目录成功: {safe_path}")
+                ResourceIndex.invalidate(safe_path)
 
             except Exception as e:
                 log.error(f"删除失败 {path}: {e!s}")
@@ -666,6 +709,7 @@ class ResourceService:
                     shutil.rmtree(safe_path)
                     success_paths.append(path)
                     log.info(f"删除目录成功: {safe_path}")
+                ResourceIndex.invalidate(safe_path)
 
             except Exception as e:
                 log.error(f"删除失败 {path}: {e!s}")
@@ -707,6 +751,7 @@ class ResourceService:
 
             # 移动文件
             shutil.move(source_path, target_path)
+            ResourceIndex.invalidate(source_path, target_path)
             log.info(f"移动成功: {source_path} -> {target_path}")
 
         except CustomException:
@@ -746,6 +791,7 @@ class ResourceService:
                 shutil.copy2(source_path, target_path)
             else:
                 shutil.copytree(source_path, target_path, dirs_exist_ok=data.overwrite)
+            ResourceIndex.invalidate(target_path)
 
             log.info(f"复制成功: {source_path} -> {target_path}")
 
@@ -781,6 +827,7 @@ class ResourceService:
 
             # 重命名
             os.rename(old_path, new_path)
+            ResourceIndex.invalidate(old_path, new_path)
             log.info(f"重命名成功: {old_path} -> {new_path}")
 
         except CustomException:
@@ -821,6 +868,7 @@ class ResourceService:
 
             # 创建目录
             os.makedirs(new_dir_path)
+            ResourceIndex.invalidate(new_dir_path)
             log.info(f"创建目录成功: {new_dir_path}")
 
         except CustomException:
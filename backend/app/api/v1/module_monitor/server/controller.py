@@ -27,6 +27,6 @@ async def get_monitor_server_info_controller() -> JSONResponse:
     - JSONResponse: 包含服务器监控信息的JSON响应。
     """
     result_dict = await ServerService.get_server_monitor_info_service()
-    log.info(f"获取服务器监控信息成功: {result_dict}")
+    log.info("获取服务器监控信息成功")
 
     return SuccessResponse(data=result_dict, msg="获取服务器监控信息成功")
@@ -0,0 +1,303 @@
+import asyncio
+import platform
+import socket
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from app.config.setting import settings
+from app.core.logger import log
+from app.utils.common_util import bytes2human
+
+from .schema import (
+    CpuInfoSchema,
+    DiskInfoSchema,
+    MemoryInfoSchema,
+    PyInfoSchema,
+    ServerHistorySchema,
+    ServerMonitorSchema,
+    SysInfoSchema,
+)
+
+
+class MetricRing:
+    """
+    定长环形缓冲区(基于 array 的时间序列)
+
+    每个指标一个预分配的 double 数组，写入 O(1)，写满后覆盖最旧的数据。
+    """
+
+    def __init__(self, capacity: int, fields: tuple[str, ...]) -> None:
+        self.capacity = max(capacity, 1)
+        self.fields = fields
+        self.size = 0
+        self._pos = 0
+        self._data = {name: array("d", [0.0]) * self.capacity for name in fields}
+
+    def append(self, **values: float) -> None:
+        """写入一个采样点"""
+        for name in self.fields:
+            self._data[name][self._pos] = values[name]
+        self._pos = (self._pos + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def series(self, name: str) -> list[float]:
+        """按时间顺序返回指标序列"""
+        data = self._data[name]
+        start = (self._pos - self.size) % self.capacity
+        return [data[(start + index) % self.capacity] for index in range(self.size)]
+
+
+class ServerSampler:
+    """
+    服务器指标后台采样器
+
+    后台任务按 SERVER_MONITOR_INTERVAL 固定间隔在线程池中采集 CPU、内存与进程信息，
+    磁盘分区按 SERVER_MONITOR_DISK_INTERVAL 低频采集(避免慢挂载点阻塞)，系统信息只采集一次。
+    历史数据写入定长环形缓冲区，每次采样后生成一次监控快照，接口直接返回快照，
+    不随请求数调用 psutil；cpu_times_percent 为两次采样间隔内的使用率。
+    """
+
+    _ring: MetricRing | None = None
+    _snapshot: dict[str, Any] | None = None
+    _sys_info: SysInfoSchema | None = None
+    _disks: list[DiskInfoSchema] = []
+    _disk_sampled_at: float = 0.0
+    _process: psutil.Process | None = None
+    _task: asyncio.Task | None = None
+    _lock: asyncio.Lock | None = None
+
+    # 环形缓冲区保存的指标
+    FIELDS = ("time", "cpu_used", "cpu_sys", "mem_usage", "py_memory_used")
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        启动后台采样任务(需在事件循环中调用)。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            return
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台采样任务。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+        cls._task = None
+
+    @classmethod
+    async def snapshot(cls) -> dict[str, Any]:
+        """
+        获取最近一次采样的监控快照(未启动采样任务时立即采样一次)。
+
+        返回:
+        - dict[str, Any]: 服务器监控信息(含历史序列)。
+        """
+        if cls._snapshot is None:
+            await cls.sample()
+        return cls._snapshot  # pyright: ignore[reportReturnType]
+
+    @classmethod
+    async def sample(cls) -> None:
+        """
+        采集一次指标并更新快照。
+
+        返回:
+        - None
+        """
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            include_disks = (
+                time.monotonic() - cls._disk_sampled_at >= settings.SERVER_MONITOR_DISK_INTERVAL
+            )
+            cls._snapshot = await asyncio.to_thread(cls._collect, include_disks)
+
+    @classmethod
+    async def _run(cls) -> None:
+        """采样循环，单次采样失败不影响后续采样"""
+        while True:
+            try:
+                await cls.sample()
+            except Exception as e:
+                log.error(f"服务器指标采样失败: {e!s}")
+            await asyncio.sleep(settings.SERVER_MONITOR_INTERVAL)
+
+    @classmethod
+    def _collect(cls, include_disks: bool) -> dict[str, Any]:
+        """采集指标、写入环形缓冲区并生成快照(同步，在线程池中执行)"""
+        if cls._ring is None:
+            cls._ring = MetricRing(settings.SERVER_MONITOR_HISTORY, cls.FIELDS)
+            # 首次调用只建立基准，返回值无意义
+            psutil.cpu_times_percent(interval=None)
+        if cls._process is None:
+            cls._process = psutil.Process()
+        if cls._sys_info is None:
+            cls._sys_info = cls._get_system_info()
+        if include_disks:
+            cls._disks = cls._get_disk_info()
+            cls._disk_sampled_at = time.monotonic()
+
+        now = time.time()
+        cpu = cls._get_cpu_info()
+        process_memory = cls._process.memory_info()
+        mem, py = cls._get_memory_info(cls._process, process_memory.rss)
+        cls._ring.append(
+            time=now,
+            cpu_used=cpu.used,
+            cpu_sys=cpu.sys,
+            mem_usage=mem.usage,
+            py_memory_used=round(process_memory.rss / 1024 / 1024, 2),
+        )
+        return ServerMonitorSchema(
+            cpu=cpu,
+            mem=mem,
+            sys=cls._sys_info,
+            py=py,
+            disks=cls._disks,
+            sample_time=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            history=ServerHistorySchema(
+                time=[
+                    time.strftime("%H:%M:%S", time.localtime(value))
+                    for value in cls._ring.series("time")
+                ],
+                cpu_used=cls._ring.series("cpu_used"),
+                cpu_sys=cls._ring.series("cpu_sys"),
+                mem_usage=cls._ring.series("mem_usage"),
+                py_memory_used=cls._ring.series("py_memory_used"),
+            ),
+        ).model_dump()
+
+    @classmethod
+    def _get_cpu_info(cls) -> CpuInfoSchema:
+        """
+        获取CPU信息(两次采样间隔内的使用率)
+
+        返回:
+        - CpuInfoSchema: CPU信息模型。
+        """
+        cpu_times = psutil.cpu_times_percent(interval=None)
+        cpu_num = psutil.cpu_count(logical=True)
+        if not cpu_num:
+            cpu_num = 1
+        return CpuInfoSchema(
+            cpu_num=cpu_num,
+            used=cpu_times.user,
+            sys=cpu_times.system,
+            free=cpu_times.idle,
+        )
+
+    @classmethod
+    def _get_memory_info(
+        cls, process: psutil.Process, rss: int
+    ) -> tuple[MemoryInfoSchema, PyInfoSchema]:
+        """
+        获取内存与Python进程信息(共用一次内存采集)
+
+        参数:
+        - process (psutil.Process): 当前进程。
+        - rss (int): 当前进程常驻内存(字节)。
+
+        返回:
+        - tuple[MemoryInfoSchema, PyInfoSchema]: 内存信息模型与Python进程信息模型。
+        """
+        memory = psutil.virtual_memory()
+        start_time = process.create_time()
+        mem = MemoryInfoSchema(
+            total=bytes2human(memory.total),
+            used=bytes2human(memory.used),
+            free=bytes2human(memory.free),
+            usage=memory.percent,
+        )
+        py = PyInfoSchema(
+            name=process.name(),
+            version=platform.python_version(),
+            start_time=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_time)),
+            run_time=cls._calculate_run_time(start_time),
+            home=str(Path(process.exe())),
+            memory_total=bytes2human(memory.available),
+            memory_used=bytes2human(rss),
+            memory_free=bytes2human(memory.available - rss),
+            memory_usage=round((rss / memory.available) * 100, 2),
+        )
+        return mem, py
+
+    @classmethod
+    def _get_system_info(cls) -> SysInfoSchema:
+        """
+        获取系统信息
+
+        返回:
+        - SysInfoSchema: 系统信息模型。
+        """
+        hostname = socket.gethostname()
+        return SysInfoSchema(
+            computer_ip=socket.gethostbyname(hostname),
+            computer_name=platform.node(),
+            os_arch=platform.machine(),
+            os_name=platform.platform(),
+            user_dir=str(Path.cwd()),
+        )
+
+    @classmethod
+    def _get_disk_info(cls) -> list[DiskInfoSchema]:
+        """
+        获取磁盘信息
+
+        返回:
+        - list[DiskInfoSchema]: 磁盘信息模型列表。
+        """
+        disk_info = []
+        for partition in psutil.disk_partitions():
+            try:
+                # 使用mountpoint而不是device来获取磁盘使用情况
+                usage = psutil.disk_usage(partition.mountpoint)
+                mount_point = str(Path(partition.mountpoint))
+                disk_info.append(
+                    DiskInfoSchema(
+                        dir_name=mount_point,  # 使用mountpoint替代device
+                        sys_type_name=partition.fstype,
+                        type_name=f"本地固定磁盘（{mount_point}）",
+                        total=bytes2human(usage.total),
+                        used=bytes2human(usage.used),
+                        free=bytes2human(usage.free),
+                        usage=usage.percent,  # 直接使用数字而不是字符串
+                    )
+                )
+            except (PermissionError, FileNotFoundError):
+                # 明确指定可能的异常
+                continue
+        return disk_info
+
+    @classmethod
+    def _calculate_run_time(cls, start_time: float) -> str:
+        """
+        计算运行时间
+
+        参数:
+        - start_time (float): 进程启动时间（时间戳）
+
+        返回:
+        - str: 格式化后的运行时间字符串（例如："1天2小时3分钟"）
+        """
+        difference = time.time() - start_time
+        days = int(difference // (24 * 60 * 60))
+        hours = int((difference % (24 * 60 * 60)) // (60 * 60))
+        minutes = int((difference % (60 * 60)) // 60)
+        return f"{days}天{hours}小时{minutes}分钟"
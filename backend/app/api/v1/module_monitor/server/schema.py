@@ -65,6 +65,18 @@ class DiskInfoSchema(BaseModel):
     usage: float = Field(ge=0, le=100, description="使用率(%)")
 
 
+class ServerHistorySchema(BaseModel):
+    """服务器指标历史序列模型(按采样时间升序)"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    time: list[str] = Field(default_factory=list, description="采样时间")
+    cpu_used: list[float] = Field(default_factory=list, description="CPU用户使用率(%)")
+    cpu_sys: list[float] = Field(default_factory=list, description="CPU系统使用率(%)")
+    mem_usage: list[float] = Field(default_factory=list, description="内存使用率(%)")
+    py_memory_used: list[float] = Field(default_factory=list, description="进程内存占用(MB)")
+
+
 class ServerMonitorSchema(BaseModel):
     """服务器监控信息模型"""
 
@@ -75,3 +87,5 @@ class ServerMonitorSchema(BaseModel):
     py: PyInfoSchema = Field(description="Python运行信息")
     sys: SysInfoSchema = Field(description="系统信息")
     disks: list[DiskInfoSchema] = Field(default_factory=list, description="磁盘信息")
+    sample_time: str | None = Field(default=None, description="采样时间")
+    history: ServerHistorySchema | None = Field(default=None, description="指标历史序列")
@@ -18,10 +18,12 @@ from app.core.logger import log
 from app.core.redis_crud import RedisCURD
 from app.core.security import (
     CustomOAuth2PasswordRequestForm,
+    TokenCache,
     create_access_token,
     decode_access_token,
+    decode_token_session,
 )
-from app.utils.captcha_util import CaptchaUtil
+from app.utils.captcha_util import CaptchaPool
 from app.utils.common_util import get_random_character
 from app.utils.hash_bcrpy_util import PwdUtil
 from app.utils.ip_local_util import IpLocalUtil
@@ -308,13 +310,14 @@ class LoginService:
         异常:
         - CustomException: 令牌无效时抛出异常
         """
-        payload: JWTPayloadSchema = decode_access_token(token=token.token)
-        session_info = json.loads(payload.sub)
+        _, session_info = decode_token_session(token=token.token)
         session_id = session_info.get("session_id")
 
         if not session_id:
             raise CustomException(msg="非法凭证,无法获取会话编号")
 
+        TokenCache.invalidate_session(session_id)
+
         # 删除Redis中的在线用户、访问令牌、刷新令牌
         await RedisCURD(redis).delete(f"{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}")
         await RedisCURD(redis).delete(f"{RedisInitKeyConfig.REFRESH_TOKEN.key}:{session_id}")
@@ -344,8 +347,8 @@ class CaptchaService:
         if not settings.CAPTCHA_ENABLE:
             raise CustomException(msg="未开启验证码服务")
 
-        # 生成验证码图片和值
-        captcha_base64, captcha_value = CaptchaUtil.captcha_arithmetic()
+        # 从预生成验证码池取出验证码图片和值
+        captcha_base64, captcha_value = await CaptchaPool.pop(redis)
         captcha_key = get_random_character()
 
         # 保存到Redis并设置过期时间
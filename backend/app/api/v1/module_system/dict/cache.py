@@ -0,0 +1,238 @@
+import asyncio
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from redis.asyncio.client import Redis
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.core.database import AFTER_COMMIT_KEY, async_db_session, on_commit
+from app.core.logger import log
+
+from .crud import DictDataCRUD, DictTypeCRUD
+from .schema import DictDataOutSchema
+
+# 会话中记录受影响字典类型的变更集(session.info 键)
+DICT_CHANGES_KEY = "dict_changes"
+
+
+class DictCache:
+    """
+    数据字典缓存
+
+    - 变更集：写操作只把受影响的字典类型记入当前事务的变更集，同一事务内多次修改同一类型自动合并；
+      事务提交后统一重建一次：一次查询取出全部受影响类型的数据，一个管道写入缓存并递增版本号，
+      再发布一条变更通知；
+    - 近端缓存：进程内按字典类型缓存数据，订阅变更通知后按版本号淘汰，
+      订阅未建立或中断期间不使用近端缓存，直接读取 Redis。
+    """
+
+    _local: dict[str, tuple[int, list[dict]]] = {}
+    _versions: dict[str, int] = {}
+    _subscribed: bool = False
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    def key(dict_type: str) -> str:
+        """字典数据缓存键"""
+        return f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
+
+    @classmethod
+    def mark(cls, auth: AuthSchema, redis: Redis, *dict_types: str | None) -> None:
+        """
+        记录本事务中受影响的字典类型，事务提交后统一重建缓存。
+
+        参数:
+        - auth (AuthSchema): 认证信息模型(使用其中的数据库会话)。
+        - redis (Redis): Redis客户端。
+        - *dict_types (str | None): 受影响的字典类型。
+
+        返回:
+        - None
+        """
+        if DICT_CHANGES_KEY not in auth.db.info.get(AFTER_COMMIT_KEY, {}):
+            # 本事务首次标记：上一事务的变更集已刷新或随回滚丢弃
+            auth.db.info[DICT_CHANGES_KEY] = set()
+        changes: set[str] = auth.db.info[DICT_CHANGES_KEY]
+        changes.update(dict_type for dict_type in dict_types if dict_type)
+        on_commit(auth.db, DICT_CHANGES_KEY, lambda: cls.flush(redis, changes))
+
+    @classmethod
+    async def flush(cls, redis: Redis, changes: set[str]) -> None:
+        """
+        重建变更集中的字典类型缓存(事务提交后执行)。
+
+        参数:
+        - redis (Redis): Redis客户端。
+        - changes (set[str]): 受影响的字典类型。
+
+        返回:
+        - None
+        """
+        await cls.rebuild(redis, changes)
+        log.info(f"刷新字典缓存成功: {sorted(changes)}")
+
+    @classmethod
+    async def rebuild(
+        cls, redis: Redis, dict_types: Iterable[str], publish: bool = True
+    ) -> dict[str, list[dict]]:
+        """
+        重建指定字典类型的缓存：一次查询取出数据，一个管道写入。
+
+        参数:
+        - redis (Redis): Redis客户端。
+        - dict_types (Iterable[str]): 字典类型。
+        - publish (bool): 是否递增版本号并发布变更通知(为 False 时只回填存在的类型，用于缓存未命中)。
+
+        返回:
+        - dict[str, list[dict]]: 存在的字典类型及其字典数据。
+        """
+        types = sorted({dict_type for dict_type in dict_types if dict_type})
+        if not types:
+            return {}
+        async with async_db_session() as session:
+            # 重建缓存不需要检查数据权限
+            auth = AuthSchema(db=session, check_data_scope=False)
+            type_list = await DictTypeCRUD(auth).list(
+                search={"dict_type": ("in", types)}, fields=["id", "dict_type"]
+            )
+            grouped: dict[str, list[dict]] = {obj.dict_type: [] for obj in type_list}
+            if grouped:
+                data_list = await DictDataCRUD(auth).get_obj_list_crud(
+                    search={"dict_type": ("in", list(grouped))}
+                )
+                for row in data_list:
+                    if row and row.dict_type in grouped:
+                        grouped[row.dict_type].append(
+                            DictDataOutSchema.model_validate(row).model_dump()
+                        )
+
+        version_key = RedisInitKeyConfig.SYSTEM_DICT_VERSION.key
+        async with redis.pipeline(transaction=True) as pipe:
+            for dict_type in types:
+                if dict_type in grouped:
+                    pipe.set(cls.key(dict_type), json.dumps(grouped[dict_type], ensure_ascii=False))
+                elif publish:
+                    # 字典类型已删除
+                    pipe.delete(cls.key(dict_type))
+                if publish:
+                    pipe.hincrby(version_key, dict_type, 1)
+            results = await pipe.execute()
+        if publish:
+            # 每个类型依次为 写入/删除、递增版本号 两条命令
+            versions = dict(zip(types, results[1::2], strict=True))
+            await redis.publish(
+                RedisInitKeyConfig.SYSTEM_DICT_CHANNEL.key, json.dumps(versions, ensure_ascii=False)
+            )
+        return grouped
+
+    @classmethod
+    async def get(cls, redis: Redis, dict_type: str) -> list[dict] | None:
+        """
+        获取字典数据(优先读取近端缓存)。
+
+        参数:
+        - redis (Redis): Redis客户端。
+        - dict_type (str): 字典类型。
+
+        返回:
+        - list[dict] | None: 字典数据列表，缓存不存在或格式错误时返回 None。
+        """
+        if cls._subscribed:
+            cached = cls._local.get(dict_type)
+            if cached is not None:
+                return cached[1]
+
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get(cls.key(dict_type))
+            pipe.hget(RedisInitKeyConfig.SYSTEM_DICT_VERSION.key, dict_type)
+            value, version = await pipe.execute()
+        if value is None:
+            return None
+        try:
+            data = json.loads(value) if value else []
+        except json.JSONDecodeError:
+            log.warning(f"字典数据反序列化失败，重新构建缓存: {dict_type}")
+            return None
+        if not isinstance(data, list):
+            return None
+
+        version = int(version or 0)
+        # 读取期间已收到更新的变更通知时不写入近端缓存，避免缓存旧数据
+        if cls._subscribed and version >= cls._versions.get(dict_type, 0):
+            cls._local[dict_type] = (version, data)
+        return data
+
+    @classmethod
+    def start(cls, redis: Redis) -> None:
+        """
+        启动变更通知订阅任务(需在事件循环中调用)。
+
+        参数:
+        - redis (Redis): Redis客户端。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            return
+        cls._task = asyncio.create_task(cls._listen(redis))
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止变更通知订阅任务并清空近端缓存。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+        cls._task = None
+        cls._reset()
+
+    @classmethod
+    def _reset(cls) -> None:
+        cls._subscribed = False
+        cls._local.clear()
+        cls._versions.clear()
+
+    @classmethod
+    def _apply(cls, data: Any) -> None:
+        """按变更通知中的版本号淘汰近端缓存"""
+        try:
+            versions: dict[str, int] = json.loads(data)
+        except (TypeError, json.JSONDecodeError):
+            log.warning(f"字典变更通知格式错误: {data}")
+            return
+        for dict_type, version in versions.items():
+            cls._versions[dict_type] = max(version, cls._versions.get(dict_type, 0))
+            cached = cls._local.get(dict_type)
+            if cached is not None and cached[0] < version:
+                cls._local.pop(dict_type, None)
+
+    @classmethod
+    async def _listen(cls, redis: Redis) -> None:
+        """订阅循环，连接中断时清空近端缓存并重新订阅"""
+        while True:
+            try:
+                async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(RedisInitKeyConfig.SYSTEM_DICT_CHANNEL.key)
+                    # 订阅建立前的变更无从得知，从空缓存开始
+                    cls._reset()
+                    cls._subscribed = True
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            cls._apply(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(f"⚠️ 字典变更通知订阅中断，稍后重试: {e}")
+            finally:
+                cls._reset()
+            await asyncio.sleep(1)
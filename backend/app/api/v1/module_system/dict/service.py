@@ -1,16 +1,13 @@
-import json
-
 from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.common.enums import RedisInitKeyConfig
 from app.core.base_schema import BatchSetAvailable
 from app.core.database import async_db_session
 from app.core.exceptions import CustomException
 from app.core.logger import log
-from app.core.redis_crud import RedisCURD
 from app.utils.excel_util import ExcelUtil
 
+from .cache import DictCache
 from .crud import DictDataCRUD, DictTypeCRUD
 from .schema import (
     DictDataCreateSchema,
@@ -89,17 +86,9 @@ class DictTypeService:
 
         new_obj_dict = DictTypeOutSchema.model_validate(obj).model_dump()
 
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
-
-        try:
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value="",
-            )
-            log.info(f"创建字典类型成功: {new_obj_dict}")
-        except Exception as e:
-            log.error(f"创建字典类型失败: {e}")
-            raise CustomException(msg=f"创建字典类型失败 {e}")
+        # 事务提交后写入缓存
+        DictCache.mark(auth, redis, data.dict_type)
+        log.info(f"创建字典类型成功: {new_obj_dict}")
 
         return new_obj_dict
 
@@ -128,55 +117,27 @@ class DictTypeService:
             raise CustomException(msg="更新失败，该数据字典类型不存在")
         if exist_obj.dict_name != data.dict_name:
             raise CustomException(msg="更新失败，数据字典类型名称不可以修改")
+        old_dict_type = exist_obj.dict_type
 
-        dict_data_list = []
-        # 如果字典类型修改或状态变更，则修改对应字典数据的类型和状态，并更新Redis缓存
-        if exist_obj.dict_type != data.dict_type or exist_obj.status != data.status:
-            # 检查字典数据类型是否被修改
+        # 如果字典类型修改或状态变更，则一次批量修改对应字典数据的类型和状态
+        if old_dict_type != data.dict_type or exist_obj.status != data.status:
             exist_obj_type_list = await DictDataCRUD(auth).list(
-                search={"dict_type": exist_obj.dict_type}
+                search={"dict_type": old_dict_type}, fields=["id"]
             )
             if exist_obj_type_list:
-                for item in exist_obj_type_list:
-                    item.dict_type = data.dict_type
-                    dict_data = DictDataUpdateSchema(
-                        dict_sort=item.dict_sort,
-                        dict_label=item.dict_label,
-                        dict_value=item.dict_value,
-                        dict_type=data.dict_type,
-                        dict_type_id=item.dict_type_id,
-                        css_class=item.css_class,
-                        list_class=item.list_class,
-                        is_default=item.is_default,
-                        status=data.status,
-                        description=item.description,
-                    )
-                    obj = await DictDataCRUD(auth).update_obj_crud(id=item.id, data=dict_data)
-                    dict_data_list.append(DictDataOutSchema.model_validate(obj).model_dump())
+                await DictDataCRUD(auth).set(
+                    ids=[item.id for item in exist_obj_type_list],
+                    dict_type=data.dict_type,
+                    status=data.status,
+                )
 
         obj = await DictTypeCRUD(auth).update_obj_crud(id=id, data=data)
 
         new_obj_dict = DictTypeOutSchema.model_validate(obj).model_dump()
 
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
-        try:
-            # 获取当前字典类型的所有字典数据，确保包含最新状态
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
-            )
-            log.info(f"更新字典类型成功并刷新缓存: {new_obj_dict}")
-        except Exception as e:
-            log.error(f"更新字典类型缓存失败: {e}")
-            raise CustomException(msg=f"更新字典类型缓存失败 {e}")
+        # 事务提交后刷新新旧字典类型的缓存
+        DictCache.mark(auth, redis, old_dict_type, data.dict_type)
+        log.info(f"更新字典类型成功: {new_obj_dict}")
 
         return new_obj_dict
 
@@ -195,24 +156,21 @@ class DictTypeService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            exist_obj = await DictTypeCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg="删除失败，该数据字典类型不存在")
-            # 检查是否有字典数据
-            exist_obj_type_list = await DictDataCRUD(auth).list(search={"dict_type": id})
-            if len(exist_obj_type_list) > 0:
-                # 如果有字典数据，不能删除
-                raise CustomException(msg="删除失败，该数据字典类型下存在字典数据")
-            # 删除Redis缓存
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{exist_obj.dict_type}"
-            try:
-                await RedisCURD(redis).delete(redis_key)
-                log.info(f"删除字典类型成功: {id}")
-            except Exception as e:
-                log.error(f"删除字典类型失败: {e}")
-                raise CustomException(msg="删除字典类型失败")
+        exist_objs = await DictTypeCRUD(auth).validate_ids(
+            ids=ids, msg="删除失败", fields=["id", "dict_type"]
+        )
+        # 检查是否有字典数据
+        dict_types = [exist_obj.dict_type for exist_obj in exist_objs]
+        exist_obj_type_list = await DictDataCRUD(auth).list(
+            search={"dict_type": ("in", dict_types)}, fields=["id"]
+        )
+        if len(exist_obj_type_list) > 0:
+            # 如果有字典数据，不能删除
+            raise CustomException(msg="删除失败，该数据字典类型下存在字典数据")
         await DictTypeCRUD(auth).delete_obj_crud(ids=ids)
+        # 事务提交后删除缓存
+        DictCache.mark(auth, redis, *dict_types)
+        log.info(f"删除字典类型成功: {ids}")
 
     @classmethod
     async def set_obj_available_service(cls, auth: AuthSchema, data: BatchSetAvailable) -> None:
@@ -321,34 +279,14 @@ class DictDataService:
         """
         try:
             async with async_db_session() as session:
-                async with session.begin():
-                    # 在初始化过程中，不需要检查数据权限
-                    auth = AuthSchema(db=session, check_data_scope=False)
-                    obj_list = await DictTypeCRUD(auth).get_obj_list_crud()
-                    if not obj_list:
-                        log.warning("未找到任何字典类型数据")
-                        return
-
-                    for obj in obj_list:
-                        dict_type = obj.dict_type
-                        try:
-                            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                                search={"dict_type": dict_type}
-                            )
-                            dict_data = [
-                                DictDataOutSchema.model_validate(row).model_dump()
-                                for row in dict_data_list
-                                if row
-                            ]
-                            # 保存到Redis并设置过期时间
-                            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-                            value = json.dumps(dict_data, ensure_ascii=False)
-                            await RedisCURD(redis).set(
-                                key=redis_key,
-                                value=value,
-                            )
-                        except Exception as e:
-                            log.error(f"❌ 初始化字典数据失败 [{dict_type}]: {e}")
+                # 在初始化过程中，不需要检查数据权限
+                auth = AuthSchema(db=session, check_data_scope=False)
+                obj_list = await DictTypeCRUD(auth).list(fields=["id", "dict_type"])
+            if not obj_list:
+                log.warning("未找到任何字典类型数据")
+                return
+            # 一次查询取出全部字典数据，一个管道写入缓存
+            await DictCache.rebuild(redis, [obj.dict_type for obj in obj_list])
 
         except Exception as e:
             log.error(f"字典初始化过程发生错误: {e}")
@@ -368,32 +306,15 @@ class DictDataService:
         - list[dict]: 字典数据列表
         """
         try:
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-            obj_list_dict = await RedisCURD(redis).get(redis_key)
-
-            # 确保返回数据正确序列化
-            if obj_list_dict:
-                if isinstance(obj_list_dict, str):
-                    try:
-                        return json.loads(obj_list_dict)
-                    except json.JSONDecodeError:
-                        log.warning(f"字典数据反序列化失败，尝试重新初始化缓存: {dict_type}")
-                elif isinstance(obj_list_dict, list):
-                    return obj_list_dict
-
-            # 缓存不存在或格式错误时重新初始化
-            await cls.init_dict_service(redis)
-            obj_list_dict = await RedisCURD(redis).get(redis_key)
-            if not obj_list_dict:
-                raise CustomException(msg="数据字典不存在")
+            obj_list_dict = await DictCache.get(redis, dict_type)
+            if obj_list_dict is not None:
+                return obj_list_dict
 
-            # 再次确保返回数据正确序列化
-            if isinstance(obj_list_dict, str):
-                try:
-                    return json.loads(obj_list_dict)
-                except json.JSONDecodeError:
-                    raise CustomException(msg="字典数据格式错误")
-            return obj_list_dict
+            # 缓存不存在或格式错误时只重建该字典类型
+            rebuilt = await DictCache.rebuild(redis, [dict_type], publish=False)
+            if dict_type not in rebuilt:
+                raise CustomException(msg="数据字典不存在")
+            return rebuilt[dict_type]
         except CustomException:
             raise
         except Exception as e:
@@ -430,26 +351,9 @@ class DictDataService:
             raise CustomException(msg=f'创建失败，该字典类型下的字典键值"{data.dict_value}"已存在')
 
         obj = await DictDataCRUD(auth).create_obj_crud(data=data)
-
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
-        try:
-            # 获取当前字典类型的所有字典数据
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
-            )
-            log.info(f"创建字典数据写入缓存成功: {obj}")
-        except Exception as e:
-            log.error(f"创建字典数据写入缓存失败: {e}")
-            raise CustomException(msg=f"创建字典数据失败 {e}")
+        # 事务提交后刷新该字典类型的缓存
+        DictCache.mark(auth, redis, data.dict_type)
+        log.info(f"创建字典数据成功: {obj}")
 
         return DictDataOutSchema.model_validate(obj).model_dump()
 
@@ -497,48 +401,12 @@ class DictDataService:
                     msg=f'更新失败，该字典类型下的字典键值"{data.dict_value}"已存在'
                 )
 
-        # 如果字典类型变更，仅刷新旧类型缓存，不联动字典类型状态
-        if exist_obj.dict_type != data.dict_type:
-            dict_type = await DictTypeCRUD(auth).get(dict_type=exist_obj.dict_type)
-            if dict_type:
-                redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type.dict_type}"
-                try:
-                    dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                        search={"dict_type": dict_type.dict_type}
-                    )
-                    dict_data = [
-                        DictDataOutSchema.model_validate(row).model_dump()
-                        for row in dict_data_list
-                        if row
-                    ]
-                    value = json.dumps(dict_data, ensure_ascii=False)
-                    await RedisCURD(redis).set(
-                        key=redis_key,
-                        value=value,
-                    )
-                except Exception as e:
-                    log.error(f"更新字典数据类型变更时刷新旧缓存失败: {e}")
-
+        # 更新会同步修改会话中的同一对象，先记录旧字典类型
+        old_dict_type = exist_obj.dict_type
         obj = await DictDataCRUD(auth).update_obj_crud(id=id, data=data)
-        redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{data.dict_type}"
-        try:
-            # 获取当前字典类型的所有字典数据
-            dict_data_list = await DictDataCRUD(auth).get_obj_list_crud(
-                search={"dict_type": data.dict_type}
-            )
-            dict_data = [
-                DictDataOutSchema.model_validate(row).model_dump() for row in dict_data_list if row
-            ]
-
-            value = json.dumps(dict_data, ensure_ascii=False)
-            await RedisCURD(redis).set(
-                key=redis_key,
-                value=value,
-            )
-            log.info(f"更新字典数据写入缓存成功: {obj}")
-        except Exception as e:
-            log.error(f"更新字典数据写入缓存失败: {e}")
-            raise CustomException(msg=f"更新字典数据失败 {e}")
+        # 事务提交后刷新该字典类型的缓存(字典类型变更时同时刷新旧类型，不联动字典类型状态)
+        DictCache.mark(auth, redis, old_dict_type, data.dict_type)
+        log.info(f"更新字典数据成功: {obj}")
 
         return DictDataOutSchema.model_validate(obj).model_dump()
 
@@ -559,34 +427,23 @@ class DictDataService:
             if len(ids) < 1:
                 raise CustomException(msg="删除失败，删除对象不能为空")
 
-            # 首先检查是否包含系统默认数据
-            for id in ids:
-                exist_obj = await DictDataCRUD(auth).get_obj_by_id_crud(id=id)
-                if not exist_obj:
-                    raise CustomException(msg=f"{id} 删除失败，该字典数据不存在")
+            # 一次查询校验存在性，同时取得受影响的字典类型
+            exist_objs = await DictDataCRUD(auth).validate_ids(
+                ids=ids, msg="删除失败", fields=["id", "is_default", "dict_type"]
+            )
+            for exist_obj in exist_objs:
                 # 系统默认字典数据不允许删除
                 if exist_obj.is_default:
-                    raise CustomException(msg=f"删除失败，ID为{id}的系统默认字典数据不允许删除")
-
-            # 获取所有需要清除的缓存键
-            dict_types_to_clear = set()
-            for id in ids:
-                exist_obj = await DictDataCRUD(auth).get_obj_by_id_crud(id=id)
-                if exist_obj:
-                    dict_types_to_clear.add(exist_obj.dict_type)
+                    raise CustomException(
+                        msg=f"删除失败，ID为{exist_obj.id}的系统默认字典数据不允许删除"
+                    )
+            dict_types_to_clear = {exist_obj.dict_type for exist_obj in exist_objs}
 
             # 执行删除操作
             await DictDataCRUD(auth).delete_obj_crud(ids=ids)
 
-            # 清除缓存
-            for dict_type in dict_types_to_clear:
-                try:
-                    redis_key = f"{RedisInitKeyConfig.SYSTEM_DICT.key}:{dict_type}"
-                    await RedisCURD(redis).delete(redis_key)
-                    log.info(f"清除字典缓存成功: {dict_type}")
-                except Exception as e:
-                    log.warning(f"清除字典缓存失败: {e}")
-                    # 缓存清除失败不影响删除操作
+            # 事务提交后按字典类型各重建一次缓存
+            DictCache.mark(auth, redis, *dict_types_to_clear)
 
             log.info(f"删除字典数据成功，ID列表: {ids}")
 
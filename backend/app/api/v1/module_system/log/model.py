@@ -15,6 +15,8 @@ class OperationLogModel(ModelMixin, UserMixin):
     __tablename__: str = "sys_log"
     __table_args__: dict[str, str] = {"comment": "系统日志表"}
     __loader_options__: list[str] = ["created_by", "updated_by"]
+    # 列表/分页查询默认不加载的大字段（详情、导出时加载）
+    __deferred_columns__: list[str] = ["request_payload", "response_json"]
 
     type: Mapped[int] = mapped_column(Integer, comment="日志类型(1登录日志 2操作日志)")
     request_path: Mapped[str] = mapped_column(String(255), comment="请求路径")
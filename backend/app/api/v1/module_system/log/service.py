@@ -56,6 +56,40 @@ class OperationLogService:
         log_dict_list = [OperationLogOutSchema.model_validate(log).model_dump() for log in log_list]
         return log_dict_list
 
+    @classmethod
+    async def page_log_service(
+        cls,
+        auth: AuthSchema,
+        page_no: int,
+        page_size: int,
+        search: OperationLogQueryParam | None = None,
+        order_by: list | None = None,
+        fields: list[str] | None = None,
+    ) -> dict:
+        """
+        分页查询日志（数据库分页，默认不返回请求体/响应体等大字段）
+
+        参数:
+        - auth (AuthSchema): 认证信息模型
+        - page_no (int): 页码
+        - page_size (int): 每页数量
+        - search (OperationLogQueryParam | None): 日志查询参数模型
+        - order_by (list | None): 排序字段列表
+        - fields (list[str] | None): 返回字段列表
+
+        返回:
+        - dict: 分页数据
+        """
+        return await OperationLogCRUD(auth).page(
+            offset=(page_no - 1) * page_size,
+            limit=page_size,
+            order_by=order_by or [{"created_time": "desc"}],
+            search=search.__dict__ if search else {},
+            out_schema=OperationLogOutSchema,
+            serialize=True,
+            fields=fields,
+        )
+
     @classmethod
     async def create_log_service(cls, auth: AuthSchema, data: OperationLogCreateSchema) -> dict:
         """
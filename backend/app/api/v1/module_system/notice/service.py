@@ -137,10 +137,7 @@ class NoticeService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            notice = await NoticeCRUD(auth).get_by_id_crud(id=id)
-            if not notice:
-                raise CustomException(msg="删除失败，该公告通知不存在")
+        await NoticeCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await NoticeCRUD(auth).delete_crud(ids=ids)
 
     @classmethod
@@ -94,14 +94,11 @@ class ParamsService:
         返回:
         - list[dict]: 配置管理型模型实例字典列表表示
         """
-        obj_list = None
-        if search:
-            obj_list = await ParamsCRUD(auth).get_obj_list_crud(
-                search=search.__dict__, order_by=order_by
-            )
-        else:
-            obj_list = await ParamsCRUD(auth).get_obj_list_crud()
-        return [ParamsOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+        return await ParamsCRUD(auth).list_dict(
+            out_schema=ParamsOutSchema,
+            search=search.__dict__ if search else None,
+            order_by=order_by,
+        )
 
     @classmethod
     async def create_obj_service(
@@ -200,10 +197,10 @@ class ParamsService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg="删除失败，该数据字典类型不存在")
+        exist_objs = await ParamsCRUD(auth).validate_ids(
+            ids=ids, msg="删除失败", fields=["id", "config_name", "config_key", "config_type"]
+        )
+        for exist_obj in exist_objs:
             # 检查是否是否初始化类型
             if exist_obj.config_type:
                 # 如果有字典数据，不能删除
@@ -213,18 +210,17 @@ class ParamsService:
 
         await ParamsCRUD(auth).delete_obj_crud(ids=ids)
 
-        # 同步删除Redis缓存
-        for id in ids:
-            exist_obj = await ParamsCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                continue
-            redis_key = f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{exist_obj.config_key}"
-            try:
-                await RedisCURD(redis).delete(redis_key)
-                log.info(f"删除系统配置成功: {id}")
-            except Exception as e:
-                log.error(f"删除系统配置失败: {e}")
-                raise CustomException(msg="删除字典类型失败")
+        # 同步删除Redis缓存(使用校验时加载的数据，一次删除全部键)
+        redis_keys = [
+            f"{RedisInitKeyConfig.SYSTEM_CONFIG.key}:{exist_obj.config_key}"
+            for exist_obj in exist_objs
+        ]
+        try:
+            await RedisCURD(redis).delete(*redis_keys)
+            log.info(f"删除系统配置成功: {ids}")
+        except Exception as e:
+            log.error(f"删除系统配置失败: {e}")
+            raise CustomException(msg="删除字典类型失败")
 
     @classmethod
     async def export_obj_service(cls, data_list: list[dict]) -> bytes:
@@ -78,9 +78,6 @@ class PositionCRUD(CRUDBase[PositionModel, PositionCreateSchema, PositionUpdateS
         返回:
         - list[str]: 岗位名称列表。
         """
-        position_names = []
-        for id in ids:
-            obj = await self.get(id=id)
-            if obj:
-                position_names.append(obj.name)
-        return position_names
+        objs = await self.list(search={"id": ("in", ids)}, fields=["id", "name"])
+        names = {obj.id: obj.name for obj in objs}
+        return [names[id] for id in ids if id in names]
@@ -111,10 +111,7 @@ class PositionService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            position = await PositionCRUD(auth).get_by_id_crud(id=id)
-            if not position:
-                raise CustomException(msg="删除失败，该岗位不存在")
+        await PositionCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await PositionCRUD(auth).delete(ids=ids)
 
     @classmethod
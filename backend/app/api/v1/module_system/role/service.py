@@ -111,10 +111,7 @@ class RoleService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            role = await RoleCRUD(auth).get_by_id_crud(id=id)
-            if not role:
-                raise CustomException(msg="删除失败，该角色不存在")
+        await RoleCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await RoleCRUD(auth).delete(ids=ids)
 
     @classmethod
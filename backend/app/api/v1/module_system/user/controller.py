@@ -1,8 +1,9 @@
 import urllib.parse
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, Request, UploadFile
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.module_system.auth.schema import AuthSchema
@@ -10,9 +11,10 @@ from app.common.request import PaginationService
 from app.common.response import ResponseSchema, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission, db_getter, get_current_user
+from app.core.dependencies import AuthPermission, db_getter, get_current_user, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
+from app.core.task_queue import TaskQueue
 from app.utils.common_util import bytes2file_response
 
 from .schema import (
@@ -439,19 +441,57 @@ async def export_obj_list_controller(
 async def import_obj_list_controller(
     file: UploadFile,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:import"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    job_id: Annotated[str | None, Query(description="导入任务ID(用于查询导入进度)")] = None,
 ) -> JSONResponse:
     """
     导入用户
 
     参数:
-    - file (UploadFile): 用户导入文件
+    - file (UploadFile): 用户导入文件(xlsx/csv)
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+    - job_id (str | None): 导入任务ID
 
     返回:
     - JSONResponse: 导入用户JSON响应
     """
     batch_import_result = await UserService.batch_import_user_service(
-        file=file, auth=auth, update_support=True
+        file=file, auth=auth, update_support=True, redis=redis, job_id=job_id
     )
     log.info(f"导入用户成功: {batch_import_result}")
     return SuccessResponse(data=batch_import_result, msg="导入用户成功")
+
+
+@UserRouter.post(
+    "/import/task",
+    summary="提交导入用户任务",
+    description="后台导入用户，通过任务接口查询进度与结果",
+    response_model=ResponseSchema[dict],
+)
+async def import_obj_list_task_controller(
+    file: UploadFile,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_system:user:import"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    提交导入用户任务
+
+    参数:
+    - file (UploadFile): 用户导入文件(xlsx/csv)
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskQueue.submit(
+        redis=redis,
+        func=UserService.batch_import_user_task_service,
+        task_type="import",
+        title=f"导入用户: {file.filename}",
+        auth=auth,
+        file=file,
+    )
+    log.info(f"提交导入用户任务成功 {result_dict['task_id']}")
+    return SuccessResponse(data=result_dict, msg="提交导入用户任务成功")
@@ -1,8 +1,8 @@
-import io
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-import pandas as pd
 from fastapi import UploadFile
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.api.v1.module_system.dept.crud import DeptCRUD
@@ -10,9 +10,10 @@ from app.api.v1.module_system.menu.crud import MenuCRUD
 from app.api.v1.module_system.menu.schema import MenuOutSchema
 from app.api.v1.module_system.position.crud import PositionCRUD
 from app.api.v1.module_system.role.crud import RoleCRUD
+from app.core.base_import import ImportColumn, ImportEngine, map_values, to_int, to_text
 from app.core.base_schema import BatchSetAvailable, UploadResponseSchema
 from app.core.exceptions import CustomException
-from app.core.logger import log
+from app.core.task_queue import TaskContext
 from app.utils.common_util import traversal_to_tree
 from app.utils.excel_util import ExcelUtil
 from app.utils.hash_bcrpy_util import PwdUtil
@@ -225,15 +226,15 @@ class UserService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg="用户不存在")
+        users = await UserCRUD(auth).validate_ids(
+            ids=ids, msg="删除失败", fields=["id", "is_superuser", "status"]
+        )
+        for user in users:
             if user.is_superuser:
                 raise CustomException(msg="超级管理员不能删除")
             if user.status == "0":
                 raise CustomException(msg="用户已启用,不能删除")
-            if auth.user and auth.user.id == id:
+            if auth.user and auth.user.id == user.id:
                 raise CustomException(msg="不能删除当前登陆用户")
         # 删除用户角色关联数据
         await UserCRUD(auth).set_user_roles_crud(user_ids=ids, role_ids=[])
@@ -344,12 +345,11 @@ class UserService:
         返回:
         - None
         """
-        for id in data.ids:
-            user = await UserCRUD(auth).get_by_id_crud(id=id)
-            if not user:
-                raise CustomException(msg=f"用户ID {id} 不存在")
-            if user.is_superuser:
-                raise CustomException(msg="超级管理员状态不能修改")
+        users = await UserCRUD(auth).validate_ids(
+            ids=data.ids, msg="设置失败", fields=["id", "is_superuser"]
+        )
+        if any(user.is_superuser for user in users):
+            raise CustomException(msg="超级管理员状态不能修改")
         await UserCRUD(auth).set_available_crud(ids=data.ids, status=data.status)
 
     @classmethod
@@ -501,117 +501,82 @@ class UserService:
 
     @classmethod
     async def batch_import_user_service(
-        cls, auth: AuthSchema, file: UploadFile, update_support: bool = False
+        cls,
+        auth: AuthSchema,
+        file: UploadFile,
+        update_support: bool = False,
+        redis: Redis | None = None,
+        job_id: str | None = None,
+        progress: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> str:
         """
         批量导入用户
 
         参数:
         - auth (AuthSchema): 认证信息模型
-        - file (UploadFile): 上传的Excel文件
+        - file (UploadFile): 上传的Excel/CSV文件
         - update_support (bool, optional): 是否支持更新已存在用户. 默认值为False.
+        - redis (Redis | None): Redis 连接，提供时记录导入进度
+        - job_id (str | None): 导入任务ID，用于查询导入进度
+        - progress (Callable[[int, int], Awaitable[None]] | None): 进度回调(后台任务使用)
 
         返回:
         - str: 导入结果消息
         """
+        engine = ImportEngine(
+            crud=UserCRUD(auth),
+            columns=[
+                ImportColumn(header="部门编号", field="dept_id", required=True, converter=to_int),
+                ImportColumn(header="用户名", field="username", required=True, converter=to_text),
+                ImportColumn(header="名称", field="name", required=True, converter=to_text),
+                ImportColumn(header="邮箱", field="email", converter=to_text),
+                ImportColumn(header="手机号", field="mobile", converter=to_text),
+                ImportColumn(
+                    header="性别",
+                    field="gender",
+                    converter=map_values({"男": "1", "女": "2", "未知": "0"}),
+                    message="性别必须是'男'、'女'或'未知'",
+                ),
+                ImportColumn(
+                    header="状态",
+                    field="status",
+                    converter=map_values({"正常": "0", "停用": "1"}, default="0"),
+                    message="状态必须是'正常'或'停用'",
+                ),
+            ],
+            key="username",
+            schema=UserCreateSchema,
+            # 默认密码只计算一次哈希，仅用于新增用户
+            defaults={"password": PwdUtil.set_password_hash(password="123456")},
+            update_support=update_support,
+            existing_fields=["is_superuser"],
+            check_existing=lambda user: "超级管理员不允许修改" if user.is_superuser else None,
+        )
+        return await engine.run(file=file, redis=redis, job_id=job_id, progress=progress)
 
-        header_dict = {
-            "部门编号": "dept_id",
-            "用户名": "username",
-            "名称": "name",
-            "邮箱": "email",
-            "手机号": "mobile",
-            "性别": "gender",
-            "状态": "status",
-        }
+    @classmethod
+    async def batch_import_user_task_service(
+        cls, ctx: TaskContext, file_path: str, file_name: str, update_support: bool = True
+    ) -> str:
+        """
+        批量导入用户(后台任务)
 
-        try:
-            # 读取Excel文件
-            contents = await file.read()
-            df = pd.read_excel(io.BytesIO(contents))
-            await file.close()
-
-            if df.empty:
-                raise CustomException(msg="导入文件为空")
-
-            # 检查表头是否完整
-            missing_headers = [header for header in header_dict.keys() if header not in df.columns]
-            if missing_headers:
-                raise CustomException(msg=f"导入文件缺少必要的列: {', '.join(missing_headers)}")
-
-            # 重命名列名
-            df.rename(columns=header_dict, inplace=True)
-
-            # 验证必填字段
-            required_fields = ["username", "name", "dept_id"]
-            errors = []
-            for field in required_fields:
-                missing_rows = df[df[field].isnull()].index.tolist()
-                if missing_rows:
-                    field_name = next(k for k, v in header_dict.items() if v == field)
-                    rows_str = "、".join([str(i + 1) for i in missing_rows])
-                    errors.append(f"{field_name}不能为空，第{rows_str}行")
-
-            if errors:
-                raise CustomException(msg="；".join(errors))
-
-            error_msgs = []
-            success_count = 0
-            count = 0
-
-            # 处理每一行数据
-            for _index, row in df.iterrows():
-                try:
-                    count = count + 1
-                    # 数据转换
-                    gender = 1 if row["gender"] == "男" else (2 if row["gender"] == "女" else 1)
-                    status = "0" if row["status"] == "正常" else "1"
-
-                    # 构建用户数据
-                    user_data = {
-                        "username": str(row["username"]).strip(),
-                        "name": str(row["name"]).strip(),
-                        "email": str(row["email"]).strip(),
-                        "mobile": str(row["mobile"]).strip(),
-                        "gender": gender,
-                        "status": status,
-                        "dept_id": int(row["dept_id"]),
-                        "password": PwdUtil.set_password_hash(password="123456"),  # 设置默认密码
-                    }
-
-                    # 处理用户导入
-                    exists_user = await UserCRUD(auth).get_by_username_crud(
-                        username=user_data["username"]
-                    )
-                    if exists_user:
-                        # 检查是否是超级管理员
-                        if exists_user.is_superuser:
-                            error_msgs.append(f"第{count}行: 超级管理员不允许修改")
-                            continue
-                        if update_support:
-                            user_update_data = UserUpdateSchema(**user_data)
-                            await UserCRUD(auth).update(id=exists_user.id, data=user_update_data)
-                            success_count += 1
-                        else:
-                            error_msgs.append(f"第{count}行: 用户 {user_data['username']} 已存在")
-                    else:
-                        user_create_data = UserCreateSchema(**user_data)
-                        await UserCRUD(auth).create(data=user_create_data)
-                        success_count += 1
-
-                except Exception as e:
-                    error_msgs.append(f"第{count}行: 异常{e!s}")
-                    continue
-
-            # 返回详细的导入结果
-            result = f"成功导入 {success_count} 条数据"
-            if error_msgs:
-                result += "\n错误信息:\n" + "\n".join(error_msgs)
-            return result
-
-        except Exception as e:
-            log.error(f"批量导入用户失败: {e!s}")
-            raise CustomException(msg=f"导入失败: {e!s}")
+        参数:
+        - ctx (TaskContext): 任务上下文
+        - file_path (str): 已保存的导入文件路径
+        - file_name (str): 原始文件名
+        - update_support (bool): 是否支持更新已存在用户
+
+        返回:
+        - str: 导入结果消息
+        """
+        async with ctx.auth() as auth:
+            return await cls.batch_import_user_service(
+                auth=auth,
+                file=TaskContext.upload_file(file_path, file_name),
+                update_support=update_support,
+                progress=ctx.progress,
+            )
 
     @classmethod
     async def get_import_template_user_service(cls) -> bytes:
@@ -43,12 +43,28 @@ class RedisInitKeyConfig(Enum):
     ACCESS_TOKEN = {"key": "access_token", "remark": "登录令牌信息"}
     REFRESH_TOKEN = {"key": "refresh_token", "remark": "刷新令牌信息"}
     CAPTCHA_CODES = {"key": "captcha_codes", "remark": "图片验证码"}
+    CAPTCHA_POOL = {"key": "captcha_pool", "remark": "预生成验证码池"}
     SYSTEM_CONFIG = {"key": "system_config", "remark": "系统配置"}
     SYSTEM_DICT = {"key": "system_dict", "remark": "数据字典"}
+    SYSTEM_DICT_VERSION = {"key": "system_dict_version", "remark": "数据字典版本号"}
+    SYSTEM_DICT_CHANNEL = {"key": "system_dict_channel", "remark": "数据字典变更通知频道"}
     APSCHEDULER_LOCK_KEY = {
         "key": "scheduler_job_lock",
         "remark": "定时任务初始化锁",
     }
+    APSCHEDULER_LEADER_KEY = {"key": "scheduler_leader", "remark": "定时任务调度主节点"}
+    APSCHEDULER_MEMBERS_KEY = {"key": "scheduler_members", "remark": "定时任务调度节点"}
+    APSCHEDULER_RUN_NOW_KEY = {"key": "scheduler_run_now", "remark": "定时任务立即执行请求"}
+    APSCHEDULER_STREAM_KEY = {"key": "scheduler_job_stream", "remark": "定时任务执行队列"}
+    APSCHEDULER_JOB_STATS_KEY = {"key": "scheduler_job_stats", "remark": "定时任务运行统计"}
+    UPLOAD_SESSION_KEY = {"key": "upload_session", "remark": "分片上传会话"}
+    UPLOAD_OBJECT_REFS_KEY = {"key": "upload_object_refs", "remark": "上传文件内容引用计数"}
+    UPLOAD_OBJECT_OWNERS_KEY = {"key": "upload_object_owners", "remark": "上传文件内容所属用户"}
+    DB_PRIMARY_STICKY = {"key": "db_primary_sticky", "remark": "写操作后读主库标记"}
+    REQUEST_PROFILE = {"key": "request_profile", "remark": "请求剖析记录"}
+    IMPORT_JOB = {"key": "import_job", "remark": "数据导入进度"}
+    TASK_QUEUE = {"key": "task_queue", "remark": "后台任务队列"}
+    TASK_STATE = {"key": "task_state", "remark": "后台任务状态与进度"}
 
     @property
     def key(self) -> str:
@@ -81,6 +97,7 @@ class McpLLMProvider(Enum):
 @unique
 class QueueEnum(str, Enum):
     """队列枚举"""
+
     none = "None"
     not_none = "not None"
     date = "date"
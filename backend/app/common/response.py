@@ -1,3 +1,4 @@
+import uuid
 from collections.abc import Mapping
 from typing import Any, Generic
 
@@ -5,6 +6,7 @@ from fastapi import status
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from pydantic.types import T
+from pydantic_core import to_json
 from starlette.background import BackgroundTask
 
 from app.common.constant import RET
@@ -20,7 +22,60 @@ class ResponseSchema(BaseModel, Generic[T]):
     success: bool = Field(default=True, description="操作是否成功")
 
 
-class SuccessResponse(JSONResponse):
+class RawJSON:
+    """
+    已序列化的 JSON 片段
+
+    作为响应数据（或其中的任意嵌套值）时原样拼接到响应体，不再重复序列化。
+    """
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: bytes | str) -> None:
+        self.content = content.encode("utf-8") if isinstance(content, str) else content
+
+
+def render_json(content: Any) -> bytes:
+    """
+    一次遍历将内容序列化为 JSON 字节（pydantic-core）。
+    - 备注：原生支持 datetime/date/Decimal/UUID/Enum/pydantic 模型；RawJSON 片段原样拼接。
+
+    参数:
+    - content (Any): 待序列化内容。
+
+    返回:
+    - bytes: JSON 字节串。
+
+    异常:
+    - PydanticSerializationError: 包含无法序列化的类型时抛出(不会静默转换为字符串)。
+    """
+    if isinstance(content, RawJSON):
+        return content.content
+
+    fragments: list[bytes] = []
+    nonce = uuid.uuid4().hex
+
+    def fallback(value: Any) -> Any:
+        if isinstance(value, RawJSON):
+            # 先以唯一占位符序列化，再替换为原始片段
+            fragments.append(value.content)
+            return f"{nonce}:{len(fragments) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    body = to_json(content, fallback=fallback)
+    for index, fragment in enumerate(fragments):
+        body = body.replace(f'"{nonce}:{index}"'.encode(), fragment, 1)
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    """高性能 JSON 响应类：使用 pydantic-core 直接序列化为字节，支持 RawJSON 片段直通"""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+class SuccessResponse(FastJSONResponse):
     """成功响应类"""
 
     def __init__(
@@ -44,17 +99,18 @@ class SuccessResponse(JSONResponse):
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success,
-        ).model_dump()
+        # 字段与 ResponseSchema 一致，直接构建响应体，避免模型校验与 model_dump 的额外遍历
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": data,
+            "status_code": status_code,
+            "success": success,
+        }
         super().__init__(content=content, status_code=status_code)
 
 
-class ErrorResponse(JSONResponse):
+class ErrorResponse(FastJSONResponse):
     """错误响应类"""
 
     def __init__(
@@ -78,13 +134,14 @@ class ErrorResponse(JSONResponse):
         返回:
         - None
         """
-        content = ResponseSchema(
-            code=code,
-            msg=msg,
-            data=data,
-            status_code=status_code,
-            success=success,
-        ).model_dump()
+        # 字段与 ResponseSchema 一致，直接构建响应体，避免模型校验与 model_dump 的额外遍历
+        content = {
+            "code": code,
+            "msg": msg,
+            "data": data,
+            "status_code": status_code,
+            "success": success,
+        }
         super().__init__(content=content, status_code=status_code)
 
 
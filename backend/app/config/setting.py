@@ -70,6 +70,7 @@ class Settings(BaseSettings):
     TOKEN_TYPE: str = "bearer"  # token类型
     TOKEN_REQUEST_PATH_EXCLUDE: list[str] = ["api/v1/auth/login"]  # JWT / RBAC 路由白名单
     TOKEN_SLIDING_EXPIRE: bool = True  # 是否启用滑动过期(用户操作时自动续期)
+    TOKEN_CACHE_SIZE: int = 10000  # 已验证令牌缓存数量(跳过重复验签与解析)，0 表示关闭
 
     # ================================================= #
     # ******************** 数据库配置 ******************* #
@@ -96,6 +97,15 @@ class Settings(BaseSettings):
     DATABASE_PASSWORD: str = "ServBay.dev"
     DATABASE_NAME: str = "fastapiadmin"
 
+    # 只读副本(与主库同账号、同库名；未配置主机时读写均走主库，SQLite 不支持)
+    DATABASE_REPLICA_HOST: str | None = None  # 只读副本主机
+    DATABASE_REPLICA_PORT: int | None = None  # 只读副本端口(默认同主库)
+    REPLICA_POOL_SIZE: int = 10  # 只读副本连接池大小
+    REPLICA_MAX_OVERFLOW: int = 20  # 只读副本最大溢出连接数
+    REPLICA_MAX_LAG: float = 5.0  # 允许的最大复制延迟(秒)，超过时读请求回退主库
+    REPLICA_LAG_CHECK_INTERVAL: int = 5  # 复制延迟检测间隔(秒)
+    REPLICA_STICKY_SECONDS: int = 10  # 写操作后同一客户端读主库的时长(秒)，保证读己之写
+
     # ================================================= #
     # ******************** Redis配置 ******************* #
     # ================================================= #
@@ -105,6 +115,7 @@ class Settings(BaseSettings):
     REDIS_DB_NAME: int = 1
     REDIS_USER: str = ""
     REDIS_PASSWORD: str = ""
+    DICT_NEAR_CACHE_ENABLE: bool = True  # 是否启用进程内数据字典近端缓存(订阅变更通知失效)
 
     # ================================================= #
     # ******************** 验证码配置 ******************* #
@@ -113,12 +124,19 @@ class Settings(BaseSettings):
     CAPTCHA_EXPIRE_SECONDS: int = 60 * 1  # 验证码过期时间(秒) 1分钟
     CAPTCHA_FONT_SIZE: int = 40  # 字体大小
     CAPTCHA_FONT_PATH: str = "static/assets/font/Arial.ttf"  # 字体路径
+    CAPTCHA_POOL_ENABLE: bool = True  # 是否启用预生成验证码池(后台线程生成，Redis 列表共享)
+    CAPTCHA_POOL_SIZE: int = 500  # 验证码池容量
+    CAPTCHA_POOL_LOW_WATERMARK: int = 100  # 池内剩余数量低于该值时后台补充至容量
+    CAPTCHA_POOL_WORKERS: int = 2  # 生成验证码的后台线程数
 
     # ================================================= #
     # ********************* 日志配置 ******************* #
     # ================================================= #
     OPERATION_LOG_RECORD: bool = True  # 是否记录操作日志
-    IGNORE_OPERATION_FUNCTION: list[str] = ["get_captcha_for_login"]  # 忽略记录的函数
+    IGNORE_OPERATION_FUNCTION: list[str] = [  # 忽略记录的函数
+        "get_captcha_for_login",
+        "multipart_part_controller",  # 分片上传请求体为流式二进制，不记录
+    ]
     OPERATION_RECORD_METHOD: list[str] = [
         "POST",
         "PUT",
@@ -134,6 +152,12 @@ class Settings(BaseSettings):
     GZIP_ENABLE: bool = True  # 是否启用Gzip
     GZIP_MIN_SIZE: int = 1000  # 最小压缩大小(字节)
     GZIP_COMPRESS_LEVEL: int = 9  # 压缩级别(1-9)
+    GZIP_EXCLUDED_MEDIA_TYPES: list[str] = [  # 不压缩的响应类型
+        "text/event-stream",
+        "multipart/byteranges",
+        "application/zip",
+        "application/gzip",
+    ]
 
     # ================================================= #
     # ***************** 静态文件配置 ***************** #
@@ -142,6 +166,16 @@ class Settings(BaseSettings):
     STATIC_URL: str = "/static"  # 访问路由
     STATIC_DIR: str = "static"  # 目录名
     STATIC_ROOT: Path = BASE_DIR.joinpath(STATIC_DIR)  # 绝对路径
+    RESOURCE_INDEX_MAX_DIRS: int = 2000  # 资源目录索引最多缓存的目录数(LRU)
+    RESOURCE_INDEX_TTL: int = 60  # 目录索引最长复用时间(秒)，兜底文件内容被外部修改的情况
+    RESOURCE_INDEX_WATCH: bool = False  # 是否监听文件变更(inotify)主动失效索引，需安装 watchfiles
+
+    # ================================================= #
+    # ***************** 服务器监控配置 ***************** #
+    # ================================================= #
+    SERVER_MONITOR_INTERVAL: float = 5  # 服务器指标后台采样间隔(秒)
+    SERVER_MONITOR_DISK_INTERVAL: float = 60  # 磁盘分区采样间隔(秒)
+    SERVER_MONITOR_HISTORY: int = 360  # 保留的历史采样点数(环形缓冲区容量)
 
     # ================================================= #
     # ***************** 动态文件配置 ***************** #
@@ -159,6 +193,29 @@ class Settings(BaseSettings):
         ".xlsx",
     ]
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 最大文件大小(10MB)
+    MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # 分片上传默认分片大小(8MB)
+    MULTIPART_MIN_PART_SIZE: int = 5 * 1024 * 1024  # 分片上传最小分片大小(5MB，最后一个分片除外)
+    MULTIPART_MAX_PART_SIZE: int = 64 * 1024 * 1024  # 分片上传单个分片最大大小(64MB)
+    MULTIPART_MAX_PARTS: int = 10000  # 分片上传最大分片数量
+    MULTIPART_MAX_FILE_SIZE: int = 20 * 1024 * 1024 * 1024  # 分片上传最大文件大小(20GB)
+    MULTIPART_SESSION_EXPIRE: int = 24 * 60 * 60  # 分片上传会话有效期(秒)，过期后需重新上传
+    MULTIPART_ALLOWED_EXTENSIONS: list[str] = [  # 分片上传额外允许的文件类型(模型、数据集)
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bin",
+        ".pt",
+        ".pth",
+        ".onnx",
+        ".safetensors",
+        ".csv",
+        ".json",
+        ".jsonl",
+        ".parquet",
+    ]
+    IMPORT_CHUNK_SIZE: int = 1000  # 数据导入分块行数(每块一次查重查询与批量写入)
+    IMPORT_MAX_ERRORS: int = 200  # 导入结果中保留的错误信息条数
+    IMPORT_PROGRESS_EXPIRE: int = 60 * 60  # 导入进度保留时间(秒)
 
     # ================================================= #
     # ***************** Swagger配置 ***************** #
@@ -174,12 +231,71 @@ class Settings(BaseSettings):
     OPENAI_BASE_URL: str = ""
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = ""
+    AI_CHAT_MEMORY_TURNS: int = 20  # WebSocket 对话每个连接保留的最大轮数
+    AI_CHAT_MEMORY_TOKENS: int = 4000  # 携带的上下文估算 token 上限(超出时截断更早的轮次)
+    MCP_ENABLE: bool = (
+        False  # 是否连接已配置的 MCP 服务器并向对话提供工具(仅限拥有工具调用权限的用户)
+    )
+    MCP_SERVER_CONCURRENCY: int = 4  # 单个 MCP 服务器同时执行的工具调用数
+    MCP_CONNECT_TIMEOUT: float = 30  # MCP 服务器连接/健康检查超时(秒)
+    MCP_CALL_TIMEOUT: float = 60  # MCP 工具调用超时(秒)
+    MCP_HEALTH_INTERVAL: float = 30  # MCP 配置同步与健康检查间隔(秒)
+    MCP_MAX_TOOL_ROUNDS: int = 5  # 单次对话最多的工具调用轮数
+
+    # ================================================= #
+    # ******************* 定时任务配置 ****************** #
+    # ================================================= #
+    # 调度模式: lock(每个实例都触发,靠任务锁竞争) | leader(选主,仅主节点调度) | shard(按任务哈希分片)
+    SCHEDULER_MODE: Literal["lock", "leader", "shard"] = "lock"
+    SCHEDULER_HEARTBEAT_SECONDS: int = 10  # 选主/分片心跳间隔(秒)
+    SCHEDULER_THREAD_WORKERS: int = 10  # 线程池执行器最大线程数
+    SCHEDULER_PROCESS_WORKERS: int = 2  # 进程池执行器最大进程数
+    SCHEDULER_STREAM_MAXLEN: int = 10000  # Redis Stream 队列最大长度
+    SCHEDULER_STREAM_CONCURRENCY: int = 4  # 单个任务工作进程的最大并发数
+    SCHEDULER_LOG_BUFFER_SIZE: int = 10000  # 执行日志缓冲队列容量(满时丢弃)
+    SCHEDULER_LOG_BATCH_SIZE: int = 200  # 执行日志单批写入条数
+    SCHEDULER_LOG_FLUSH_SECONDS: float = 2.0  # 执行日志最长刷新间隔(秒)
+
+    # ================================================= #
+    # ******************* 后台任务配置 ****************** #
+    # ================================================= #
+    TASK_WORKER_EMBEDDED: bool = True  # 是否在 Web 进程内启动任务工作进程(否则运行 task-worker)
+    TASK_WORKER_CONCURRENCY: int = 4  # 单个任务工作进程的最大并发任务数
+    TASK_DEFAULT_CONCURRENCY: int = 2  # 未单独配置的任务类型在单个工作进程内的最大并发数
+    TASK_TYPE_CONCURRENCY: dict[str, int] = {  # 各任务类型在单个工作进程内的最大并发数
+        "import": 2,
+        "export": 2,
+        "gencode": 1,
+    }
+    TASK_QUEUE_MAXLEN: int = 10000  # 任务队列(Redis Stream)最大长度
+    TASK_STATE_EXPIRE: int = 24 * 60 * 60  # 任务状态与进度事件保留时间(秒)
+    TASK_ARTIFACT_DIR: Path = BASE_DIR.joinpath("tasks")  # 任务文件目录(不可位于静态目录下)
+    TASK_ARTIFACT_EXPIRE: int = 24 * 60 * 60  # 任务产物保留时间(秒)，过期后由工作进程清理
 
     # ================================================= #
     # ******************* 请求限制配置 ****************** #
     # ================================================= #
     REQUEST_LIMITER_REDIS_PREFIX: str = "fastapiadmin:request_limiter:"
 
+    # ================================================= #
+    # ******************* 监控指标配置 ****************** #
+    # ================================================= #
+    METRICS_ENABLE: bool = False  # 是否启用 Prometheus 监控指标
+    METRICS_URL: str = "/metrics"  # 指标采集路径(不在 API 前缀下，建议仅对内网开放)
+    METRICS_TOKEN: str = ""  # 采集口令(Authorization: Bearer)，为空时仅允许本机直连采集
+    SLOW_QUERY_THRESHOLD: float = 0.5  # 慢查询阈值(秒)
+    SLOW_QUERY_SAMPLE_RATE: float = 1.0  # 慢查询日志采样率(0~1)，慢查询计数不受影响
+
+    # 请求剖析(按请求头或采样触发，记录调用栈火焰图与 DB/Redis/HTTP 耗时时间线)
+    PROFILE_ENABLE: bool = False  # 是否启用请求剖析
+    PROFILE_HEADER: str = "X-Profile"  # 触发剖析的请求头，值需与 PROFILE_TOKEN 一致
+    PROFILE_TOKEN: str = ""  # 请求头触发口令，为空时不允许请求头触发
+    PROFILE_SAMPLE_RATE: float = 0.0  # 随机采样率(0~1)，采样请求仅在超过慢请求阈值时保存
+    PROFILE_SLOW_THRESHOLD: float = 1.0  # 慢请求阈值(秒)
+    PROFILE_INTERVAL: float = 0.001  # 采样间隔(秒)
+    PROFILE_RING_SIZE: int = 100  # 保留的剖析记录数(Redis 环形列表)
+    PROFILE_EXPIRE_SECONDS: int = 60 * 60 * 24  # 火焰图保留时间(秒)
+
     # ================================================= #
     # ******************* 重构配置 ******************* #
     # ================================================= #
@@ -189,6 +305,7 @@ class Settings(BaseSettings):
         # 中间件列表
         MIDDLEWARES: list[str | None] = [
             "app.core.middlewares.CustomCORSMiddleware" if self.CORS_ORIGIN_ENABLE else None,
+            "app.core.metrics.MetricsMiddleware" if self.METRICS_ENABLE else None,
             "app.core.middlewares.RequestLogMiddleware" if self.OPERATION_LOG_RECORD else None,
             "app.core.middlewares.CustomGZipMiddleware" if self.GZIP_ENABLE else None,
         ]
@@ -218,6 +335,17 @@ class Settings(BaseSettings):
             db_connect = f"sqlite+aiosqlite:///{self.DATABASE_NAME}.db"
         return db_connect
 
+    @property
+    def ASYNC_DB_REPLICA_URI(self) -> str | None:
+        """获取异步只读副本连接(未配置副本或使用 SQLite 时返回 None)"""
+        if not self.DATABASE_REPLICA_HOST or self.DATABASE_TYPE == "sqlite":
+            return None
+        host = self.DATABASE_REPLICA_HOST
+        port = self.DATABASE_REPLICA_PORT or self.DATABASE_PORT
+        if self.DATABASE_TYPE == "mysql":
+            return f"mysql+asyncmy://{self.DATABASE_USER}:{quote_plus(self.DATABASE_PASSWORD)}@{host}:{port}/{self.DATABASE_NAME}?charset=utf8mb4"
+        return f"postgresql+asyncpg://{self.DATABASE_USER}:{quote_plus(self.DATABASE_PASSWORD)}@{host}:{port}/{self.DATABASE_NAME}"
+
     @property
     def DB_URI(self) -> str:
         """获取同步数据库连接"""
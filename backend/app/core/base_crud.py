@@ -1,17 +1,22 @@
 import builtins
 from collections.abc import Sequence
+from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pydantic import BaseModel
-from sqlalchemy import Select, asc, delete, desc, func, select, update
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, asc, delete, desc, func, insert, select, tuple_, update
 from sqlalchemy import inspect as sa_inspect
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.response import RawJSON, render_json
 from app.core.base_model import MappedBase
+from app.core.database import check_writable
 from app.core.exceptions import CustomException
 from app.core.permission import Permission
+from app.core.row_serializer import RowSerializer
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Result
@@ -22,6 +27,18 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 OutSchemaType = TypeVar("OutSchemaType", bound=BaseModel)
 
 
+# 批量写入单批行数
+BULK_BATCH_SIZE = 1000
+# 批量插入或更新时，冲突行默认保留的字段
+UPSERT_KEEP_FIELDS = frozenset({"id", "uuid", "created_id", "created_time"})
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """获取输出模型列表的 TypeAdapter（按模型缓存，避免重复构建校验器）"""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """基础数据层"""
 
@@ -68,11 +85,65 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"获取查询失败: {e!s}")
 
+    async def validate_ids(
+        self,
+        ids: Sequence[Any],
+        msg: str = "操作失败",
+        preload: builtins.list[str | Any] | None = None,
+        fields: builtins.list[str] | None = None,
+    ) -> builtins.list[ModelType]:
+        """
+        批量校验对象存在且在数据权限范围内(单次查询)
+
+        参数:
+        - ids (Sequence[Any]): 主键列表(重复的主键只校验一次)
+        - msg (str): 校验失败时的提示前缀
+        - preload (Optional[List[Union[str, Any]]]): 预加载关系，支持关系名字符串或SQLAlchemy loader option
+        - fields (Optional[List[str]]): 投影字段，只加载这些列（及其中的关系）
+
+        返回:
+        - List[ModelType]: 按请求顺序排列的对象列表，可用于后续的缓存清理等操作
+
+        异常:
+        - CustomException: 存在不存在或无权限访问的主键时抛出异常，提示中列出这些主键
+        """
+        try:
+            unique_ids = builtins.list(dict.fromkeys(ids))
+            if not unique_ids:
+                return []
+            pk_col = self.__single_pk("校验")
+            pk_key = sa_inspect(self.model).get_property_by_column(pk_col).key
+            sql = select(self.model).where(pk_col.in_(unique_ids))
+            for opt in self.__loader_options(preload, fields):
+                sql = sql.options(opt)
+            sql = await self.__filter_permissions(sql)
+            result: Result = await self.auth.db.execute(sql)
+            found = {getattr(obj, pk_key): obj for obj in result.scalars().all()}
+            absent = [id for id in unique_ids if id not in found]
+            if absent:
+                # 仅在校验失败时再查一次(不过滤权限)，区分不存在与无权限
+                result = await self.auth.db.execute(select(pk_col).where(pk_col.in_(absent)))
+                existing = set(result.scalars().all())
+                missing = [str(id) for id in absent if id not in existing]
+                forbidden = [str(id) for id in absent if id in existing]
+                reasons = []
+                if missing:
+                    reasons.append(f"ID为{', '.join(missing)}的数据不存在")
+                if forbidden:
+                    reasons.append(f"ID为{', '.join(forbidden)}的数据无权限访问")
+                raise CustomException(msg=f"{msg}，{'；'.join(reasons)}")
+            return [found[id] for id in unique_ids]
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量校验失败: {e!s}")
+
     async def list(
         self,
         search: dict | None = None,
         order_by: list[dict[str, str]] | None = None,
         preload: list[str | Any] | None = None,
+        fields: list[str] | None = None,
     ) -> Sequence[ModelType]:
         """
         根据条件获取对象列表
@@ -81,6 +152,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - search (Optional[Dict]): 查询条件,格式为 {'id': value, 'name': value}
         - order_by (Optional[List[Dict[str, str]]]): 排序字段,格式为 [{'id': 'asc'}, {'name': 'desc'}]
         - preload (Optional[List[Union[str, Any]]]): 预加载关系，支持关系名字符串或SQLAlchemy loader option
+        - fields (Optional[List[str]]): 投影字段，只加载这些列（及其中的关系），访问未加载的列将报错
 
         返回:
         - Sequence[ModelType]: 对象列表
@@ -93,7 +165,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             order = order_by or [{"id": "asc"}]
             sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
             # 应用可配置的预加载选项
-            for opt in self.__loader_options(preload):
+            for opt in self.__loader_options(preload, fields):
                 sql = sql.options(opt)
             sql = await self.__filter_permissions(sql)
             result: Result = await self.auth.db.execute(sql)
@@ -101,12 +173,53 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"列表查询失败: {e!s}")
 
+    async def list_dict(
+        self,
+        out_schema: type[OutSchemaType],
+        search: dict | None = None,
+        order_by: builtins.list[dict[str, str]] | None = None,
+        fields: builtins.list[str] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
+        """
+        根据条件获取输出模型字典列表（等价于对 list 结果逐个 model_validate().model_dump()）
+
+        参数:
+        - out_schema (Type[OutSchemaType]): 输出数据模型
+        - search (Optional[Dict]): 查询条件,格式为 {'id': value, 'name': value}
+        - order_by (Optional[List[Dict[str, str]]]): 排序字段,格式为 [{'id': 'asc'}, {'name': 'desc'}]
+        - fields (Optional[List[str]]): 输出字段，未提供时输出除模型大字段（__deferred_columns__）外的全部字段
+
+        返回:
+        - List[Dict[str, Any]]: 字典列表
+
+        异常:
+        - CustomException: 查询失败时抛出异常
+        """
+        plan = RowSerializer.get_plan(self.model, out_schema, fields)
+        if plan is None:
+            # 输出模型包含无法按列还原的字段，回退到 ORM 对象校验
+            objs = await self.list(search=search, order_by=order_by)
+            return [
+                out_schema.model_validate(obj).model_dump(include=self.__include(fields))
+                for obj in objs
+            ]
+        try:
+            conditions = await self.__build_conditions(**search) if search else []
+            order = order_by or [{"id": "asc"}]
+            sql = plan.statement().where(*conditions).order_by(*self.__order_by(order))
+            sql = await self.__filter_permissions(sql)
+            result: Result = await self.auth.db.execute(sql)
+            return plan.to_dicts(result.all())
+        except Exception as e:
+            raise CustomException(msg=f"列表查询失败: {e!s}")
+
     async def tree_list(
         self,
         search: dict | None = None,
         order_by: builtins.list[dict[str, str]] | None = None,
         children_attr: str = "children",
         preload: builtins.list[str | Any] | None = None,
+        fields: builtins.list[str] | None = None,
     ) -> Sequence[ModelType]:
         """
         获取树形结构数据列表
@@ -116,6 +229,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - order_by (Optional[List[Dict[str, str]]]): 排序字段
         - children_attr (str): 子节点属性名
         - preload (Optional[List[Union[str, Any]]]): 额外预加载关系，若为None则默认包含children_attr
+        - fields (Optional[List[str]]): 投影字段，只加载这些列（及其中的关系），访问未加载的列将报错
 
         返回:
         - Sequence[ModelType]: 树形结构数据列表
@@ -132,13 +246,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             final_preload = preload
             # 如果没有提供preload且children_attr存在，则添加到预加载选项中
             if preload is None and children_attr and hasattr(self.model, children_attr):
-                # 获取模型默认预加载选项
-                model_defaults = getattr(self.model, "__loader_options__", [])
+                # 获取模型默认预加载选项（指定投影字段时只加载其中的关系）
+                model_defaults = fields if fields else getattr(self.model, "__loader_options__", [])
                 # 将children_attr添加到默认预加载选项中
                 final_preload = [*list(model_defaults), children_attr]
 
             # 应用预加载选项
-            for opt in self.__loader_options(final_preload):
+            for opt in self.__loader_options(final_preload, fields):
                 sql = sql.options(opt)
 
             sql = await self.__filter_permissions(sql)
@@ -155,6 +269,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         search: dict,
         out_schema: type[OutSchemaType],
         preload: builtins.list[str | Any] | None = None,
+        serialize: bool = False,
+        fields: builtins.list[str] | None = None,
     ) -> dict:
         """
         获取分页数据
@@ -166,6 +282,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         - search (Dict): 查询条件
         - out_schema (Type[OutSchemaType]): 输出数据模型
         - preload (Optional[List[Union[str, Any]]]): 预加载关系
+        - serialize (bool): 是否直接将 items 序列化为 JSON 片段（RawJSON），仅用于直接返回响应、不再处理 items 的场景
+        - fields (Optional[List[str]]): 输出字段，未提供时输出除模型大字段（__deferred_columns__）外的全部字段
 
         返回:
         - Dict: 分页数据
@@ -176,11 +294,6 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         try:
             conditions = await self.__build_conditions(**search) if search else []
             order = order_by or [{"id": "asc"}]
-            sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
-            # 应用预加载选项
-            for opt in self.__loader_options(preload):
-                sql = sql.options(opt)
-            sql = await self.__filter_permissions(sql)
 
             # 优化count查询：使用主键计数而非全表扫描
             mapper = sa_inspect(self.model)
@@ -199,15 +312,44 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             total_result = await self.auth.db.execute(count_sql)
             total = total_result.scalar() or 0
 
-            result: Result = await self.auth.db.execute(sql.offset(offset).limit(limit))
-            objs = result.scalars().all()
+            plan = RowSerializer.get_plan(self.model, out_schema, fields)
+            if plan is not None:
+                # 只查询输出模型需要的列，由结果行直接构建字典，不实例化模型
+                sql = plan.statement().where(*conditions).order_by(*self.__order_by(order))
+                sql = await self.__filter_permissions(sql)
+                rows = (await self.auth.db.execute(sql.offset(offset).limit(limit))).all()
+                items: Any = plan.to_dicts(rows)
+                if serialize:
+                    items = RawJSON(render_json(items))
+            else:
+                sql = select(self.model).where(*conditions).order_by(*self.__order_by(order))
+                # 应用预加载选项
+                for opt in self.__loader_options(preload):
+                    sql = sql.options(opt)
+                sql = await self.__filter_permissions(sql)
+                result: Result = await self.auth.db.execute(sql.offset(offset).limit(limit))
+                objs = result.scalars().all()
+                if serialize:
+                    # ORM 对象校验后由 pydantic-core 一次序列化为 JSON，不生成中间字典
+                    adapter = _list_adapter(out_schema)
+                    items = RawJSON(
+                        adapter.dump_json(
+                            adapter.validate_python(objs, from_attributes=True),
+                            include={"__all__": self.__include(fields)} if fields else None,
+                        )
+                    )
+                else:
+                    include = self.__include(fields)
+                    items = [
+                        out_schema.model_validate(obj).model_dump(include=include) for obj in objs
+                    ]
 
             return {
                 "page_no": offset // limit + 1 if limit else 1,
                 "page_size": limit or 10,
                 "total": total,
                 "has_next": offset + limit < total,
-                "items": [out_schema.model_validate(obj).model_dump() for obj in objs],
+                "items": items,
             }
         except Exception as e:
             raise CustomException(msg=f"分页查询失败: {e!s}")
@@ -225,6 +367,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 创建失败时抛出异常
         """
+        check_writable(self.auth.db)
         try:
             obj_dict = data if isinstance(data, dict) else data.model_dump()
             obj = self.model(**obj_dict)
@@ -257,6 +400,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 更新失败时抛出异常
         """
+        check_writable(self.auth.db)
         try:
             obj_dict = (
                 data
@@ -302,6 +446,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 删除失败时抛出异常
         """
+        check_writable(self.auth.db)
         try:
             mapper = sa_inspect(self.model)
             pk_cols = list(getattr(mapper, "primary_key", []))
@@ -324,6 +469,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 清空失败时抛出异常
         """
+        check_writable(self.auth.db)
         try:
             sql = delete(self.model)
             await self.auth.db.execute(sql)
@@ -342,6 +488,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         异常:
         - CustomException: 更新失败时抛出异常
         """
+        check_writable(self.auth.db)
         try:
             mapper = sa_inspect(self.model)
             pk_cols = list(getattr(mapper, "primary_key", []))
@@ -359,6 +506,238 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except Exception as e:
             raise CustomException(msg=f"批量更新失败: {e!s}")
 
+    async def bulk_create(
+        self,
+        data: builtins.list[CreateSchemaType | dict],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> builtins.list[int]:
+        """
+        批量创建对象(多行 INSERT，不逐行 flush/refresh)
+
+        参数:
+        - data (List[Union[CreateSchemaType, Dict]]): 对象属性列表
+        - batch_size (int): 单批写入行数
+
+        返回:
+        - List[int]: 新对象主键列表(按输入顺序)，数据库不支持 RETURNING(MySQL)时返回空列表
+
+        异常:
+        - CustomException: 创建失败时抛出异常
+        """
+        check_writable(self.auth.db)
+        try:
+            pk_col = self.__single_pk("创建")
+            rows = self.__bulk_rows(data, created=True)
+            returning = self.auth.db.get_bind().dialect.insert_executemany_returning
+            ids: builtins.list[int] = []
+            for batch in self.__batches(rows, batch_size):
+                sql = insert(self.model)
+                if returning:
+                    result = await self.auth.db.execute(
+                        sql.returning(pk_col, sort_by_parameter_order=True), batch
+                    )
+                    ids.extend(result.scalars().all())
+                else:
+                    await self.auth.db.execute(sql, batch)
+            return ids
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量创建失败: {e!s}")
+
+    async def bulk_update(
+        self,
+        data: builtins.list[UpdateSchemaType | dict],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        按主键批量更新对象(executemany UPDATE)，每批只做一次数据权限校验
+
+        参数:
+        - data (List[Union[UpdateSchemaType, Dict]]): 对象属性列表，每项必须包含 id
+        - batch_size (int): 单批更新行数
+
+        返回:
+        - int: 更新的行数
+
+        异常:
+        - CustomException: 对象不存在、无权限或更新失败时抛出异常
+        """
+        check_writable(self.auth.db)
+        try:
+            pk_col = self.__single_pk("更新")
+            rows = self.__bulk_rows(data, created=False)
+            if any(row.get(pk_col.key) is None for row in rows):
+                raise CustomException(msg="批量更新的数据必须包含主键")
+            for batch in self.__batches(rows, batch_size):
+                ids = {row[pk_col.key] for row in batch}
+                allowed = await self.__permitted_ids(pk_col.in_(ids))
+                if len(allowed) != len(ids):
+                    raise CustomException(msg="更新失败，对象不存在或无权限访问")
+                await self.auth.db.execute(update(self.model), batch)
+            return len(rows)
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量更新失败: {e!s}")
+
+    async def upsert(
+        self,
+        data: builtins.list[CreateSchemaType | dict],
+        conflict: builtins.list[str],
+        update_fields: builtins.list[str] | None = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> builtins.list[int]:
+        """
+        批量插入或更新(PostgreSQL/SQLite: ON CONFLICT DO UPDATE，MySQL: ON DUPLICATE KEY UPDATE)
+
+        已存在的记录须在当前用户的数据权限范围内，每批只做一次校验；
+        更新时保留创建人/创建时间等字段，只更新 update_fields 与更新人。
+
+        参数:
+        - data (List[Union[CreateSchemaType, Dict]]): 对象属性列表
+        - conflict (List[str]): 冲突判定字段(需有唯一约束，MySQL 按表上任一唯一键判定)
+        - update_fields (Optional[List[str]]): 冲突时更新的字段，默认为除冲突字段与创建信息外的全部字段
+        - batch_size (int): 单批写入行数
+
+        返回:
+        - List[int]: 写入对象的主键列表，MySQL 不支持 RETURNING 时返回空列表
+
+        异常:
+        - CustomException: 无权限或写入失败时抛出异常
+        """
+        check_writable(self.auth.db)
+        try:
+            pk_col = self.__single_pk("写入")
+            columns = self.model.__table__.columns
+            unknown = [name for name in conflict if name not in columns]
+            if not conflict or unknown:
+                raise CustomException(msg=f"冲突字段无效: {unknown or conflict}")
+            dialect = self.auth.db.get_bind().dialect.name
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            elif dialect in ("mysql", "mariadb"):
+                from sqlalchemy.dialects.mysql import insert as dialect_insert
+            else:
+                raise CustomException(msg=f"数据库 {dialect} 不支持批量插入或更新")
+
+            rows = self.__bulk_rows(data, created=True)
+            ids: builtins.list[int] = []
+            for batch in self.__batches(rows, batch_size):
+                await self.__check_upsert_permission(batch, conflict)
+                # 多行 VALUES 要求各行字段一致，按字段集合分组执行
+                groups: dict[tuple[str, ...], builtins.list[dict]] = {}
+                for row in batch:
+                    groups.setdefault(tuple(sorted(row)), []).append(row)
+                for keys, group in groups.items():
+                    fields = [
+                        name
+                        for name in update_fields
+                        or [key for key in keys if key not in UPSERT_KEEP_FIELDS]
+                        if name in keys and name not in conflict
+                    ]
+                    # 冲突时至少更新审计字段，保证 RETURNING 返回已存在的行
+                    fields += [
+                        name
+                        for name in ("updated_id", "updated_time")
+                        if name in keys and name not in fields
+                    ]
+                    sql = dialect_insert(self.model).values(group)
+                    if dialect in ("mysql", "mariadb"):
+                        # 无可更新字段时以主键自赋值代替(语法要求至少一个字段)
+                        sql = sql.on_duplicate_key_update(
+                            {name: sql.inserted[name] for name in fields} or {pk_col.name: pk_col}
+                        )
+                        await self.auth.db.execute(sql)
+                        continue
+                    sql = (
+                        sql.on_conflict_do_update(
+                            index_elements=conflict,
+                            set_={name: sql.excluded[name] for name in fields},
+                        )
+                        if fields
+                        else sql.on_conflict_do_nothing(index_elements=conflict)
+                    ).returning(pk_col)
+                    result = await self.auth.db.execute(sql)
+                    ids.extend(result.scalars().all())
+            return ids
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(msg=f"批量插入或更新失败: {e!s}")
+
+    def __single_pk(self, action: str) -> ColumnElement:
+        """获取单一主键列"""
+        mapper = sa_inspect(self.model)
+        pk_cols = list(getattr(mapper, "primary_key", []))
+        if not pk_cols:
+            raise CustomException(msg=f"模型缺少主键，无法批量{action}")
+        if len(pk_cols) > 1:
+            raise CustomException(msg=f"暂不支持复合主键的批量{action}")
+        return pk_cols[0]
+
+    def __bulk_rows(self, data: builtins.list[Any], created: bool) -> builtins.list[dict[str, Any]]:
+        """
+        转换为表字段字典列表并批量填充审计字段(忽略非表字段)
+
+        参数:
+        - data (List[Any]): Pydantic 模型或字典列表
+        - created (bool): 是否为新增(新增时同时填充创建人)
+
+        返回:
+        - List[Dict[str, Any]]: 行数据列表
+        """
+        columns = self.model.__table__.columns
+        audit: dict[str, Any] = {}
+        if "updated_time" in columns:
+            audit["updated_time"] = datetime.now()
+        if self.auth.user:
+            if created and "created_id" in columns:
+                audit["created_id"] = self.auth.user.id
+            if "updated_id" in columns:
+                audit["updated_id"] = self.auth.user.id
+        rows = []
+        for item in data:
+            values = item if isinstance(item, dict) else item.model_dump(exclude_unset=not created)
+            row = {key: value for key, value in values.items() if key in columns}
+            row.update(audit)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def __batches(
+        rows: builtins.list[dict[str, Any]], batch_size: int
+    ) -> builtins.list[builtins.list[dict[str, Any]]]:
+        size = max(batch_size, 1)
+        return [rows[index : index + size] for index in range(0, len(rows), size)]
+
+    async def __permitted_ids(self, condition: ColumnElement) -> builtins.set[Any]:
+        """查询满足条件且在数据权限范围内的主键"""
+        pk_col = self.__single_pk("校验")
+        sql = await self.__filter_permissions(select(pk_col).where(condition))
+        result: Result = await self.auth.db.execute(sql)
+        return set(result.scalars().all())
+
+    async def __check_upsert_permission(
+        self, batch: builtins.list[dict[str, Any]], conflict: builtins.list[str]
+    ) -> None:
+        """校验本批中已存在的记录都在数据权限范围内(不受数据权限限制时跳过)"""
+        columns = self.model.__table__.columns
+        keys = [tuple(row.get(name) for name in conflict) for row in batch]
+        if len(conflict) == 1:
+            condition = columns[conflict[0]].in_([key[0] for key in keys])
+        else:
+            condition = tuple_(*(columns[name] for name in conflict)).in_(keys)
+        sql = select(self.__single_pk("校验")).where(condition)
+        filtered = await self.__filter_permissions(sql)
+        if filtered is sql:
+            return
+        existing = set((await self.auth.db.execute(sql)).scalars().all())
+        if existing and existing != set((await self.auth.db.execute(filtered)).scalars().all()):
+            raise CustomException(msg="写入失败，存在无权限访问的记录")
+
     async def __filter_permissions(self, sql: Select) -> Select:
         """
         过滤数据权限（仅用于Select）。
@@ -437,21 +816,51 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 columns.append(desc(column) if direction.lower() == "desc" else asc(column))
         return columns
 
+    @staticmethod
+    def __include(fields: builtins.list[str] | None) -> builtins.set[str] | None:
+        """输出字段集合（用于 model_dump 的 include）"""
+        return set(fields) if fields else None
+
     def __loader_options(
-        self, preload: builtins.list[str | Any] | None = None
+        self,
+        preload: builtins.list[str | Any] | None = None,
+        fields: builtins.list[str] | None = None,
     ) -> builtins.list[Any]:
         """
         构建预加载选项
 
         参数:
         - preload (Optional[List[Union[str, Any]]]): 预加载关系，支持关系名字符串或SQLAlchemy loader option
+        - fields (Optional[List[str]]): 投影字段，只加载其中的列；未指定 preload 时只预加载其中的关系
 
         返回:
         - List[Any]: 预加载选项列表
         """
         options = []
-        # 获取模型定义的默认加载选项
-        model_loader_options = getattr(self.model, "__loader_options__", [])
+        mapper = sa_inspect(self.model)
+        if fields:
+            relationships = [
+                mapper.relationships[name] for name in fields if name in mapper.relationships
+            ]
+            column_keys = {name for name in fields if name in mapper.column_attrs}
+            # 关系加载依赖的外键列一并加载
+            for relationship in relationships:
+                column_keys.update(
+                    mapper.get_property_by_column(column).key
+                    for column in relationship.local_columns
+                )
+            # 未加载的列和关系访问时直接报错，避免异步环境中的隐式查询
+            options.append(raiseload("*"))
+            if column_keys:
+                options.append(
+                    load_only(*(getattr(self.model, key) for key in column_keys), raiseload=True)
+                )
+        # 获取模型定义的默认加载选项（指定投影字段时关系需显式选择）
+        model_loader_options = (
+            [name for name in fields if name in mapper.relationships]
+            if fields
+            else getattr(self.model, "__loader_options__", [])
+        )
 
         # 合并所有需要预加载的选项
         all_preloads = set(model_loader_options)
@@ -0,0 +1,526 @@
+import asyncio
+import csv
+import dataclasses
+import io
+import os
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from typing import IO, Any
+
+import pandas as pd
+from fastapi import UploadFile
+from pydantic import BaseModel, ValidationError
+from redis.asyncio.client import Redis
+from sqlalchemy import select
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.base_crud import CRUDBase
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+# 支持的导入文件类型
+IMPORT_EXTENSIONS = (".xlsx", ".csv")
+
+
+@dataclasses.dataclass
+class ImportColumn:
+    """
+    导入列定义
+
+    - header: 文件表头
+    - field: 模型字段
+    - required: 是否必填
+    - converter: 整列转换函数(输入输出均为 pd.Series)，原值非空而转换结果为空视为不合法
+    - message: 转换不合法时的错误信息，默认为"{header}格式不正确"
+    """
+
+    header: str
+    field: str
+    required: bool = False
+    converter: Callable[[pd.Series], pd.Series] | None = None
+    message: str | None = None
+
+
+def map_values(mapping: dict[Any, Any], default: Any = None) -> Callable[[pd.Series], pd.Series]:
+    """
+    生成按映射表整列转换的函数(如 "正常" -> "0")。
+
+    参数:
+    - mapping (dict[Any, Any]): 原值到目标值的映射。
+    - default (Any): 原值为空时的默认值，为 None 时保持为空。
+
+    返回:
+    - Callable[[pd.Series], pd.Series]: 转换函数，映射表外的非空值转换为空(不合法)。
+    """
+
+    def converter(series: pd.Series) -> pd.Series:
+        converted = series.map(mapping)
+        if default is not None:
+            converted = converted.where(series.notna(), default)
+        return converted
+
+    return converter
+
+
+def to_text(series: pd.Series) -> pd.Series:
+    """整列转换为文本(整数值的数字单元格不带小数部分，如手机号)"""
+    return series.map(
+        lambda value: str(int(value)) if isinstance(value, float) and value.is_integer() else value,
+        na_action="ignore",
+    ).astype("string")
+
+
+def to_int(series: pd.Series) -> pd.Series:
+    """整列转换为整数，无法转换的值为空"""
+    return pd.to_numeric(series, errors="coerce").astype("Int64")
+
+
+class ImportProgress:
+    """
+    导入任务进度
+
+    进度以 Hash 保存在 Redis 中(键: import_job:<job_id>)，按块更新，过期时间 IMPORT_PROGRESS_EXPIRE；
+    字段: status(running/success/failed)、file_name、total(xlsx 可预估，csv 为 0)、processed、success、failed、message。
+    """
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{RedisInitKeyConfig.IMPORT_JOB.key}:{job_id}"
+
+    @classmethod
+    async def update(cls, redis: Redis | None, job_id: str, **fields: Any) -> None:
+        """
+        写入导入进度(未提供 Redis 连接时忽略，进度写入失败不影响导入)。
+
+        参数:
+        - redis (Redis | None): Redis 连接。
+        - job_id (str): 导入任务ID。
+        - **fields: 进度字段。
+
+        返回:
+        - None
+        """
+        if redis is None:
+            return
+        try:
+            key = cls._key(job_id)
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={name: str(value) for name, value in fields.items()})
+                pipe.expire(key, settings.IMPORT_PROGRESS_EXPIRE)
+                await pipe.execute()
+        except Exception as e:
+            log.warning(f"写入导入进度失败: {e!s}")
+
+    @classmethod
+    async def claim(cls, redis: Redis | None, job_id: str, user_id: int | None) -> None:
+        """
+        占用导入任务ID：客户端指定的 job_id 已被其他用户使用时拒绝，避免覆盖他人的导入进度。
+
+        参数:
+        - redis (Redis | None): Redis 连接。
+        - job_id (str): 导入任务ID。
+        - user_id (int | None): 当前用户ID。
+
+        返回:
+        - None
+
+        异常:
+        - CustomException: 导入任务ID已被其他用户使用时抛出。
+        """
+        if redis is None:
+            return
+        key, owner = cls._key(job_id), "" if user_id is None else str(user_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, "user_id", owner)
+            pipe.hget(key, "user_id")
+            pipe.expire(key, settings.IMPORT_PROGRESS_EXPIRE)
+            _, current, _ = await pipe.execute()
+        if current != owner:
+            raise CustomException(msg="导入任务ID已被占用，请重新生成")
+
+    @classmethod
+    async def get(cls, redis: Redis, job_id: str, user_id: int | None = None) -> dict[str, Any]:
+        """
+        查询导入进度。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - job_id (str): 导入任务ID。
+        - user_id (int | None): 当前用户ID，只能查询本人发起的导入任务。
+
+        返回:
+        - dict[str, Any]: 导入进度。
+
+        异常:
+        - CustomException: 导入任务不存在或已过期时抛出。
+        """
+        progress = await redis.hgetall(cls._key(job_id))
+        if not progress or (user_id is not None and progress.get("user_id") != str(user_id)):
+            raise CustomException(msg="导入任务不存在或已过期")
+        return {
+            "job_id": job_id,
+            "status": progress.get("status", ""),
+            "file_name": progress.get("file_name", ""),
+            "total": int(progress.get("total", 0)),
+            "processed": int(progress.get("processed", 0)),
+            "success": int(progress.get("success", 0)),
+            "failed": int(progress.get("failed", 0)),
+            "message": progress.get("message", ""),
+        }
+
+
+class ImportEngine:
+    """
+    通用流式导入引擎
+
+    - 读取: xlsx 使用 openpyxl 只读模式逐行读取，csv 使用 csv 模块逐行读取，按 IMPORT_CHUNK_SIZE 分块，不整表载入内存；
+    - 校验: 必填与列转换按块整列执行，可选的 Pydantic 模型逐行校验；
+    - 写入: 每块按唯一键一次 IN 查询已存在的记录，新增与更新分别批量写入(CRUDBase.bulk_create/bulk_update)，
+      每块在独立的保存点中执行，写入失败只回滚当前块；
+    - 进度: 每块处理完成后写入 ImportProgress。
+    """
+
+    def __init__(
+        self,
+        crud: CRUDBase,
+        columns: list[ImportColumn],
+        key: str | None = None,
+        schema: type[BaseModel] | None = None,
+        defaults: dict[str, Any] | None = None,
+        update_support: bool = False,
+        existing_fields: list[str] | None = None,
+        check_existing: Callable[[Any], str | None] | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """
+        初始化导入引擎
+
+        参数:
+        - crud (CRUDBase): 目标模型的数据层(携带认证信息与数据库会话)。
+        - columns (list[ImportColumn]): 导入列定义。
+        - key (str | None): 判定记录是否已存在的唯一字段，为空时全部新增。
+        - schema (type[BaseModel] | None): 逐行校验使用的 Pydantic 模型。
+        - defaults (dict[str, Any] | None): 新增记录的默认字段值(如初始密码)。
+        - update_support (bool): 是否更新已存在的记录。
+        - existing_fields (list[str] | None): 查询已存在记录时额外加载的字段(供 check_existing 使用)。
+        - check_existing (Callable[[Any], str | None] | None): 已存在记录的校验函数，返回错误信息时跳过该行。
+        - chunk_size (int | None): 分块行数，默认 IMPORT_CHUNK_SIZE。
+
+        返回:
+        - None
+        """
+        self.crud = crud
+        self.columns = columns
+        self.key = key
+        self.schema = schema
+        self.defaults = defaults or {}
+        self.update_support = update_support
+        self.existing_fields = existing_fields or []
+        self.check_existing = check_existing
+        self.chunk_size = max(chunk_size or settings.IMPORT_CHUNK_SIZE, 1)
+        self.success = 0
+        self.failed = 0
+        self.errors: list[str] = []
+        self._seen_keys: set[Any] = set()
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        """单元格取值，去除首尾空白，空字符串视为空"""
+        if isinstance(value, str):
+            return value.strip() or None
+        return value
+
+    @classmethod
+    def iter_chunks(
+        cls, file: IO[bytes], file_name: str, chunk_size: int
+    ) -> Iterator[tuple[int, pd.DataFrame]]:
+        """
+        逐块读取导入文件(同步，在线程池中执行)。
+
+        第一项为 (预估数据行数, 空 DataFrame(仅表头))，之后每项为 (0, 数据块)；
+        数据块的索引为数据行号(从 1 开始，不含表头)，整行为空的行跳过。
+
+        参数:
+        - file (IO[bytes]): 文件对象(需支持 seek)。
+        - file_name (str): 文件名，按扩展名判断文件类型。
+        - chunk_size (int): 分块行数。
+
+        返回:
+        - Iterator[tuple[int, pd.DataFrame]]: 数据块迭代器。
+
+        异常:
+        - CustomException: 文件类型不支持或文件为空时抛出。
+        """
+        ext = os.path.splitext(file_name or "")[1].lower()
+        if ext not in IMPORT_EXTENSIONS:
+            raise CustomException(msg=f"导入文件仅支持 {'、'.join(IMPORT_EXTENSIONS)} 格式")
+        file.seek(0)
+        workbook = None
+        try:
+            if ext == ".xlsx":
+                from openpyxl import load_workbook
+
+                workbook = load_workbook(file, read_only=True, data_only=True)
+                sheet = workbook.active
+                if sheet is None:
+                    raise CustomException(msg="导入文件为空")
+                rows: Iterator[tuple[Any, ...]] = sheet.iter_rows(values_only=True)
+                total = max((sheet.max_row or 1) - 1, 0)
+            else:
+                text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+                rows = (tuple(row) for row in csv.reader(text))
+                total = 0
+
+            header_row = next(rows, None)
+            if not header_row:
+                raise CustomException(msg="导入文件为空")
+            headers = [str(cls._cell(value) or "") for value in header_row]
+            yield total, pd.DataFrame(columns=headers)
+
+            width = len(headers)
+            index: list[int] = []
+            records: list[tuple[Any, ...]] = []
+            for number, row in enumerate(rows, start=1):
+                values = tuple(cls._cell(value) for value in row[:width])
+                if not any(value is not None for value in values):
+                    continue
+                index.append(number)
+                records.append(values + (None,) * (width - len(values)))
+                if len(records) >= chunk_size:
+                    yield 0, pd.DataFrame.from_records(records, index=index, columns=headers)
+                    index, records = [], []
+            if records:
+                yield 0, pd.DataFrame.from_records(records, index=index, columns=headers)
+        finally:
+            if workbook is not None:
+                workbook.close()
+
+    def _error(self, row: int | str, message: str) -> None:
+        """记录一行导入失败"""
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append(f"第{row}行: {message}")
+
+    def _validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        整列校验与转换，返回校验通过的行。
+
+        参数:
+        - df (pd.DataFrame): 已按字段重命名的数据块。
+
+        返回:
+        - pd.DataFrame: 校验通过的行。
+        """
+        row_errors: dict[int, list[str]] = {}
+        for column in self.columns:
+            series = df[column.field]
+            missing = series.isna()
+            if column.required:
+                for row in df.index[missing]:
+                    row_errors.setdefault(row, []).append(f"{column.header}不能为空")
+            if column.converter is not None:
+                converted = column.converter(series)
+                invalid = converted.isna() & ~missing
+                for row in df.index[invalid]:
+                    row_errors.setdefault(row, []).append(
+                        column.message or f"{column.header}格式不正确"
+                    )
+                df[column.field] = converted
+
+        if self.key is not None:
+            keys = df[self.key]
+            # 与文件中前面的行(含之前的块)重复
+            duplicated = keys.notna() & (keys.duplicated() | keys.isin(self._seen_keys))
+            for row in df.index[duplicated]:
+                row_errors.setdefault(row, []).append(f"{keys[row]} 在文件中重复")
+            self._seen_keys.update(keys.dropna())
+
+        for row, messages in row_errors.items():
+            self._error(row, "，".join(messages))
+        return df.drop(index=list(row_errors))
+
+    def _records(self, df: pd.DataFrame) -> list[tuple[int, dict[str, Any]]]:
+        """
+        转换为行号与字段字典列表(空值为 None)，按 schema 逐行校验。
+
+        参数:
+        - df (pd.DataFrame): 校验通过的数据块。
+
+        返回:
+        - list[tuple[int, dict[str, Any]]]: 行号与字段字典列表。
+        """
+        df = df.astype(object).where(df.notna(), None)
+        records = []
+        for row, record in zip(df.index, df.to_dict("records"), strict=True):
+            if self.schema is not None:
+                try:
+                    record = self.schema.model_validate(record).model_dump(exclude_unset=True)
+                except ValidationError as e:
+                    self._error(row, "；".join(error["msg"] for error in e.errors()))
+                    continue
+            records.append((row, record))
+        return records
+
+    async def _existing(self, keys: list[Any]) -> tuple[dict[Any, Any], set[Any]]:
+        """
+        一次查询本块中已存在的记录，并校验数据权限。
+
+        参数:
+        - keys (list[Any]): 本块的唯一键值。
+
+        返回:
+        - tuple[dict[Any, Any], set[Any]]: 唯一键到已存在记录的映射，以及有权限访问的主键集合。
+        """
+        model = self.crud.model
+        key_col = getattr(model, str(self.key))
+        fields = [getattr(model, name) for name in self.existing_fields]
+        result = await self.crud.auth.db.execute(
+            select(model.id, key_col, *fields).where(key_col.in_(keys))
+        )
+        existing = {row[1]: row for row in result.all()}
+        if not existing:
+            return existing, set()
+        permitted = await self.crud.list(
+            search={"id": ("in", [row.id for row in existing.values()])}, fields=["id"]
+        )
+        return existing, {obj.id for obj in permitted}
+
+    async def _write_chunk(self, df: pd.DataFrame) -> None:
+        """
+        校验并写入一个数据块。
+
+        参数:
+        - df (pd.DataFrame): 已按字段重命名的数据块。
+
+        返回:
+        - None
+        """
+        records = self._records(self._validate(df))
+        if not records:
+            return
+
+        existing: dict[Any, Any] = {}
+        permitted: set[Any] = set()
+        if self.key is not None:
+            keys = [record[self.key] for _, record in records if record.get(self.key) is not None]
+            if keys:
+                existing, permitted = await self._existing(keys)
+
+        to_create: list[dict[str, Any]] = []
+        to_update: list[dict[str, Any]] = []
+        rows: list[int] = []
+        for row, record in records:
+            exists = existing.get(record.get(self.key)) if self.key is not None else None
+            if exists is None:
+                to_create.append({**self.defaults, **record})
+                rows.append(row)
+                continue
+            message = self.check_existing(exists) if self.check_existing else None
+            if message:
+                self._error(row, message)
+            elif exists.id not in permitted:
+                self._error(row, f"{record[self.key]} 已存在且无权限修改")
+            elif not self.update_support:
+                self._error(row, f"{record[self.key]} 已存在")
+            else:
+                to_update.append({**record, "id": exists.id})
+                rows.append(row)
+
+        if not rows:
+            return
+        try:
+            async with self.crud.auth.db.begin_nested():
+                if to_create:
+                    await self.crud.bulk_create(to_create)
+                if to_update:
+                    await self.crud.bulk_update(to_update)
+            self.success += len(rows)
+        except Exception as e:
+            self.failed += len(rows)
+            if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+                self.errors.append(f"第{rows[0]}-{rows[-1]}行: 写入失败，{e!s}")
+
+    async def run(
+        self,
+        file: UploadFile,
+        redis: Redis | None = None,
+        job_id: str | None = None,
+        progress: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> str:
+        """
+        执行导入。
+
+        参数:
+        - file (UploadFile): 上传的 xlsx/csv 文件。
+        - redis (Redis | None): Redis 连接，提供时写入导入进度。
+        - job_id (str | None): 导入任务ID(客户端生成后轮询进度)，默认自动生成。
+        - progress (Callable[[int, int], Awaitable[None]] | None): 每块处理完成后的回调(已处理行数, 预估总行数)，
+          如后台任务的进度上报。
+
+        返回:
+        - str: 导入结果信息。
+
+        异常:
+        - CustomException: 文件格式不支持、为空、缺少必要的列或 job_id 已被其他用户占用时抛出。
+        """
+        user = self.crud.auth.user
+        if job_id:
+            await ImportProgress.claim(redis, job_id, user.id if user else None)
+        else:
+            job_id = uuid.uuid4().hex
+        file_name = file.filename or ""
+        processed = 0
+        await ImportProgress.update(
+            redis,
+            job_id,
+            status="running",
+            file_name=file_name,
+            user_id=user.id if user else "",
+            total=0,
+            processed=0,
+            success=0,
+            failed=0,
+            message="",
+        )
+        try:
+            chunks = self.iter_chunks(file.file, file_name, self.chunk_size)
+            total, header = await asyncio.to_thread(next, chunks)
+            missing_headers = [
+                column.header for column in self.columns if column.header not in header.columns
+            ]
+            if missing_headers:
+                raise CustomException(msg=f"导入文件缺少必要的列: {', '.join(missing_headers)}")
+            rename = {column.header: column.field for column in self.columns}
+            await ImportProgress.update(redis, job_id, total=total)
+
+            while True:
+                item = await asyncio.to_thread(next, chunks, None)
+                if item is None:
+                    break
+                df = item[1][list(rename)].rename(columns=rename)
+                await self._write_chunk(df)
+                processed = self.success + self.failed
+                await ImportProgress.update(
+                    redis, job_id, processed=processed, success=self.success, failed=self.failed
+                )
+                if progress is not None:
+                    await progress(processed, total)
+
+            if processed == 0:
+                raise CustomException(msg="导入文件为空")
+            result = f"成功导入 {self.success} 条数据"
+            if self.errors:
+                result += "\n错误信息:\n" + "\n".join(self.errors)
+                if self.failed > len(self.errors):
+                    result += f"\n其余 {self.failed - len(self.errors)} 条错误已省略"
+            await ImportProgress.update(redis, job_id, status="success", message=result)
+            return result
+        except Exception as e:
+            log.error(f"导入失败({file_name}): {e!s}")
+            await ImportProgress.update(redis, job_id, status="failed", message=str(e))
+            if isinstance(e, CustomException):
+                raise
+            raise CustomException(msg=f"导入失败: {e!s}")
+        finally:
+            await file.close()
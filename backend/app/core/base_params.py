@@ -16,6 +16,10 @@ class PaginationQueryParam:
             default=None,
             description="排序字段,格式:[{'field1': 'asc'}, {'field2': 'desc'}]",
         ),
+        fields: str | None = Query(
+            default=None,
+            description="返回字段,逗号分隔,为空时返回除大字段外的全部字段",
+        ),
     ) -> None:
         """
         初始化分页查询参数。
@@ -24,6 +28,7 @@ class PaginationQueryParam:
         - page_no (int | None): 当前页码，默认 None。
         - page_size (int | None): 每页数量，默认 None，最大 100。
         - order_by (str | None): 排序字段，格式 'field,asc;field2,desc'。
+        - fields (str | None): 返回字段，格式 'id,name,status'。
 
         返回:
         - None
@@ -39,6 +44,10 @@ class PaginationQueryParam:
                 self.order_by = [{"updated_time": "desc"}]
         else:
             self.order_by = [{"updated_time": "desc"}]
+        # 将逗号分隔的字段转换为列表，供数据层做列投影
+        self.fields = (
+            [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        )
 
 
 class BaseQueryParam:
@@ -1,19 +1,28 @@
-from fastapi import FastAPI
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request
 from redis import exceptions
 from redis.asyncio import Redis
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 
+from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
 from app.core.base_model import MappedBase
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.metrics import Metrics, MetricsQueuePool, MetricsRedis
+from app.core.profiler import RequestProfiler
 
 
 def create_engine_and_session(
@@ -52,10 +61,17 @@ def create_engine_and_session(
 
 def create_async_engine_and_session(
     db_url: str = settings.ASYNC_DB_URI,
+    pool_size: int = settings.POOL_SIZE,
+    max_overflow: int = settings.MAX_OVERFLOW,
 ) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
     """
     获取异步数据库会话连接。
 
+    参数:
+    - db_url (str): 数据库连接URL,默认从配置中获取。
+    - pool_size (int): 连接池大小。
+    - max_overflow (int): 最大溢出连接数。
+
     返回:
     - tuple[AsyncEngine, async_sessionmaker[AsyncSession]]: 异步数据库引擎和会话工厂。
     """
@@ -83,8 +99,9 @@ def create_async_engine_and_session(
                 pool_pre_ping=settings.POOL_PRE_PING,
                 future=settings.FUTURE,
                 pool_recycle=settings.POOL_RECYCLE,
-                pool_size=settings.POOL_SIZE,
-                max_overflow=settings.MAX_OVERFLOW,
+                poolclass=MetricsQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
                 pool_timeout=settings.POOL_TIMEOUT,
                 pool_use_lifo=settings.POOL_USE_LIFO,
             )
@@ -106,6 +123,218 @@ def create_async_engine_and_session(
 engine, db_session = create_engine_and_session(settings.DB_URI)
 async_engine, async_db_session = create_async_engine_and_session(settings.ASYNC_DB_URI)
 
+# 只读副本(独立连接池，供读请求使用；未配置时为 None)
+replica_engine: AsyncEngine | None = None
+replica_db_session: async_sessionmaker[AsyncSession] | None = None
+if settings.ASYNC_DB_REPLICA_URI:
+    replica_engine, replica_db_session = create_async_engine_and_session(
+        settings.ASYNC_DB_REPLICA_URI,
+        pool_size=settings.REPLICA_POOL_SIZE,
+        max_overflow=settings.REPLICA_MAX_OVERFLOW,
+    )
+
+if settings.METRICS_ENABLE:
+    Metrics.instrument_engine(async_engine, "primary")
+    if replica_engine is not None:
+        Metrics.instrument_engine(replica_engine, "replica")
+if settings.PROFILE_ENABLE:
+    RequestProfiler.instrument_engine(async_engine)
+    if replica_engine is not None:
+        RequestProfiler.instrument_engine(replica_engine)
+
+# 各数据库的复制延迟查询(秒)，NULL 表示复制中断
+_REPLICA_LAG_SQL = {
+    "mysql": "SHOW REPLICA STATUS",
+    "postgres": """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    """,
+}
+
+
+class ReplicaRouter:
+    """
+    主从读写路由
+
+    - 读请求在副本复制延迟不超过 REPLICA_MAX_LAG 时使用只读副本连接池，否则回退主库；
+    - 复制延迟按 REPLICA_LAG_CHECK_INTERVAL 间隔懒检测，检测失败视为副本不可用；
+    - 写请求提交后在 Redis 中标记该客户端，REPLICA_STICKY_SECONDS 内的读请求走主库(读己之写)。
+    """
+
+    _lag: float | None = None
+    _checked_at: float = 0.0
+
+    @classmethod
+    async def _query_lag(cls) -> float | None:
+        """查询副本复制延迟(秒)"""
+        if replica_engine is None:
+            return None
+        async with replica_engine.connect() as conn:
+            if settings.DATABASE_TYPE == "mysql":
+                try:
+                    row = (await conn.execute(text(_REPLICA_LAG_SQL["mysql"]))).mappings().first()
+                except DBAPIError:
+                    # MySQL 8.0.22 之前的版本
+                    row = (await conn.execute(text("SHOW SLAVE STATUS"))).mappings().first()
+                if row is None:
+                    # 未配置复制(如只读代理、云数据库只读地址)时视为无延迟
+                    return 0.0
+                lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+            else:
+                lag = (await conn.execute(text(_REPLICA_LAG_SQL["postgres"]))).scalar()
+        return None if lag is None else float(lag)
+
+    @classmethod
+    async def replica_available(cls) -> bool:
+        """
+        检查只读副本是否可用(已配置且复制延迟在允许范围内)。
+
+        返回:
+        - bool: 副本是否可用。
+        """
+        if replica_engine is None:
+            return False
+        now = time.monotonic()
+        if now - cls._checked_at >= settings.REPLICA_LAG_CHECK_INTERVAL:
+            # 先更新检测时间，检测期间的并发请求沿用上次结果
+            cls._checked_at = now
+            try:
+                cls._lag = await asyncio.wait_for(cls._query_lag(), timeout=settings.POOL_TIMEOUT)
+            except Exception as e:
+                cls._lag = None
+                log.warning(f"⚠️ 只读副本延迟检测失败，读请求回退主库: {e}")
+            if cls._lag is not None and cls._lag > settings.REPLICA_MAX_LAG:
+                log.warning(f"⚠️ 只读副本复制延迟 {cls._lag:.1f}s，读请求回退主库")
+        return cls._lag is not None and cls._lag <= settings.REPLICA_MAX_LAG
+
+    @staticmethod
+    def _sticky_key(request: Request) -> str | None:
+        """按客户端令牌生成读主库标记键，未登录请求不做标记"""
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        digest = hashlib.sha256(authorization.encode()).hexdigest()[:32]
+        return f"{RedisInitKeyConfig.DB_PRIMARY_STICKY.key}:{digest}"
+
+    @classmethod
+    async def read_session_factory(cls, request: Request) -> async_sessionmaker[AsyncSession]:
+        """
+        获取读请求使用的会话工厂。
+
+        参数:
+        - request (Request): 请求对象。
+
+        返回:
+        - async_sessionmaker[AsyncSession]: 副本可用且客户端近期无写操作时返回副本会话工厂，否则返回主库会话工厂。
+        """
+        if replica_db_session is None or not await cls.replica_available():
+            return async_db_session
+        key = cls._sticky_key(request)
+        redis: Redis | None = getattr(request.app.state, "redis", None)
+        if key and redis is not None:
+            try:
+                if await redis.exists(key):
+                    return async_db_session
+            except exceptions.RedisError as e:
+                log.warning(f"⚠️ 读取读主库标记失败，读请求回退主库: {e}")
+                return async_db_session
+        return replica_db_session
+
+    @classmethod
+    async def mark_write(cls, request: Request) -> None:
+        """
+        标记客户端刚完成写操作，短时间内的读请求走主库。
+
+        参数:
+        - request (Request): 请求对象。
+
+        返回:
+        - None
+        """
+        if replica_db_session is None:
+            return
+        key = cls._sticky_key(request)
+        redis: Redis | None = getattr(request.app.state, "redis", None)
+        if key and redis is not None:
+            try:
+                await redis.set(key, 1, ex=settings.REPLICA_STICKY_SECONDS)
+            except exceptions.RedisError as e:
+                log.warning(f"⚠️ 设置读主库标记失败: {e}")
+
+
+# 会话中登记的事务提交后回调(session.info 键)
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def on_commit(session: AsyncSession, key: str, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    登记事务提交后执行的回调，同一键在一个事务内只登记一次(后续登记被忽略)。
+
+    回调由 run_commit_hooks 在事务提交后执行，事务回滚时丢弃。
+
+    参数:
+    - session (AsyncSession): 数据库会话。
+    - key (str): 回调键，用于合并同一事务内的重复登记。
+    - callback (Callable[[], Awaitable[None]]): 回调函数。
+
+    返回:
+    - None
+
+    异常:
+    - CustomException: 会话为只读时抛出(只读会话不提交，回调永远不会执行)。
+    """
+    check_writable(session)
+    session.info.setdefault(AFTER_COMMIT_KEY, {}).setdefault(key, callback)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_commit_hooks(session: Session, previous_transaction: SessionTransaction) -> None:
+    """外层事务回滚时丢弃登记的提交后回调(保存点回滚不影响外层事务)"""
+    if previous_transaction.parent is None:
+        session.info.pop(AFTER_COMMIT_KEY, None)
+
+
+# 只读会话标记(session.info 键)：读请求的会话不开启事务、不提交，也可能连接只读副本
+READONLY_KEY = "readonly"
+
+
+def check_writable(session: AsyncSession) -> None:
+    """
+    校验会话允许写入，只读会话(读请求)中的写操作直接拒绝，避免写入被静默丢弃或发往只读副本。
+
+    参数:
+    - session (AsyncSession): 数据库会话。
+
+    返回:
+    - None
+
+    异常:
+    - CustomException: 会话为只读时抛出。
+    """
+    if session.info.get(READONLY_KEY):
+        raise CustomException(msg="只读请求(GET/HEAD/OPTIONS)不允许写入数据")
+
+
+async def run_commit_hooks(session: AsyncSession) -> None:
+    """
+    执行并清空会话中登记的事务提交后回调，单个回调失败只记录日志。
+
+    参数:
+    - session (AsyncSession): 数据库会话(事务已提交)。
+
+    返回:
+    - None
+    """
+    callbacks: dict[str, Callable[[], Awaitable[None]]] = session.info.pop(AFTER_COMMIT_KEY, {})
+    for key, callback in callbacks.items():
+        try:
+            await callback()
+        except Exception as e:
+            log.error(f"❌ 事务提交后回调执行失败 [{key}]: {e}")
+
 
 async def create_tables() -> None:
     """创建数据库表"""
@@ -138,7 +367,10 @@ async def redis_connect(app: FastAPI, status: str) -> Redis | None:
 
     if status:
         try:
-            rd = await Redis.from_url(
+            redis_class = (
+                MetricsRedis if settings.METRICS_ENABLE or settings.PROFILE_ENABLE else Redis
+            )
+            rd = await redis_class.from_url(
                 url=settings.REDIS_URI,
                 encoding="utf-8",
                 decode_responses=True,
@@ -1,4 +1,3 @@
-import json
 from collections.abc import AsyncGenerator
 
 from fastapi import Depends, Request
@@ -11,22 +10,41 @@ from app.api.v1.module_system.user.crud import UserCRUD
 from app.api.v1.module_system.user.model import UserModel
 from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
-from app.core.database import async_db_session
+from app.core.database import READONLY_KEY, ReplicaRouter, async_db_session, run_commit_hooks
 from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.core.redis_crud import RedisCURD
-from app.core.security import OAuth2Schema, decode_access_token
+from app.core.security import OAuth2Schema, decode_token_session
 
+# 只读请求方法，使用只读会话(优先路由到只读副本，不允许写入)
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-async def db_getter() -> AsyncGenerator[AsyncSession, None]:
+
+async def db_getter(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """获取数据库会话连接
 
+    - 读请求(GET/HEAD/OPTIONS)：副本可用且客户端近期无写操作时使用只读副本连接池，否则使用主库；
+      会话标记为只读，不开启写事务、不提交，结束时直接关闭，CRUDBase 的写方法抛出异常；
+    - 写请求：在主库事务中执行，提交后执行登记的提交后回调，并标记客户端短时间内读主库(读己之写)。
+
+    参数:
+    - request (Request): 请求对象
+
     返回:
     - AsyncSession: 数据库会话连接
     """
+    if request.method in READ_METHODS:
+        session_factory = await ReplicaRouter.read_session_factory(request)
+        async with session_factory() as session:
+            session.info[READONLY_KEY] = True
+            yield session
+        return
+
     async with async_db_session() as session:
         async with session.begin():
             yield session
+        await run_commit_hooks(session)
+    await ReplicaRouter.mark_write(request)
 
 
 async def redis_getter(request: Request) -> Redis:
@@ -65,14 +83,10 @@ async def get_current_user(
     if token.startswith("Bearer"):
         token = token.split(" ")[1]
 
-    payload = decode_access_token(token)
+    payload, user_info = decode_token_session(token)
     if not payload or not hasattr(payload, "is_refresh") or payload.is_refresh:
         raise CustomException(msg="非法凭证", code=10401, status_code=401)
 
-    online_user_info = payload.sub
-    # 从Redis中获取用户信息
-    user_info = json.loads(online_user_info)  # 确保是字典类型
-
     session_id = user_info.get("session_id")
     if not session_id:
         raise CustomException(msg="认证已失效", code=10401, status_code=401)
@@ -2,6 +2,7 @@ from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
+from pydantic_core import to_jsonable_python
 from pydantic_validation_decorator import FieldValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException
@@ -140,7 +141,8 @@ def handle_exception(app: FastAPI) -> None:
         return ErrorResponse(
             msg=str(msg),
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            data=exc.body,
+            # 原样回显的请求体可能含表单/上传文件等对象，显式转换为字符串
+            data=to_jsonable_python(exc.body, fallback=str),
         )
 
     @app.exception_handler(ResponseValidationError)
@@ -163,7 +165,7 @@ def handle_exception(app: FastAPI) -> None:
         return ErrorResponse(
             msg="服务器响应格式错误",
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            data=exc.body,
+            data=to_jsonable_python(exc.body, fallback=str),
         )
 
     @app.exception_handler(SQLAlchemyError)
@@ -0,0 +1,339 @@
+import hmac
+import os
+import random
+import time
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.setting import settings
+from app.core.logger import log
+from app.core.profiler import RequestProfiler
+
+# 延迟直方图分桶(秒)：覆盖 1ms ~ 30s
+_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 请求处理耗时(按路由模板)",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "正在处理的 HTTP 请求数",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "数据库连接池获取连接等待耗时",
+    ["pool"],
+    buckets=_LATENCY_BUCKETS,
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "数据库连接池已借出连接数",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL 语句执行耗时",
+    ["pool", "operation"],
+    buckets=_LATENCY_BUCKETS,
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "超过慢查询阈值的 SQL 语句数",
+    ["pool", "operation"],
+)
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 命令耗时",
+    ["command"],
+    buckets=_LATENCY_BUCKETS,
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "上游大模型首个 token 到达耗时",
+    ["provider", "model"],
+    buckets=_LATENCY_BUCKETS,
+)
+LLM_TOKENS_PER_SECOND = Histogram(
+    "llm_tokens_per_second",
+    "上游大模型流式输出速率(首 token 之后)",
+    ["provider", "model"],
+    buckets=(1, 5, 10, 20, 40, 60, 80, 100, 150, 200, 500),
+)
+LLM_STREAM_DURATION = Histogram(
+    "llm_stream_duration_seconds",
+    "上游大模型流式调用总耗时",
+    ["provider", "model", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "定时任务执行耗时",
+    ["job_id", "executor", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+# 统计的 SQL 操作类型，其余归为 OTHER，避免标签基数膨胀
+_SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+
+class MetricsQueuePool(AsyncAdaptedQueuePool):
+    """记录获取连接等待耗时的异步连接池(未启用监控指标时不记录)"""
+
+    metrics_label: str = "primary"
+
+    def _do_get(self) -> Any:
+        if not settings.METRICS_ENABLE:
+            return super()._do_get()
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(
+                time.perf_counter() - start_time
+            )
+
+
+class Metrics:
+    """
+    Prometheus 监控指标工具类
+
+    - HTTP：按路由模板统计请求耗时，区分状态码；
+    - 数据库：连接池等待耗时、已借出连接数，逐条 SQL 耗时与慢查询采样日志；
+    - Redis：按命令统计耗时；
+    - 大模型：首 token 耗时、输出速率；
+    - 定时任务：执行耗时。
+
+    设置环境变量 PROMETHEUS_MULTIPROC_DIR 后按多进程模式(gunicorn 多 worker)汇总指标。
+    """
+
+    @staticmethod
+    def _sql_operation(statement: str) -> str:
+        operation = statement.lstrip()[:6].upper()
+        return operation if operation in _SQL_OPERATIONS else "OTHER"
+
+    @classmethod
+    def instrument_engine(cls, engine: AsyncEngine, label: str) -> None:
+        """
+        为数据库引擎注册连接池与 SQL 耗时监听。
+
+        参数:
+        - engine (AsyncEngine): 异步数据库引擎。
+        - label (str): 连接池标签，如 primary/replica。
+
+        返回:
+        - None
+        """
+        sync_engine = engine.sync_engine
+        pool = sync_engine.pool
+        if isinstance(pool, MetricsQueuePool):
+            pool.metrics_label = label
+        in_use = DB_POOL_IN_USE.labels(label)
+
+        @event.listens_for(pool, "checkout")
+        def _on_checkout(*_: Any) -> None:
+            in_use.inc()
+
+        @event.listens_for(pool, "checkin")
+        def _on_checkin(*_: Any) -> None:
+            in_use.dec()
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(
+            conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+        ) -> None:
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(
+            conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+        ) -> None:
+            start_times = conn.info.get("query_start_time")
+            if not start_times:
+                return
+            duration = time.perf_counter() - start_times.pop()
+            operation = cls._sql_operation(statement)
+            DB_QUERY_DURATION.labels(label, operation).observe(duration)
+            if duration >= settings.SLOW_QUERY_THRESHOLD:
+                DB_SLOW_QUERIES.labels(label, operation).inc()
+                if random.random() < settings.SLOW_QUERY_SAMPLE_RATE:
+                    log.warning(
+                        f"慢查询({label}) 耗时 {duration:.3f}s: {' '.join(statement.split())[:1000]}"
+                    )
+
+    @staticmethod
+    def observe_job(job_id: str, executor: str, status: str, duration: float) -> None:
+        """
+        记录定时任务执行耗时。
+
+        参数:
+        - job_id (str): 任务ID。
+        - executor (str): 执行器名称。
+        - status (str): 执行状态(0成功 1失败)。
+        - duration (float): 执行耗时(秒)。
+
+        返回:
+        - None
+        """
+        SCHEDULER_JOB_DURATION.labels(
+            job_id, executor, "success" if status == "0" else "failed"
+        ).observe(duration)
+
+    @staticmethod
+    def _authorized(request: Request) -> bool:
+        """配置了 METRICS_TOKEN 时校验 Bearer 口令，否则只允许本机直连(不信任转发头)"""
+        if settings.METRICS_TOKEN:
+            scheme, _, token = request.headers.get("authorization", "").partition(" ")
+            return scheme.lower() == "bearer" and hmac.compare_digest(
+                token.strip().encode(), settings.METRICS_TOKEN.encode()
+            )
+        return request.client is not None and request.client.host in ("127.0.0.1", "::1")
+
+    @classmethod
+    def render(cls, request: Request) -> Response:
+        """
+        生成 Prometheus 文本格式的指标响应。
+
+        参数:
+        - request (Request): 请求对象，用于校验采集口令或来源。
+
+        返回:
+        - Response: 指标响应，未授权时返回 403。
+        """
+        if not cls._authorized(request):
+            return Response(status_code=403)
+        registry = REGISTRY
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            MultiProcessCollector(registry)
+        return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class LLMStreamMetrics:
+    """
+    大模型流式调用计时
+
+    每收到一个输出片段调用 on_token，流结束后调用 finish；
+    OpenAI 兼容接口的流式输出每个片段约为一个 token，按片段数估算输出速率。
+    未启用监控指标时不记录；模型标签只保留已配置的 OPENAI_MODEL，其余归为 other，
+    避免客户端传入的模型名导致标签基数无限增长。
+    """
+
+    def __init__(self, provider: str, model: str) -> None:
+        self.enabled = settings.METRICS_ENABLE
+        self.provider = provider
+        self.model = model if model and model == settings.OPENAI_MODEL else "other"
+        self.start_time = time.perf_counter()
+        self.first_token_time: float | None = None
+        self.tokens = 0
+
+    def on_token(self, count: int = 1) -> None:
+        if not self.enabled:
+            return
+        if self.first_token_time is None:
+            self.first_token_time = time.perf_counter()
+            LLM_TIME_TO_FIRST_TOKEN.labels(self.provider, self.model).observe(
+                self.first_token_time - self.start_time
+            )
+        self.tokens += count
+
+    def finish(self, success: bool = True) -> None:
+        if not self.enabled:
+            return
+        end_time = time.perf_counter()
+        LLM_STREAM_DURATION.labels(
+            self.provider, self.model, "success" if success else "failed"
+        ).observe(end_time - self.start_time)
+        if self.first_token_time is not None and self.tokens > 1:
+            elapsed = end_time - self.first_token_time
+            if elapsed > 0:
+                LLM_TOKENS_PER_SECOND.labels(self.provider, self.model).observe(
+                    (self.tokens - 1) / elapsed
+                )
+
+
+class MetricsRedis(Redis):
+    """记录命令耗时的 Redis 客户端(覆盖 RedisCURD 及直接使用连接的调用，同时写入请求剖析时间线)"""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        start_time = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            end_time = time.perf_counter()
+            command = args[0] if args else "UNKNOWN"
+            if isinstance(command, bytes):
+                command = command.decode()
+            command = str(command).upper()
+            if settings.METRICS_ENABLE:
+                REDIS_COMMAND_DURATION.labels(command).observe(end_time - start_time)
+            RequestProfiler.record_span("redis", command, start_time, end_time)
+
+
+class MetricsMiddleware:
+    """按路由模板统计 HTTP 请求耗时的 ASGI 中间件(计时到响应体发送完成，包含流式响应)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].endswith(settings.METRICS_URL):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            # 使用路由模板而非实际路径，避免路径参数导致标签基数膨胀
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(scope["method"], route_path, str(status_code)).observe(
+                time.perf_counter() - start_time
+            )
@@ -1,22 +1,22 @@
-import json
 import time
 
+from starlette.datastructures import Headers
 from starlette.middleware.base import (
     BaseHTTPMiddleware,
     RequestResponseEndpoint,
 )
 from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1.module_system.params.service import ParamsService
 from app.common.response import ErrorResponse
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import log
-from app.core.security import decode_access_token
+from app.core.security import decode_token_session
 
 
 class CustomCORSMiddleware(CORSMiddleware):
@@ -66,13 +66,8 @@ class RequestLogMiddleware(BaseHTTPMiddleware):
             # 处理Bearer token
             token = authorization.replace("Bearer ", "").strip()
 
-            # 解码token
-            payload = decode_access_token(token)
-            if not payload or not hasattr(payload, "sub"):
-                return None
-
-            # 从payload中提取session_id
-            user_info = json.loads(payload.sub)
+            # 解码token(与鉴权依赖共用已验证令牌缓存)
+            _, user_info = decode_token_session(token)
             session_id = user_info.get("session_id")
 
             # 同时设置到request.scope中，避免后续重复解析
@@ -189,8 +184,26 @@ class RequestLogMiddleware(BaseHTTPMiddleware):
             return ErrorResponse(msg="系统异常，请联系管理员", data=str(e))
 
 
+class _GZipBypassResponder(GZipResponder):
+    """对无需压缩的响应直接透传的 GZip 响应器"""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start" and CustomGZipMiddleware.is_excluded(
+            Headers(raw=message["headers"])
+        ):
+            # 复用父类"已设置 Content-Encoding"的透传分支
+            self.content_encoding_set = True
+
+
 class CustomGZipMiddleware(GZipMiddleware):
-    """GZip压缩中间件"""
+    """
+    GZip压缩中间件
+
+    以下响应不压缩，原样透传:
+    - 媒体类型在 GZIP_EXCLUDED_MEDIA_TYPES 中(事件流需逐条推送，压缩包压缩无收益)；
+    - 支持字节范围的文件下载(Accept-Ranges / Content-Range)，压缩会使分段偏移与长度失效。
+    """
 
     def __init__(self, app: ASGIApp) -> None:
         super().__init__(
@@ -198,3 +211,30 @@ class CustomGZipMiddleware(GZipMiddleware):
             minimum_size=settings.GZIP_MIN_SIZE,
             compresslevel=settings.GZIP_COMPRESS_LEVEL,
         )
+
+    @staticmethod
+    def is_excluded(headers: Headers) -> bool:
+        """
+        判断响应是否跳过压缩。
+
+        参数:
+        - headers (Headers): 响应头。
+
+        返回:
+        - bool: 是否跳过压缩。
+        """
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return (
+            media_type in settings.GZIP_EXCLUDED_MEDIA_TYPES
+            or "content-range" in headers
+            or headers.get("accept-ranges", "").lower() == "bytes"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            responder = _GZipBypassResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,249 @@
+import asyncio
+import hmac
+import json
+import random
+import time
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+
+from fastapi import Request, Response
+from pyinstrument import Profiler
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.logger import log
+
+# 单个请求最多记录的耗时片段数，超出后只累计不记录明细
+MAX_SPANS = 1000
+
+
+class RequestProfile:
+    """单个请求的剖析数据：DB/Redis/HTTP 等待耗时时间线"""
+
+    def __init__(self) -> None:
+        self.start_time = time.perf_counter()
+        self.spans: list[dict[str, Any]] = []
+        self.totals: dict[str, float] = {}
+        self.dropped = 0
+
+    def add_span(self, kind: str, name: str, start_time: float, end_time: float) -> None:
+        duration = (end_time - start_time) * 1000
+        self.totals[kind] = self.totals.get(kind, 0.0) + duration
+        if len(self.spans) >= MAX_SPANS:
+            self.dropped += 1
+            return
+        self.spans.append({
+            "kind": kind,
+            "name": name[:500],
+            "start_ms": round((start_time - self.start_time) * 1000, 3),
+            "duration_ms": round(duration, 3),
+        })
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar("current_profile", default=None)
+
+
+class RequestProfiler:
+    """
+    请求剖析工具类
+
+    - 触发方式：请求头 PROFILE_HEADER 携带 PROFILE_TOKEN，或按 PROFILE_SAMPLE_RATE 随机采样；
+    - 调用栈：pyinstrument 异步模式采样(只统计当前请求协程)，生成可下载的 HTML 火焰图，同一进程同时只运行一个；
+    - 时间线：通过上下文变量记录 SQL、Redis 命令与出站 HTTP 调用的起止时间；
+    - 存储：摘要写入 Redis 环形列表(保留 PROFILE_RING_SIZE 条)，火焰图单独存储并按 PROFILE_EXPIRE_SECONDS 过期。
+    """
+
+    _sampling: bool = False
+    # 保存任务引用，避免后台任务被提前回收
+    _tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def get_trigger(cls, request: Request) -> str | None:
+        """
+        判断请求是否需要剖析。
+
+        参数:
+        - request (Request): 请求对象。
+
+        返回:
+        - str | None: 触发方式 header/sample，不需要剖析时返回 None。
+        """
+        if not settings.PROFILE_ENABLE:
+            return None
+        token = request.headers.get(settings.PROFILE_HEADER)
+        if (
+            token
+            and settings.PROFILE_TOKEN
+            and hmac.compare_digest(token.encode(), settings.PROFILE_TOKEN.encode())
+        ):
+            return "header"
+        if settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE:
+            return "sample"
+        return None
+
+    @classmethod
+    def record_span(cls, kind: str, name: str, start_time: float, end_time: float) -> None:
+        """
+        记录一次等待耗时(当前请求未开启剖析时忽略)。
+
+        参数:
+        - kind (str): 类型，如 db/redis/http。
+        - name (str): 名称，如 SQL 语句、Redis 命令、URL。
+        - start_time (float): 开始时间(perf_counter)。
+        - end_time (float): 结束时间(perf_counter)。
+
+        返回:
+        - None
+        """
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.add_span(kind, name, start_time, end_time)
+
+    @classmethod
+    @asynccontextmanager
+    async def span(cls, kind: str, name: str) -> AsyncGenerator[None, None]:
+        """
+        记录代码块耗时的异步上下文管理器。
+
+        参数:
+        - kind (str): 类型。
+        - name (str): 名称。
+
+        返回:
+        - AsyncGenerator[None, None]: 上下文。
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record_span(kind, name, start_time, time.perf_counter())
+
+    @classmethod
+    def instrument_engine(cls, engine: AsyncEngine) -> None:
+        """
+        为数据库引擎注册 SQL 耗时监听。
+
+        参数:
+        - engine (AsyncEngine): 异步数据库引擎。
+
+        返回:
+        - None
+        """
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(
+            conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+        ) -> None:
+            if _current_profile.get() is not None:
+                conn.info.setdefault("profile_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(
+            conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+        ) -> None:
+            start_times = conn.info.get("profile_start_time")
+            if start_times:
+                cls.record_span(
+                    "db", " ".join(statement.split()), start_times.pop(), time.perf_counter()
+                )
+
+    @classmethod
+    async def run(
+        cls,
+        request: Request,
+        handler: Callable[[Request], Awaitable[Response]],
+        trigger: str,
+    ) -> Response:
+        """
+        剖析执行路由处理函数，满足条件时保存剖析结果。
+
+        参数:
+        - request (Request): 请求对象。
+        - handler (Callable[[Request], Awaitable[Response]]): 原路由处理函数。
+        - trigger (str): 触发方式 header/sample。
+
+        返回:
+        - Response: 路由处理函数的响应。
+        """
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        profiler: Profiler | None = None
+        if not cls._sampling:
+            try:
+                profiler = Profiler(interval=settings.PROFILE_INTERVAL, async_mode="enabled")
+                profiler.start()
+            except Exception as e:
+                # 启动失败时本次请求只记录耗时区间，不占用采样标记
+                profiler = None
+                log.warning(f"⚠️ 采样剖析器启动失败: {e}")
+            else:
+                cls._sampling = True
+        status_code = 500
+        try:
+            response = await handler(request)
+            status_code = response.status_code
+            return response
+        finally:
+            if profiler is not None:
+                profiler.stop()
+                cls._sampling = False
+            _current_profile.reset(token)
+            duration = time.perf_counter() - profile.start_time
+            if trigger == "header" or duration >= settings.PROFILE_SLOW_THRESHOLD:
+                # 生成火焰图与写入 Redis 不阻塞响应
+                task = asyncio.create_task(
+                    cls._save(request, profile, profiler, trigger, status_code, duration)
+                )
+                cls._tasks.add(task)
+                task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def _save(
+        cls,
+        request: Request,
+        profile: RequestProfile,
+        profiler: Profiler | None,
+        trigger: str,
+        status_code: int,
+        duration: float,
+    ) -> None:
+        """保存剖析摘要与火焰图"""
+        try:
+            redis = request.app.state.redis
+            profile_id = uuid.uuid4().hex
+            route = request.scope.get("route")
+            record = {
+                "id": profile_id,
+                "method": request.method,
+                "path": request.url.path,
+                "route": getattr(route, "path", None),
+                "status_code": status_code,
+                "trigger": trigger,
+                "duration_ms": round(duration * 1000, 3),
+                "totals_ms": {kind: round(value, 3) for kind, value in profile.totals.items()},
+                "span_count": len(profile.spans) + profile.dropped,
+                "spans": profile.spans,
+                "has_flamegraph": profiler is not None,
+                "created_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            key = RedisInitKeyConfig.REQUEST_PROFILE.key
+            async with redis.pipeline(transaction=False) as pipe:
+                if profiler is not None:
+                    html = await asyncio.to_thread(profiler.output_html)
+                    pipe.set(f"{key}:{profile_id}", html, ex=settings.PROFILE_EXPIRE_SECONDS)
+                pipe.lpush(key, json.dumps(record, ensure_ascii=False))
+                pipe.ltrim(key, 0, settings.PROFILE_RING_SIZE - 1)
+                await pipe.execute()
+            log.info(
+                f"请求剖析已保存: {request.method} {request.url.path} "
+                f"耗时 {record['duration_ms']}ms, 编号 {profile_id}"
+            )
+        except Exception as e:
+            log.error(f"保存请求剖析失败: {e!s}")
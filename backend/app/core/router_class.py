@@ -12,6 +12,7 @@ from app.api.v1.module_system.log.schema import OperationLogCreateSchema
 from app.api.v1.module_system.log.service import OperationLogService
 from app.config.setting import settings
 from app.core.database import async_db_session
+from app.core.profiler import RequestProfiler
 from app.utils.ip_local_util import IpLocalUtil
 
 """
@@ -51,7 +52,13 @@ class OperationLogRoute(APIRoute):
             """
             start_time = time.time()
             # 请求前的处理
-            response: Response = await original_route_handler(request)
+            profile_trigger = RequestProfiler.get_trigger(request)
+            if profile_trigger:
+                response: Response = await RequestProfiler.run(
+                    request, original_route_handler, profile_trigger
+                )
+            else:
+                response = await original_route_handler(request)
 
             # 请求后的处理
             if not settings.OPERATION_LOG_RECORD:
@@ -0,0 +1,225 @@
+import types
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WrapSerializer,
+    WrapValidator,
+)
+from sqlalchemy import Select, select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import RelationshipDirection, aliased
+
+from app.core.base_model import MappedBase
+
+# 无需转换、可直接透传的标量类型
+_PLAIN_TYPES = (int, str, bool, float)
+# 会改变字段值的注解元数据（其余如长度、范围约束仅用于入参校验）
+_TRANSFORM_METADATA = (
+    AfterValidator,
+    BeforeValidator,
+    PlainValidator,
+    WrapValidator,
+    PlainSerializer,
+    WrapSerializer,
+)
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    """拆出 Optional[X] / X | None 中的 X，返回 (X, 是否可为空)"""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+class RowPlan:
+    """
+    行序列化计划
+
+    记录需要查询的列（含多对一关系的外连接列）以及每个输出字段在结果行中的位置和值转换器，
+    按 (ORM 模型, 输出模型) 编译一次后复用。
+    """
+
+    def __init__(self, model: type[MappedBase]) -> None:
+        self.model = model
+        self.columns: list[Any] = []
+        # 多对一关系: (关系属性, 别名实体)
+        self.joins: list[tuple[Any, Any]] = []
+        # 输出字段: (字段名, 行下标 | 嵌套计划, 转换器 | None, 默认值)
+        self.fields: list[tuple[str, Any, Callable[[Any], Any] | None, Any]] = []
+
+    def add_column(self, expression: Any) -> int:
+        self.columns.append(expression)
+        return len(self.columns) - 1
+
+    def statement(self) -> Select:
+        """构建只查询所需列的 SQL（关系通过外连接获取）"""
+        sql = select(*self.columns).select_from(self.model)
+        for relationship_attr, alias in self.joins:
+            sql = sql.outerjoin(relationship_attr.of_type(alias))
+        return sql
+
+    @staticmethod
+    def _build(fields: list, row: Sequence[Any]) -> dict[str, Any]:
+        result = {}
+        for name, source, converter, default in fields:
+            if source is None:
+                result[name] = default
+            elif isinstance(source, tuple):
+                # 嵌套关系: (关联主键下标, 子字段)
+                pk_index, nested_fields = source
+                result[name] = None if row[pk_index] is None else RowPlan._build(nested_fields, row)
+            else:
+                value = row[source]
+                result[name] = converter(value) if converter and value is not None else value
+        return result
+
+    def to_dicts(self, rows: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
+        """将结果行直接转换为字典列表"""
+        fields = self.fields
+        return [self._build(fields, row) for row in rows]
+
+
+class RowSerializer:
+    """
+    ORM 行序列化工具类
+
+    根据输出模型的字段只查询需要的列，由结果行直接构建字典，跳过逐行的模型实例化、校验与关系加载：
+    - 普通列：与输出字段类型一致的标量直接透传，其余（日期格式化、枚举、JSON 等）按字段类型转换；
+    - 多对一关系字段（如 created_by/updated_by）：通过别名外连接一次查出；
+    - 一对多/多对多关系、模型属性方法、computed_field 或自定义序列化器无法编译，调用方回退到 model_validate；
+    - 字段投影：指定 fields 时只输出这些字段，否则输出除模型 __deferred_columns__（大字段）外的全部字段。
+    """
+
+    PLAN_CACHE_SIZE: int = 1024  # 最大缓存计划数（字段组合由请求决定，需限制数量）
+
+    _plans: dict[tuple[type, type, frozenset[str] | None], RowPlan | None] = {}
+
+    @staticmethod
+    def _has_custom_serialization(schema: type[BaseModel]) -> bool:
+        decorators = schema.__pydantic_decorators__
+        return bool(
+            decorators.computed_fields
+            or decorators.field_serializers
+            or decorators.model_serializers
+        )
+
+    @staticmethod
+    def _converter(field_info: Any, column: Any) -> Callable[[Any], Any] | None:
+        """生成字段值转换器，返回 None 表示直接透传"""
+        annotation, _ = _unwrap_optional(field_info.annotation)
+        metadata = field_info.metadata
+        if annotation in _PLAIN_TYPES and not any(
+            isinstance(item, _TRANSFORM_METADATA) for item in metadata
+        ):
+            try:
+                if column.type.python_type is annotation:
+                    return None
+            except NotImplementedError:
+                pass
+        adapter = TypeAdapter(
+            Annotated[(field_info.annotation, *metadata)] if metadata else field_info.annotation
+        )
+        return lambda value: adapter.dump_python(adapter.validate_python(value))
+
+    @classmethod
+    def _compile_fields(
+        cls,
+        plan: RowPlan,
+        entity: Any,
+        mapper: Any,
+        schema: type[BaseModel],
+        nested: bool,
+        include: frozenset[str] | None = None,
+    ) -> list | None:
+        """编译输出模型的字段计划，无法编译时返回 None"""
+        if cls._has_custom_serialization(schema):
+            return None
+        column_attrs = mapper.column_attrs
+        relationships = mapper.relationships
+        if include is None and not nested:
+            deferred = set(getattr(mapper.class_, "__deferred_columns__", []))
+            include = frozenset(name for name in schema.model_fields if name not in deferred)
+        fields: list = []
+        for name, field_info in schema.model_fields.items():
+            if include is not None and name not in include:
+                continue
+            # model_validate 按别名读取属性，输出键仍为字段名
+            source = field_info.validation_alias or field_info.alias or name
+            if not isinstance(source, str):
+                # AliasPath / AliasChoices
+                return None
+            if source in column_attrs:
+                attr = column_attrs[source]
+                index = plan.add_column(getattr(entity, source))
+                fields.append((name, index, cls._converter(field_info, attr.columns[0]), None))
+                continue
+
+            if not nested and source in relationships:
+                relationship = relationships[source]
+                nested_schema, _ = _unwrap_optional(field_info.annotation)
+                if (
+                    relationship.direction is not RelationshipDirection.MANYTOONE
+                    or relationship.uselist
+                    or not isinstance(nested_schema, type)
+                    or not issubclass(nested_schema, BaseModel)
+                ):
+                    return None
+                related_mapper = relationship.mapper
+                alias = aliased(related_mapper.class_)
+                plan.joins.append((getattr(entity, source), alias))
+                pk_index = plan.add_column(getattr(alias, related_mapper.primary_key[0].key))
+                nested_fields = cls._compile_fields(
+                    plan, alias, related_mapper, nested_schema, True
+                )
+                if nested_fields is None:
+                    return None
+                fields.append((name, (pk_index, nested_fields), None, None))
+                continue
+
+            # 模型上存在同名属性（属性方法、关系等）时无法仅靠列还原
+            if hasattr(mapper.class_, source) or field_info.is_required():
+                return None
+            fields.append((name, None, None, field_info.get_default(call_default_factory=True)))
+        return fields
+
+    @classmethod
+    def get_plan(
+        cls,
+        model: type[MappedBase],
+        schema: type[BaseModel],
+        fields: Sequence[str] | None = None,
+    ) -> RowPlan | None:
+        """
+        获取（编译并缓存）行序列化计划。
+
+        参数:
+        - model (type[MappedBase]): ORM 模型类。
+        - schema (type[BaseModel]): 输出模型类。
+        - fields (Sequence[str] | None): 需要输出的字段，未提供时输出除大字段外的全部字段。
+
+        返回:
+        - RowPlan | None: 序列化计划，无法编译时返回 None。
+        """
+        # 忽略输出模型中不存在的字段
+        include = frozenset(name for name in fields or () if name in schema.model_fields) or None
+        key = (model, schema, include)
+        if key not in cls._plans:
+            if len(cls._plans) >= cls.PLAN_CACHE_SIZE:
+                cls._plans.clear()
+            plan = RowPlan(model)
+            fields_plan = cls._compile_fields(
+                plan, model, sa_inspect(model), schema, False, include
+            )
+            if fields_plan is not None:
+                plan.fields = fields_plan
+            cls._plans[key] = plan if fields_plan is not None else None
+        return cls._plans[key]
@@ -1,3 +1,10 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
 import jwt
 from fastapi import Form, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -113,6 +120,133 @@ def create_access_token(payload: JWTPayloadSchema) -> str:
     )
 
 
+class TokenCache:
+    """
+    已验证令牌缓存
+
+    以令牌摘要为键缓存验签结果与解析后的会话信息(sub)，同一令牌的后续请求跳过验签与 JSON 解析。
+    缓存项在令牌 exp 到期时失效，数量超过 TOKEN_CACHE_SIZE 时按 LRU 淘汰；
+    退出登录、强制下线时按会话编号主动失效。只缓存令牌本身的解析结果，
+    会话是否有效仍以 Redis 中的在线会话为准(多 worker 下其他进程的缓存不影响吊销)。
+    """
+
+    # 令牌摘要 -> (过期时间戳, 载荷, 会话信息)
+    _items: OrderedDict[str, tuple[float, JWTPayloadSchema, dict[str, Any]]] = OrderedDict()
+    # 会话编号 -> 令牌摘要
+    _sessions: dict[str, set[str]] = {}
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def get(cls, token: str) -> tuple[JWTPayloadSchema, dict[str, Any]] | None:
+        """
+        获取未过期的缓存解析结果。
+
+        参数:
+        - token (str): JWT令牌字符串。
+
+        返回:
+        - tuple[JWTPayloadSchema, dict[str, Any]] | None: (载荷, 会话信息)，未命中时返回None。
+        """
+        digest = cls._digest(token)
+        item = cls._items.get(digest)
+        if item is None:
+            return None
+        if item[0] <= time.time():
+            cls._discard(digest)
+            return None
+        cls._items.move_to_end(digest)
+        return item[1], item[2]
+
+    @classmethod
+    def put(cls, token: str, payload: JWTPayloadSchema, session_info: dict[str, Any]) -> None:
+        """
+        缓存验签通过的令牌解析结果。
+
+        参数:
+        - token (str): JWT令牌字符串。
+        - payload (JWTPayloadSchema): 解析后的载荷。
+        - session_info (dict[str, Any]): 解析后的会话信息。
+
+        返回:
+        - None
+        """
+        if settings.TOKEN_CACHE_SIZE <= 0:
+            return
+        exp = payload.exp.timestamp() if isinstance(payload.exp, datetime) else payload.exp
+        digest = cls._digest(token)
+        cls._discard(digest)
+        cls._items[digest] = (exp, payload, session_info)
+        session_id = session_info.get("session_id")
+        if session_id:
+            cls._sessions.setdefault(session_id, set()).add(digest)
+        while len(cls._items) > settings.TOKEN_CACHE_SIZE:
+            cls._discard(next(iter(cls._items)))
+
+    @classmethod
+    def _discard(cls, digest: str) -> None:
+        item = cls._items.pop(digest, None)
+        if item is None:
+            return
+        session_id = item[2].get("session_id")
+        digests = cls._sessions.get(session_id) if session_id else None
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                cls._sessions.pop(session_id, None)
+
+    @classmethod
+    def invalidate_session(cls, session_id: str) -> None:
+        """
+        失效指定会话的全部缓存令牌(退出登录、强制下线)。
+
+        参数:
+        - session_id (str): 会话编号。
+
+        返回:
+        - None
+        """
+        for digest in list(cls._sessions.get(session_id, ())):
+            cls._discard(digest)
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空缓存(强制下线全部用户)"""
+        cls._items.clear()
+        cls._sessions.clear()
+
+
+def decode_token_session(token: str) -> tuple[JWTPayloadSchema, dict[str, Any]]:
+    """
+    解析JWT令牌并返回会话信息(命中已验证令牌缓存时跳过验签与解析)
+
+    参数:
+    - token (str): JWT令牌字符串。
+
+    返回:
+    - tuple[JWTPayloadSchema, dict[str, Any]]: (载荷, 会话信息)，会话信息为共享对象，调用方不可修改。
+
+    异常:
+    - CustomException: 解析失败时抛出,状态码为401。
+    """
+    if token:
+        cached = TokenCache.get(token)
+        if cached is not None:
+            return cached
+
+    payload = decode_access_token(token)
+    try:
+        session_info = json.loads(payload.sub)
+    except ValueError:
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+    if not isinstance(session_info, dict):
+        raise CustomException(msg="无效认证,请重新登录", code=10401, status_code=401)
+    TokenCache.put(token, payload, session_info)
+    return payload, session_info
+
+
 def decode_access_token(token: str) -> JWTPayloadSchema:
     """
     解析JWT访问令牌
@@ -0,0 +1,658 @@
+import asyncio
+import json
+import shutil
+import time
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+from apscheduler.util import obj_to_ref, ref_to_obj
+from fastapi import UploadFile
+from redis import exceptions
+from redis.asyncio.client import Redis
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+# 任务状态
+TASK_PENDING = "pending"
+TASK_RUNNING = "running"
+TASK_SUCCESS = "success"
+TASK_FAILED = "failed"
+TASK_CANCELLED = "cancelled"
+TASK_FINISHED = frozenset({TASK_SUCCESS, TASK_FAILED, TASK_CANCELLED})
+
+# 单个任务保留的进度事件条数
+TASK_EVENTS_MAXLEN = 200
+
+
+class TaskCancelled(asyncio.CancelledError):
+    """任务已被取消(继承 CancelledError，不会被业务代码的 except Exception 吞掉)"""
+
+
+def _state_key(task_id: str) -> str:
+    return f"{RedisInitKeyConfig.TASK_STATE.key}:{task_id}"
+
+
+def _events_key(task_id: str) -> str:
+    return f"{RedisInitKeyConfig.TASK_STATE.key}:{task_id}:events"
+
+
+def _task_dir(task_id: str) -> Path:
+    # 任务目录不在静态文件目录下，产物只能通过鉴权的任务接口下载
+    return settings.TASK_ARTIFACT_DIR.joinpath(task_id)
+
+
+async def publish_task(redis: Redis, task_id: str, **fields: Any) -> None:
+    """
+    更新任务状态并追加一条进度事件(同一管道内完成，SSE 订阅方按事件流读取)。
+
+    参数:
+    - redis (Redis): Redis 连接。
+    - task_id (str): 任务ID。
+    - **fields: 状态字段。
+
+    返回:
+    - None
+    """
+    values = {name: "" if value is None else str(value) for name, value in fields.items()}
+    values["updated_time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    state_key, events_key = _state_key(task_id), _events_key(task_id)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.hset(state_key, mapping=values)
+        pipe.expire(state_key, settings.TASK_STATE_EXPIRE)
+        pipe.xadd(events_key, values, maxlen=TASK_EVENTS_MAXLEN, approximate=True)
+        pipe.expire(events_key, settings.TASK_STATE_EXPIRE)
+        await pipe.execute()
+
+
+class TaskContext:
+    """
+    任务执行上下文
+
+    传给任务函数的第一个参数，提供进度上报、取消检查、数据库会话与产物路径。
+    """
+
+    def __init__(self, redis: Redis, task_id: str, user_id: int | None) -> None:
+        self.redis = redis
+        self.task_id = task_id
+        self.user_id = user_id
+        self.artifact: Path | None = None
+
+    async def check_cancelled(self) -> None:
+        """
+        检查任务是否已被取消。
+
+        返回:
+        - None
+
+        异常:
+        - TaskCancelled: 任务已被取消时抛出。
+        """
+        if await self.redis.hget(_state_key(self.task_id), "cancel") == "1":
+            raise TaskCancelled()
+
+    async def progress(self, current: int, total: int = 0, message: str = "") -> None:
+        """
+        上报任务进度，同时检查任务是否已被取消。
+
+        参数:
+        - current (int): 已处理数量。
+        - total (int): 总数量(未知时为 0)。
+        - message (str): 进度说明。
+
+        返回:
+        - None
+
+        异常:
+        - TaskCancelled: 任务已被取消时抛出。
+        """
+        await self.check_cancelled()
+        await publish_task(self.redis, self.task_id, progress=current, total=total, message=message)
+
+    @asynccontextmanager
+    async def auth(self, check_data_scope: bool = True) -> AsyncGenerator[AuthSchema, None]:
+        """
+        以提交任务的用户身份打开数据库事务(正常退出时提交，异常时回滚)。
+
+        参数:
+        - check_data_scope (bool): 是否启用数据权限过滤。
+
+        返回:
+        - AsyncGenerator[AuthSchema, None]: 认证信息。
+
+        异常:
+        - CustomException: 用户不存在或已停用时抛出。
+        """
+        from sqlalchemy.orm import selectinload
+
+        from app.api.v1.module_system.user.crud import UserCRUD
+        from app.api.v1.module_system.user.model import UserModel
+        from app.core.database import async_db_session, run_commit_hooks
+
+        async with async_db_session() as session:
+            async with session.begin():
+                auth = AuthSchema(db=session, check_data_scope=False)
+                user = None
+                if self.user_id is not None:
+                    user = await UserCRUD(auth).get(
+                        id=self.user_id,
+                        preload=[
+                            "dept",
+                            selectinload(UserModel.roles),
+                            "positions",
+                            "created_by",
+                        ],
+                    )
+                    if not user or user.status == "1":
+                        raise CustomException(msg="提交任务的用户不存在或已停用")
+                    user.roles = [role for role in user.roles if role and role.status]
+                    user.positions = [pos for pos in user.positions if pos and pos.status]
+                auth.user = user
+                auth.check_data_scope = check_data_scope
+                yield auth
+            await run_commit_hooks(session)
+
+    def artifact_path(self, file_name: str) -> Path:
+        """
+        获取任务产物文件路径(<TASK_ARTIFACT_DIR>/<task_id>/)，任务完成后由提交人通过任务接口下载。
+
+        参数:
+        - file_name (str): 文件名。
+
+        返回:
+        - Path: 文件路径。
+        """
+        path = _task_dir(self.task_id).joinpath(Path(file_name).name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.artifact = path
+        return path
+
+    @staticmethod
+    def upload_file(file_path: str, file_name: str) -> UploadFile:
+        """
+        以上传文件对象打开任务的输入文件(复用按 UploadFile 实现的服务)。
+
+        参数:
+        - file_path (str): 输入文件路径。
+        - file_name (str): 原始文件名。
+
+        返回:
+        - UploadFile: 上传文件对象。
+        """
+        return UploadFile(file=open(file_path, "rb"), filename=file_name)  # noqa: SIM115
+
+
+class TaskQueue:
+    """
+    后台任务队列(基于 Redis Stream)
+
+    导入、导出、代码生成等耗时操作在请求中只提交任务并立即返回任务ID，
+    由任务工作进程(Web 进程内嵌或 python main.py task-worker 独立启动)执行；
+    任务状态保存在 Redis Hash，进度事件追加到每个任务的 Stream，供轮询与 SSE 订阅。
+    """
+
+    @classmethod
+    async def submit(
+        cls,
+        redis: Redis,
+        func: Callable,
+        task_type: str,
+        title: str,
+        auth: AuthSchema,
+        kwargs: dict[str, Any] | None = None,
+        file: UploadFile | None = None,
+    ) -> dict[str, Any]:
+        """
+        提交后台任务。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - func (Callable): 任务函数(模块级函数或类方法，第一个参数为 TaskContext)。
+        - task_type (str): 任务类型，按类型限制并发(见 TASK_TYPE_CONCURRENCY)。
+        - title (str): 任务标题。
+        - auth (AuthSchema): 提交人认证信息，任务以该用户身份执行。
+        - kwargs (dict[str, Any] | None): 任务参数(需可 JSON 序列化)。
+        - file (UploadFile | None): 输入文件，保存到任务目录后以 file_path/file_name 参数传给任务函数。
+
+        返回:
+        - dict[str, Any]: 任务状态。
+        """
+        task_id = uuid.uuid4().hex
+        kwargs = dict(kwargs or {})
+        if file is not None:
+            file_name = Path(file.filename or "upload").name
+            file_path = _task_dir(task_id).joinpath("input", file_name)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(file_path, "wb") as f:
+                while chunk := await file.read(1024 * 1024):
+                    await f.write(chunk)
+            await file.close()
+            kwargs.update(file_path=str(file_path), file_name=file_name)
+
+        user_id = auth.user.id if auth.user else ""
+        await publish_task(
+            redis,
+            task_id,
+            task_id=task_id,
+            task_type=task_type,
+            title=title,
+            user_id=user_id,
+            status=TASK_PENDING,
+            progress=0,
+            total=0,
+            message="",
+            result="",
+            artifact="",
+            error="",
+            created_time=time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        await redis.xadd(
+            RedisInitKeyConfig.TASK_QUEUE.key,
+            {
+                "task_id": task_id,
+                "task_type": task_type,
+                "func": obj_to_ref(func),
+                "kwargs": json.dumps(kwargs, ensure_ascii=False),
+                "user_id": str(user_id),
+            },
+            maxlen=settings.TASK_QUEUE_MAXLEN,
+            approximate=True,
+        )
+        log.info(f"提交后台任务 {task_id}: {title}")
+        return await cls.get(redis, task_id)
+
+    @classmethod
+    async def get(cls, redis: Redis, task_id: str, user_id: int | None = None) -> dict[str, Any]:
+        """
+        查询任务状态。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID，只能查询本人提交的任务。
+
+        返回:
+        - dict[str, Any]: 任务状态。
+
+        异常:
+        - CustomException: 任务不存在或已过期时抛出。
+        """
+        state = await redis.hgetall(_state_key(task_id))
+        if not state or (user_id is not None and state.get("user_id") != str(user_id)):
+            raise CustomException(msg="任务不存在或已过期")
+        return cls._format(state)
+
+    @classmethod
+    async def artifact(cls, redis: Redis, task_id: str, user_id: int | None = None) -> Path:
+        """
+        获取任务产物文件路径。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID，只能下载本人提交的任务产物。
+
+        返回:
+        - Path: 产物文件路径。
+
+        异常:
+        - CustomException: 任务不存在、未完成或产物已过期时抛出。
+        """
+        state = await redis.hgetall(_state_key(task_id))
+        if not state or (user_id is not None and state.get("user_id") != str(user_id)):
+            raise CustomException(msg="任务不存在或已过期")
+        artifact = state.get("artifact") or ""
+        if state.get("status") != TASK_SUCCESS or not artifact:
+            raise CustomException(msg="任务没有可下载的产物")
+        path = _task_dir(task_id).joinpath(Path(artifact).name)
+        if not await asyncio.to_thread(path.is_file):
+            raise CustomException(msg="任务产物不存在或已过期")
+        return path
+
+    @staticmethod
+    def _format(state: dict[str, str]) -> dict[str, Any]:
+        """转换任务状态字段类型"""
+        result = state.get("result") or ""
+        artifact = state.get("artifact") or ""
+        return {
+            "task_id": state.get("task_id", ""),
+            "task_type": state.get("task_type", ""),
+            "title": state.get("title", ""),
+            "status": state.get("status", ""),
+            "progress": int(state.get("progress") or 0),
+            "total": int(state.get("total") or 0),
+            "message": state.get("message", ""),
+            "result": json.loads(result) if result else None,
+            "artifact": Path(artifact).name if artifact else None,
+            "artifact_url": (
+                f"{settings.ROOT_PATH}/common/task/{state.get('task_id', '')}/artifact"
+                if artifact
+                else None
+            ),
+            "error": state.get("error", ""),
+            "created_time": state.get("created_time", ""),
+            "updated_time": state.get("updated_time", ""),
+        }
+
+    @classmethod
+    async def cancel(cls, redis: Redis, task_id: str, user_id: int | None = None) -> dict[str, Any]:
+        """
+        取消任务：排队中的任务直接标记为已取消，执行中的任务由工作进程中断。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - user_id (int | None): 当前用户ID，只能取消本人提交的任务。
+
+        返回:
+        - dict[str, Any]: 任务状态。
+
+        异常:
+        - CustomException: 任务不存在或已结束时抛出。
+        """
+        state = await cls.get(redis, task_id, user_id)
+        if state["status"] in TASK_FINISHED:
+            raise CustomException(msg="任务已结束，无法取消")
+        if state["status"] == TASK_PENDING:
+            await publish_task(redis, task_id, cancel=1, status=TASK_CANCELLED, message="已取消")
+        else:
+            await publish_task(redis, task_id, cancel=1, message="正在取消")
+        return await cls.get(redis, task_id)
+
+    @classmethod
+    async def events(
+        cls, redis: Redis, task_id: str, last_event_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        以 SSE 格式输出任务进度事件，任务结束后结束输出。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - task_id (str): 任务ID。
+        - last_event_id (str | None): 客户端重连时的 Last-Event-ID，从该事件之后继续输出。
+
+        返回:
+        - AsyncIterator[str]: SSE 消息。
+        """
+        last_id = last_event_id or "0"
+        while True:
+            response = await redis.xread({_events_key(task_id): last_id}, count=50, block=15000)
+            if not response:
+                state = await redis.hgetall(_state_key(task_id))
+                if not state or state.get("status") in TASK_FINISHED:
+                    return
+                # 心跳注释，避免代理断开空闲连接
+                yield ": keepalive\n\n"
+                continue
+            for _, messages in response:
+                for message_id, fields in messages:
+                    last_id = message_id
+                    data = json.dumps(fields, ensure_ascii=False)
+                    yield f"id: {message_id}\nevent: progress\ndata: {data}\n\n"
+                    if fields.get("status") in TASK_FINISHED:
+                        state = cls._format(await redis.hgetall(_state_key(task_id)))
+                        data = json.dumps(state, ensure_ascii=False)
+                        yield f"id: {message_id}\nevent: done\ndata: {data}\n\n"
+                        return
+
+
+class TaskWorker:
+    """
+    后台任务工作进程
+
+    通过消费者组消费任务队列：整体并发受 TASK_WORKER_CONCURRENCY 限制，
+    各任务类型的并发受 TASK_TYPE_CONCURRENCY 限制(未配置的类型使用 TASK_DEFAULT_CONCURRENCY)；
+    执行中的任务定期续期(避免被其他消费者认领)并检查取消标记，
+    进程异常退出后未确认的任务在空闲超时后由其他工作进程认领重新执行；
+    定期清理超过 TASK_ARTIFACT_EXPIRE 的任务产物目录。
+    """
+
+    group_name: str = "task_workers"
+    # 未续期的消息可被其他消费者认领的空闲时间(毫秒)
+    claim_idle_ms: int = 2 * 60 * 1000
+    # 续期、取消检查间隔(秒)
+    watch_interval: float = 2.0
+    # 产物清理间隔(秒)
+    cleanup_interval: float = 10 * 60
+
+    _embedded: "TaskWorker | None" = None
+    _embedded_task: asyncio.Task | None = None
+
+    def __init__(self, redis: Redis, consumer_name: str) -> None:
+        """
+        初始化工作进程
+
+        参数:
+        - redis (Redis): Redis 连接(需 decode_responses=True)。
+        - consumer_name (str): 消费者名称。
+        """
+        self.redis = redis
+        self.consumer_name = consumer_name
+        self.stream_key = RedisInitKeyConfig.TASK_QUEUE.key
+        self.slots = asyncio.Semaphore(settings.TASK_WORKER_CONCURRENCY)
+        self.type_slots: dict[str, asyncio.Semaphore] = {}
+        # 执行中的任务: {消息ID: (任务ID, asyncio.Task)}
+        self.running: dict[str, tuple[str, asyncio.Task]] = {}
+
+    @classmethod
+    def start_embedded(cls, redis: Redis, consumer_name: str) -> None:
+        """
+        在当前(Web)进程中启动任务工作进程。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - consumer_name (str): 消费者名称。
+
+        返回:
+        - None
+        """
+        if cls._embedded_task and not cls._embedded_task.done():
+            return
+        cls._embedded = cls(redis=redis, consumer_name=consumer_name)
+        cls._embedded_task = asyncio.create_task(cls._embedded.run())
+
+    @classmethod
+    async def stop_embedded(cls) -> None:
+        """
+        停止内嵌的任务工作进程。
+
+        返回:
+        - None
+        """
+        if cls._embedded_task and not cls._embedded_task.done():
+            cls._embedded_task.cancel()
+            try:
+                await cls._embedded_task
+            except asyncio.CancelledError:
+                pass
+        cls._embedded = None
+        cls._embedded_task = None
+
+    def _type_slot(self, task_type: str) -> asyncio.Semaphore:
+        """获取任务类型的并发信号量"""
+        slot = self.type_slots.get(task_type)
+        if slot is None:
+            limit = settings.TASK_TYPE_CONCURRENCY.get(task_type, settings.TASK_DEFAULT_CONCURRENCY)
+            slot = self.type_slots[task_type] = asyncio.Semaphore(max(limit, 1))
+        return slot
+
+    async def _ensure_group(self) -> None:
+        """创建消费者组(已存在时忽略)"""
+        try:
+            await self.redis.xgroup_create(self.stream_key, self.group_name, id="0", mkstream=True)
+        except exceptions.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _execute(self, message_id: str, fields: dict[str, str]) -> None:
+        """执行单条任务消息，结束后确认(进程停止导致的中断不确认，由其他工作进程认领重新执行)"""
+        task_id = fields.get("task_id", "")
+        ack = False
+        try:
+            async with self._type_slot(fields.get("task_type", "")):
+                state = await self.redis.hgetall(_state_key(task_id))
+                if not state or state.get("status") in TASK_FINISHED or state.get("cancel") == "1":
+                    ack = True
+                    return
+                user_id = fields.get("user_id")
+                context = TaskContext(
+                    redis=self.redis, task_id=task_id, user_id=int(user_id) if user_id else None
+                )
+                await publish_task(
+                    self.redis,
+                    task_id,
+                    status=TASK_RUNNING,
+                    message="执行中",
+                    worker=self.consumer_name,
+                )
+                start_time = time.perf_counter()
+                try:
+                    func = ref_to_obj(fields["func"])
+                    result = await func(context, **json.loads(fields.get("kwargs") or "{}"))
+                    await publish_task(
+                        self.redis,
+                        task_id,
+                        status=TASK_SUCCESS,
+                        message="执行完成",
+                        result=json.dumps(result, ensure_ascii=False, default=str),
+                        artifact=context.artifact or "",
+                    )
+                    log.info(
+                        f"后台任务 {task_id} 执行完成，耗时 {time.perf_counter() - start_time:.3f}s"
+                    )
+                except (TaskCancelled, asyncio.CancelledError):
+                    if await self.redis.hget(_state_key(task_id), "cancel") != "1":
+                        # 工作进程停止：恢复为排队状态，等待重新执行
+                        await publish_task(
+                            self.redis, task_id, status=TASK_PENDING, message="等待重新执行"
+                        )
+                        raise
+                    await publish_task(self.redis, task_id, status=TASK_CANCELLED, message="已取消")
+                    log.info(f"后台任务 {task_id} 已取消")
+                except Exception as e:
+                    await publish_task(
+                        self.redis, task_id, status=TASK_FAILED, message="执行失败", error=str(e)
+                    )
+                    log.error(f"后台任务 {task_id} 执行失败: {e!s}")
+                ack = True
+        finally:
+            if ack:
+                await self.redis.xack(self.stream_key, self.group_name, message_id)
+            self.running.pop(message_id, None)
+            self.slots.release()
+
+    async def _dispatch(self, messages: list) -> None:
+        """按整体并发上限分发消息"""
+        for message_id, fields in messages:
+            if not fields:
+                # 已被裁剪的消息，直接确认
+                await self.redis.xack(self.stream_key, self.group_name, message_id)
+                continue
+            await self.slots.acquire()
+            task = asyncio.create_task(self._execute(message_id, fields))
+            self.running[message_id] = (fields.get("task_id", ""), task)
+
+    async def _watch(self) -> None:
+        """续期执行中的消息并中断已取消的任务"""
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            running = list(self.running.items())
+            if not running:
+                continue
+            try:
+                await self.redis.xclaim(
+                    self.stream_key,
+                    self.group_name,
+                    self.consumer_name,
+                    min_idle_time=0,
+                    message_ids=[message_id for message_id, _ in running],
+                    justid=True,
+                )
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for _, (task_id, _task) in running:
+                        pipe.hget(_state_key(task_id), "cancel")
+                    flags = await pipe.execute()
+                for (_, (_task_id, task)), flag in zip(running, flags, strict=True):
+                    if flag == "1" and not task.done():
+                        task.cancel()
+            except Exception as e:
+                log.error(f"后台任务续期检查失败: {e!s}")
+
+    @staticmethod
+    def _cleanup_artifacts() -> int:
+        """删除过期的任务目录(同步，在线程池中执行)"""
+        root = settings.TASK_ARTIFACT_DIR
+        if not root.is_dir():
+            return 0
+        expire_before = time.time() - settings.TASK_ARTIFACT_EXPIRE
+        removed = 0
+        for path in root.iterdir():
+            try:
+                if path.is_dir() and path.stat().st_mtime < expire_before:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    async def _cleanup(self) -> None:
+        """定期清理过期的任务产物"""
+        while True:
+            try:
+                removed = await asyncio.to_thread(self._cleanup_artifacts)
+                if removed:
+                    log.info(f"已清理 {removed} 个过期的后台任务目录")
+            except Exception as e:
+                log.error(f"清理后台任务产物失败: {e!s}")
+            await asyncio.sleep(self.cleanup_interval)
+
+    async def run(self) -> None:
+        """
+        消费循环：先认领超时未确认的消息，再阻塞读取新消息。
+
+        返回:
+        - None
+        """
+        await self._ensure_group()
+        log.info(f"🚀 后台任务工作进程已启动: {self.consumer_name}")
+        helpers = [asyncio.create_task(self._watch()), asyncio.create_task(self._cleanup())]
+        claim_interval = 60
+        last_claim = 0.0
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if loop.time() - last_claim >= claim_interval:
+                    last_claim = loop.time()
+                    claimed = await self.redis.xautoclaim(
+                        self.stream_key,
+                        self.group_name,
+                        self.consumer_name,
+                        min_idle_time=self.claim_idle_ms,
+                        count=settings.TASK_WORKER_CONCURRENCY,
+                    )
+                    await self._dispatch(claimed[1])
+
+                response = await self.redis.xreadgroup(
+                    self.group_name,
+                    self.consumer_name,
+                    streams={self.stream_key: ">"},
+                    count=settings.TASK_WORKER_CONCURRENCY,
+                    block=5000,
+                )
+                for _, messages in response or []:
+                    await self._dispatch(messages)
+        finally:
+            for helper in helpers:
+                helper.cancel()
+            tasks = [task for _, task in self.running.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*helpers, *tasks, return_exceptions=True)
+            log.info(f"✅️ 后台任务工作进程已退出: {self.consumer_name}")
@@ -1,3 +1,5 @@
+import os
+import socket
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -18,6 +20,7 @@ from app.core.exceptions import handle_exception
 from app.core.http_limit import http_limit_callback, ws_limit_callback
 from app.core.logger import log
 from app.scripts.initialize import InitializeData
+from app.utils.captcha_util import CaptchaPool
 from app.utils.common_util import import_module, import_modules_async
 from app.utils.console import console_close, console_run
 
@@ -33,8 +36,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     返回:
     - AsyncGenerator[Any, Any]: 生命周期上下文生成器。
     """
+    from app.api.v1.module_monitor.resource.index import ResourceIndex
+    from app.api.v1.module_monitor.server.sampler import ServerSampler
+    from app.api.v1.module_system.dict.cache import DictCache
     from app.api.v1.module_system.dict.service import DictDataService
     from app.api.v1.module_system.params.service import ParamsService
+    from app.core.task_queue import TaskWorker
+    from app.plugin.module_application.ai.llm import LLMClientRegistry
+    from app.plugin.module_application.ai.mcp_runtime import McpRuntime
     from app.plugin.module_application.job.tools.ap_scheduler import SchedulerUtil
 
     try:
@@ -48,6 +57,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
         log.info("✅ Redis系统配置初始化完成")
         await DictDataService().init_dict_service(redis=app.state.redis)
         log.info("✅ Redis数据字典初始化完成")
+        if settings.DICT_NEAR_CACHE_ENABLE:
+            DictCache.start(redis=app.state.redis)
+            log.info("✅ 数据字典近端缓存已启动")
         await SchedulerUtil.init_system_scheduler(redis=app.state.redis)
         log.info("✅ 定时任务调度器初始化完成")
         await FastAPILimiter.init(
@@ -57,6 +69,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
             ws_callback=ws_limit_callback,
         )
         log.info("✅ 请求限流器初始化完成")
+        if settings.CAPTCHA_ENABLE and settings.CAPTCHA_POOL_ENABLE:
+            CaptchaPool.start(redis=app.state.redis)
+            log.info("✅ 验证码池已启动")
+        if settings.STATIC_ENABLE and settings.RESOURCE_INDEX_WATCH:
+            ResourceIndex.start_watch(str(settings.STATIC_ROOT))
+            log.info("✅ 资源目录变更监听已启动")
+        ServerSampler.start()
+        log.info("✅ 服务器指标采样已启动")
+        if settings.MCP_ENABLE:
+            McpRuntime.start()
+            log.info("✅ MCP 运行时已启动")
+        if settings.TASK_WORKER_EMBEDDED:
+            TaskWorker.start_embedded(
+                redis=app.state.redis, consumer_name=f"{socket.gethostname()}:{os.getpid()}"
+            )
+            log.info("✅ 后台任务工作进程已启动")
 
         # 导入并显示最终的启动信息面板
         from app.common.enums import EnvironmentEnum
@@ -85,8 +113,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
         log.info("✅ 全局事件模块卸载完成")
         await SchedulerUtil.close_system_scheduler()
         log.info("✅ 定时任务调度器已关闭")
+        await ResourceIndex.stop_watch()
+        await ServerSampler.stop()
+        await DictCache.stop()
+        await TaskWorker.stop_embedded()
+        await McpRuntime.stop()
+        await LLMClientRegistry.close()
         await FastAPILimiter.close()
         log.info("✅ 请求限制器已关闭")
+        await CaptchaPool.stop()
         console_close()
 
     except Exception as e:
@@ -154,6 +189,14 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(
         router=WS_AI, dependencies=[Depends(WebSocketRateLimiter(times=1, seconds=5))]
     )
+    # Prometheus 指标采集接口(不走限流与用户鉴权，按 METRICS_TOKEN 或本机来源校验)
+    if settings.METRICS_ENABLE:
+        from app.core.metrics import Metrics
+
+        app.add_api_route(
+            settings.METRICS_URL, Metrics.render, methods=["GET"], include_in_schema=False
+        )
+
     # 先将动态路由注册到应用，使用速率限制器
     from app.core.discover import get_dynamic_router
 
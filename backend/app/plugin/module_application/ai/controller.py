@@ -37,16 +37,19 @@ async def chat_controller(
 
     参数:
     - query (ChatQuerySchema): 聊天查询模型
+    - auth (AuthSchema): 认证信息模型
 
     返回:
     - StreamingResponse: 流式响应,每次返回一个聊天响应
     """
     user_name = auth.user.name if auth.user else "未知用户"
     log.info(f"用户 {user_name} 发起智能对话: {query.message[:50]}...")
+    # 流式响应开始前完成权限校验(响应期间数据库会话已关闭)
+    use_tools = await McpService.tools_permitted(auth)
 
     async def generate_response():
         try:
-            async for chunk in McpService.chat_query(query=query):
+            async for chunk in McpService.chat_query(query=query, use_tools=use_tools):
                 # 确保返回的是字节串
                 if chunk:
                     yield (chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
@@ -0,0 +1,139 @@
+import hashlib
+from collections import deque
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+
+from app.config.setting import settings
+from app.core.logger import log
+
+SYSTEM_PROMPT = "你是一个有用的AI助手，可以帮助用户回答问题和提供帮助。请用中文回答用户的问题。"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本 token 数(不依赖分词器)：中日韩字符按 1 个 token 计，其余字符按 4 个字符 1 个 token 计。
+
+    参数:
+    - text (str): 文本。
+
+    返回:
+    - int: 估算的 token 数。
+    """
+    wide = sum(1 for char in text if ord(char) > 0x2E7F)
+    return wide + (len(text) - wide + 3) // 4
+
+
+class LLMClientRegistry:
+    """
+    大模型客户端注册表
+
+    按 供应商/模型/接口地址/密钥摘要 复用 ChatOpenAI 实例(及其底层 HTTP 连接池)，
+    所有连接与请求共享，避免每条消息都重新创建客户端并建立连接。
+    """
+
+    _clients: dict[tuple[str, str, str, str], ChatOpenAI] = {}
+
+    @classmethod
+    def get(
+        cls,
+        provider: str = "openai",
+        model: str | None = None,
+        base_url: str | None = None,
+        api_key: str | None = None,
+    ) -> ChatOpenAI:
+        """
+        获取(或创建)共享的流式聊天客户端，未指定的参数使用系统配置。
+
+        参数:
+        - provider (str): 供应商(需兼容 OpenAI 接口)。
+        - model (str | None): 模型名称。
+        - base_url (str | None): 接口地址。
+        - api_key (str | None): 接口密钥。
+
+        返回:
+        - ChatOpenAI: 聊天客户端。
+        """
+        model = model or settings.OPENAI_MODEL
+        base_url = base_url or settings.OPENAI_BASE_URL
+        key_digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+        registry_key = (provider, model, base_url, key_digest)
+        client = cls._clients.get(registry_key)
+        if client is None:
+            client = ChatOpenAI(
+                # 未指定密钥时每次请求读取系统配置，配置变更无需重建客户端
+                api_key=(lambda: api_key) if api_key else (lambda: settings.OPENAI_API_KEY),
+                model=model,
+                base_url=base_url or None,
+                temperature=0.7,
+                streaming=True,
+            )
+            cls._clients[registry_key] = client
+        return client
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        关闭全部客户端的 HTTP 连接。
+
+        返回:
+        - None
+        """
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            root_client: Any = getattr(client, "root_async_client", None)
+            if root_client is None:
+                continue
+            try:
+                await root_client.close()
+            except Exception as e:
+                log.debug(f"关闭大模型客户端时发生异常: {e!s}")
+
+
+class ChatMemory:
+    """
+    单个会话(WebSocket 连接)的对话记忆
+
+    按轮次保存用户消息与助手回复，最多保留 AI_CHAT_MEMORY_TURNS 轮，
+    组装上下文时从最近一轮向前累加，估算 token 数超过 AI_CHAT_MEMORY_TOKENS 时截断更早的轮次。
+    """
+
+    def __init__(self, max_tokens: int | None = None, max_turns: int | None = None) -> None:
+        self.max_tokens = max_tokens or settings.AI_CHAT_MEMORY_TOKENS
+        self._turns: deque[tuple[str, str, int]] = deque(
+            maxlen=max_turns or settings.AI_CHAT_MEMORY_TURNS
+        )
+
+    def add_turn(self, message: str, reply: str) -> None:
+        """
+        记录一轮对话。
+
+        参数:
+        - message (str): 用户消息。
+        - reply (str): 助手回复。
+
+        返回:
+        - None
+        """
+        self._turns.append((message, reply, estimate_tokens(message) + estimate_tokens(reply)))
+
+    def build_messages(self, message: str) -> list[BaseMessage]:
+        """
+        组装本轮请求的消息列表(系统提示词 + 截断后的历史 + 当前消息)。
+
+        参数:
+        - message (str): 当前用户消息。
+
+        返回:
+        - list[BaseMessage]: 消息列表。
+        """
+        budget = self.max_tokens - estimate_tokens(SYSTEM_PROMPT) - estimate_tokens(message)
+        history: list[BaseMessage] = []
+        for past_message, reply, tokens in reversed(self._turns):
+            budget -= tokens
+            if budget < 0:
+                break
+            history[:0] = [HumanMessage(content=past_message), AIMessage(content=reply)]
+        return [SystemMessage(content=SYSTEM_PROMPT), *history, HumanMessage(content=message)]
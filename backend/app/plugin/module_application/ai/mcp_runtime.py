@@ -0,0 +1,426 @@
+import asyncio
+import shlex
+import time
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any
+
+from langchain_core.tools import BaseTool, StructuredTool, ToolException
+from mcp import ClientSession, StdioServerParameters, types
+from mcp.client.sse import sse_client
+from mcp.client.stdio import get_default_environment, stdio_client
+from sqlalchemy import select
+
+from app.common.enums import McpType
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+
+from .model import McpModel
+
+# 连接失败后的最长重试间隔(秒)
+MCP_MAX_BACKOFF = 300
+
+
+def mcp_definition(obj: Any) -> dict[str, Any]:
+    """
+    将 MCP 服务器记录转换为运行时配置。
+
+    参数:
+    - obj (Any): McpModel 实例或具有相同字段的对象。
+
+    返回:
+    - dict[str, Any]: 运行时配置。
+    """
+    return {
+        "id": obj.id,
+        "name": obj.name,
+        "type": getattr(obj.type, "value", obj.type),
+        "url": str(obj.url) if obj.url else None,
+        "command": obj.command,
+        "args": obj.args,
+        "env": dict(obj.env or {}),
+        "status": obj.status,
+    }
+
+
+class McpConnection:
+    """
+    单个 MCP 服务器的长连接
+
+    stdio 类型保持一个常驻子进程，sse 类型保持一条 HTTP 长连接。
+    连接上下文由专属后台任务持有(传输层的任务组必须在同一任务中进入和退出)，
+    工具列表在连接内缓存，收到 tools/list_changed 通知或重连时失效；
+    工具调用受 MCP_SERVER_CONCURRENCY 限制，连接失败后按指数退避重试。
+    """
+
+    def __init__(self, server: dict[str, Any]) -> None:
+        self.server = server
+        self.session: ClientSession | None = None
+        self.tools: list[types.Tool] | None = None
+        self.semaphore = asyncio.Semaphore(settings.MCP_SERVER_CONCURRENCY)
+        self.failures = 0
+        self._retry_at = 0.0
+        self._task: asyncio.Task | None = None
+        self._stop: asyncio.Event | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.server["name"]
+
+    @staticmethod
+    def fingerprint(server: dict[str, Any]) -> tuple:
+        """连接相关的配置，变更时需要重建连接"""
+        return (
+            server["type"],
+            server["url"],
+            server["command"],
+            server["args"],
+            tuple(sorted(server["env"].items())),
+        )
+
+    def _transport(self) -> Any:
+        if self.server["type"] == McpType.sse.value:
+            if not self.server["url"]:
+                raise ValueError("未配置远程 SSE 地址")
+            return sse_client(self.server["url"], timeout=settings.MCP_CONNECT_TIMEOUT)
+        if not self.server["command"]:
+            raise ValueError("未配置 MCP 命令")
+        return stdio_client(
+            StdioServerParameters(
+                command=self.server["command"],
+                args=shlex.split(self.server["args"] or ""),
+                env={**get_default_environment(), **self.server["env"]},
+            )
+        )
+
+    async def _message_handler(self, message: Any) -> None:
+        """处理服务端通知：工具列表变更时失效缓存"""
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            log.info(f"MCP 服务器 {self.name} 工具列表已变更")
+            self.tools = None
+            McpRuntime.tools_changed()
+        elif isinstance(message, Exception):
+            log.warning(f"MCP 服务器 {self.name} 传输异常: {message!s}")
+
+    async def _serve(self, ready: asyncio.Future) -> None:
+        """持有连接直到收到停止信号"""
+        try:
+            async with AsyncExitStack() as stack:
+                read, write, *_ = await stack.enter_async_context(self._transport())
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=settings.MCP_CALL_TIMEOUT),
+                        message_handler=self._message_handler,
+                    )
+                )
+                await session.initialize()
+                self.session = session
+                ready.set_result(None)
+                await self._stop.wait()  # pyright: ignore[reportOptionalMemberAccess]
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                log.error(f"MCP 服务器 {self.name} 连接中断: {e!s}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+            if self.session is not None:
+                McpRuntime.tools_changed()
+            self.session = None
+            self.tools = None
+
+    async def _close_task(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        if self._task is not None:
+            done, _ = await asyncio.wait({self._task}, timeout=5)
+            if not done:
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._stop = None
+
+    async def ensure(self) -> ClientSession:
+        """
+        获取可用会话，未连接时建立连接。
+
+        返回:
+        - ClientSession: MCP 会话。
+
+        异常:
+        - ToolException: 连接失败或处于退避期时抛出。
+        """
+        if self.session is not None:
+            return self.session
+        async with self._lock:
+            if self.session is not None:
+                return self.session
+            if time.monotonic() < self._retry_at:
+                raise ToolException(f"MCP 服务器 {self.name} 暂不可用，稍后重试")
+            await self._close_task()
+            ready = asyncio.get_running_loop().create_future()
+            self._stop = asyncio.Event()
+            self._task = asyncio.create_task(self._serve(ready))
+            try:
+                await asyncio.wait_for(asyncio.shield(ready), settings.MCP_CONNECT_TIMEOUT)
+            except Exception as e:
+                self.failures += 1
+                self._retry_at = time.monotonic() + min(2**self.failures, MCP_MAX_BACKOFF)
+                await self._close_task()
+                raise ToolException(f"MCP 服务器 {self.name} 连接失败: {e!s}") from e
+            self.failures = 0
+            log.info(f"MCP 服务器 {self.name} 已连接")
+            return self.session  # pyright: ignore[reportReturnType]
+
+    async def close(self) -> None:
+        """关闭连接(stdio 子进程随之退出)"""
+        async with self._lock:
+            await self._close_task()
+
+    async def list_tools(self) -> list[types.Tool]:
+        """
+        获取工具列表(连接内缓存)。
+
+        返回:
+        - list[types.Tool]: 工具定义列表。
+        """
+        if self.tools is not None:
+            return self.tools
+        session = await self.ensure()
+        tools: list[types.Tool] = []
+        cursor: str | None = None
+        while True:
+            result = await session.list_tools(cursor=cursor)
+            tools.extend(result.tools)
+            cursor = result.nextCursor
+            if not cursor:
+                break
+        self.tools = tools
+        return tools
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> str:
+        """
+        调用工具(受单服务器并发数限制)。
+
+        参数:
+        - name (str): 工具名称。
+        - arguments (dict[str, Any]): 工具参数。
+
+        返回:
+        - str: 工具返回的文本内容。
+
+        异常:
+        - ToolException: 连接失败或工具返回错误时抛出。
+        """
+        async with self.semaphore:
+            session = await self.ensure()
+            result = await session.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds=timedelta(seconds=settings.MCP_CALL_TIMEOUT),
+            )
+        text = "\n".join(
+            item.text for item in result.content if isinstance(item, types.TextContent)
+        )
+        if result.isError:
+            raise ToolException(text or f"工具 {name} 执行失败")
+        return text
+
+    async def check(self) -> None:
+        """健康检查：未连接时尝试连接，ping 失败时重启连接"""
+        if self.session is None:
+            if time.monotonic() >= self._retry_at:
+                try:
+                    await self.ensure()
+                except ToolException as e:
+                    log.warning(str(e))
+            return
+        try:
+            await asyncio.wait_for(self.session.send_ping(), settings.MCP_CONNECT_TIMEOUT)
+        except Exception as e:
+            log.warning(f"MCP 服务器 {self.name} 健康检查失败，重启连接: {e!s}")
+            await self.close()
+            try:
+                await self.ensure()
+            except ToolException as error:
+                log.warning(str(error))
+
+
+class McpRuntime:
+    """
+    MCP 运行时
+
+    为已启用的 MCP 服务器维护常驻连接池，汇总各服务器的工具并转换为 LangChain 工具供对话调用，
+    汇总结果缓存到任一服务器工具列表变更为止。后台任务按 MCP_HEALTH_INTERVAL 同步数据库中的服务器配置
+    (多 worker 下各自生效)并对每个连接做健康检查，异常连接自动重启。
+    """
+
+    _connections: dict[int, McpConnection] = {}
+    _tools: list[BaseTool] | None = None
+    _version: int = 0
+    _health_task: asyncio.Task | None = None
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        启动后台同步与健康检查任务(需在事件循环中调用)。
+
+        返回:
+        - None
+        """
+        if not settings.MCP_ENABLE or (cls._health_task and not cls._health_task.done()):
+            return
+        cls._health_task = asyncio.create_task(cls._health_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台任务并关闭全部连接。
+
+        返回:
+        - None
+        """
+        if cls._health_task and not cls._health_task.done():
+            cls._health_task.cancel()
+            await asyncio.gather(cls._health_task, return_exceptions=True)
+        cls._health_task = None
+        connections = list(cls._connections.values())
+        cls._connections.clear()
+        cls.tools_changed()
+        await asyncio.gather(*(connection.close() for connection in connections))
+
+    @classmethod
+    def tools_changed(cls) -> None:
+        """失效汇总的工具列表"""
+        cls._version += 1
+        cls._tools = None
+
+    @classmethod
+    async def upsert(cls, obj: Any) -> None:
+        """
+        新增或更新服务器配置，连接相关配置变更时重建连接，禁用时关闭连接。
+
+        参数:
+        - obj (Any): McpModel 实例或 mcp_definition 返回的配置。
+
+        返回:
+        - None
+        """
+        server = obj if isinstance(obj, dict) else mcp_definition(obj)
+        if server["status"] != "0":
+            await cls.remove([server["id"]])
+            return
+        connection = cls._connections.get(server["id"])
+        if connection is not None:
+            if McpConnection.fingerprint(connection.server) == McpConnection.fingerprint(server):
+                connection.server = server
+                return
+            await connection.close()
+        cls._connections[server["id"]] = McpConnection(server)
+        cls.tools_changed()
+
+    @classmethod
+    async def remove(cls, ids: list[int]) -> None:
+        """
+        移除服务器并关闭连接。
+
+        参数:
+        - ids (list[int]): MCP 服务器ID列表。
+
+        返回:
+        - None
+        """
+        connections = [cls._connections.pop(id) for id in ids if id in cls._connections]
+        if connections:
+            cls.tools_changed()
+            await asyncio.gather(*(connection.close() for connection in connections))
+
+    @classmethod
+    async def reload(cls) -> None:
+        """
+        从数据库同步服务器配置。
+
+        返回:
+        - None
+        """
+        async with async_db_session() as session:
+            rows = (await session.execute(select(McpModel))).scalars().all()
+            servers = [mcp_definition(row) for row in rows]
+        enabled = {server["id"] for server in servers if server["status"] == "0"}
+        await cls.remove([id for id in cls._connections if id not in enabled])
+        for server in servers:
+            if server["id"] in enabled:
+                await cls.upsert(server)
+
+    @classmethod
+    async def _health_loop(cls) -> None:
+        while True:
+            try:
+                await cls.reload()
+                await asyncio.gather(
+                    *(connection.check() for connection in list(cls._connections.values()))
+                )
+            except Exception as e:
+                log.error(f"MCP 运行时健康检查失败: {e!s}")
+            await asyncio.sleep(settings.MCP_HEALTH_INTERVAL)
+
+    @classmethod
+    async def get_tools(cls) -> list[BaseTool]:
+        """
+        获取全部可用的 MCP 工具(LangChain 工具)，不可用的服务器跳过。
+
+        返回:
+        - list[BaseTool]: 工具列表。
+        """
+        if not settings.MCP_ENABLE:
+            return []
+        if cls._tools is not None:
+            return cls._tools
+        version = cls._version
+        connections = list(cls._connections.items())
+        results = await asyncio.gather(
+            *(connection.list_tools() for _, connection in connections), return_exceptions=True
+        )
+        tools: list[BaseTool] = []
+        names: set[str] = set()
+        complete = True
+        for (server_id, connection), result in zip(connections, results, strict=True):
+            if isinstance(result, BaseException):
+                log.warning(f"获取 MCP 服务器 {connection.name} 工具列表失败: {result!s}")
+                complete = False
+                continue
+            for tool in result:
+                if tool.name in names:
+                    log.warning(
+                        f"MCP 服务器 {connection.name} 的工具 {tool.name} 与已有工具重名，已忽略"
+                    )
+                    continue
+                names.add(tool.name)
+                tools.append(cls._to_langchain_tool(server_id, tool))
+        # 期间工具列表发生变更或存在不可用的服务器时不缓存，下次重新获取
+        if complete and version == cls._version:
+            cls._tools = tools
+        return tools
+
+    @classmethod
+    def _to_langchain_tool(cls, server_id: int, tool: types.Tool) -> BaseTool:
+        async def call(**arguments: Any) -> str:
+            connection = cls._connections.get(server_id)
+            if connection is None:
+                raise ToolException(f"MCP 服务器已移除，无法调用工具 {tool.name}")
+            return await connection.call_tool(tool.name, arguments)
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description or tool.name,
+            args_schema=tool.inputSchema,
+            coroutine=call,
+            handle_tool_error=True,
+        )
@@ -1,17 +1,21 @@
-from collections.abc import AsyncGenerator
-from typing import Any
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import AIMessageChunk, ToolCall, ToolMessage
+from langchain_core.tools import BaseTool
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.core.exceptions import CustomException
 from app.config.setting import settings
+from app.core.database import on_commit
+from app.core.dependencies import AuthPermission
+from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.metrics import LLMStreamMetrics
 
 from .crud import McpCRUD
+from .llm import ChatMemory, LLMClientRegistry
+from .mcp_runtime import McpRuntime, mcp_definition
 from .schema import (
     ChatQuerySchema,
     McpCreateSchema,
@@ -20,9 +24,34 @@ from .schema import (
     McpUpdateSchema,
 )
 
+# 对话中调用 MCP 工具所需的权限标识
+MCP_TOOL_PERMISSION = "module_application:ai:tool"
+
+
 class McpService:
     """MCP服务层"""
 
+    @classmethod
+    async def tools_permitted(cls, auth: AuthSchema | None) -> bool:
+        """
+        判断当前用户能否在对话中调用 MCP 工具
+
+        参数:
+        - auth (AuthSchema | None): 认证信息模型，未认证时为空
+
+        返回:
+        - bool: 已启用 MCP 且用户拥有工具调用权限时返回 True
+        """
+        if not settings.MCP_ENABLE or auth is None or auth.user is None:
+            return False
+        try:
+            await AuthPermission([MCP_TOOL_PERMISSION], check_data_scope=auth.check_data_scope)(
+                auth
+            )
+        except CustomException:
+            return False
+        return True
+
     @classmethod
     async def detail_service(cls, auth: AuthSchema, id: int) -> dict[str, Any]:
         """
@@ -59,8 +88,9 @@ class McpService:
         - list[dict[str, Any]]: MCP服务器详情字典列表
         """
         search_dict = search.__dict__ if search else None
-        obj_list = await McpCRUD(auth).get_list_crud(search=search_dict, order_by=order_by)
-        return [McpOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+        return await McpCRUD(auth).list_dict(
+            out_schema=McpOutSchema, search=search_dict, order_by=order_by
+        )
 
     @classmethod
     async def create_service(cls, auth: AuthSchema, data: McpCreateSchema) -> dict[str, Any]:
@@ -78,6 +108,9 @@ class McpService:
         if obj:
             raise CustomException(msg="创建失败，MCP 服务器已存在")
         obj = await McpCRUD(auth).create_crud(data=data)
+        # 事务提交后再建立连接，回滚时不会留下连接
+        server = mcp_definition(obj)
+        on_commit(auth.db, f"mcp_runtime:{server['id']}", lambda: McpRuntime.upsert(server))
         return McpOutSchema.model_validate(obj).model_dump()
 
     @classmethod
@@ -102,6 +135,8 @@ class McpService:
         if exist_obj and exist_obj.id != id:
             raise CustomException(msg="更新失败，MCP 服务器名称重复")
         obj = await McpCRUD(auth).update_crud(id=id, data=data)
+        server = mcp_definition(obj)
+        on_commit(auth.db, f"mcp_runtime:{server['id']}", lambda: McpRuntime.upsert(server))
         return McpOutSchema.model_validate(obj).model_dump()
 
     @classmethod
@@ -118,49 +153,92 @@ class McpService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            obj = await McpCRUD(auth).get_by_id_crud(id=id)
-            if not obj:
-                raise CustomException(msg="删除失败，该数据不存在")
+        await McpCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await McpCRUD(auth).delete_crud(ids=ids)
+        on_commit(auth.db, "mcp_runtime:remove", lambda: McpRuntime.remove(ids))
 
     @classmethod
-    async def chat_query(cls, query: ChatQuerySchema) -> AsyncGenerator[str, Any]:
+    async def _run_tool(cls, tools: dict[str, BaseTool], call: ToolCall) -> ToolMessage:
+        """
+        执行一次工具调用，异常时以错误结果返回给模型
+
+        参数:
+        - tools (dict[str, BaseTool]): 可用工具
+        - call (ToolCall): 模型返回的工具调用
+
+        返回:
+        - ToolMessage: 工具结果消息
+        """
+        tool = tools.get(call["name"])
+        if tool is None:
+            return ToolMessage(
+                content=f"工具 {call['name']} 不存在", tool_call_id=call["id"], status="error"
+            )
+        try:
+            return await tool.ainvoke(call)
+        except Exception as e:
+            log.error(f"调用 MCP 工具 {call['name']} 失败: {e!s}")
+            return ToolMessage(
+                content=f"工具调用失败: {e!s}", tool_call_id=call["id"], status="error"
+            )
+
+    @classmethod
+    async def chat_query(
+        cls, query: ChatQuerySchema, memory: ChatMemory | None = None, use_tools: bool = False
+    ) -> AsyncGenerator[str, Any]:
         """
         处理聊天查询
 
         参数:
         - query (ChatQuerySchema): 聊天查询模型
+        - memory (ChatMemory | None): 会话记忆，为空时不携带历史上下文
+        - use_tools (bool): 是否提供 MCP 工具(调用方需先通过 tools_permitted 校验权限)
 
         返回:
         - AsyncGenerator[str, None]: 异步生成器,每次返回一个聊天响应
         """
-        # 创建MCP客户端实例
-        lll_model = ChatOpenAI(
-            api_key=lambda: settings.OPENAI_API_KEY,
-            model=settings.OPENAI_MODEL,
-            base_url=settings.OPENAI_BASE_URL,
-            temperature=0.7,
-            streaming=True,
-        )
-
-        system_prompt = (
-            """你是一个有用的AI助手，可以帮助用户回答问题和提供帮助。请用中文回答用户的问题。"""
-        )
-
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=query.message),
-        ]
+        # 复用共享客户端，携带会话记忆时附带截断后的历史上下文
+        llm_model = LLMClientRegistry.get()
+        messages = (memory or ChatMemory()).build_messages(query.message)
+        # 已连接 MCP 服务器的工具(连接池内缓存)
+        tools = await McpRuntime.get_tools() if use_tools else []
+        tools_by_name = {tool.name: tool for tool in tools}
 
+        metrics = LLMStreamMetrics("openai", settings.OPENAI_MODEL)
+        success = False
         try:
-            # 使用LangChain的流式响应
-            async for chunk in lll_model.astream(messages):
-                yield chunk.text
+            # 使用LangChain的流式响应，模型请求调用工具时执行工具并继续对话
+            reply: list[str] = []
+            for round_index in range(settings.MCP_MAX_TOOL_ROUNDS + 1):
+                # 最后一轮不再提供工具，要求模型直接给出回答
+                runnable = (
+                    llm_model.bind_tools(tools)
+                    if tools and round_index < settings.MCP_MAX_TOOL_ROUNDS
+                    else llm_model
+                )
+                gathered: AIMessageChunk | None = None
+                async for chunk in runnable.astream(messages):
+                    metrics.on_token()
+                    gathered = chunk if gathered is None else gathered + chunk
+                    if chunk.text:
+                        reply.append(chunk.text)
+                        yield chunk.text
+                if gathered is None or not gathered.tool_calls:
+                    break
+                messages.append(gathered)
+                # 同一轮的工具调用并发执行(单个服务器内受并发数限制)
+                messages.extend(
+                    await asyncio.gather(
+                        *(cls._run_tool(tools_by_name, call) for call in gathered.tool_calls)
+                    )
+                )
+            success = True
+            if memory is not None:
+                memory.add_turn(query.message, "".join(reply))
 
         except Exception as e:
             log.debug(f"关闭AIClient时发生异常(预期行为，服务可能正在关闭): {e}")
-            
+
             status_code = getattr(e, "status_code", None)
             body = getattr(e, "body", None)
             message = None
@@ -185,7 +263,9 @@ class McpService:
                 or (error_type == "Arrearage")
                 or ("in good standing" in (msg or ""))
             ):
-                raise ValueError("账户欠费或结算异常，访问被拒绝。请检查账号状态或更换有效的 API Key。")
+                raise ValueError(
+                    "账户欠费或结算异常，访问被拒绝。请检查账号状态或更换有效的 API Key。"
+                )
             # 鉴权失败
             if status_code == 401 or "invalid api key" in msg.lower():
                 raise ValueError("鉴权失败，API Key 无效或已过期。请检查系统配置中的 API Key。")
@@ -210,4 +290,5 @@ class McpService:
 
             # 默认兜底
             raise CustomException(f"处理您的请求时出现错误：{msg}")
-
+        finally:
+            metrics.finish(success=success)
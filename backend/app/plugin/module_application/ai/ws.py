@@ -1,8 +1,14 @@
-from fastapi import APIRouter, WebSocket
+from fastapi import APIRouter, Request, WebSocket
 
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.dependencies import get_current_user
+from app.core.exceptions import CustomException
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 
+from .llm import ChatMemory
 from .schema import ChatQuerySchema
 from .service import McpService
 
@@ -13,6 +19,34 @@ WS_AI = APIRouter(
 )
 
 
+async def _tools_permitted(websocket: WebSocket) -> bool:
+    """
+    校验连接能否调用 MCP 工具：需携带有效访问令牌(查询参数 token 或 Authorization 请求头)
+    并拥有工具调用权限，未认证的连接只能进行普通对话。
+
+    参数:
+    - websocket (WebSocket): WebSocket 连接
+
+    返回:
+    - bool: 是否允许调用 MCP 工具
+    """
+    token = websocket.query_params.get("token") or websocket.headers.get("authorization")
+    if not settings.MCP_ENABLE or not token:
+        return False
+    try:
+        async with async_db_session() as session:
+            auth: AuthSchema = await get_current_user(
+                request=Request(websocket.scope),
+                db=session,
+                redis=websocket.app.state.redis,
+                token=token,
+            )
+            return await McpService.tools_permitted(auth)
+    except CustomException as e:
+        log.warning(f"WebSocket 聊天认证失败，不提供 MCP 工具: {e.msg}")
+        return False
+
+
 @WS_AI.websocket("/ws", name="WebSocket聊天")
 async def websocket_chat_controller(
     websocket: WebSocket,
@@ -20,15 +54,22 @@ async def websocket_chat_controller(
     """
     WebSocket聊天接口
 
-    ws://127.0.0.1:8001/api/v1/application/ai/ws
+    ws://127.0.0.1:8001/api/v1/application/ai/ws?token=<access_token>
+
+    携带访问令牌且拥有工具调用权限时，对话中可调用已配置的 MCP 工具。
     """
     await websocket.accept()
+    use_tools = await _tools_permitted(websocket)
+    # 每个连接独立的有界对话记忆，连接断开后释放
+    memory = ChatMemory()
     try:
         while True:
             data = await websocket.receive_text()
             # 流式发送响应
             try:
-                async for chunk in McpService.chat_query(query=ChatQuerySchema(message=data)):
+                async for chunk in McpService.chat_query(
+                    query=ChatQuerySchema(message=data), memory=memory, use_tools=use_tools
+                ):
                     if chunk:
                         await websocket.send_text(chunk)
             except Exception as e:
@@ -2,12 +2,13 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.request import PaginationService
 from app.common.response import ErrorResponse, ResponseSchema, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
 from app.utils.common_util import bytes2file_response
@@ -61,6 +62,7 @@ async def get_obj_list_controller(
     page: Annotated[PaginationQueryParam, Depends()],
     search: Annotated[JobQueryParam, Depends()],
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_application:job:query"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
 ) -> JSONResponse:
     """
     查询定时任务
@@ -69,12 +71,13 @@ async def get_obj_list_controller(
     - page (PaginationQueryParam): 分页查询参数模型
     - search (JobQueryParam): 查询参数模型
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis连接
 
     返回:
     - JSONResponse: 包含分页后的定时任务列表的JSON响应
     """
     result_dict_list = await JobService.get_job_list_service(
-        auth=auth, search=search, order_by=page.order_by
+        auth=auth, search=search, order_by=page.order_by, redis=redis
     )
     result_dict = await PaginationService.paginate(
         data_list=result_dict_list,
@@ -437,7 +440,7 @@ async def run_job_now_controller(
     - JSONResponse: 包含操作结果的JSON响应
     """
     try:
-        SchedulerUtil.run_job_now(job_id=id)
+        await SchedulerUtil.run_job_now(job_id=id)
         log.info(f"立即执行定时任务成功: {id}")
         return SuccessResponse(msg="立即执行定时任务成功")
     except Exception as e:
@@ -67,11 +67,28 @@ class JobUpdateSchema(JobCreateSchema):
     """定时任务更新模型"""
 
 
+class JobRunStatsSchema(BaseModel):
+    """定时任务运行统计模型"""
+
+    last_status: str | None = Field(default=None, description="最近执行状态:0成功,1失败")
+    last_run_time: str | None = Field(default=None, description="最近执行时间")
+    last_duration: float | None = Field(default=None, description="最近执行耗时(秒)")
+    avg_duration: float | None = Field(default=None, description="平均执行耗时(秒)")
+    run_count: int = Field(default=0, description="执行次数")
+    fail_count: int = Field(default=0, description="失败次数")
+    consecutive_failures: int = Field(default=0, description="连续失败次数")
+    duration_histogram: dict[str, int] = Field(
+        default_factory=dict, description="执行耗时分布(le_上界秒数: 次数)"
+    )
+
+
 class JobOutSchema(JobCreateSchema, BaseSchema, UserBySchema):
     """定时任务响应模型"""
 
     model_config = ConfigDict(from_attributes=True)
 
+    run_stats: JobRunStatsSchema | None = Field(default=None, description="运行统计")
+
 
 class JobLogCreateSchema(BaseModel):
     """
@@ -1,3 +1,5 @@
+from redis.asyncio.client import Redis
+
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.core.exceptions import CustomException
 from app.utils.cron_util import CronUtil
@@ -13,6 +15,7 @@ from .schema import (
     JobUpdateSchema,
 )
 from .tools.ap_scheduler import SchedulerUtil
+from .tools.log_sink import JobLogSink
 
 
 class JobService:
@@ -41,6 +44,7 @@ class JobService:
         auth: AuthSchema,
         search: JobQueryParam | None = None,
         order_by: list[dict[str, str]] | None = None,
+        redis: Redis | None = None,
     ) -> list[dict]:
         """
         获取定时任务列表
@@ -49,12 +53,18 @@ class JobService:
         - auth (AuthSchema): 认证信息模型
         - search (JobQueryParam | None): 查询参数模型
         - order_by (list[dict[str, str]] | None): 排序参数列表
+        - redis (Redis | None): Redis连接，提供时附带运行统计
 
         返回:
         - List[Dict]: 定时任务详情字典列表
         """
         obj_list = await JobCRUD(auth).get_obj_list_crud(search=search.__dict__, order_by=order_by)
-        return [JobOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+        result = [JobOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+        if redis:
+            stats = await JobLogSink.get_stats(redis, [item["id"] for item in result])
+            for item in result:
+                item["run_stats"] = stats.get(item["id"])
+        return result
 
     @classmethod
     async def create_job_service(cls, auth: AuthSchema, data: JobCreateSchema) -> dict:
@@ -117,15 +127,17 @@ class JobService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            exist_obj = await JobCRUD(auth).get_obj_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg="删除失败，该数据定时任务不存在")
-            obj = await JobLogCRUD(auth).get(job_id=id)
-            if obj:
+        exist_objs = await JobCRUD(auth).validate_ids(
+            ids=ids, msg="删除失败", fields=["id", "name"]
+        )
+        # 一次查询检查是否存在日志记录
+        logs = await JobLogCRUD(auth).list(search={"job_id": ("in", ids)}, fields=["id", "job_id"])
+        logged_ids = {log_obj.job_id for log_obj in logs}
+        for exist_obj in exist_objs:
+            if exist_obj.id in logged_ids:
                 raise CustomException(msg=f"删除失败，该定时任务存 {exist_obj.name} 在日志记录")
-
-            SchedulerUtil().remove_job(job_id=id)
+        for exist_obj in exist_objs:
+            SchedulerUtil().remove_job(job_id=exist_obj.id)
         await JobCRUD(auth).delete_obj_crud(ids=ids)
 
     @classmethod
@@ -271,10 +283,7 @@ class JobLogService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            exist_obj = await JobLogCRUD(auth).get_obj_log_by_id_crud(id=id)
-            if not exist_obj:
-                raise CustomException(msg=f"删除失败，该定时任务日志ID为{id}的记录不存在")
+        await JobLogCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await JobLogCRUD(auth).delete_obj_log_crud(ids=ids)
 
     @classmethod
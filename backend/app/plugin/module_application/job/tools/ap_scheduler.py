@@ -1,13 +1,16 @@
+import asyncio
 import importlib
 import json
+import time
 from asyncio import iscoroutinefunction
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from apscheduler.events import EVENT_ALL, JobEvent, JobExecutionEvent
 from apscheduler.executors.asyncio import AsyncIOExecutor
-from apscheduler.executors.pool import ProcessPoolExecutor
 from apscheduler.job import Job
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.jobstores.redis import RedisJobStore
@@ -20,13 +23,18 @@ from redis.asyncio.client import Redis
 
 from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
-from app.core.database import async_db_session, db_session, engine
+from app.core.database import async_db_session, engine
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.metrics import Metrics
 from app.core.redis_crud import RedisCURD
 from app.plugin.module_application.job.model import JobModel
 from app.utils.cron_util import CronUtil
 
+from .coordinator import SchedulerCoordinator
+from .job_worker import JobStreamWorker
+from .log_sink import JobLogSink
+
 job_stores = {
     "default": MemoryJobStore(),
     "sqlalchemy": SQLAlchemyJobStore(url=settings.DB_URI, engine=engine),
@@ -39,10 +47,20 @@ job_stores = {
     ),
 }
 # 配置执行器
+# 任务统一由异步包装器 SchedulerUtil._task_wrapper 触发，APScheduler 层面全部使用 AsyncIOExecutor，
+# 执行器名称决定包装器把任务函数派发到哪里：
+# - default: 事件循环（异步函数）/ 默认线程池（同步函数）
+# - threadpool: 独立线程池
+# - processpool: 独立进程池（CPU 密集型任务）
+# - stream: 投递到 Redis Stream，由 python main.py worker 启动的工作进程消费
 executors = {
     "default": AsyncIOExecutor(),
-    "processpool": ProcessPoolExecutor(max_workers=1),  # 减少进程数量以减少资源消耗
+    "threadpool": AsyncIOExecutor(),
+    "processpool": AsyncIOExecutor(),
+    "stream": AsyncIOExecutor(),
 }
+# 任务函数实际使用的执行池（延迟创建）
+_job_pools: dict[str, Executor] = {}
 # 配置默认参数
 job_defaults = {
     "coalesce": True,  # 合并执行错过的任务
@@ -58,6 +76,47 @@ scheduler.configure(
 )
 
 
+def _get_job_pool(executor: str) -> Executor | None:
+    """
+    获取执行器对应的执行池，default 返回 None（使用事件循环默认线程池）。
+
+    参数:
+    - executor (str): 执行器名称。
+
+    返回:
+    - Executor | None: 执行池。
+    """
+    if executor not in ("threadpool", "processpool"):
+        return None
+    pool = _job_pools.get(executor)
+    if pool is None:
+        if executor == "threadpool":
+            pool = ThreadPoolExecutor(
+                max_workers=settings.SCHEDULER_THREAD_WORKERS, thread_name_prefix="job"
+            )
+        else:
+            pool = ProcessPoolExecutor(max_workers=settings.SCHEDULER_PROCESS_WORKERS)
+        _job_pools[executor] = pool
+    return pool
+
+
+def _run_job(func: Callable, args: tuple, kwargs: dict) -> Any:
+    """
+    在线程池/进程池中执行任务函数（模块级函数，保证可被进程池序列化）。
+
+    参数:
+    - func (Callable): 任务函数。
+    - args (tuple): 位置参数。
+    - kwargs (dict): 关键字参数。
+
+    返回:
+    - Any: 任务执行结果。
+    """
+    if iscoroutinefunction(func):
+        return asyncio.run(func(*args, **kwargs))
+    return func(*args, **kwargs)
+
+
 class SchedulerUtil:
     """
     定时任务相关方法
@@ -65,12 +124,21 @@ class SchedulerUtil:
 
     # 类变量，存储应用的Redis连接
     redis_instance = None
+    # 任务元信息缓存 {任务ID: 元信息}，避免事件回调中访问任务存储器
+    _job_meta: dict[str, dict[str, str]] = {}
+    # 本节点最近一次执行耗时 {任务ID: 秒}，由包装器写入、事件回调取出
+    _run_durations: dict[str, float] = {}
+    # shard 模式下本节点已加载任务的配置指纹 {任务ID: (更新时间, 状态)}
+    _shard_fingerprints: dict[str, tuple[Any, str]] = {}
 
     @classmethod
     def scheduler_event_listener(cls, event: JobEvent | JobExecutionEvent) -> None:
         """
         监听任务执行事件并记录详细执行信息。
 
+        运行在调度器事件分发中，只读取本地缓存的任务元信息并把执行记录放入
+        JobLogSink 的缓冲队列，数据库写入与统计更新由后台批量完成。
+
         参数:
         - event (JobEvent | JobExecutionEvent): 任务事件对象。
 
@@ -82,127 +150,108 @@ class SchedulerUtil:
             if not isinstance(event, JobExecutionEvent):
                 return
 
-            # 延迟导入避免循环导入
-            from app.plugin.module_application.job.model import JobLogModel
+            job_id = str(event.job_id)
+            duration = cls._run_durations.pop(job_id, None)
+            exception_info = str(event.exception) if event.exception else ""
+            # 未在本节点执行（锁竞争失败/非归属节点/错过执行）且无异常时不记录日志
+            if duration is None and not exception_info:
+                return
 
-            # 获取事件类型和任务ID
-            event_type = event.__class__.__name__
+            meta = cls._get_job_meta(job_id)
+            if not meta:
+                return
+            # stream 执行器的执行日志由工作进程记录
+            if meta["executor"] == "stream" and not exception_info:
+                return
 
-            # 初始化任务状态
-            status = "0"
-            exception_info = ""
-            if hasattr(event, "exception") and event.exception:
-                exception_info = str(event.exception)
-                status = "1"
+            status = "1" if exception_info else "0"
+            if duration is not None and settings.METRICS_ENABLE:
+                Metrics.observe_job(job_id, meta["executor"], status, duration)
+            scheduled_time_str = (
+                event.scheduled_run_time.strftime("%Y-%m-%d %H:%M:%S")
+                if event.scheduled_run_time
+                else "未知"
+            )
+            job_message = (
+                f"任务 {job_id} ({meta['name']}) 执行完成: "
+                f"状态={'成功' if status == '0' else '失败'}, "
+                f"执行函数={meta['invoke_target']}, "
+                f"参数={meta['args']}, "
+                f"关键字参数={meta['kwargs']}, "
+                f"计划时间={scheduled_time_str}, "
+                f"实际执行时间={datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+            if duration is not None:
+                job_message += f", 耗时={duration:.3f}s"
+            if exception_info:
+                job_message += f", 错误={exception_info[:200]}..."
+
+            JobLogSink.submit(
+                JobLogSink.build_record(
+                    job_id=job_id,
+                    job_name=meta["name"],
+                    job_group=meta["jobstore"],
+                    job_executor=meta["executor"],
+                    invoke_target=meta["invoke_target"],
+                    job_args=meta["args"],
+                    job_kwargs=meta["kwargs"],
+                    job_trigger=meta["trigger"],
+                    job_message=job_message,
+                    status=status,
+                    exception_info=exception_info,
+                    duration=duration,
+                )
+            )
+        except Exception as e:
+            log.error(f"处理任务执行事件失败: {e!s}")
 
-            if hasattr(event, "job_id"):
-                job_id = event.job_id
-                query_job = cls.get_job(job_id=job_id)
+    @classmethod
+    def _build_job_meta(cls, job: Job) -> dict[str, str]:
+        """
+        从调度任务对象提取日志所需的元信息。
 
-                if query_job:
-                    # 解析任务的实际执行函数和参数
-                    actual_func = None
-                    actual_args = []
-                    actual_kwargs = {}
+        参数:
+        - job (Job): 调度任务对象。
 
-                    try:
-                        if hasattr(query_job, "args") and len(query_job.args) >= 2:
-                            actual_func = query_job.args[0]
-                            actual_args = query_job.args[2:]
-
-                        if hasattr(query_job, "kwargs"):
-                            actual_kwargs = query_job.kwargs
-                    except Exception as e:
-                        log.error(f"解析任务 {job_id} 参数失败: {e!s}")
-
-                    # 格式化参数显示
-                    formatted_args = str(actual_args) if actual_args else "()"
-                    formatted_kwargs = str(actual_kwargs) if actual_kwargs else "{}"
-
-                    # 获取实际的执行函数信息
-                    actual_func_module = ""
-                    actual_func_name = ""
-                    try:
-                        if actual_func:
-                            actual_func_module = getattr(actual_func, "__module__", "")
-                            actual_func_name = getattr(actual_func, "__name__", "")
-                    except Exception as e:
-                        log.error(f"获取任务 {job_id} 函数信息失败: {e!s}")
-
-                    # 构建详细的任务消息
-                    scheduled_time_str = "未知"
-                    try:
-                        if hasattr(event, "scheduled_run_time") and event.scheduled_run_time:
-                            scheduled_time_str = event.scheduled_run_time.strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                    except Exception:
-                        scheduled_time_str = str(event.scheduled_run_time)
+        返回:
+        - dict[str, str]: 任务元信息。
+        """
+        # 包装器参数布局: [任务函数, 任务ID, 执行器, *位置参数]
+        actual_func = job.args[0] if len(job.args) >= 3 else job.func
+        executor = job.args[2] if len(job.args) >= 3 else job.executor
+        actual_args = job.args[3:] if len(job.args) >= 3 else ()
+        invoke_target = (
+            f"{getattr(actual_func, '__module__', '')}.{getattr(actual_func, '__name__', '')}"
+        )
+        return {
+            "name": job.name or "",
+            "jobstore": job._jobstore_alias or "",
+            "executor": executor or "default",
+            "invoke_target": invoke_target,
+            "args": str(list(actual_args)) if actual_args else "()",
+            "kwargs": str(job.kwargs) if job.kwargs else "{}",
+            "trigger": str(job.trigger),
+        }
 
-                    try:
-                        event_type = event_type
-                        func_info = (
-                            f"{actual_func_module}.{actual_func_name}" if actual_func else "未知"
-                        )
-                        job_message = f"任务 {job_id} ({query_job.name}) 执行完成: "
-                        job_message += f"状态={'成功' if status == '0' else '失败'}, "
-                        job_message += f"执行函数={func_info}, "
-                        job_message += f"参数={formatted_args}, "
-                        job_message += f"关键字参数={formatted_kwargs}, "
-                        job_message += f"计划时间={scheduled_time_str}, "
-                        job_message += (
-                            f"实际执行时间={datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                        )
-                        if exception_info:
-                            job_message += f", 错误={exception_info[:500]}..."
-                    except Exception as e:
-                        job_message = (
-                            f"任务 {job_id} 执行事件，状态={'成功' if status == '0' else '失败'}"
-                        )
-                        log.error(f"构建任务 {job_id} 消息失败: {e!s}")
-
-                    # 创建日志记录
-                    try:
-                        # 获取执行函数信息
-                        invoke_target = func_info
-                        if not invoke_target:
-                            try:
-                                invoke_target = f"{getattr(query_job.func, '__module__', '')}.{getattr(query_job.func, '__name__', '')}"
-                            except Exception:
-                                invoke_target = "未知"
-
-                        job_log = JobLogModel(
-                            job_name=query_job.name,
-                            job_group=query_job._jobstore_alias,
-                            job_executor=query_job.executor,
-                            invoke_target=invoke_target,
-                            job_args=formatted_args,
-                            job_kwargs=formatted_kwargs,
-                            job_trigger=str(query_job.trigger),
-                            job_message=job_message,
-                            status=status,
-                            exception_info=exception_info,
-                            created_time=datetime.now(),
-                            updated_time=datetime.now(),
-                            job_id=job_id,
-                        )
-
-                        # 保存到数据库
-                        with db_session.begin() as session:
-                            try:
-                                session.add(job_log)
-                                session.commit()
-                                log.info(f"任务 {job_id} 执行日志已保存")
-                            except Exception as e:
-                                session.rollback()
-                                log.error(f"保存任务 {job_id} 执行日志失败: {e!s}")
-                    except Exception as e:
-                        log.error(f"创建任务 {job_id} 日志记录失败: {e!s}")
-        except Exception as e:
-            log.error(f"处理任务执行事件失败: {e!s}")
-            import traceback
+    @classmethod
+    def _get_job_meta(cls, job_id: str) -> dict[str, str] | None:
+        """
+        获取任务元信息，优先使用本地缓存，未命中时读取一次任务存储器。
+
+        参数:
+        - job_id (str): 任务ID。
 
-            traceback.print_exc()
+        返回:
+        - dict[str, str] | None: 任务元信息。
+        """
+        meta = cls._job_meta.get(job_id)
+        if meta is None:
+            job = cls.get_job(job_id=job_id)
+            if not job:
+                return None
+            meta = cls._build_job_meta(job)
+            cls._job_meta[job_id] = meta
+        return meta
 
     @classmethod
     async def init_system_scheduler(cls, redis: Redis) -> None:
@@ -219,10 +268,17 @@ class SchedulerUtil:
         log.info("🔎 开始启动定时任务...")
         # 保存Redis连接到类变量
         cls.redis_instance = redis
-        # 启动调度器
-        scheduler.start()
+        # 启动调度器：leader 模式下先以暂停状态启动，选主成功后再恢复
+        scheduler.start(paused=settings.SCHEDULER_MODE == "leader")
         # 添加事件监听器
         scheduler.add_listener(cls.scheduler_event_listener, EVENT_ALL)
+        JobLogSink.start(redis)
+        if settings.SCHEDULER_MODE != "lock":
+            await SchedulerCoordinator.start(redis)
+        if settings.SCHEDULER_MODE == "shard":
+            # 各节点使用本地存储器，只加载归属于本节点的任务(协调器首次心跳已完成同步)
+            log.info(f"✅️ 本节点已加载 {len(cls._shard_fingerprints)} 个归属任务")
+            return
         async with async_db_session() as session:
             async with session.begin():
                 auth = AuthSchema(db=session)
@@ -250,8 +306,6 @@ class SchedulerUtil:
                         await redis_client.unlock(lock_key, lock_value)
                 else:
                     # 等待其他实例完成初始化
-                    import asyncio
-
                     await asyncio.sleep(2)
                     log.info("✅️ 定时任务已由其他实例初始化完成")
 
@@ -264,14 +318,53 @@ class SchedulerUtil:
         - None
         """
         try:
+            if settings.SCHEDULER_MODE != "lock":
+                await SchedulerCoordinator.stop()
             # 移除所有任务
             scheduler.remove_all_jobs()
             # 等待所有任务完成后再关闭
             scheduler.shutdown(wait=True)
+            for pool in _job_pools.values():
+                pool.shutdown(wait=False, cancel_futures=True)
+            _job_pools.clear()
+            await JobLogSink.stop()
             log.info("✅️ 关闭定时任务成功")
         except Exception as e:
             log.error(f"关闭定时任务失败: {e!s}")
 
+    @classmethod
+    def pause_scheduler(cls) -> None:
+        """
+        暂停调度器（leader 模式下失去主节点身份时调用）。
+
+        返回:
+        - None
+        """
+        if scheduler.running:
+            scheduler.pause()
+
+    @classmethod
+    def resume_scheduler(cls) -> None:
+        """
+        恢复调度器（leader 模式下成为主节点时调用）。
+
+        返回:
+        - None
+        """
+        if scheduler.state != 0:
+            scheduler.resume()
+
+    @classmethod
+    def wakeup_scheduler(cls) -> None:
+        """
+        唤醒调度器重新检查共享存储中的任务。
+
+        返回:
+        - None
+        """
+        if scheduler.running:
+            scheduler.wakeup()
+
     @classmethod
     def get_job(cls, job_id: str | int) -> Job | None:
         """
@@ -296,9 +389,33 @@ class SchedulerUtil:
         return scheduler.get_jobs()
 
     @classmethod
-    async def _task_wrapper(cls, func: Callable, job_id: str | int, *args, **kwargs):
-        """任务执行包装器，添加分布式锁防止并发执行"""
-        import asyncio
+    async def _task_wrapper(
+        cls, func: Callable, job_id: str | int, executor: str, *args, **kwargs
+    ) -> Any:
+        """
+        任务执行包装器
+
+        - lock 模式: 每个实例都会触发，通过分布式锁保证只执行一次
+        - leader 模式: 只有主节点的调度器在运行，直接执行
+        - shard 模式: 每个节点的本地存储器只包含归属于本节点的任务，直接执行
+
+        参数:
+        - func (Callable): 任务函数。
+        - job_id (str | int): 任务ID。
+        - executor (str): 执行器名称。
+        - args: 位置参数。
+        - kwargs: 关键字参数。
+
+        返回:
+        - Any: 任务执行结果。
+        """
+        if settings.SCHEDULER_MODE == "leader":
+            if not SchedulerCoordinator.is_leader:
+                log.info(f"任务 {job_id} 当前节点非主节点，跳过本次执行")
+                return None
+            return await cls._dispatch_job(func, job_id, executor, args, kwargs)
+        if settings.SCHEDULER_MODE == "shard":
+            return await cls._dispatch_job(func, job_id, executor, args, kwargs)
 
         # 使用类变量中的Redis连接
         if not cls.redis_instance:
@@ -337,25 +454,10 @@ class SchedulerUtil:
                 log.info(f"任务 {job_id} 获取执行锁成功")
                 # 启动锁续约任务
                 renewal_task = asyncio.create_task(renew_lock())
-
-                # 执行任务
-                if iscoroutinefunction(func):
-                    return await func(*args, **kwargs)
-                # 对于同步函数，使用线程池执行
-                log.info(f"任务 {job_id} 开始执行同步函数: {func.__name__}, 参数: {args}-{kwargs}")
-                try:
-                    loop = asyncio.get_running_loop()
-                    # 使用lambda包装函数调用，以支持关键字参数
-                    result = await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-                    log.info(f"任务 {job_id} 同步函数执行完成，结果: {result}")
-                    return result
-                except Exception as e:
-                    log.error(f"任务 {job_id} 同步函数执行失败: {e!s}")
-                    raise
-            else:
-                # 获取锁失败，记录日志
-                log.info(f"任务 {job_id} 获取执行锁失败，跳过本次执行")
-                return None
+                return await cls._dispatch_job(func, job_id, executor, args, kwargs)
+            # 获取锁失败，记录日志
+            log.info(f"任务 {job_id} 获取执行锁失败，跳过本次执行")
+            return None
         finally:
             # 取消锁续约任务
             if renewal_task and not renewal_task.done():
@@ -371,16 +473,114 @@ class SchedulerUtil:
                 log.info(f"任务 {job_id} 释放执行锁")
 
     @classmethod
-    def add_job(cls, job_info: JobModel) -> Job:
+    async def _dispatch_job(
+        cls, func: Callable, job_id: str | int, executor: str, args: tuple, kwargs: dict
+    ) -> Any:
+        """
+        按执行器把任务函数派发到事件循环、线程池、进程池或 Redis Stream 队列。
+
+        参数:
+        - func (Callable): 任务函数。
+        - job_id (str | int): 任务ID。
+        - executor (str): 执行器名称。
+        - args (tuple): 位置参数。
+        - kwargs (dict): 关键字参数。
+
+        返回:
+        - Any: 任务执行结果（stream 执行器返回消息ID）。
+        """
+        start_time = time.perf_counter()
+        try:
+            if executor == "stream":
+                if not cls.redis_instance:
+                    raise CustomException(msg=f"任务 {job_id} 投递失败：Redis连接未初始化")
+                message_id = await JobStreamWorker.enqueue(
+                    cls.redis_instance,
+                    func,
+                    job_id,
+                    args,
+                    kwargs,
+                    meta=cls._get_job_meta(str(job_id)),
+                )
+                log.info(f"任务 {job_id} 已投递到执行队列: {message_id}")
+                return message_id
+
+            pool = _get_job_pool(executor)
+            if iscoroutinefunction(func) and executor != "processpool":
+                return await func(*args, **kwargs)
+
+            log.info(f"任务 {job_id} 开始执行({executor}): {func.__name__}, 参数: {args}-{kwargs}")
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(pool, partial(_run_job, func, args, kwargs))
+                log.info(f"任务 {job_id} 执行完成，结果: {result}")
+                return result
+            except Exception as e:
+                log.error(f"任务 {job_id} 执行失败: {e!s}")
+                raise
+        finally:
+            cls._run_durations[str(job_id)] = time.perf_counter() - start_time
+
+    @classmethod
+    async def rebalance(cls) -> None:
+        """
+        shard 模式：按数据库中的任务配置与当前存活节点同步本节点负责的任务。
+
+        由协调器每次心跳调用：移除不再归属本节点或已删除的任务，
+        加载新归属、新增或配置/状态已变更的任务，并执行其他节点转交的立即执行请求。
+
+        返回:
+        - None
+        """
+        # 延迟导入避免循环导入
+        from app.api.v1.module_system.auth.schema import AuthSchema
+        from app.plugin.module_application.job.crud import JobCRUD
+
+        async with async_db_session() as session:
+            auth = AuthSchema(db=session, check_data_scope=False)
+            job_list = await JobCRUD(auth).get_obj_list_crud()
+        owned = {str(item.id): item for item in job_list if SchedulerCoordinator.owns(item.id)}
+
+        for job_id in list(cls._shard_fingerprints):
+            if job_id not in owned:
+                cls.remove_job(job_id=job_id)
+                log.info(f"任务 {job_id} 已不属于当前节点，移出本地调度器")
+        for job_id, item in owned.items():
+            fingerprint = (item.updated_time, item.status)
+            if cls._shard_fingerprints.get(job_id) == fingerprint:
+                continue
+            try:
+                cls.remove_job(job_id=job_id)
+                cls.add_job(item)
+                if item.status == "1":
+                    cls.pause_job(job_id=job_id)
+            except Exception as e:
+                log.error(f"任务 {job_id} 加载到当前节点失败: {e!s}")
+
+        if not cls.redis_instance or not owned:
+            return
+        # 其他节点收到的立即执行请求，由归属节点认领执行
+        run_now_key = RedisInitKeyConfig.APSCHEDULER_RUN_NOW_KEY.key
+        for job_id in await cls.redis_instance.hkeys(run_now_key):
+            if job_id in owned and await cls.redis_instance.hdel(run_now_key, job_id):
+                cls._run_local_job_now(job_id)
+
+    @classmethod
+    def add_job(cls, job_info: JobModel) -> Job | None:
         """
         根据任务配置创建并添加调度任务。
 
+        shard 模式下任务只添加到归属节点的本地存储器，其他节点由归属节点在下次心跳时加载。
+
         参数:
         - job_info (JobModel): 任务对象信息（包含触发器、函数、参数等）。
 
         返回:
-        - Job: 新增的任务对象。
+        - Job | None: 新增的任务对象，shard 模式下任务不属于当前节点时返回 None。
         """
+        if settings.SCHEDULER_MODE == "shard" and not SchedulerCoordinator.owns(job_info.id):
+            log.info(f"任务 {job_info.id} 不属于当前节点，由归属节点加载")
+            return None
         # 动态导入模块
         # 1. 解析调用目标
         module_path, func_name = str(job_info.func).rsplit(".", 1)
@@ -390,16 +590,18 @@ class SchedulerUtil:
             job_func = getattr(module, func_name)
 
             # 2. 确定任务存储器：优先使用redis，确保分布式环境中任务同步
-            if job_info.jobstore is None:
-                job_info.jobstore = "redis"  # 改为默认使用redis存储
+            # (使用局部变量，避免修改会话中的任务对象后被写回数据库)
+            jobstore = job_info.jobstore or "redis"
+            if settings.SCHEDULER_MODE == "leader" and jobstore == "default":
+                # 选主模式下内存存储器无法在实例间共享，改用redis存储
+                jobstore = "redis"
+            elif settings.SCHEDULER_MODE == "shard":
+                # 分片模式下每个节点只在本地存储器保存归属于自己的任务
+                jobstore = "default"
 
             # 3. 确定执行器
             job_executor = job_info.executor
-            if job_executor is None:
-                job_executor = "default"
-
-            # 异步函数必须使用默认执行器
-            if iscoroutinefunction(job_func):
+            if job_executor not in executors:
                 job_executor = "default"
 
             # 4. 创建触发器
@@ -475,16 +677,19 @@ class SchedulerUtil:
             job = scheduler.add_job(
                 func=cls._task_wrapper,
                 trigger=trigger,
-                args=[job_func, str(job_info.id), *job_args],
+                args=[job_func, str(job_info.id), job_executor, *job_args],
                 kwargs=json.loads(job_info.kwargs) if job_info.kwargs else {},
                 id=str(job_info.id),
                 name=job_info.name,
                 coalesce=job_info.coalesce,
                 max_instances=1,  # 确保只有一个实例执行
-                jobstore=job_info.jobstore,
+                jobstore=jobstore,
                 executor=job_executor,
             )
-            log.info(f"任务 {job_info.id} 添加到 {job_info.jobstore} 存储器成功")
+            cls._job_meta[str(job_info.id)] = cls._build_job_meta(job)
+            if settings.SCHEDULER_MODE == "shard":
+                cls._shard_fingerprints[str(job_info.id)] = (job_info.updated_time, job_info.status)
+            log.info(f"任务 {job_info.id} 添加到 {jobstore} 存储器成功")
             return job
         except ModuleNotFoundError:
             raise ValueError(f"未找到该模块：{module_path}")
@@ -504,6 +709,8 @@ class SchedulerUtil:
         返回:
         - None
         """
+        cls._job_meta.pop(str(job_id), None)
+        cls._shard_fingerprints.pop(str(job_id), None)
         query_job = cls.get_job(job_id=str(job_id))
         if query_job:
             scheduler.remove_job(job_id=str(job_id))
@@ -516,10 +723,12 @@ class SchedulerUtil:
         返回:
         - None
         """
+        cls._job_meta.clear()
+        cls._shard_fingerprints.clear()
         scheduler.remove_all_jobs()
 
     @classmethod
-    def modify_job(cls, job_id: str | int) -> Job:
+    def modify_job(cls, job_id: str | int) -> Job | None:
         """
         更新指定任务的配置（运行中的任务下次执行生效）。
 
@@ -527,14 +736,17 @@ class SchedulerUtil:
         - job_id (str | int): 任务ID。
 
         返回:
-        - Job: 更新后的任务对象。
+        - Job | None: 更新后的任务对象，shard 模式下任务由其他节点负责时返回 None。
 
         异常:
         - CustomException: 当任务不存在时抛出。
         """
         query_job = cls.get_job(job_id=str(job_id))
         if not query_job:
+            if cls._held_by_other_node():
+                return None
             raise CustomException(msg=f"未找到该任务：{job_id}")
+        cls._job_meta.pop(str(job_id), None)
         return scheduler.modify_job(job_id=str(job_id))
 
     @classmethod
@@ -553,6 +765,8 @@ class SchedulerUtil:
         """
         query_job = cls.get_job(job_id=str(job_id))
         if not query_job:
+            if cls._held_by_other_node():
+                return
             raise ValueError(f"未找到该任务：{job_id}")
         scheduler.pause_job(job_id=str(job_id))
 
@@ -572,6 +786,8 @@ class SchedulerUtil:
         """
         query_job = cls.get_job(job_id=str(job_id))
         if not query_job:
+            if cls._held_by_other_node():
+                return
             raise ValueError(f"未找到该任务：{job_id}")
         scheduler.resume_job(job_id=str(job_id))
 
@@ -595,7 +811,10 @@ class SchedulerUtil:
         """
         query_job = cls.get_job(job_id=str(job_id))
         if not query_job:
+            if cls._held_by_other_node():
+                return None
             raise CustomException(msg=f"未找到该任务：{job_id}")
+        cls._job_meta.pop(str(job_id), None)
 
         # 如果没有提供新的触发器，则使用现有触发器
         if trigger is None:
@@ -662,10 +881,12 @@ class SchedulerUtil:
         return "unknown"
 
     @classmethod
-    def run_job_now(cls, job_id: str | int) -> None:
+    async def run_job_now(cls, job_id: str | int) -> None:
         """
         立即执行指定任务。
 
+        shard 模式下任务不在当前节点时登记立即执行请求，由归属节点在下次心跳时认领执行。
+
         参数:
         - job_id (str | int): 任务ID。
 
@@ -675,6 +896,22 @@ class SchedulerUtil:
         异常:
         - ValueError: 当任务不存在时抛出。
         """
+        if not cls.get_job(job_id=str(job_id)) and cls._held_by_other_node():
+            if not cls.redis_instance:
+                raise ValueError("Redis连接未初始化")
+            run_now_key = RedisInitKeyConfig.APSCHEDULER_RUN_NOW_KEY.key
+            async with cls.redis_instance.pipeline(transaction=True) as pipe:
+                pipe.hset(run_now_key, str(job_id), time.time())
+                # 已删除任务的请求无人认领，随键过期清理
+                pipe.expire(run_now_key, max(settings.SCHEDULER_HEARTBEAT_SECONDS * 30, 60))
+                await pipe.execute()
+            log.info(f"任务 {job_id} 不属于当前节点，已转交归属节点立即执行")
+            return
+        cls._run_local_job_now(job_id)
+
+    @classmethod
+    def _run_local_job_now(cls, job_id: str | int) -> None:
+        """把本地调度器中的任务设置为立即执行"""
         job = cls.get_job(job_id=str(job_id))
         if not job:
             raise ValueError(f"未找到该任务：{job_id}")
@@ -682,3 +919,8 @@ class SchedulerUtil:
         # 立即执行任务
         scheduler.modify_job(job_id=str(job_id), next_run_time=datetime.now())
         log.info(f"任务 {job_id} 已设置为立即执行")
+
+    @classmethod
+    def _held_by_other_node(cls) -> bool:
+        """本地未找到任务时，shard 模式下任务可能由其他节点负责(配置以数据库为准，由归属节点同步)"""
+        return settings.SCHEDULER_MODE == "shard"
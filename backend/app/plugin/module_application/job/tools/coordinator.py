@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import os
+import socket
+import time
+import uuid
+
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+
+class SchedulerCoordinator:
+    """
+    多实例调度协调器
+
+    - leader: 通过 Redis 键选主，只有主节点的调度器处于运行状态，其余节点保持暂停；
+      主节点失联（心跳过期）后由其他节点接管。
+    - shard: 所有节点登记到 Redis 有序集合，按任务ID做最高随机权重哈希(rendezvous hashing)，
+      在调度时分区：每个节点的本地存储器只加载归属于自己的任务，每次心跳按存活节点与
+      数据库中的任务配置重新分配，不再需要每次触发都争抢 Redis 锁。
+    """
+
+    # 当前节点标识
+    node_id: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    # 是否为主节点
+    is_leader: bool = False
+    # 本地缓存的存活节点列表（已排序）
+    members: list[str] = []
+
+    _redis: Redis | None = None
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    def _ttl(cls) -> int:
+        """心跳过期时间（秒），为心跳间隔的3倍"""
+        return max(settings.SCHEDULER_HEARTBEAT_SECONDS * 3, 3)
+
+    @classmethod
+    async def start(cls, redis: Redis) -> None:
+        """
+        启动协调器并完成第一次心跳。
+
+        参数:
+        - redis (Redis): Redis 连接。
+
+        返回:
+        - None
+        """
+        cls._redis = redis
+        await cls.heartbeat()
+        cls._task = asyncio.create_task(cls._heartbeat_loop())
+        log.info(
+            f"🔗 调度协调器已启动: 模式={settings.SCHEDULER_MODE}, 节点={cls.node_id}, "
+            f"主节点={cls.is_leader}, 存活节点数={len(cls.members)}"
+        )
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止协调器，主动释放主节点身份并注销节点。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+        cls._task = None
+
+        if not cls._redis:
+            return
+        try:
+            if cls.is_leader:
+                await RedisCURD(cls._redis).unlock(
+                    RedisInitKeyConfig.APSCHEDULER_LEADER_KEY.key, cls.node_id
+                )
+            await cls._redis.zrem(RedisInitKeyConfig.APSCHEDULER_MEMBERS_KEY.key, cls.node_id)
+        except Exception as e:
+            log.error(f"注销调度节点失败: {e!s}")
+        finally:
+            cls.is_leader = False
+            cls.members = []
+
+    @classmethod
+    async def _heartbeat_loop(cls) -> None:
+        """定时心跳"""
+        while True:
+            await asyncio.sleep(settings.SCHEDULER_HEARTBEAT_SECONDS)
+            try:
+                await cls.heartbeat()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"调度节点心跳失败: {e!s}")
+
+    @classmethod
+    async def heartbeat(cls) -> None:
+        """
+        执行一次心跳：leader 模式下竞选/续约主节点，shard 模式下刷新存活节点列表并重新分配任务。
+
+        返回:
+        - None
+        """
+        if not cls._redis:
+            return
+        if settings.SCHEDULER_MODE == "leader":
+            await cls._elect()
+        elif settings.SCHEDULER_MODE == "shard":
+            # 延迟导入避免循环导入
+            from .ap_scheduler import SchedulerUtil
+
+            await cls._refresh_members()
+            await SchedulerUtil.rebalance()
+
+    @classmethod
+    async def _elect(cls) -> None:
+        """竞选或续约主节点，并据此暂停/恢复本地调度器"""
+        # 延迟导入避免循环导入
+        from .ap_scheduler import SchedulerUtil
+
+        redis_client = RedisCURD(cls._redis)  # pyright: ignore[reportArgumentType]
+        key = RedisInitKeyConfig.APSCHEDULER_LEADER_KEY.key
+        if cls.is_leader:
+            still_leader = await redis_client.renew_lock(key, cls._ttl(), cls.node_id)
+        else:
+            still_leader, _ = await redis_client.lock(key, cls._ttl(), cls.node_id)
+
+        if still_leader and not cls.is_leader:
+            cls.is_leader = True
+            log.info(f"👑 节点 {cls.node_id} 成为定时任务主节点")
+            SchedulerUtil.resume_scheduler()
+        elif not still_leader and cls.is_leader:
+            cls.is_leader = False
+            log.warning(f"节点 {cls.node_id} 失去定时任务主节点身份")
+            SchedulerUtil.pause_scheduler()
+        elif still_leader:
+            # 共享存储中的任务可能由其他节点新增/修改，唤醒调度器重新计算下次执行时间
+            SchedulerUtil.wakeup_scheduler()
+
+    @classmethod
+    async def _refresh_members(cls) -> None:
+        """登记本节点并刷新存活节点列表"""
+        if not cls._redis:
+            return
+        key = RedisInitKeyConfig.APSCHEDULER_MEMBERS_KEY.key
+        now = time.time()
+        async with cls._redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {cls.node_id: now})
+            pipe.zremrangebyscore(key, "-inf", now - cls._ttl())
+            pipe.zrange(key, 0, -1)
+            *_, members = await pipe.execute()
+        cls.members = sorted(members)
+
+    @classmethod
+    def owns(cls, job_id: str | int) -> bool:
+        """
+        判断任务是否归属于当前节点（shard 模式）。
+
+        参数:
+        - job_id (str | int): 任务ID。
+
+        返回:
+        - bool: 是否由当前节点执行。
+        """
+        if not cls.members:
+            # 尚未获取到节点列表时保守处理：仅单节点视角下执行
+            return True
+
+        def weight(member: str) -> int:
+            digest = hashlib.md5(f"{member}:{job_id}".encode()).digest()
+            return int.from_bytes(digest[:8], "big")
+
+        return max(cls.members, key=weight) == cls.node_id
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import time
+from asyncio import iscoroutinefunction
+from collections.abc import Callable
+from typing import Any
+
+from apscheduler.util import obj_to_ref, ref_to_obj
+from redis import exceptions
+from redis.asyncio.client import Redis
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.logger import log
+from app.core.metrics import Metrics
+
+from .log_sink import JobLogSink
+
+
+class JobStreamWorker:
+    """
+    基于 Redis Stream 的定时任务工作进程
+
+    调度器在任务执行器为 stream 时只负责把任务投递到队列，
+    由独立启动的工作进程（python main.py worker）通过消费者组消费并执行，
+    CPU 密集型任务可以水平扩展到多台机器上，不再占用 Web 进程。
+    """
+
+    group_name: str = "scheduler_job_workers"
+    # 消息处理超时后可被其他消费者认领的空闲时间（毫秒）
+    claim_idle_ms: int = 5 * 60 * 1000
+
+    def __init__(self, redis: Redis, consumer_name: str) -> None:
+        """
+        初始化工作进程
+
+        参数:
+        - redis (Redis): Redis 连接（需 decode_responses=True）。
+        - consumer_name (str): 消费者名称。
+        """
+        self.redis = redis
+        self.consumer_name = consumer_name
+        self.stream_key = RedisInitKeyConfig.APSCHEDULER_STREAM_KEY.key
+        self.semaphore = asyncio.Semaphore(settings.SCHEDULER_STREAM_CONCURRENCY)
+        self.tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    async def enqueue(
+        cls,
+        redis: Redis,
+        func: Callable,
+        job_id: str | int,
+        args: tuple | list,
+        kwargs: dict[str, Any],
+        meta: dict[str, str] | None = None,
+    ) -> str:
+        """
+        投递任务到执行队列
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - func (Callable): 任务函数。
+        - job_id (str | int): 任务ID。
+        - args (tuple | list): 位置参数。
+        - kwargs (dict[str, Any]): 关键字参数。
+        - meta (dict[str, str] | None): 任务元信息（名称、存储器、触发器），用于记录执行日志。
+
+        返回:
+        - str: 消息ID。
+        """
+        meta = meta or {}
+        return await redis.xadd(
+            RedisInitKeyConfig.APSCHEDULER_STREAM_KEY.key,
+            {
+                "job_id": str(job_id),
+                "func": obj_to_ref(func),
+                "args": json.dumps(list(args), ensure_ascii=False),
+                "kwargs": json.dumps(kwargs, ensure_ascii=False),
+                "job_name": meta.get("name", ""),
+                "job_group": meta.get("jobstore", ""),
+                "job_trigger": meta.get("trigger", ""),
+            },
+            maxlen=settings.SCHEDULER_STREAM_MAXLEN,
+            approximate=True,
+        )
+
+    async def _ensure_group(self) -> None:
+        """创建消费者组（已存在时忽略）"""
+        try:
+            await self.redis.xgroup_create(self.stream_key, self.group_name, id="0", mkstream=True)
+        except exceptions.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _execute(self, message_id: str, fields: dict[str, str]) -> None:
+        """执行单条任务消息并确认"""
+        job_id = fields.get("job_id", "")
+        args_str = fields.get("args") or "[]"
+        kwargs_str = fields.get("kwargs") or "{}"
+        exception_info = ""
+        start_time = time.perf_counter()
+        try:
+            func = ref_to_obj(fields["func"])
+            args = json.loads(args_str)
+            kwargs = json.loads(kwargs_str)
+            log.info(f"任务 {job_id} 开始执行: {fields['func']}, 参数: {args}-{kwargs}")
+            if iscoroutinefunction(func):
+                await func(*args, **kwargs)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+            log.info(f"任务 {job_id} 执行完成")
+        except Exception as e:
+            exception_info = str(e)
+            log.error(f"任务 {job_id} 执行失败: {e!s}")
+        finally:
+            duration = time.perf_counter() - start_time
+            # 执行失败同样确认，避免毒消息反复投递
+            await self.redis.xack(self.stream_key, self.group_name, message_id)
+            self.semaphore.release()
+
+        status = "1" if exception_info else "0"
+        if settings.METRICS_ENABLE:
+            Metrics.observe_job(job_id, "stream", status, duration)
+        JobLogSink.submit(
+            JobLogSink.build_record(
+                job_id=job_id,
+                job_name=fields.get("job_name", ""),
+                job_group=fields.get("job_group", ""),
+                job_executor="stream",
+                invoke_target=fields.get("func", "").replace(":", "."),
+                job_args=args_str,
+                job_kwargs=kwargs_str,
+                job_trigger=fields.get("job_trigger", ""),
+                job_message=(
+                    f"任务 {job_id} ({fields.get('job_name', '')}) 由工作进程 {self.consumer_name} "
+                    f"执行完成: 状态={'成功' if status == '0' else '失败'}, 耗时={duration:.3f}s"
+                ),
+                status=status,
+                exception_info=exception_info,
+                duration=duration,
+            )
+        )
+
+    async def _dispatch(self, messages: list) -> None:
+        """按并发上限分发消息"""
+        for message_id, fields in messages:
+            if not fields:
+                # 已被裁剪的消息，直接确认
+                await self.redis.xack(self.stream_key, self.group_name, message_id)
+                continue
+            await self.semaphore.acquire()
+            task = asyncio.create_task(self._execute(message_id, fields))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def run(self) -> None:
+        """
+        消费循环：先认领超时未确认的消息，再阻塞读取新消息。
+
+        返回:
+        - None
+        """
+        await self._ensure_group()
+        JobLogSink.start(self.redis)
+        log.info(f"🚀 定时任务工作进程已启动: {self.consumer_name}")
+        claim_interval = 60
+        last_claim = 0.0
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if loop.time() - last_claim >= claim_interval:
+                    last_claim = loop.time()
+                    claimed = await self.redis.xautoclaim(
+                        self.stream_key,
+                        self.group_name,
+                        self.consumer_name,
+                        min_idle_time=self.claim_idle_ms,
+                        count=settings.SCHEDULER_STREAM_CONCURRENCY,
+                    )
+                    await self._dispatch(claimed[1])
+
+                response = await self.redis.xreadgroup(
+                    self.group_name,
+                    self.consumer_name,
+                    streams={self.stream_key: ">"},
+                    count=settings.SCHEDULER_STREAM_CONCURRENCY,
+                    block=5000,
+                )
+                for _, messages in response or []:
+                    await self._dispatch(messages)
+        finally:
+            if self.tasks:
+                await asyncio.gather(*self.tasks, return_exceptions=True)
+            await JobLogSink.stop()
+            log.info(f"✅️ 定时任务工作进程已退出: {self.consumer_name}")
@@ -0,0 +1,285 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio.client import Redis
+from sqlalchemy import insert
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.database import async_db_session
+from app.core.logger import log
+from app.plugin.module_application.job.model import JobLogModel
+
+# 执行耗时直方图分桶上界（秒）
+DURATION_BUCKETS: tuple[float, ...] = (0.1, 0.5, 1, 5, 10, 30, 60, 300)
+# 停止标记：后台任务读到后写完当前批次再退出
+_STOP = object()
+
+
+class JobLogSink:
+    """
+    定时任务执行日志异步写入器
+
+    调度器事件回调只把执行记录放入有界缓冲队列（O(1)，不做任何 IO），
+    后台任务按批次或时间间隔批量写入 app_job_log 表，并通过一次 Redis pipeline
+    更新每个任务的运行统计（耗时直方图、最近状态、连续失败次数），供任务列表页展示。
+    缓冲区写满时丢弃新记录并计数，保证高频任务不会拖垮调度线程。
+    """
+
+    _queue: asyncio.Queue | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _task: asyncio.Task | None = None
+    _redis: Redis | None = None
+    dropped: int = 0
+
+    @classmethod
+    def start(cls, redis: Redis | None) -> None:
+        """
+        启动后台写入任务（需在事件循环中调用）。
+
+        参数:
+        - redis (Redis | None): Redis 连接，为空时只写数据库不记录统计。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done():
+            return
+        cls._redis = redis
+        cls._loop = asyncio.get_running_loop()
+        cls._queue = asyncio.Queue(maxsize=settings.SCHEDULER_LOG_BUFFER_SIZE)
+        cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台写入任务并写入剩余记录。
+
+        不取消后台任务(取消会丢失其已取出或正在写入的批次)，而是放入停止标记，
+        等待其写完标记之前的全部记录后退出。
+
+        返回:
+        - None
+        """
+        if cls._task and not cls._task.done() and cls._queue:
+            # 队列已满时等待后台任务腾出空间
+            await cls._queue.put(_STOP)
+            try:
+                await cls._task
+            except Exception as e:
+                log.error(f"任务执行日志写入器退出异常: {e!s}")
+        cls._task = None
+        if cls._queue and not cls._queue.empty():
+            # 停止标记之后提交的记录
+            batch, _ = cls._drain(cls._queue.qsize())
+            await cls._flush(batch)
+
+    @classmethod
+    def submit(cls, record: dict[str, Any]) -> None:
+        """
+        提交一条执行记录（线程安全，不阻塞）。
+
+        参数:
+        - record (dict[str, Any]): JobLogModel 字段字典，额外包含 duration（秒）。
+
+        返回:
+        - None
+        """
+        if not cls._queue or not cls._loop:
+            log.warning(f"任务 {record.get('job_id')} 日志写入器未启动，丢弃执行日志")
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is cls._loop:
+            cls._put(record)
+        else:
+            cls._loop.call_soon_threadsafe(cls._put, record)
+
+    @classmethod
+    def _put(cls, record: dict[str, Any]) -> None:
+        """放入缓冲队列，队列已满时丢弃"""
+        try:
+            cls._queue.put_nowait(record)  # pyright: ignore[reportOptionalMemberAccess]
+        except asyncio.QueueFull:
+            cls.dropped += 1
+            if cls.dropped % 1000 == 1:
+                log.warning(f"任务执行日志缓冲区已满，累计丢弃 {cls.dropped} 条")
+
+    @classmethod
+    def _drain(cls, limit: int) -> tuple[list[dict[str, Any]], bool]:
+        """从队列中非阻塞取出最多 limit 条记录，遇到停止标记时返回 (记录, True)"""
+        batch = []
+        while cls._queue and len(batch) < limit:
+            try:
+                item = cls._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    @classmethod
+    async def _run(cls) -> None:
+        """后台循环：凑满一批或到达刷新间隔即写入，读到停止标记时写完当前批次后退出"""
+        queue = cls._queue
+        if queue is None:
+            return
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is _STOP:
+                return
+            deadline = time.monotonic() + settings.SCHEDULER_LOG_FLUSH_SECONDS
+            batch = [first]
+            while len(batch) < settings.SCHEDULER_LOG_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            if not stopping:
+                rest, stopping = cls._drain(settings.SCHEDULER_LOG_BATCH_SIZE - len(batch))
+                batch.extend(rest)
+            await cls._flush(batch)
+
+    @classmethod
+    async def _flush(cls, batch: list[dict[str, Any]]) -> None:
+        """批量写入数据库并更新 Redis 统计"""
+        if not batch:
+            return
+        durations = [record.pop("duration", None) for record in batch]
+        try:
+            async with async_db_session() as session:
+                async with session.begin():
+                    await session.execute(insert(JobLogModel), batch)
+            log.debug(f"批量写入任务执行日志 {len(batch)} 条")
+        except Exception as e:
+            log.error(f"批量写入任务执行日志失败({len(batch)} 条): {e!s}")
+
+        if not cls._redis:
+            return
+        try:
+            async with cls._redis.pipeline(transaction=False) as pipe:
+                for record, duration in zip(batch, durations, strict=True):
+                    cls._stats_commands(pipe, record, duration)
+                await pipe.execute()
+        except Exception as e:
+            log.error(f"更新任务运行统计失败: {e!s}")
+
+    @classmethod
+    def _stats_commands(cls, pipe: Any, record: dict[str, Any], duration: float | None) -> None:
+        """向 pipeline 追加单条记录的统计命令"""
+        if record.get("job_id") is None:
+            return
+        key = f"{RedisInitKeyConfig.APSCHEDULER_JOB_STATS_KEY.key}:{record['job_id']}"
+        failed = record.get("status") == "1"
+        mapping: dict[str, Any] = {
+            "last_status": record.get("status", "0"),
+            "last_run_time": record["created_time"].strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if duration is not None:
+            mapping["last_duration"] = round(duration, 3)
+            bucket = next((f"le_{b}" for b in DURATION_BUCKETS if duration <= b), "le_inf")
+            pipe.hincrby(key, bucket, 1)
+            pipe.hincrbyfloat(key, "total_duration", duration)
+        pipe.hset(key, mapping=mapping)
+        pipe.hincrby(key, "run_count", 1)
+        if failed:
+            pipe.hincrby(key, "fail_count", 1)
+            pipe.hincrby(key, "consecutive_failures", 1)
+        else:
+            pipe.hset(key, "consecutive_failures", 0)
+
+    @classmethod
+    async def get_stats(cls, redis: Redis, job_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        批量读取任务运行统计（一次 pipeline）。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - job_ids (list[int]): 任务ID列表。
+
+        返回:
+        - dict[int, dict[str, Any]]: {任务ID: 统计信息}
+        """
+        if not job_ids:
+            return {}
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for job_id in job_ids:
+                    pipe.hgetall(f"{RedisInitKeyConfig.APSCHEDULER_JOB_STATS_KEY.key}:{job_id}")
+                results = await pipe.execute()
+        except Exception as e:
+            log.error(f"获取任务运行统计失败: {e!s}")
+            return {}
+
+        stats = {}
+        for job_id, raw in zip(job_ids, results, strict=True):
+            if not raw:
+                continue
+            run_count = int(raw.get("run_count", 0))
+            total_duration = float(raw.get("total_duration", 0))
+            stats[job_id] = {
+                "last_status": raw.get("last_status"),
+                "last_run_time": raw.get("last_run_time"),
+                "last_duration": float(raw["last_duration"]) if "last_duration" in raw else None,
+                "avg_duration": round(total_duration / run_count, 3) if run_count else None,
+                "run_count": run_count,
+                "fail_count": int(raw.get("fail_count", 0)),
+                "consecutive_failures": int(raw.get("consecutive_failures", 0)),
+                "duration_histogram": {
+                    bucket: int(raw.get(bucket, 0))
+                    for bucket in [*(f"le_{b}" for b in DURATION_BUCKETS), "le_inf"]
+                },
+            }
+        return stats
+
+    @staticmethod
+    def build_record(
+        job_id: str | int,
+        job_name: str,
+        job_group: str,
+        job_executor: str,
+        invoke_target: str,
+        job_args: str,
+        job_kwargs: str,
+        job_trigger: str,
+        job_message: str,
+        status: str,
+        exception_info: str,
+        duration: float | None,
+    ) -> dict[str, Any]:
+        """
+        构建执行记录字典。
+
+        返回:
+        - dict[str, Any]: 执行记录。
+        """
+        now = datetime.now()
+        return {
+            "job_id": int(job_id) if str(job_id).isdigit() else None,
+            "job_name": job_name[:64],
+            "job_group": job_group[:64],
+            "job_executor": job_executor[:64],
+            "invoke_target": invoke_target[:500],
+            "job_args": job_args[:255],
+            "job_kwargs": job_kwargs[:255],
+            "job_trigger": job_trigger[:255],
+            "job_message": job_message[:500],
+            "status": status,
+            "exception_info": exception_info[:2000],
+            "created_time": now,
+            "updated_time": now,
+            "duration": duration,
+        }
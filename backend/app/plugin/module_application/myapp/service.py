@@ -115,10 +115,7 @@ class ApplicationService:
         """
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
-        for id in ids:
-            obj = await ApplicationCRUD(auth).get_by_id_crud(id=id)
-            if not obj:
-                raise CustomException(msg=f"删除失败，应用 {id} 不存在")
+        await ApplicationCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
         await ApplicationCRUD(auth).delete_crud(ids=ids)
 
     @classmethod
@@ -1,16 +1,18 @@
 import urllib.parse
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, UploadFile
+from fastapi import APIRouter, Body, Depends, Path, Query, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.response import ResponseSchema, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
 from app.core.base_schema import BatchSetAvailable
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
+from app.core.task_queue import TaskQueue
 from app.utils.common_util import bytes2file_response
 
 from .schema import DemoCreateSchema, DemoOutSchema, DemoQueryParam, DemoUpdateSchema
@@ -73,6 +75,7 @@ async def get_obj_list_controller(
         page_size=page.page_size,
         search=search,
         order_by=page.order_by,
+        fields=page.fields,
     )
     log.info("查询示例列表成功")
     return SuccessResponse(data=result_dict, msg="查询示例列表成功")
@@ -219,24 +222,96 @@ async def export_obj_list_controller(
 async def import_obj_list_controller(
     file: UploadFile,
     auth: Annotated[AuthSchema, Depends(AuthPermission(["module_example:demo:import"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+    job_id: Annotated[str | None, Query(description="导入任务ID(用于查询导入进度)")] = None,
 ) -> JSONResponse:
     """
     导入示例
 
     参数:
-    - file (UploadFile): 导入的Excel文件
+    - file (UploadFile): 导入的Excel/CSV文件
     - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+    - job_id (str | None): 导入任务ID
 
     返回:
     - JSONResponse: 包含导入示例详情的JSON响应
     """
     batch_import_result = await DemoService.batch_import_service(
-        file=file, auth=auth, update_support=True
+        file=file, auth=auth, update_support=True, redis=redis, job_id=job_id
     )
     log.info(f"导入示例成功: {batch_import_result}")
     return SuccessResponse(data=batch_import_result, msg="导入示例成功")
 
 
+@DemoRouter.post(
+    "/export/task",
+    summary="提交导出示例任务",
+    description="后台导出示例，完成后通过任务产物下载",
+    response_model=ResponseSchema[dict],
+)
+async def export_obj_list_task_controller(
+    search: Annotated[DemoQueryParam, Depends()],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_example:demo:export"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    提交导出示例任务
+
+    参数:
+    - search (DemoQueryParam): 查询参数
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskQueue.submit(
+        redis=redis,
+        func=DemoService.batch_export_task_service,
+        task_type="export",
+        title="导出示例",
+        auth=auth,
+        kwargs={"search": search.__dict__},
+    )
+    log.info(f"提交导出示例任务成功 {result_dict['task_id']}")
+    return SuccessResponse(data=result_dict, msg="提交导出示例任务成功")
+
+
+@DemoRouter.post(
+    "/import/task",
+    summary="提交导入示例任务",
+    description="后台导入示例，通过任务接口查询进度与结果",
+    response_model=ResponseSchema[dict],
+)
+async def import_obj_list_task_controller(
+    file: UploadFile,
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_example:demo:import"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    提交导入示例任务
+
+    参数:
+    - file (UploadFile): 导入的Excel/CSV文件
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskQueue.submit(
+        redis=redis,
+        func=DemoService.batch_import_task_service,
+        task_type="import",
+        title=f"导入示例: {file.filename}",
+        auth=auth,
+        file=file,
+    )
+    log.info(f"提交导入示例任务成功 {result_dict['task_id']}")
+    return SuccessResponse(data=result_dict, msg="提交导入示例任务成功")
+
+
 @DemoRouter.post(
     "/download/template",
     summary="获取示例导入模板",
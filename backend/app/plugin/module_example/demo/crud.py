@@ -108,6 +108,7 @@ class DemoCRUD(CRUDBase[DemoModel, DemoCreateSchema, DemoUpdateSchema]):
         order_by: list[dict] | None = None,
         search: dict | None = None,
         preload: list | None = None,
+        fields: list[str] | None = None,
     ) -> dict:
         """
         分页查询
@@ -118,6 +119,7 @@ class DemoCRUD(CRUDBase[DemoModel, DemoCreateSchema, DemoUpdateSchema]):
         - order_by (list[dict] | None): 排序参数
         - search (dict | None): 查询参数
         - preload (list | None): 预加载关系，未提供时使用模型默认项
+        - fields (list[str] | None): 返回字段，未提供时返回除大字段外的全部字段
 
         返回:
         - dict: 分页数据
@@ -132,4 +134,6 @@ class DemoCRUD(CRUDBase[DemoModel, DemoCreateSchema, DemoUpdateSchema]):
             search=search_dict,
             out_schema=DemoOutSchema,
             preload=preload,
+            serialize=True,
+            fields=fields,
         )
@@ -1,13 +1,15 @@
-import io
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-import pandas as pd
+import aiofiles
 from fastapi import UploadFile
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_import import ImportColumn, ImportEngine, map_values, to_text
 from app.core.base_schema import BatchSetAvailable
 from app.core.exceptions import CustomException
-from app.core.logger import log
+from app.core.task_queue import TaskContext
 from app.utils.excel_util import ExcelUtil
 
 from .crud import DemoCRUD
@@ -71,6 +73,7 @@ class DemoService:
         page_size: int,
         search: DemoQueryParam | None = None,
         order_by: list[dict[str, str]] | None = None,
+        fields: list[str] | None = None,
     ) -> dict:
         """
         分页查询
@@ -81,6 +84,7 @@ class DemoService:
         - page_size (int): 每页数量
         - search (DemoQueryParam | None): 查询参数
         - order_by (list[dict[str, str]] | None): 排序参数
+        - fields (list[str] | None): 返回字段
 
         返回:
         - dict: 分页数据
@@ -94,6 +98,7 @@ class DemoService:
             limit=page_size,
             order_by=order_by_list,
             search=search_dict,
+            fields=fields,
         )
         return result
 
@@ -156,11 +161,8 @@ class DemoService:
         if len(ids) < 1:
             raise CustomException(msg="删除失败，删除对象不能为空")
 
-        # 检查所有要删除的数据是否存在
-        for id in ids:
-            obj = await DemoCRUD(auth).get_by_id_crud(id=id)
-            if not obj:
-                raise CustomException(msg=f"删除失败，ID为{id}的数据不存在")
+        # 一次查询校验所有要删除的数据是否存在且有权限
+        await DemoCRUD(auth).validate_ids(ids=ids, msg="删除失败", fields=["id"])
 
         await DemoCRUD(auth).delete_crud(ids=ids)
 
@@ -213,100 +215,96 @@ class DemoService:
 
         return ExcelUtil.export_list2excel(list_data=data, mapping_dict=mapping_dict)
 
+    @classmethod
+    async def batch_export_task_service(cls, ctx: TaskContext, search: dict[str, Any]) -> dict:
+        """
+        批量导出(后台任务)，导出文件保存为任务产物
+
+        参数:
+        - ctx (TaskContext): 任务上下文
+        - search (dict[str, Any]): 查询条件(DemoQueryParam 的字段字典)
+
+        返回:
+        - dict: 导出条数
+        """
+        # 查询条件经 JSON 序列化后元组变为列表，还原为 (操作符, 值)
+        search_dict = {
+            key: tuple(value) if isinstance(value, list) else value for key, value in search.items()
+        }
+        async with ctx.auth() as auth:
+            obj_list = await DemoCRUD(auth).list_crud(search=search_dict)
+            data = [DemoOutSchema.model_validate(obj).model_dump() for obj in obj_list]
+        await ctx.progress(len(data), len(data), "正在生成导出文件")
+        content = await cls.batch_export_service(obj_list=data)
+        async with aiofiles.open(ctx.artifact_path("demo.xlsx"), "wb") as f:
+            await f.write(content)
+        return {"count": len(data)}
+
     @classmethod
     async def batch_import_service(
-        cls, auth: AuthSchema, file: UploadFile, update_support: bool = False
+        cls,
+        auth: AuthSchema,
+        file: UploadFile,
+        update_support: bool = False,
+        redis: Redis | None = None,
+        job_id: str | None = None,
+        progress: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> str:
         """
         批量导入
 
         参数:
         - auth (AuthSchema): 认证信息模型
-        - file (UploadFile): 上传的Excel文件
+        - file (UploadFile): 上传的Excel/CSV文件
         - update_support (bool): 是否支持更新存在数据
+        - redis (Redis | None): Redis 连接，提供时记录导入进度
+        - job_id (str | None): 导入任务ID，用于查询导入进度
+        - progress (Callable[[int, int], Awaitable[None]] | None): 进度回调(后台任务使用)
 
         返回:
         - str: 导入结果信息
         """
+        engine = ImportEngine(
+            crud=DemoCRUD(auth),
+            columns=[
+                ImportColumn(header="名称", field="name", required=True, converter=to_text),
+                ImportColumn(
+                    header="状态",
+                    field="status",
+                    required=True,
+                    converter=map_values({"正常": "0", "停用": "1"}),
+                    message="状态必须是'正常'或'停用'",
+                ),
+                ImportColumn(header="描述", field="description", converter=to_text),
+            ],
+            key="name",
+            update_support=update_support,
+        )
+        return await engine.run(file=file, redis=redis, job_id=job_id, progress=progress)
+
+    @classmethod
+    async def batch_import_task_service(
+        cls, ctx: TaskContext, file_path: str, file_name: str, update_support: bool = True
+    ) -> str:
+        """
+        批量导入(后台任务)
 
-        header_dict = {"名称": "name", "状态": "status", "描述": "description"}
-
-        try:
-            # 读取Excel文件
-            contents = await file.read()
-            df = pd.read_excel(io.BytesIO(contents))
-            await file.close()
-
-            if df.empty:
-                raise CustomException(msg="导入文件为空")
-
-            # 检查表头是否完整
-            missing_headers = [header for header in header_dict.keys() if header not in df.columns]
-            if missing_headers:
-                raise CustomException(msg=f"导入文件缺少必要的列: {', '.join(missing_headers)}")
-
-            # 重命名列名
-            df.rename(columns=header_dict, inplace=True)
-
-            # 验证必填字段
-            required_fields = ["name", "status"]
-            errors = []
-            for field in required_fields:
-                missing_rows = df[df[field].isnull()].index.tolist()
-                if missing_rows:
-                    field_name = next(k for k, v in header_dict.items() if v == field)
-                    rows_str = "、".join([str(i + 1) for i in missing_rows])
-                    errors.append(f"{field_name}不能为空，第{rows_str}行")
-            if errors:
-                raise CustomException(msg=f"导入失败，以下行缺少必要字段：\n{'; '.join(errors)}")
-
-            error_msgs = []
-            success_count = 0
-            count = 0
-
-            # 处理每一行数据
-            for _index, row in df.iterrows():
-                count += 1
-                try:
-                    # 数据转换前的类型检查
-                    try:
-                        status = "0" if row["status"] == "正常" else "1"
-                    except ValueError:
-                        error_msgs.append(f"第{count}行: 状态必须是'正常'或'停用'")
-                        continue
-
-                    # 构建用户数据
-                    data = {
-                        "name": str(row["name"]),
-                        "status": status,
-                        "description": str(row["description"]),
-                    }
-
-                    # 处理用户导入
-                    exists_obj = await DemoCRUD(auth).get(name=data["name"])
-                    if exists_obj:
-                        if update_support:
-                            await DemoCRUD(auth).update(id=exists_obj.id, data=data)
-                            success_count += 1
-                        else:
-                            error_msgs.append(f"第{count}行: 对象 {data['name']} 已存在")
-                    else:
-                        await DemoCRUD(auth).create(data=data)
-                        success_count += 1
-
-                except Exception as e:
-                    error_msgs.append(f"第{count}行: {e!s}")
-                    continue
-
-            # 返回详细的导入结果
-            result = f"成功导入 {success_count} 条数据"
-            if error_msgs:
-                result += "\n错误信息:\n" + "\n".join(error_msgs)
-            return result
-
-        except Exception as e:
-            log.error(f"批量导入用户失败: {e!s}")
-            raise CustomException(msg=f"导入失败: {e!s}")
+        参数:
+        - ctx (TaskContext): 任务上下文
+        - file_path (str): 已保存的导入文件路径
+        - file_name (str): 原始文件名
+        - update_support (bool): 是否支持更新存在数据
+
+        返回:
+        - str: 导入结果信息
+        """
+        async with ctx.auth() as auth:
+            return await cls.batch_import_service(
+                auth=auth,
+                file=TaskContext.upload_file(file_path, file_name),
+                update_support=update_support,
+                progress=ctx.progress,
+            )
 
     @classmethod
     async def import_template_download_service(cls) -> bytes:
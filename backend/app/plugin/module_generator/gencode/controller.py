@@ -2,15 +2,16 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path
 from fastapi.responses import JSONResponse
+from redis.asyncio.client import Redis
 
 from app.api.v1.module_system.auth.schema import AuthSchema
 from app.common.request import PaginationService
 from app.common.response import ResponseSchema, StreamResponse, SuccessResponse
 from app.core.base_params import PaginationQueryParam
-from app.core.dependencies import AuthPermission
+from app.core.dependencies import AuthPermission, redis_getter
 from app.core.logger import log
 from app.core.router_class import OperationLogRoute
-from app.utils.common_util import bytes2file_response
+from app.core.task_queue import TaskQueue
 
 from .schema import GenDBTableSchema, GenTableOutSchema, GenTableQueryParam, GenTableSchema
 from .service import GenTableService
@@ -246,12 +247,46 @@ async def batch_gen_code_controller(
     batch_gen_code_result = await GenTableService.batch_gen_code_service(auth, table_names)
     log.info(f"批量生成代码成功,表名列表：{table_names}")
     return StreamResponse(
-        data=bytes2file_response(batch_gen_code_result),
+        data=batch_gen_code_result,
         media_type="application/zip",
         headers={"Content-Disposition": "attachment; filename=code.zip"},
     )
 
 
+@GenRouter.patch(
+    "/batch/output/task",
+    summary="提交批量生成代码任务",
+    description="后台批量生成代码，完成后通过任务产物下载压缩包",
+    response_model=ResponseSchema[dict],
+)
+async def batch_gen_code_task_controller(
+    table_names: Annotated[list[str], Body(description="表名列表")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_generator:gencode:patch"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    提交批量生成代码任务
+
+    参数:
+    - table_names (List[str]): 表名列表
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskQueue.submit(
+        redis=redis,
+        func=GenTableService.batch_gen_code_task_service,
+        task_type="gencode",
+        title="批量生成代码",
+        auth=auth,
+        kwargs={"table_names": table_names},
+    )
+    log.info(f"提交批量生成代码任务成功,表名列表：{table_names}")
+    return SuccessResponse(data=result_dict, msg="提交批量生成代码任务成功")
+
+
 @GenRouter.post(
     "/output/{table_name}",
     summary="生成代码到指定路径",
@@ -325,3 +360,37 @@ async def sync_db_controller(
     result = await GenTableService.sync_db_service(auth, table_name)
     log.info(f"同步数据库,表名：{table_name},成功")
     return SuccessResponse(msg="同步数据库成功", data=result)
+
+
+@GenRouter.post(
+    "/sync_db/{table_name}/task",
+    summary="提交同步数据库任务",
+    description="后台同步数据库表结构到业务表",
+    response_model=ResponseSchema[dict],
+)
+async def sync_db_task_controller(
+    table_name: Annotated[str, Path(description="表名")],
+    auth: Annotated[AuthSchema, Depends(AuthPermission(["module_generator:db:sync"]))],
+    redis: Annotated[Redis, Depends(redis_getter)],
+) -> JSONResponse:
+    """
+    提交同步数据库任务
+
+    参数:
+    - table_name (str): 表名
+    - auth (AuthSchema): 认证信息模型
+    - redis (Redis): Redis 客户端实例
+
+    返回:
+    - JSONResponse: 包含任务状态的JSON响应
+    """
+    result_dict = await TaskQueue.submit(
+        redis=redis,
+        func=GenTableService.sync_db_task_service,
+        task_type="gencode",
+        title=f"同步数据库: {table_name}",
+        auth=auth,
+        kwargs={"table_name": table_name},
+    )
+    log.info(f"提交同步数据库任务成功,表名：{table_name}")
+    return SuccessResponse(data=result_dict, msg="提交同步数据库任务成功")
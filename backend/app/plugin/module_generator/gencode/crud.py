@@ -1,10 +1,8 @@
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
 
-from sqlalchemy import Inspector, inspect, select, text
+from sqlalchemy import select, text
 
 from app.api.v1.module_system.auth.schema import AuthSchema
-from app.config.setting import settings
 from app.core.base_crud import CRUDBase
 from app.core.logger import log
 
@@ -16,9 +14,7 @@ from .schema import (
     GenTableQueryParam,
     GenTableSchema,
 )
-
-if TYPE_CHECKING:
-    from sqlalchemy.engine.reflection import Inspector
+from .tools.schema_catalog import SchemaCatalog
 
 
 class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
@@ -63,6 +59,21 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         """
         return await self.get(table_name=table_name, preload=preload)
 
+    async def get_gen_table_list_by_names(
+        self, table_names: list[str], preload: list | None = None
+    ) -> Sequence[GenTableModel]:
+        """
+        根据业务表名称列表批量获取业务表信息（一次查询）。
+
+        参数:
+        - table_names (list[str]): 业务表名称列表。
+        - preload (list | None): 预加载关系，未提供时使用模型默认项
+
+        返回:
+        - Sequence[GenTableModel]: 业务表信息列表。
+        """
+        return await self.list(search={"table_name": ("in", table_names)}, preload=preload)
+
     async def get_gen_table_all(self, preload: list | None = None) -> Sequence[GenTableModel]:
         """
         获取所有业务表信息。
@@ -144,45 +155,22 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         返回:
         - list[dict]: 数据库表列表信息（已转为可序列化字典）。
         """
-        database_name = settings.DATABASE_NAME
-        database_type = settings.DATABASE_TYPE
-
-        from app.core.database import engine
+        # 从结构目录获取（结构未变更时直接使用缓存，不阻塞事件循环）
+        tables = await SchemaCatalog.get_tables()
 
-        inspector: Inspector = inspect(engine)
-        table_names = inspector.get_table_names()
+        # 统一处理 search 为 None 的情况，避免重复判断
+        if not search or not (search.table_name or search.table_comment):
+            return list(tables)
 
         dict_data = []
-        for table_name in table_names:
-            try:
-                table_comment = inspector.get_table_comment(table_name)
-                comment = (
-                    table_comment.get("text", "")
-                    if isinstance(table_comment, dict)
-                    else table_comment
-                )
-                table_comment = comment or ""
-            except Exception as e:
-                log.warning(f"获取表 {table_name} 的注释失败: {e}")
-                table_comment = ""
-
-            # 统一处理 search 为 None 的情况，避免重复判断
-            if search:
-                # 表名过滤：忽略大小写，支持模糊匹配
-                if search.table_name and search.table_name.lower() not in table_name.lower():
-                    continue
-                # 表注释过滤：忽略大小写，支持模糊匹配；table_comment 为 None 时视为空字符串
-                if search.table_comment and search.table_comment not in table_comment:
-                    continue
-
-            table_info = {
-                "database_name": database_name,
-                "table_name": table_name,
-                "table_type": database_type,
-                "table_comment": table_comment,
-            }
-
-            dict_data.append(GenDBTableSchema(**table_info).model_dump())
+        for table in tables:
+            # 表名过滤：忽略大小写，支持模糊匹配
+            if search.table_name and search.table_name.lower() not in table["table_name"].lower():
+                continue
+            # 表注释过滤：忽略大小写，支持模糊匹配；table_comment 为 None 时视为空字符串
+            if search.table_comment and search.table_comment not in table["table_comment"]:
+                continue
+            dict_data.append(table)
 
         return dict_data
 
@@ -222,10 +210,7 @@ class GenTableCRUD(CRUDBase[GenTableModel, GenTableSchema, GenTableSchema]):
         返回:
         - bool: 如果表存在返回True，否则返回False。
         """
-        from app.core.database import engine
-
-        inspector: Inspector = inspect(engine)
-        return inspector.has_table(table_name)
+        return await SchemaCatalog.table_exists(table_name)
 
     async def execute_sql(self, sql: str) -> bool:
         """
@@ -258,82 +243,6 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
         """
         super().__init__(model=GenTableColumnModel, auth=auth)
 
-    @staticmethod
-    def _sync_get_table_columns(database_type: str, table_name: str) -> list[dict]:
-        """
-        同步函数：获取数据库表的列信息
-
-        参数:
-        - database_type: 数据库类型
-        - table_name: 表名
-
-        返回:
-        - list: 列信息列表
-        """
-        # 使用SQLAlchemy Inspector获取表列信息
-        from app.core.database import engine
-
-        inspector: Inspector = inspect(engine)
-
-        # 获取列信息
-        columns = inspector.get_columns(table_name)
-
-        # 获取主键信息
-        try:
-            pk_constraint = inspector.get_pk_constraint(table_name)
-            primary_keys = (
-                set(pk_constraint.get("constrained_columns", [])) if pk_constraint else set()
-            )
-        except Exception:
-            primary_keys = set()
-
-        # 获取唯一约束信息
-        unique_columns = set()
-        unique_constraints = inspector.get_unique_constraints(table_name)
-        for constraint in unique_constraints:
-            unique_columns.update(constraint.get("column_names", []))
-
-        # 处理列信息
-        columns_list = []
-        for idx, column in enumerate(columns):
-            # 获取列的基本信息
-            column_name = column["name"]
-            column_type = str(column["type"])
-            is_nullable = column.get("nullable", True)
-            column_default = column.get("default", None)
-            # 获取列注释（如果有的话）
-            column_comment = column.get("comment", "")
-            # 判断是否为主键
-            is_pk = column_name in primary_keys
-            # 判断是否为唯一约束
-            is_unique = column_name in unique_columns
-            # 判断是否为自增列（基于数据库类型和列类型）
-            is_increment = column.get("autoincrement", False) in (True, "auto")
-            # 获取列长度（如果适用）
-            column_length = None
-            # 使用getattr安全地获取length属性，避免访问不存在时抛出AttributeError
-            column_length = getattr(column["type"], "length", None)
-            if column_length is not None:
-                column_length = str(getattr(column["type"], "length", ""))
-
-            # 构造列信息字典
-            column_info = {
-                "column_name": column_name,
-                "column_comment": column_comment or "",
-                "column_type": column_type,
-                "column_length": column_length or "",
-                "column_default": str(column_default) if column_default is not None else "",
-                "sort": idx + 1,  # 序号从1开始
-                "is_pk": 1 if is_pk else 0,
-                "is_increment": 1 if is_increment else 0,
-                "is_nullable": 1 if is_nullable else 0,
-                "is_unique": 1 if is_unique else 0,
-            }
-
-            columns_list.append(column_info)
-
-        return columns_list
-
     async def get_gen_table_column_by_id(
         self, id: int, preload: list | None = None
     ) -> GenTableColumnModel | None:
@@ -381,13 +290,14 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
         return await self.list(search={"table_id": table_id}, order_by=order_by, preload=preload)
 
     async def get_gen_db_table_columns_by_name(
-        self, table_name: str | None
+        self, table_name: str | None, refresh: bool = False
     ) -> list[GenTableColumnOutSchema]:
         """
         根据业务表名称获取业务表字段列表信息。
 
         参数:
         - table_name (str | None): 业务表名称。
+        - refresh (bool): 是否忽略结构目录缓存，直接读取数据库。
 
         返回:
         - list[GenTableColumnOutSchema]: 业务表字段列表信息对象。
@@ -397,10 +307,10 @@ class GenTableColumnCRUD(CRUDBase[GenTableColumnModel, GenTableColumnSchema, Gen
             raise ValueError("数据表名称不能为空")
 
         try:
-            # 直接调用同步方法获取列信息
-            columns_info = GenTableColumnCRUD._sync_get_table_columns(
-                settings.DATABASE_TYPE, table_name
-            )
+            # 从结构目录批量查询列信息
+            columns_info = (await SchemaCatalog.get_columns([table_name], refresh=refresh))[
+                table_name
+            ]
 
             # 转换为GenTableColumnOutSchema对象列表
             columns_list = [GenTableColumnOutSchema(**column_info) for column_info in columns_info]
@@ -1,7 +1,6 @@
-import io
+import asyncio
 import os
-import zipfile
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import anyio
@@ -23,6 +22,8 @@ from app.config.path_conf import BASE_DIR
 from app.config.setting import settings
 from app.core.exceptions import CustomException
 from app.core.logger import log
+from app.core.task_queue import TaskContext
+from app.utils.zip_stream_util import ZipStreamUtil
 
 from .crud import GenTableColumnCRUD, GenTableCRUD
 from .schema import (
@@ -34,6 +35,7 @@ from .schema import (
 )
 from .tools.gen_util import GenUtils
 from .tools.jinja2_template_util import Jinja2TemplateUtil
+from .tools.schema_catalog import SchemaCatalog
 
 
 def handle_service_exception(func: Callable) -> Callable:
@@ -142,6 +144,10 @@ class GenTableService:
         if not gen_table_list:
             raise CustomException(msg="导入的表结构不能为空")
         try:
+            # 一次查询预取所有待导入表的列信息
+            await SchemaCatalog.get_columns([
+                table.table_name for table in gen_table_list if table.table_name
+            ])
             for table in gen_table_list:
                 table_name = table.table_name
                 # 检查表是否已存在
@@ -249,6 +255,7 @@ class GenTableService:
                 log.info(f"执行SQL语句: {exc_sql}")
                 if not await gen_table_crud.execute_sql(exc_sql):
                     raise CustomException(msg=f"执行SQL语句 {exc_sql} 失败，请检查数据库")
+            SchemaCatalog.invalidate()
             return True
 
         except Exception as e:
@@ -379,19 +386,8 @@ class GenTableService:
             await GenTableCRUD(auth).get_gen_table_by_id(table_id)
         )
         await cls.set_pk_column(gen_table)
-        env = Jinja2TemplateUtil.get_env()
-        context = Jinja2TemplateUtil.prepare_context(gen_table)
-        template_list = Jinja2TemplateUtil.get_template_list()
-        preview_code_result = {}
-        for template in template_list:
-            try:
-                render_content = await env.get_template(template).render_async(**context)
-                preview_code_result[template] = render_content
-            except Exception as e:
-                log.error(f"渲染模板 {template} 时出错: {e!s}")
-                # 即使某个模板渲染失败，也继续处理其他模板
-                preview_code_result[template] = f"渲染错误: {e!s}"
-        return preview_code_result
+        # 即使某个模板渲染失败，也继续处理其他模板；表定义未变时直接返回缓存的渲染结果
+        return await Jinja2TemplateUtil.render_table(gen_table, ignore_errors=True)
 
     @classmethod
     @handle_service_exception
@@ -409,9 +405,8 @@ class GenTableService:
         # 验证表名非空
         if not table_name or not table_name.strip():
             raise CustomException(msg="表名不能为空")
-        env = Jinja2TemplateUtil.get_env()
         render_info = await cls.__get_gen_render_info(auth, table_name)
-        gen_table_schema: GenTableOutSchema = render_info[3]
+        gen_table_schema: GenTableOutSchema = render_info[2]
 
         from app.api.v1.module_system.menu.crud import MenuCRUD
         from app.api.v1.module_system.menu.schema import MenuCreateSchema
@@ -567,9 +562,15 @@ class GenTableService:
         log.info(f"成功创建{gen_table_schema.function_name}菜单及按钮权限")
 
         # 2. 菜单创建成功后，再生成页面代码
+        try:
+            render_result = await Jinja2TemplateUtil.render_table(gen_table_schema)
+        except Exception as e:
+            raise CustomException(
+                msg=f"渲染模板失败，表名：{gen_table_schema.table_name}，详细错误信息：{e!s}"
+            )
         for template in render_info[0]:
             try:
-                render_content = await env.get_template(template).render_async(**render_info[2])
+                render_content = render_result[template]
 
                 file_name = Jinja2TemplateUtil.get_file_name(template, gen_table_schema)
                 full_path = BASE_DIR.parent.joinpath(file_name)
@@ -601,43 +602,78 @@ class GenTableService:
 
     @classmethod
     @handle_service_exception
-    async def batch_gen_code_service(cls, auth: AuthSchema, table_names: list[str]) -> bytes:
+    async def batch_gen_code_service(
+        cls, auth: AuthSchema, table_names: list[str]
+    ) -> AsyncIterator[bytes]:
         """
         批量生成代码并打包为ZIP。
-        - 备注：内存生成并压缩，兼容多模板类型；供下载使用。
+        - 备注：业务表一次查询加载，各表模板在线程池中并发渲染（表定义未变时复用渲染缓存），边压缩边输出，不在内存中构建完整压缩包。
 
         参数:
         - auth (AuthSchema): 认证信息。
         - table_names (list[str]): 业务表名列表。
 
         返回:
-        - bytes: 包含所有生成代码的ZIP文件内容。
+        - AsyncIterator[bytes]: ZIP文件数据流。
         """
+        table_names = [name for name in dict.fromkeys(table_names) if name and name.strip()]
         # 验证表名列表非空
         if not table_names:
             raise CustomException(msg="表名列表不能为空")
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for table_name in table_names:
-                if not table_name.strip():
-                    continue
+        gen_table_models = await GenTableCRUD(auth).get_gen_table_list_by_names(table_names)
+        gen_table_map = {model.table_name: model for model in gen_table_models}
+        gen_tables = []
+        for table_name in table_names:
+            try:
+                gen_table_model = gen_table_map.get(table_name)
+                if gen_table_model is None:
+                    raise CustomException(msg=f"业务表 {table_name} 不存在")
+                gen_table = GenTableOutSchema.model_validate(gen_table_model)
+                await cls.set_pk_column(gen_table)
+                gen_tables.append(gen_table)
+            except Exception as e:
+                log.error(f"批量生成代码时处理表 {table_name} 出错: {e!s}")
+                # 继续处理其他表，不中断整个过程
+                continue
+        return ZipStreamUtil.iter_zip(cls.__iter_gen_code_files(gen_tables))
+
+    @classmethod
+    async def __iter_gen_code_files(
+        cls, gen_tables: list[GenTableOutSchema]
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        并发渲染各表模板，按表顺序逐个输出生成的文件。
+
+        参数:
+        - gen_tables (list[GenTableOutSchema]): 业务表对象列表。
+
+        返回:
+        - AsyncIterator[tuple[str, str]]: (输出文件名, 渲染内容)。
+        """
+        semaphore = asyncio.Semaphore(Jinja2TemplateUtil.RENDER_CONCURRENCY)
+
+        async def render(gen_table: GenTableOutSchema) -> dict[str, str]:
+            async with semaphore:
+                return await Jinja2TemplateUtil.render_table(gen_table)
+
+        tasks = [asyncio.create_task(render(gen_table)) for gen_table in gen_tables]
+        try:
+            for gen_table, task in zip(gen_tables, tasks, strict=True):
                 try:
-                    env = Jinja2TemplateUtil.get_env()
-                    render_info = await cls.__get_gen_render_info(auth, table_name)
-                    for template_file, output_file in zip(
-                        render_info[0], render_info[1], strict=False
-                    ):
-                        render_content = await env.get_template(template_file).render_async(
-                            **render_info[2]
-                        )
-                        zip_file.writestr(output_file, render_content)
+                    render_result = await task
+                    files = [
+                        (Jinja2TemplateUtil.get_file_name(template, gen_table), content)
+                        for template, content in render_result.items()
+                    ]
                 except Exception as e:
-                    log.error(f"批量生成代码时处理表 {table_name} 出错: {e!s}")
-                    # 继续处理其他表，不中断整个过程
+                    log.error(f"批量生成代码时处理表 {gen_table.table_name} 出错: {e!s}")
                     continue
-        zip_data = zip_buffer.getvalue()
-        zip_buffer.close()
-        return zip_data
+                for file in files:
+                    yield file
+        finally:
+            # 客户端中断下载时取消未完成的渲染
+            for task in tasks:
+                task.cancel()
 
     @classmethod
     @handle_service_exception
@@ -664,8 +700,12 @@ class GenTableService:
         table_columns = table.columns or []
         table_column_map = {column.column_name: column for column in table_columns}
         # 确保db_table_columns始终是列表类型，避免None值
+        # 同步时绕过结构目录缓存，确保读取到最新的表结构
         db_table_columns = (
-            await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(table_name) or []
+            await GenTableColumnCRUD(auth).get_gen_db_table_columns_by_name(
+                table_name, refresh=True
+            )
+            or []
         )
         db_table_columns = [col for col in db_table_columns if col is not None]
         db_table_column_names = [column.column_name for column in db_table_columns]
@@ -714,9 +754,46 @@ class GenTableService:
                         await GenTableColumnCRUD(auth).delete_gen_table_column_by_column_id_crud([
                             column.id
                         ])
+            SchemaCatalog.invalidate()
         except Exception as e:
             raise CustomException(msg=f"同步失败: {e!s}")
 
+    @classmethod
+    async def sync_db_task_service(cls, ctx: TaskContext, table_name: str) -> None:
+        """
+        同步数据库表结构到业务表(后台任务)。
+
+        参数:
+        - ctx (TaskContext): 任务上下文。
+        - table_name (str): 业务表名。
+
+        返回:
+        - None
+        """
+        async with ctx.auth() as auth:
+            await cls.sync_db_service(auth, table_name)
+
+    @classmethod
+    async def batch_gen_code_task_service(cls, ctx: TaskContext, table_names: list[str]) -> dict:
+        """
+        批量生成代码(后台任务)，压缩包保存为任务产物。
+
+        参数:
+        - ctx (TaskContext): 任务上下文。
+        - table_names (list[str]): 业务表名列表。
+
+        返回:
+        - dict: 压缩包大小。
+        """
+        async with ctx.auth() as auth:
+            stream = await cls.batch_gen_code_service(auth, table_names)
+        size = 0
+        async with await anyio.open_file(ctx.artifact_path("code.zip"), "wb") as f:
+            async for chunk in stream:
+                await f.write(chunk)
+                size += len(chunk)
+        return {"size": size}
+
     @classmethod
     async def set_pk_column(cls, gen_table: GenTableOutSchema) -> None:
         """设置主键列信息（主表/子表）。
@@ -748,7 +825,7 @@ class GenTableService:
         - table_name (str): 业务表名称。
 
         返回:
-        - list[Any]: [模板列表, 输出文件名列表, 渲染上下文, 业务表对象]。
+        - list[Any]: [模板列表, 输出文件名列表, 业务表对象]。
 
         异常:
         - CustomException: 当业务表不存在或数据转换失败时抛出。
@@ -759,12 +836,11 @@ class GenTableService:
             raise CustomException(msg=f"业务表 {table_name} 不存在")
         gen_table = GenTableOutSchema.model_validate(gen_table_model)
         await cls.set_pk_column(gen_table)
-        context = Jinja2TemplateUtil.prepare_context(gen_table)
         template_list = Jinja2TemplateUtil.get_template_list()
         output_files = [
             Jinja2TemplateUtil.get_file_name(template, gen_table) for template in template_list
         ]
-        return [template_list, output_files, context, gen_table]
+        return [template_list, output_files, gen_table]
 
 
 class GenTableColumnService:
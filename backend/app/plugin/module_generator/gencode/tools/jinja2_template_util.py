@@ -1,8 +1,11 @@
+import asyncio
+import hashlib
 import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from app.common.constant import GenConstant
 from app.config.path_conf import TEMPLATE_DIR
@@ -24,8 +27,15 @@ class Jinja2TemplateUtil:
     FRONTEND_PROJECT_PATH = "frontend"
     BACKEND_PROJECT_PATH = "backend"
 
+    # 渲染结果缓存的最大表定义数
+    RENDER_CACHE_SIZE = 256
+    # 批量生成时并发渲染的表数
+    RENDER_CONCURRENCY = 4
+
     # 环境对象
     _env = None
+    # 渲染结果缓存: 表定义哈希 -> {模板路径: 渲染内容}
+    _render_cache: OrderedDict[str, dict[str, str]] = OrderedDict()
 
     @classmethod
     def get_env(cls):
@@ -46,7 +56,8 @@ class Jinja2TemplateUtil:
                     trim_blocks=True,  # 删除多余的空行
                     lstrip_blocks=True,  # 删除行首空格
                     keep_trailing_newline=True,  # 保留行尾换行符
-                    enable_async=True,  # 开启异步支持
+                    # 模板编译结果缓存到磁盘（系统临时目录），重启后无需重新编译
+                    bytecode_cache=FileSystemBytecodeCache(),
                 )
                 cls._env.filters.update({
                     "camel_to_snake": SnakeCaseUtil.camel_to_snake,
@@ -73,6 +84,80 @@ class Jinja2TemplateUtil:
         """
         return cls.get_env().get_template(template_path)
 
+    @classmethod
+    def get_render_key(cls, gen_table: GenTableOutSchema) -> str:
+        """
+        计算渲染缓存键（表及字段定义的哈希）。
+
+        参数:
+        - gen_table (GenTableOutSchema): 生成表的配置信息。
+
+        返回:
+        - str: 缓存键。
+        """
+        payload = f"{settings.DATABASE_TYPE}:{gen_table.model_dump_json()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def render_templates(
+        cls, gen_table: GenTableOutSchema, ignore_errors: bool = False
+    ) -> dict[str, str]:
+        """
+        渲染所有模板（同步，在线程池中执行）。
+
+        参数:
+        - gen_table (GenTableOutSchema): 生成表的配置信息。
+        - ignore_errors (bool): 是否忽略单个模板的渲染错误（以错误信息作为渲染内容）。
+
+        返回:
+        - dict[str, str]: 模板路径到渲染内容的映射。
+        """
+        env = cls.get_env()
+        context = cls.prepare_context(gen_table)
+        result = {}
+        for template in cls.get_template_list():
+            try:
+                result[template] = env.get_template(template).render(**context)
+            except Exception as e:
+                if not ignore_errors:
+                    raise
+                result[template] = f"渲染错误: {e!s}"
+        return result
+
+    @classmethod
+    async def render_table(
+        cls, gen_table: GenTableOutSchema, ignore_errors: bool = False
+    ) -> dict[str, str]:
+        """
+        渲染表的所有模板，按表定义哈希缓存渲染结果。
+        - 备注：渲染在线程池中执行，不阻塞事件循环；表或字段定义变化后哈希改变，自动重新渲染。
+
+        参数:
+        - gen_table (GenTableOutSchema): 生成表的配置信息。
+        - ignore_errors (bool): 是否忽略单个模板的渲染错误。
+
+        返回:
+        - dict[str, str]: 模板路径到渲染内容的映射。
+        """
+        key = cls.get_render_key(gen_table)
+        cached = cls._render_cache.get(key)
+        if cached is not None:
+            cls._render_cache.move_to_end(key)
+            return cached
+
+        try:
+            result = await asyncio.to_thread(cls.render_templates, gen_table)
+        except Exception:
+            if not ignore_errors:
+                raise
+            # 存在渲染失败的模板时不缓存，逐个返回错误信息
+            return await asyncio.to_thread(cls.render_templates, gen_table, True)
+
+        cls._render_cache[key] = result
+        while len(cls._render_cache) > cls.RENDER_CACHE_SIZE:
+            cls._render_cache.popitem(last=False)
+        return result
+
     @classmethod
     def prepare_context(cls, gen_table: GenTableOutSchema) -> dict[str, Any]:
         """
@@ -340,14 +425,14 @@ class Jinja2TemplateUtil:
         - str: 数据库类型（去除长度等修饰）。
         """
         # 移除 COLLATE 子句（处理带引号和不带引号的情况，不区分大小写）
-        collate_pattern = re.compile(r'\s+COLLATE\s+', re.IGNORECASE)
+        collate_pattern = re.compile(r"\s+COLLATE\s+", re.IGNORECASE)
         if collate_pattern.search(column_type):
             column_type = collate_pattern.split(column_type)[0].strip()
 
         # 移除 UNSIGNED 标记（不区分大小写）
-        unsigned_pattern = re.compile(r'\s+UNSIGNED', re.IGNORECASE)
+        unsigned_pattern = re.compile(r"\s+UNSIGNED", re.IGNORECASE)
         if unsigned_pattern.search(column_type):
-            column_type = unsigned_pattern.sub('', column_type).strip()
+            column_type = unsigned_pattern.sub("", column_type).strip()
 
         # 处理PostgreSQL数组类型（如 integer[], text[]）
         if "[]" in column_type:
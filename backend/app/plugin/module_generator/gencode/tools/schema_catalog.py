@@ -0,0 +1,265 @@
+import asyncio
+import re
+from typing import Any
+
+from sqlalchemy import bindparam, text
+
+from app.config.setting import settings
+from app.core.logger import log
+
+# 各数据库的结构版本指纹查询：表数量、DDL 时间/系统行版本、注释，任一变化即视为结构变更
+# (MySQL 的 ALTER TABLE 不一定更新 CREATE_TIME，另对列名、类型、可空、默认值、注释、位置计算指纹)
+_VERSION_SQL = {
+    "mysql": """
+        SELECT t.table_count, t.created, t.table_crc, c.column_count, c.column_crc
+        FROM (
+            SELECT COUNT(*) AS table_count, COALESCE(MAX(CREATE_TIME), '') AS created,
+                   COALESCE(SUM(CRC32(CONCAT(TABLE_NAME, ':', TABLE_COMMENT))), 0) AS table_crc
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE()
+        ) t
+        CROSS JOIN (
+            SELECT COUNT(*) AS column_count,
+                   COALESCE(SUM(CRC32(CONCAT_WS(
+                       ':', TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE,
+                       COALESCE(COLUMN_DEFAULT, '<NULL>'), COLUMN_KEY, EXTRA, COLUMN_COMMENT
+                   ))), 0) AS column_crc
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+        ) c
+    """,
+    "postgres": """
+        SELECT COUNT(*), COALESCE(md5(string_agg(
+                   c.oid::text || ':' || c.xmin::text || ':'
+                   || COALESCE(obj_description(c.oid, 'pg_class'), ''),
+                   ',' ORDER BY c.oid)), '')
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+    """,
+    "sqlite": "PRAGMA schema_version",
+}
+
+_TABLES_SQL = {
+    "mysql": """
+        SELECT TABLE_NAME, COALESCE(TABLE_COMMENT, '')
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'
+        ORDER BY TABLE_NAME
+    """,
+    "postgres": """
+        SELECT c.relname, COALESCE(obj_description(c.oid, 'pg_class'), '')
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+        ORDER BY c.relname
+    """,
+    "sqlite": """
+        SELECT name, ''
+        FROM sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+    """,
+}
+
+# 列查询统一输出: 表名, 列名, 列类型, 列长度, 可空, 默认值, 注释, 主键, 唯一, 自增
+_COLUMNS_SQL = {
+    "mysql": """
+        SELECT c.TABLE_NAME, c.COLUMN_NAME, UPPER(c.COLUMN_TYPE),
+               CASE WHEN c.DATA_TYPE IN ('char', 'varchar', 'binary', 'varbinary')
+                    THEN c.CHARACTER_MAXIMUM_LENGTH END,
+               c.IS_NULLABLE = 'YES', c.COLUMN_DEFAULT, c.COLUMN_COMMENT,
+               c.COLUMN_KEY = 'PRI',
+               EXISTS (
+                   SELECT 1 FROM information_schema.STATISTICS s
+                   WHERE s.TABLE_SCHEMA = c.TABLE_SCHEMA AND s.TABLE_NAME = c.TABLE_NAME
+                     AND s.COLUMN_NAME = c.COLUMN_NAME AND s.NON_UNIQUE = 0
+                     AND s.INDEX_NAME <> 'PRIMARY'
+               ),
+               c.EXTRA LIKE '%auto_increment%'
+        FROM information_schema.COLUMNS c
+        WHERE c.TABLE_SCHEMA = DATABASE() AND c.TABLE_NAME IN :table_names
+        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+    """,
+    "postgres": """
+        SELECT c.relname, a.attname, UPPER(format_type(a.atttypid, a.atttypmod)),
+               CASE WHEN a.atttypid IN (1042, 1043) AND a.atttypmod > 4
+                    THEN a.atttypmod - 4 END,
+               NOT a.attnotnull, pg_get_expr(d.adbin, d.adrelid),
+               col_description(c.oid, a.attnum),
+               EXISTS (
+                   SELECT 1 FROM pg_constraint k
+                   WHERE k.conrelid = c.oid AND k.contype = 'p' AND a.attnum = ANY (k.conkey)
+               ),
+               EXISTS (
+                   SELECT 1 FROM pg_constraint k
+                   WHERE k.conrelid = c.oid AND k.contype = 'u' AND a.attnum = ANY (k.conkey)
+               ),
+               a.attidentity <> '' OR COALESCE(pg_get_expr(d.adbin, d.adrelid), '') LIKE 'nextval(%'
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+        WHERE n.nspname = current_schema() AND c.relname IN :table_names
+          AND a.attnum > 0 AND NOT a.attisdropped
+        ORDER BY c.relname, a.attnum
+    """,
+    "sqlite": """
+        SELECT m.name, p.name, UPPER(p.type), NULL, p."notnull" = 0, p.dflt_value, '',
+               p.pk > 0,
+               EXISTS (
+                   SELECT 1 FROM pragma_index_list(m.name) il
+                   JOIN pragma_index_info(il.name) ii
+                   WHERE il."unique" = 1 AND il.origin <> 'pk' AND ii.name = p.name
+               ),
+               p.pk = 1 AND UPPER(p.type) = 'INTEGER'
+        FROM sqlite_master m
+        JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name IN :table_names
+        ORDER BY m.name, p.cid
+    """,
+}
+
+
+class SchemaCatalog:
+    """
+    数据库结构目录
+
+    通过异步引擎执行按数据库类型的批量 information_schema / pg_catalog 查询获取表和列信息，
+    结果按结构版本指纹缓存：每次访问只执行一条轻量的版本查询，版本未变时直接复用缓存。
+    建表、同步结构后调用 invalidate 主动失效。
+    """
+
+    _version: str | None = None
+    _tables: list[dict[str, Any]] | None = None
+    _columns: dict[str, list[dict[str, Any]]] = {}
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        失效全部缓存。
+
+        返回:
+        - None
+        """
+        cls._version = None
+        cls._tables = None
+        cls._columns = {}
+
+    @classmethod
+    async def _check_version(cls, conn: Any) -> None:
+        """查询结构版本，与缓存版本不一致时清空缓存"""
+        row = (await conn.execute(text(_VERSION_SQL[settings.DATABASE_TYPE]))).first()
+        version = ":".join(str(value) for value in row) if row else ""
+        if version != cls._version:
+            cls.invalidate()
+            cls._version = version
+
+    @classmethod
+    async def get_tables(cls) -> list[dict[str, Any]]:
+        """
+        获取当前数据库的所有表（表名、注释）。
+
+        返回:
+        - list[dict[str, Any]]: 表信息列表，包含 database_name/table_name/table_type/table_comment。
+        """
+        from app.core.database import async_engine
+
+        async with cls._get_lock(), async_engine.connect() as conn:
+            await cls._check_version(conn)
+            if cls._tables is None:
+                result = await conn.execute(text(_TABLES_SQL[settings.DATABASE_TYPE]))
+                cls._tables = [
+                    {
+                        "database_name": settings.DATABASE_NAME,
+                        "table_name": table_name,
+                        "table_type": settings.DATABASE_TYPE,
+                        "table_comment": table_comment or "",
+                    }
+                    for table_name, table_comment in result.all()
+                ]
+                log.debug(f"加载数据库表结构目录: {len(cls._tables)} 张表")
+            return cls._tables
+
+    @classmethod
+    async def table_exists(cls, table_name: str) -> bool:
+        """
+        检查表是否存在。
+
+        参数:
+        - table_name (str): 表名。
+
+        返回:
+        - bool: 是否存在。
+        """
+        return any(table["table_name"] == table_name for table in await cls.get_tables())
+
+    @staticmethod
+    def _parse_length(column_type: str, column_length: Any) -> str:
+        """获取列长度：优先使用目录中的字符长度，否则从类型声明中解析（如 SQLite 的 VARCHAR(64)）"""
+        if column_length is not None:
+            return str(column_length)
+        match = re.match(r"^\s*(?:N?VAR)?CHAR(?:ACTER)?(?:\s+VARYING)?\s*\((\d+)\)", column_type)
+        return match.group(1) if match else ""
+
+    @classmethod
+    async def get_columns(
+        cls, table_names: list[str], refresh: bool = False
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        批量获取表的列信息（一次查询获取所有缺失的表）。
+
+        参数:
+        - table_names (list[str]): 表名列表。
+        - refresh (bool): 是否忽略缓存重新查询。
+
+        返回:
+        - dict[str, list[dict[str, Any]]]: {表名: 列信息列表}
+        """
+        from app.core.database import async_engine
+
+        async with cls._get_lock(), async_engine.connect() as conn:
+            await cls._check_version(conn)
+            missing = [
+                name for name in dict.fromkeys(table_names) if refresh or name not in cls._columns
+            ]
+            if missing:
+                statement = text(_COLUMNS_SQL[settings.DATABASE_TYPE]).bindparams(
+                    bindparam("table_names", expanding=True)
+                )
+                result = await conn.execute(statement, {"table_names": missing})
+                loaded: dict[str, list[dict[str, Any]]] = {name: [] for name in missing}
+                for (
+                    table_name,
+                    column_name,
+                    column_type,
+                    column_length,
+                    is_nullable,
+                    column_default,
+                    column_comment,
+                    is_pk,
+                    is_unique,
+                    is_increment,
+                ) in result.all():
+                    columns = loaded.setdefault(table_name, [])
+                    columns.append({
+                        "column_name": column_name,
+                        "column_comment": column_comment or "",
+                        "column_type": column_type or "",
+                        "column_length": cls._parse_length(column_type or "", column_length),
+                        "column_default": str(column_default) if column_default is not None else "",
+                        "sort": len(columns) + 1,  # 序号从1开始
+                        "is_pk": 1 if is_pk else 0,
+                        "is_increment": 1 if is_increment else 0,
+                        "is_nullable": 1 if is_nullable else 0,
+                        "is_unique": 1 if is_unique else 0,
+                    })
+                cls._columns.update(loaded)
+            return {name: cls._columns.get(name, []) for name in table_names}
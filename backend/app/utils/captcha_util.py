@@ -1,11 +1,24 @@
+import asyncio
 import base64
+import json
 import random
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from PIL import Image, ImageDraw, ImageFont
+from redis.asyncio.client import Redis
 
+from app.common.enums import RedisInitKeyConfig
 from app.config.setting import settings
+from app.core.logger import log
+from app.core.redis_crud import RedisCURD
+
+# 验证码池单批生成并写入 Redis 的数量
+CAPTCHA_POOL_BATCH_SIZE = 50
+# 验证码池补充锁过期时间(秒)，补充进程异常退出时自动释放
+CAPTCHA_POOL_LOCK_EXPIRE = 60
 
 
 class CaptchaUtil:
@@ -13,6 +26,20 @@ class CaptchaUtil:
     验证码工具类
     """
 
+    # 字体对象按线程缓存(FreeType 字体对象不保证线程安全)
+    _local = threading.local()
+
+    @classmethod
+    def _font(cls) -> ImageFont.FreeTypeFont:
+        """获取当前线程缓存的验证码字体，避免每次生成都从磁盘加载"""
+        font = getattr(cls._local, "font", None)
+        if font is None:
+            font = ImageFont.truetype(
+                font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE
+            )
+            cls._local.font = font
+        return font
+
     @classmethod
     def generate_captcha(cls) -> tuple[str, str]:
         """
@@ -32,7 +59,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 使用指定字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._font()
 
         # 计算文本总宽度和高度
         total_width = sum(draw.textbbox((0, 0), char, font=font)[2] for char in captcha_value)
@@ -93,7 +120,7 @@ class CaptchaUtil:
         draw = ImageDraw.Draw(image)
 
         # 设置字体
-        font = ImageFont.truetype(font=settings.CAPTCHA_FONT_PATH, size=settings.CAPTCHA_FONT_SIZE)
+        font = cls._font()
 
         # 生成运算数字和运算符
         operators = ["+", "-", "*"]
@@ -140,3 +167,133 @@ class CaptchaUtil:
         base64_string = base64.b64encode(buffer.getvalue()).decode()
 
         return base64_string, captcha_value
+
+
+class CaptchaPool:
+    """
+    预生成验证码池
+
+    后台线程池批量绘制算术验证码，写入 Redis 列表供所有 worker 共享，
+    获取验证码只需一次 LPOP(O(1))，请求链路不在事件循环中绘图。
+    剩余数量低于 CAPTCHA_POOL_LOW_WATERMARK 时后台补充至 CAPTCHA_POOL_SIZE，
+    多个 worker 通过分布式锁保证同一时间只有一个在补充；池为空时在线程池中即时生成。
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _refill_task: asyncio.Task | None = None
+
+    @classmethod
+    def _pool_key(cls) -> str:
+        return RedisInitKeyConfig.CAPTCHA_POOL.key
+
+    @classmethod
+    def start(cls, redis: Redis) -> None:
+        """
+        启动验证码池并在后台填充(需在事件循环中调用)。
+
+        参数:
+        - redis (Redis): Redis客户端对象
+
+        返回:
+        - None
+        """
+        if not settings.CAPTCHA_ENABLE or not settings.CAPTCHA_POOL_ENABLE:
+            return
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.CAPTCHA_POOL_WORKERS, thread_name_prefix="captcha"
+            )
+        cls.trigger_refill(redis)
+
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        停止后台补充并关闭线程池。
+
+        返回:
+        - None
+        """
+        if cls._refill_task and not cls._refill_task.done():
+            cls._refill_task.cancel()
+            try:
+                await cls._refill_task
+            except asyncio.CancelledError:
+                pass
+        cls._refill_task = None
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+
+    @classmethod
+    async def pop(cls, redis: Redis) -> tuple[str, int]:
+        """
+        从验证码池取出一个验证码，剩余数量低于低水位时触发后台补充。
+
+        参数:
+        - redis (Redis): Redis客户端对象
+
+        返回:
+        - tuple[str, int]: [base64图片字符串, 计算结果]。
+        """
+        if cls._executor is None:
+            # 未启用验证码池时同样不在事件循环中绘图
+            return await asyncio.to_thread(CaptchaUtil.captcha_arithmetic)
+
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.lpop(cls._pool_key())
+            pipe.llen(cls._pool_key())
+            item, remaining = await pipe.execute()
+        if remaining < settings.CAPTCHA_POOL_LOW_WATERMARK:
+            cls.trigger_refill(redis)
+        if item:
+            data = json.loads(item)
+            return data["img"], data["value"]
+
+        log.warning("验证码池为空，即时生成验证码")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._executor, CaptchaUtil.captcha_arithmetic)
+
+    @classmethod
+    def trigger_refill(cls, redis: Redis) -> None:
+        """
+        触发后台补充(当前进程已有补充任务时忽略)。
+
+        参数:
+        - redis (Redis): Redis客户端对象
+
+        返回:
+        - None
+        """
+        if cls._executor is None or (cls._refill_task and not cls._refill_task.done()):
+            return
+        cls._refill_task = asyncio.create_task(cls._refill(redis))
+
+    @classmethod
+    async def _refill(cls, redis: Redis) -> None:
+        """分批生成验证码并写入 Redis 列表，直到达到池容量"""
+        lock_key = f"{cls._pool_key()}:lock"
+        acquired, lock_value = await RedisCURD(redis).lock(
+            lock_key, expire=CAPTCHA_POOL_LOCK_EXPIRE
+        )
+        if not acquired:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            missing = settings.CAPTCHA_POOL_SIZE - await redis.llen(cls._pool_key())
+            while missing > 0 and cls._executor is not None:
+                captchas = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(cls._executor, CaptchaUtil.captcha_arithmetic)
+                        for _ in range(min(missing, CAPTCHA_POOL_BATCH_SIZE))
+                    )
+                )
+                length = await redis.rpush(
+                    cls._pool_key(),
+                    *(json.dumps({"img": img, "value": value}) for img, value in captchas),
+                )
+                await RedisCURD(redis).renew_lock(lock_key, CAPTCHA_POOL_LOCK_EXPIRE, lock_value)
+                missing = settings.CAPTCHA_POOL_SIZE - length
+        except Exception as e:
+            log.error(f"验证码池补充失败: {e!s}")
+        finally:
+            await RedisCURD(redis).unlock(lock_key, lock_value)
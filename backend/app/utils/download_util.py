@@ -0,0 +1,257 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+from collections.abc import AsyncIterator
+from email.utils import formatdate
+from pathlib import Path
+
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.core.exceptions import CustomException
+
+
+class DownloadUtil:
+    """
+    文件下载工具类
+
+    - 整文件下载走 Starlette FileResponse（服务器支持 pathsend/zerocopysend 扩展时由服务器直接发送文件）；
+    - 支持 HTTP Range（单段/多段 multipart/byteranges）与 If-Range，断点续传与并发分段下载；
+    - ETag 由 大小+修改时间 生成，内容寻址文件直接使用内容哈希作为强 ETag，支持 If-None-Match 返回 304；
+    - 响应带 Accept-Ranges，GZip 中间件不会压缩(见 CustomGZipMiddleware)。
+    """
+
+    CHUNK_SIZE: int = 1024 * 1024  # 分段读取块大小(1MB)
+    MAX_RANGES: int = 16  # 单个请求允许的最大分段数
+
+    @staticmethod
+    def make_etag(stat_result: os.stat_result, content_hash: str | None = None) -> str:
+        """
+        生成 ETag。
+
+        参数:
+        - stat_result (os.stat_result): 文件状态。
+        - content_hash (str | None): 文件内容哈希，提供时生成强 ETag。
+
+        返回:
+        - str: ETag 值。
+        """
+        if content_hash:
+            return f'"{content_hash}"'
+        return f'W/"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+    @staticmethod
+    def _etag_matches(header: str, etag: str) -> bool:
+        """If-None-Match 弱比较"""
+        if header.strip() == "*":
+            return True
+        opaque = etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+    @staticmethod
+    def _if_range_matches(header: str, etag: str, last_modified: str) -> bool:
+        """
+        If-Range 强比较(RFC 9110 13.1.5)：弱 ETag 任何一方都不匹配；
+        日期形式需与 Last-Modified 完全一致。
+        """
+        header = header.strip()
+        if header.startswith('"'):
+            return not etag.startswith("W/") and header == etag
+        if header.startswith("W/"):
+            return False
+        return header == last_modified
+
+    @classmethod
+    def parse_range(cls, header: str, size: int) -> list[tuple[int, int]]:
+        """
+        解析 Range 请求头，返回合并后的闭区间列表。
+
+        参数:
+        - header (str): Range 请求头，例如 bytes=0-99,200-。
+        - size (int): 文件大小。
+
+        返回:
+        - list[tuple[int, int]]: [(start, end)]，end 包含在内。
+
+        异常:
+        - ValueError: 格式错误或无可满足的分段时抛出。
+        """
+        unit, _, spec = header.partition("=")
+        if unit.strip().lower() != "bytes" or not spec:
+            raise ValueError("不支持的 Range 单位")
+
+        ranges = []
+        for part in spec.split(","):
+            start_str, sep, end_str = part.strip().partition("-")
+            if not sep:
+                raise ValueError("Range 格式错误")
+            if start_str:
+                start = int(start_str)
+                end = int(end_str) if end_str else size - 1
+            else:
+                # 后缀形式: bytes=-500 表示最后 500 字节
+                suffix = int(end_str)
+                if suffix <= 0:
+                    continue
+                start, end = max(size - suffix, 0), size - 1
+            if start > end or start >= size:
+                continue
+            ranges.append((start, min(end, size - 1)))
+
+        if not ranges:
+            raise ValueError("没有可满足的 Range")
+
+        # 合并重叠/相邻分段，避免重复读取
+        ranges.sort()
+        merged = [ranges[0]]
+        for start, end in ranges[1:]:
+            last_start, last_end = merged[-1]
+            if start <= last_end + 1:
+                merged[-1] = (last_start, max(last_end, end))
+            else:
+                merged.append((start, end))
+        if len(merged) > cls.MAX_RANGES:
+            raise ValueError("Range 分段过多")
+        return merged
+
+    @classmethod
+    async def _read_range(cls, fd: int, start: int, end: int) -> AsyncIterator[bytes]:
+        """在线程池中按块读取 [start, end] 区间（pread 不改变文件偏移，可并发读取）"""
+        offset = start
+        while offset <= end:
+            length = min(cls.CHUNK_SIZE, end - offset + 1)
+            chunk = await asyncio.to_thread(os.pread, fd, length, offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+
+    @classmethod
+    async def _iter_ranges(
+        cls,
+        file_path: str,
+        ranges: list[tuple[int, int]],
+        size: int,
+        media_type: str,
+        boundary: str | None,
+    ) -> AsyncIterator[bytes]:
+        """生成单段或多段(multipart/byteranges)响应体"""
+        fd = await asyncio.to_thread(os.open, file_path, os.O_RDONLY)
+        try:
+            for start, end in ranges:
+                if boundary:
+                    yield (
+                        f"--{boundary}\r\n"
+                        f"Content-Type: {media_type}\r\n"
+                        f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+                    ).encode("latin-1")
+                async for chunk in cls._read_range(fd, start, end):
+                    yield chunk
+                if boundary:
+                    yield b"\r\n"
+            if boundary:
+                yield f"--{boundary}--\r\n".encode("latin-1")
+        finally:
+            os.close(fd)
+
+    @classmethod
+    async def file_response(
+        cls,
+        request: Request,
+        file_path: str,
+        filename: str | None = None,
+        media_type: str | None = None,
+        content_hash: str | None = None,
+    ) -> Response:
+        """
+        构建支持 Range / If-None-Match 的文件下载响应。
+
+        参数:
+        - request (Request): 请求对象，用于读取条件请求头。
+        - file_path (str): 本地文件路径。
+        - filename (str | None): 下载文件名，默认取路径文件名。
+        - media_type (str | None): 文件类型，默认按扩展名推断。
+        - content_hash (str | None): 文件内容哈希，提供时作为强 ETag。
+
+        返回:
+        - Response: 200 / 206 / 304 / 416 响应。
+        """
+        try:
+            stat_result = await asyncio.to_thread(os.stat, file_path)
+        except FileNotFoundError:
+            raise CustomException(msg="文件不存在")
+
+        filename = filename or Path(file_path).name
+        media_type = media_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        size = stat_result.st_size
+        etag = cls.make_etag(stat_result, content_hash)
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        headers = {
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+            "Last-Modified": last_modified,
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and cls._etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        # If-Range 不匹配时说明文件已变更，返回完整文件
+        if range_header and if_range and not cls._if_range_matches(if_range, etag, last_modified):
+            range_header = None
+
+        if not range_header:
+            return FileResponse(
+                path=file_path,
+                headers=headers,
+                media_type=media_type,
+                filename=filename,
+                stat_result=stat_result,
+                content_disposition_type="attachment",
+            )
+
+        try:
+            ranges = cls.parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+        # 复用 FileResponse 生成 Content-Disposition（兼容中文文件名）
+        disposition = FileResponse(
+            path=file_path, filename=filename, stat_result=stat_result
+        ).headers["content-disposition"]
+        headers["Content-Disposition"] = disposition
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                cls._iter_ranges(file_path, ranges, size, media_type, None),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
+        boundary = uuid.uuid4().hex
+        content_length = sum(
+            len(
+                f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            )
+            + (end - start + 1)
+            + 2
+            for start, end in ranges
+        ) + len(f"--{boundary}--\r\n")
+        headers["Content-Length"] = str(content_length)
+        return StreamingResponse(
+            cls._iter_ranges(file_path, ranges, size, media_type, boundary),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=f"multipart/byteranges; boundary={boundary}",
+            headers=headers,
+        )
@@ -0,0 +1,481 @@
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import uuid
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin
+
+import aiofiles
+from redis.asyncio.client import Redis
+from starlette.requests import ClientDisconnect, Request
+
+from app.common.enums import RedisInitKeyConfig
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.core.logger import log
+
+from .upload_util import UploadUtil
+
+
+class MultipartUploadUtil:
+    """
+    分片上传工具类（可断点续传 + 内容寻址去重）
+
+    流程: init(声明文件名/大小/可选 sha256) -> 逐个上传分片 -> complete 合并。
+    - 会话与已上传分片记录在 Redis，网络中断后客户端查询会话即可只补传缺失分片；
+    - 分片按顺序到达时在写盘的同时增量计算整个文件的 SHA-256，合并时无需再读一遍；
+    - 合并后的文件按 SHA-256 存放在 objects/ 目录下，相同内容只保存一份并维护引用计数；
+    - init 时提供的 sha256 已存在且当前用户曾完整上传过该内容时直接秒传，
+      仅凭哈希值无法引用其他用户上传的文件。
+    """
+
+    # 分片按顺序到达时的增量哈希状态: {upload_id: {"next": 下一个分片号, "hash": sha256}}
+    _hashers: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    _max_hashers: int = 1000
+
+    @classmethod
+    def _objects_dir(cls) -> Path:
+        """内容寻址存储目录"""
+        return settings.UPLOAD_FILE_PATH.joinpath("objects")
+
+    @classmethod
+    def _parts_dir(cls, upload_id: str) -> Path:
+        """
+        分片临时目录。
+
+        异常:
+        - CustomException: 上传会话ID格式不合法或目录不在 .multipart 下时抛出。
+        """
+        if not re.fullmatch(r"[0-9a-f]{32}", upload_id):
+            raise CustomException(msg="上传会话ID不合法")
+        root = settings.UPLOAD_FILE_PATH.joinpath(".multipart").resolve()
+        parts_dir = root.joinpath(upload_id).resolve()
+        if parts_dir.parent != root:
+            raise CustomException(msg="上传会话ID不合法")
+        return parts_dir
+
+    @classmethod
+    def _object_path(cls, sha256: str, filename: str) -> Path:
+        """根据内容哈希生成对象存储路径: objects/ab/cd/<sha256>.<ext>"""
+        ext = os.path.splitext(filename)[1].lower()
+        return cls._objects_dir().joinpath(sha256[:2], sha256[2:4], f"{sha256}{ext}")
+
+    @staticmethod
+    def _session_key(upload_id: str) -> str:
+        return f"{RedisInitKeyConfig.UPLOAD_SESSION_KEY.key}:{upload_id}"
+
+    @staticmethod
+    def _parts_key(upload_id: str) -> str:
+        return f"{RedisInitKeyConfig.UPLOAD_SESSION_KEY.key}:{upload_id}:parts"
+
+    @staticmethod
+    def _owners_key(object_path: Path) -> str:
+        return f"{RedisInitKeyConfig.UPLOAD_OBJECT_OWNERS_KEY.key}:{object_path.name}"
+
+    @classmethod
+    def check_file(cls, filename: str, file_size: int) -> None:
+        """
+        在接收任何数据之前校验文件类型和大小。
+
+        参数:
+        - filename (str): 原始文件名。
+        - file_size (int): 文件总大小(字节)。
+
+        返回:
+        - None
+
+        异常:
+        - CustomException: 文件类型不支持或大小超限时抛出。
+        """
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in {*settings.ALLOWED_EXTENSIONS, *settings.MULTIPART_ALLOWED_EXTENSIONS}:
+            raise CustomException(msg="文件类型不支持")
+        if file_size <= 0 or file_size > settings.MULTIPART_MAX_FILE_SIZE:
+            raise CustomException(msg="文件大小不合法")
+
+    @classmethod
+    async def _get_session(
+        cls, redis: Redis, upload_id: str, user_id: int | None = None
+    ) -> dict[str, Any]:
+        """获取当前用户的上传会话，会话ID不合法、不存在、已过期或属于其他用户时抛出异常"""
+        if not re.fullmatch(r"[0-9a-f]{32}", upload_id):
+            raise CustomException(msg="上传会话ID不合法")
+        session = await redis.hgetall(cls._session_key(upload_id))
+        if not session:
+            raise CustomException(msg="上传会话不存在或已过期")
+        owner = str(user_id) if user_id is not None else ""
+        if session.get("user_id", "") != owner:
+            raise CustomException(msg="无权访问该上传会话")
+        return {
+            "file_name": session["file_name"],
+            "file_size": int(session["file_size"]),
+            "part_size": int(session["part_size"]),
+            "total_parts": int(session["total_parts"]),
+            "sha256": session.get("sha256") or None,
+            "user_id": session.get("user_id") or None,
+        }
+
+    @classmethod
+    async def _add_ref(cls, redis: Redis, object_path: Path, user_id: str | None = None) -> int:
+        """增加对象引用计数，并记录完整上传过该内容的用户(秒传凭证)"""
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(RedisInitKeyConfig.UPLOAD_OBJECT_REFS_KEY.key, object_path.name, 1)
+            if user_id:
+                pipe.sadd(cls._owners_key(object_path), user_id)
+            results = await pipe.execute()
+        return results[0]
+
+    @classmethod
+    def _build_result(
+        cls, object_path: Path, origin_name: str, base_url: str, deduplicated: bool
+    ) -> dict[str, Any]:
+        """构建上传完成结果"""
+        return {
+            "file_path": str(object_path),
+            "file_name": object_path.name,
+            "origin_name": origin_name,
+            "file_url": urljoin(base_url, str(object_path)),
+            "sha256": object_path.stem,
+            "deduplicated": deduplicated,
+        }
+
+    @classmethod
+    async def init_upload(
+        cls,
+        redis: Redis,
+        file_name: str,
+        file_size: int,
+        base_url: str,
+        sha256: str | None = None,
+        part_size: int | None = None,
+        user_id: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        初始化分片上传。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - file_name (str): 原始文件名。
+        - file_size (int): 文件总大小(字节)。
+        - base_url (str): 基础 URL。
+        - sha256 (str | None): 客户端预先计算的文件 SHA-256，当前用户已上传过相同内容时直接秒传。
+        - part_size (int | None): 分片大小(字节)，默认使用 MULTIPART_PART_SIZE。
+        - user_id (int | None): 当前用户ID，秒传仅对曾完整上传过该内容的用户生效。
+
+        返回:
+        - dict[str, Any]: 会话信息；秒传时 completed 为 True 并包含文件信息。
+
+        异常:
+        - CustomException: 文件、分片大小或分片数量不合法时抛出。
+        """
+        cls.check_file(file_name, file_size)
+        part_size = part_size or settings.MULTIPART_PART_SIZE
+        # 除最后一个分片外不得小于最小分片大小(文件只有一个分片时不受限制)
+        if part_size > settings.MULTIPART_MAX_PART_SIZE or (
+            part_size < settings.MULTIPART_MIN_PART_SIZE and part_size < file_size
+        ):
+            raise CustomException(msg="分片大小不合法")
+        total_parts = (file_size + part_size - 1) // part_size
+        if total_parts > settings.MULTIPART_MAX_PARTS:
+            raise CustomException(msg=f"分片数量超出限制: {settings.MULTIPART_MAX_PARTS}")
+        owner = str(user_id) if user_id is not None else ""
+
+        if sha256:
+            sha256 = sha256.lower()
+            if not re.fullmatch(r"[0-9a-f]{64}", sha256):
+                raise CustomException(msg="文件SHA-256格式不合法")
+            object_path = cls._object_path(sha256, file_name)
+            if (
+                owner
+                and await redis.sismember(cls._owners_key(object_path), owner)
+                and await asyncio.to_thread(object_path.exists)
+            ):
+                await cls._add_ref(redis, object_path)
+                log.info(f"文件秒传: {file_name} -> {object_path}")
+                return {
+                    "upload_id": None,
+                    "completed": True,
+                    **cls._build_result(object_path, file_name, base_url, deduplicated=True),
+                }
+
+        upload_id = uuid.uuid4().hex
+        session_key = cls._session_key(upload_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                session_key,
+                mapping={
+                    "file_name": file_name,
+                    "file_size": file_size,
+                    "part_size": part_size,
+                    "total_parts": total_parts,
+                    "sha256": sha256 or "",
+                    "user_id": owner,
+                },
+            )
+            pipe.expire(session_key, settings.MULTIPART_SESSION_EXPIRE)
+            await pipe.execute()
+        await asyncio.to_thread(cls._parts_dir(upload_id).mkdir, parents=True, exist_ok=True)
+
+        return {
+            "upload_id": upload_id,
+            "completed": False,
+            "part_size": part_size,
+            "total_parts": total_parts,
+            "uploaded_parts": [],
+        }
+
+    @classmethod
+    async def get_upload(
+        cls, redis: Redis, upload_id: str, user_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        查询上传会话及已上传分片（用于断点续传）。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - user_id (int | None): 当前用户ID，须与初始化上传的用户一致。
+
+        返回:
+        - dict[str, Any]: 会话信息及已上传分片号列表。
+        """
+        session = await cls._get_session(redis, upload_id, user_id)
+        parts = await redis.hkeys(cls._parts_key(upload_id))
+        return {
+            "upload_id": upload_id,
+            "completed": False,
+            "part_size": session["part_size"],
+            "total_parts": session["total_parts"],
+            "uploaded_parts": sorted(int(part_no) for part_no in parts),
+        }
+
+    @classmethod
+    def _take_hasher(cls, upload_id: str, part_no: int) -> Any:
+        """取出可用于该分片的增量哈希对象（分片乱序或重传时丢弃，合并时重新计算）"""
+        state = cls._hashers.get(upload_id)
+        if part_no == 1:
+            state = {"next": 1, "hash": hashlib.sha256()}
+            cls._hashers[upload_id] = state
+            while len(cls._hashers) > cls._max_hashers:
+                cls._hashers.popitem(last=False)
+        if state is None or state["next"] != part_no:
+            cls._hashers.pop(upload_id, None)
+            return None
+        return state["hash"]
+
+    @classmethod
+    async def upload_part(
+        cls,
+        redis: Redis,
+        upload_id: str,
+        part_no: int,
+        request: Request,
+        user_id: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        流式接收一个分片（请求体即分片内容），边写盘边计算 SHA-256。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - part_no (int): 分片号，从 1 开始。
+        - request (Request): 请求对象，用于读取请求体流。
+        - user_id (int | None): 当前用户ID，须与初始化上传的用户一致。
+
+        返回:
+        - dict[str, Any]: 分片号、大小和分片 SHA-256。
+        """
+        session = await cls._get_session(redis, upload_id, user_id)
+        if part_no < 1 or part_no > session["total_parts"]:
+            raise CustomException(msg="分片号不合法")
+        expected_size = (
+            session["file_size"] - session["part_size"] * (session["total_parts"] - 1)
+            if part_no == session["total_parts"]
+            else session["part_size"]
+        )
+
+        part_hash = hashlib.sha256()
+        file_hash = cls._take_hasher(upload_id, part_no)
+        part_path = cls._parts_dir(upload_id).joinpath(f"{part_no:06d}")
+        tmp_path = part_path.with_suffix(".tmp")
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in request.stream():
+                    size += len(chunk)
+                    if size > expected_size:
+                        raise CustomException(msg="分片大小超出限制")
+                    part_hash.update(chunk)
+                    if file_hash is not None:
+                        file_hash.update(chunk)
+                    await f.write(chunk)
+            if size != expected_size:
+                raise CustomException(msg=f"分片大小不完整: {size}/{expected_size}")
+            # 写完后原子替换，中断的分片不会被当作已上传
+            await asyncio.to_thread(os.replace, tmp_path, part_path)
+        except (CustomException, ClientDisconnect, OSError) as e:
+            cls._hashers.pop(upload_id, None)
+            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            if isinstance(e, CustomException):
+                raise
+            raise CustomException(msg=f"分片上传失败: {e!s}")
+
+        state = cls._hashers.get(upload_id)
+        if file_hash is not None and state and state["hash"] is file_hash:
+            state["next"] = part_no + 1
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(cls._parts_key(upload_id), str(part_no), part_hash.hexdigest())
+            pipe.expire(cls._parts_key(upload_id), settings.MULTIPART_SESSION_EXPIRE)
+            pipe.expire(cls._session_key(upload_id), settings.MULTIPART_SESSION_EXPIRE)
+            await pipe.execute()
+
+        return {"part_no": part_no, "size": size, "sha256": part_hash.hexdigest()}
+
+    @classmethod
+    def _assemble(cls, part_paths: list[Path], target: Path, need_hash: bool) -> str | None:
+        """
+        按顺序合并分片（同步，在线程池中执行）。
+
+        已有增量哈希时使用 copy_file_range 在内核中零拷贝合并；
+        否则边读边写并计算哈希，只读取一遍数据。
+        """
+        file_hash = hashlib.sha256() if need_hash else None
+        with target.open("wb") as dst:
+            for part_path in part_paths:
+                if file_hash is None:
+                    with part_path.open("rb") as src:
+                        UploadUtil.copy_fd(src.fileno(), dst.fileno(), part_path.stat().st_size)
+                    continue
+                with part_path.open("rb") as src:
+                    while chunk := src.read(1024 * 1024):
+                        file_hash.update(chunk)
+                        dst.write(chunk)
+        return file_hash.hexdigest() if file_hash else None
+
+    @classmethod
+    async def complete_upload(
+        cls, redis: Redis, upload_id: str, base_url: str, user_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        合并分片并写入内容寻址存储。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - base_url (str): 基础 URL。
+        - user_id (int | None): 当前用户ID，须与初始化上传的用户一致。
+
+        返回:
+        - dict[str, Any]: 文件信息（路径、URL、SHA-256、是否去重）。
+        """
+        session = await cls._get_session(redis, upload_id, user_id)
+        uploaded = {int(part_no) for part_no in await redis.hkeys(cls._parts_key(upload_id))}
+        if len(uploaded) < session["total_parts"]:
+            missing = list(
+                islice((n for n in range(1, session["total_parts"] + 1) if n not in uploaded), 20)
+            )
+            raise CustomException(msg=f"分片未上传完整，缺少: {missing}")
+
+        parts_dir = cls._parts_dir(upload_id)
+        part_paths = [
+            parts_dir.joinpath(f"{part_no:06d}") for part_no in range(1, session["total_parts"] + 1)
+        ]
+        state = cls._hashers.pop(upload_id, None)
+        streamed_hash = (
+            state["hash"].hexdigest()
+            if state and state["next"] == session["total_parts"] + 1
+            else None
+        )
+
+        objects_dir = cls._objects_dir()
+        await asyncio.to_thread(objects_dir.mkdir, parents=True, exist_ok=True)
+        tmp_path = objects_dir.joinpath(f".{upload_id}.tmp")
+        try:
+            assembled_hash = await asyncio.to_thread(
+                cls._assemble, part_paths, tmp_path, streamed_hash is None
+            )
+            sha256 = streamed_hash or assembled_hash or ""
+            if session["sha256"] and session["sha256"] != sha256:
+                raise CustomException(msg="文件校验失败，SHA-256 不一致")
+
+            object_path = cls._object_path(sha256, session["file_name"])
+            deduplicated = await asyncio.to_thread(object_path.exists)
+            if deduplicated:
+                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            else:
+                await asyncio.to_thread(object_path.parent.mkdir, parents=True, exist_ok=True)
+                await asyncio.to_thread(os.replace, tmp_path, object_path)
+        except Exception:
+            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            raise
+
+        await cls._add_ref(redis, object_path, session["user_id"])
+        await redis.delete(cls._session_key(upload_id), cls._parts_key(upload_id))
+        await asyncio.to_thread(shutil.rmtree, parts_dir, ignore_errors=True)
+        log.info(f"分片上传完成: {session['file_name']} -> {object_path} (去重: {deduplicated})")
+        return cls._build_result(object_path, session["file_name"], base_url, deduplicated)
+
+    @classmethod
+    async def abort_upload(cls, redis: Redis, upload_id: str, user_id: int | None = None) -> None:
+        """
+        取消分片上传并清理已上传分片。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - upload_id (str): 上传会话ID。
+        - user_id (int | None): 当前用户ID，须与初始化上传的用户一致。
+
+        返回:
+        - None
+
+        异常:
+        - CustomException: 会话不存在或属于其他用户时抛出，此时不清理任何文件。
+        """
+        await cls._get_session(redis, upload_id, user_id)
+        parts_dir = cls._parts_dir(upload_id)
+        cls._hashers.pop(upload_id, None)
+        await redis.delete(cls._session_key(upload_id), cls._parts_key(upload_id))
+        await asyncio.to_thread(shutil.rmtree, parts_dir, ignore_errors=True)
+
+    @classmethod
+    def is_object(cls, file_path: str | Path) -> bool:
+        """
+        判断路径是否为内容寻址存储中的对象。
+
+        参数:
+        - file_path (str | Path): 文件路径。
+
+        返回:
+        - bool: 是否为内容寻址对象。
+        """
+        try:
+            Path(file_path).resolve().relative_to(cls._objects_dir().resolve())
+            return True
+        except ValueError:
+            return False
+
+    @classmethod
+    async def release_object(cls, redis: Redis, file_path: str | Path) -> bool:
+        """
+        释放一次对象引用，引用计数归零时删除文件。
+
+        参数:
+        - redis (Redis): Redis 连接。
+        - file_path (str | Path): 对象文件路径。
+
+        返回:
+        - bool: 文件是否已被删除。
+        """
+        path = Path(file_path)
+        refs = await redis.hincrby(RedisInitKeyConfig.UPLOAD_OBJECT_REFS_KEY.key, path.name, -1)
+        if refs > 0:
+            return False
+        await redis.hdel(RedisInitKeyConfig.UPLOAD_OBJECT_REFS_KEY.key, path.name)
+        await redis.delete(cls._owners_key(path))
+        return await asyncio.to_thread(UploadUtil.delete_file, path)
@@ -1,10 +1,12 @@
+import asyncio
 import mimetypes
+import os
 import random
 from datetime import datetime
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
 from urllib.parse import urljoin
 
-import aiofiles
 from fastapi import UploadFile
 
 from app.config.setting import settings
@@ -160,6 +162,71 @@ class UploadUtil:
             while chunk := f.read(chunk_size):
                 yield chunk
 
+    @staticmethod
+    def copy_fd(src_fd: int, dst_fd: int, count: int) -> None:
+        """
+        在文件描述符之间复制数据，优先使用内核零拷贝（copy_file_range / sendfile）。
+
+        参数:
+        - src_fd (int): 源文件描述符（从偏移 0 开始读取）。
+        - dst_fd (int): 目标文件描述符（从当前位置追加写入）。
+        - count (int): 复制字节数。
+
+        返回:
+        - None
+        """
+        offset = 0
+        try:
+            if hasattr(os, "copy_file_range"):
+                while offset < count:
+                    copied = os.copy_file_range(src_fd, dst_fd, count - offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            else:
+                while offset < count:
+                    copied = os.sendfile(dst_fd, src_fd, offset, count - offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+        except (AttributeError, OSError):
+            # 跨文件系统或平台不支持时回退到用户态复制
+            pass
+        if offset >= count:
+            return
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        while offset < count:
+            chunk = os.read(src_fd, min(1024 * 1024, count - offset))
+            if not chunk:
+                break
+            os.write(dst_fd, chunk)
+            offset += len(chunk)
+
+    @classmethod
+    def save_upload_file(cls, file: UploadFile, filepath: Path) -> None:
+        """
+        保存上传文件（同步，在线程池中执行）。
+
+        小文件仍在内存中，直接一次写入；已落盘到临时文件的大文件
+        通过 copy_file_range/sendfile 在内核中复制，不经过 Python 缓冲区。
+
+        参数:
+        - file (UploadFile): 上传的文件对象。
+        - filepath (Path): 目标文件路径。
+
+        返回:
+        - None
+        """
+        spooled = file.file
+        if isinstance(spooled, SpooledTemporaryFile) and not getattr(spooled, "_rolled", True):
+            filepath.write_bytes(spooled.getvalue())  # pyright: ignore[reportAttributeAccessIssue]
+            return
+        spooled.flush()
+        src_fd = spooled.fileno()
+        size = os.fstat(src_fd).st_size
+        with filepath.open("wb") as dst:
+            cls.copy_fd(src_fd, dst.fileno(), size)
+
     @staticmethod
     def delete_file(filepath: Path) -> bool:
         """
@@ -212,11 +279,8 @@ class UploadUtil:
             file_url = urljoin(base_url, str(filepath))
             # filepath.mkdir(parents=True, exist_ok=True)
 
-            # 分块写入文件
-            chunk_size = 8 * 1024 * 1024  # 8MB chunks
-            async with aiofiles.open(filepath, "wb") as f:
-                while chunk := await file.read(chunk_size):
-                    await f.write(chunk)
+            # 在线程池中写入文件，避免阻塞事件循环
+            await asyncio.to_thread(cls.save_upload_file, file, filepath)
 
             # 返回相对路径
             return filename, filepath, file_url
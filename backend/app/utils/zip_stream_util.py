@@ -0,0 +1,60 @@
+import asyncio
+import zipfile
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+class _ZipStreamBuffer:
+    """只写缓冲区：ZipFile 写入的数据暂存于此，由生成器逐段取出（不可 seek，ZipFile 自动使用数据描述符）"""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStreamUtil:
+    """
+    ZIP 流式打包工具类
+
+    边压缩边输出，内存中只保留当前条目的压缩数据，不在内存中构建完整压缩包。
+    """
+
+    @staticmethod
+    def _write_entry(zip_file: zipfile.ZipFile, name: str, content: str | bytes) -> None:
+        """写入单个条目（同步，在线程池中执行压缩）"""
+        zip_file.writestr(name, content)
+
+    @classmethod
+    async def iter_zip(
+        cls, entries: AsyncIterable[tuple[str, str | bytes]]
+    ) -> AsyncIterator[bytes]:
+        """
+        将条目流打包为 ZIP 字节流。
+
+        参数:
+        - entries (AsyncIterable[tuple[str, str | bytes]]): (压缩包内路径, 文件内容) 的异步迭代器。
+
+        返回:
+        - AsyncIterator[bytes]: ZIP 数据块。
+        """
+        buffer = _ZipStreamBuffer()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:  # type: ignore[arg-type]
+            async for name, content in entries:
+                await asyncio.to_thread(cls._write_entry, zip_file, name, content)
+                data = buffer.drain()
+                if data:
+                    yield data
+        # 关闭后写入中央目录
+        data = buffer.drain()
+        if data:
+            yield data
@@ -0,0 +1,9 @@
+"""
+核心链路基准测试
+
+离线运行(SQLite 或本地 PostgreSQL、fakeredis 或本地 Redis、本地模拟大模型服务)，
+覆盖登录、当前用户鉴权、分页列表、菜单树、SSE 转发、字典查询与导出，
+输出吞吐量、延迟分位数与内存占用，并与基线对比，性能回退时以非零状态退出。
+
+执行命令: python main.py bench --help
+"""
@@ -0,0 +1,265 @@
+import dataclasses
+import os
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.mock_llm import MockLLMConfig, MockLLMServer
+from benchmarks.server import LocalServer
+
+# SQLite 基准库与默认基线文件所在目录
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR / ".data"
+
+# 初始化数据中的管理员账号
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "123456"
+
+# 分页场景造数单批写入条数
+SEED_BATCH_SIZE = 5000
+
+
+@dataclasses.dataclass
+class BenchOptions:
+    """基准测试参数"""
+
+    db: str = "sqlite"
+    db_name: str = "fastapiadmin_bench"
+    redis_url: str | None = None
+    rows: list[int] = dataclasses.field(default_factory=lambda: [10_000])
+    requests: int = 200
+    concurrency: int = 10
+    warmup: int = 5
+    scenarios: list[str] | None = None
+    llm_tokens: int = 64
+    llm_token_rate: float = 200.0
+    llm_ttft: float = 0.0
+    llm_chunk_size: int = 1
+    stream_levels: list[int] = dataclasses.field(default_factory=lambda: [10, 50, 100, 200])
+    ttft_slo: float = 0.5
+    stream_hold: int = 100
+
+
+def prepare_environment(options: BenchOptions, llm_base_url: str) -> None:
+    """
+    在导入应用配置前设置基准测试环境变量(环境变量优先于 env 文件)。
+
+    参数:
+    - options (BenchOptions): 基准测试参数。
+    - llm_base_url (str): 模拟大模型服务地址。
+
+    返回:
+    - None
+    """
+    os.environ.setdefault("ENVIRONMENT", "dev")
+    if options.db == "sqlite":
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        db_name = str(DATA_DIR / options.db_name)
+    else:
+        # PostgreSQL 主机、账号沿用 env 文件配置，库名使用独立的基准库(需提前创建)
+        db_name = options.db_name
+    os.environ.update({
+        "DATABASE_TYPE": options.db,
+        "DATABASE_NAME": db_name,
+        "DATABASE_REPLICA_HOST": "",
+        "CAPTCHA_ENABLE": "false",
+        "PROFILE_ENABLE": "false",
+        "LOGGER_LEVEL": "WARNING",
+        "OPENAI_BASE_URL": llm_base_url,
+        "OPENAI_API_KEY": "mock",
+    })
+
+
+class BenchHarness:
+    """
+    基准测试运行环境
+
+    不经过应用生命周期(lifespan)，只初始化被测链路需要的组件：
+    重建数据库并写入初始化数据、连接 Redis 并加载系统配置与字典缓存、关闭接口限流，
+    通过 ASGITransport 在进程内调用接口，请求不经过网络栈；
+    流式场景需要真实连接(首字节耗时、背压)，按需在本地端口启动应用服务。
+    """
+
+    def __init__(self, options: BenchOptions) -> None:
+        self.options = options
+        self.llm = MockLLMServer(
+            MockLLMConfig(
+                tokens=options.llm_tokens,
+                token_rate=options.llm_token_rate,
+                ttft=options.llm_ttft,
+                chunk_size=options.llm_chunk_size,
+            ),
+            seed=0,
+        )
+        self.app: FastAPI | None = None
+        self.redis: Any = None
+        self.client: httpx.AsyncClient | None = None
+        self.server: LocalServer | None = None
+        self.stream_client: httpx.AsyncClient | None = None
+        self.headers: dict[str, str] = {}
+
+    async def _connect_redis(self) -> Any:
+        if self.options.redis_url:
+            from redis.asyncio import Redis
+
+            return Redis.from_url(self.options.redis_url, encoding="utf-8", decode_responses=True)
+        try:
+            from fakeredis import FakeAsyncRedis
+        except ImportError as e:
+            raise RuntimeError("未安装 fakeredis，请安装或通过 --redis-url 指定本地 Redis") from e
+        return FakeAsyncRedis(decode_responses=True)
+
+    async def _reset_database(self) -> None:
+        """重建基准库，保证每次运行的数据一致"""
+        from app.core.database import async_engine, drop_tables
+        from app.scripts.initialize import InitializeData
+
+        if self.options.db == "sqlite":
+            await async_engine.dispose()
+            Path(f"{DATA_DIR / self.options.db_name}.db").unlink(missing_ok=True)
+        else:
+            await drop_tables()
+        await InitializeData().init_db()
+
+    def _disable_rate_limit(self, app: FastAPI) -> None:
+        """覆盖路由上的限流依赖，避免限流影响测试结果"""
+        from fastapi.routing import APIRoute
+        from fastapi_limiter.depends import RateLimiter
+
+        async def _no_limit() -> None:
+            return None
+
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for dependency in route.dependencies:
+                if isinstance(dependency.dependency, RateLimiter):
+                    app.dependency_overrides[dependency.dependency] = _no_limit
+
+    async def setup(self, create_app: Callable[[], FastAPI]) -> None:
+        """
+        初始化运行环境并登录管理员账号。
+
+        参数:
+        - create_app (Callable[[], FastAPI]): 应用工厂函数。
+
+        返回:
+        - None
+        """
+        await self.llm.start()
+        self.app = create_app()
+        await self._reset_database()
+
+        from app.api.v1.module_system.dict.service import DictDataService
+        from app.api.v1.module_system.params.service import ParamsService
+
+        self.redis = await self._connect_redis()
+        self.app.state.redis = self.redis
+        await ParamsService().init_config_service(redis=self.redis)
+        await DictDataService().init_dict_service(redis=self.redis)
+        self._disable_rate_limit(self.app)
+
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app),
+            base_url="http://benchmark",
+            timeout=None,
+        )
+        token = await self.login()
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+    async def serve_app(self) -> httpx.AsyncClient:
+        """
+        在本地端口启动应用服务，返回连接该服务的客户端(不限制连接数)。
+
+        返回:
+        - httpx.AsyncClient: HTTP 客户端。
+        """
+        if self.stream_client is None:
+            assert self.app is not None
+            self.server = LocalServer(self.app)
+            await self.server.start()
+            self.stream_client = httpx.AsyncClient(
+                base_url=self.server.url,
+                timeout=None,
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+            )
+        return self.stream_client
+
+    async def login(self) -> str:
+        """
+        管理员账号登录。
+
+        返回:
+        - str: 访问令牌。
+        """
+        assert self.client is not None
+        response = await self.client.post(
+            "/system/auth/login",
+            data={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD},
+        )
+        response.raise_for_status()
+        return response.json()["data"]["access_token"]
+
+    async def seed_logs(self, rows: int) -> None:
+        """
+        将系统日志表数据重置为指定条数(分页与导出场景的数据源)。
+
+        参数:
+        - rows (int): 数据条数。
+
+        返回:
+        - None
+        """
+        from sqlalchemy import delete, insert
+
+        from app.api.v1.module_system.log.model import OperationLogModel
+        from app.core.database import async_engine
+
+        table = OperationLogModel.__table__
+        start_time = datetime.now() - timedelta(seconds=rows)
+        async with async_engine.begin() as conn:
+            await conn.execute(delete(table))
+        for offset in range(0, rows, SEED_BATCH_SIZE):
+            batch = []
+            for index in range(offset, min(offset + SEED_BATCH_SIZE, rows)):
+                created_time = start_time + timedelta(seconds=index)
+                batch.append({
+                    "uuid": uuid.uuid4().hex,
+                    "status": "0",
+                    "created_time": created_time,
+                    "updated_time": created_time,
+                    "created_id": 1,
+                    "type": 2,
+                    "request_path": f"/api/v1/system/demo/{index % 50}",
+                    "request_method": ("GET", "POST", "PUT", "DELETE")[index % 4],
+                    "request_payload": '{"page_no": 1, "page_size": 10}',
+                    "request_ip": "127.0.0.1",
+                    "login_location": "内网IP",
+                    "request_os": "Linux",
+                    "request_browser": "Chrome",
+                    "response_code": 200,
+                    "response_json": '{"code": 0, "msg": "ok"}',
+                    "process_time": f"{index % 100}ms",
+                })
+            async with async_engine.begin() as conn:
+                await conn.execute(insert(table), batch)
+
+    async def close(self) -> None:
+        """释放连接与模拟服务"""
+        from app.core.database import async_engine
+
+        if self.client is not None:
+            await self.client.aclose()
+        if self.stream_client is not None:
+            await self.stream_client.aclose()
+        if self.server is not None:
+            await self.server.stop()
+        if self.redis is not None:
+            await self.redis.aclose()
+        await async_engine.dispose()
+        await self.llm.stop()
@@ -0,0 +1,223 @@
+import asyncio
+import dataclasses
+import json
+import random
+import time
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
+
+import typer
+from fastapi import Body, FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.server import LocalServer
+
+
+@dataclasses.dataclass
+class MockLLMConfig:
+    """
+    模拟大模型输出配置
+
+    请求体中的 mock 字段(字典)可按请求覆盖以下任意配置，
+    OpenAI 兼容调用方会原样透传请求体，无需修改被测代码。
+    """
+
+    tokens: int = 64  # 输出 token 数
+    token_rate: float = 200.0  # 首 token 之后的输出速率(token/s)，0 表示不限速
+    ttft: float = 0.0  # 首 token 耗时(秒)
+    chunk_size: int = 1  # 每个 SSE 片段包含的 token 数
+    error_rate: float = 0.0  # 直接返回 HTTP 500 的概率
+    midstream_error_rate: float = 0.0  # 输出中途断开连接的概率
+    stall_rate: float = 0.0  # 输出中途停顿的概率
+    stall_after: int = 1  # 停顿前输出的片段数
+    stall_seconds: float = 30.0  # 停顿时长(秒)
+    request_id: str | None = None  # 请求标识，用于记录输出完成时间
+
+    @classmethod
+    def merge(cls, base: "MockLLMConfig", overrides: Any) -> "MockLLMConfig":
+        """按请求覆盖配置(忽略未知字段)"""
+        if not isinstance(overrides, dict):
+            return base
+        names = {field.name for field in dataclasses.fields(cls)}
+        return dataclasses.replace(
+            base, **{key: value for key, value in overrides.items() if key in names}
+        )
+
+
+class MockStreamAborted(Exception):
+    """模拟上游中途断开(响应头已发送，抛出异常使服务端直接关闭连接)"""
+
+
+class MockLLMServer:
+    """
+    OpenAI 兼容的本地模拟大模型服务
+
+    提供 /v1/chat/completions(同步与 SSE 流式)，可配置输出速率、首 token 耗时、片段大小，
+    以及错误注入(HTTP 500、中途断开)与停顿注入，与被测应用运行在同一事件循环中，
+    避免基准测试依赖外部付费接口。同时统计当前/峰值打开的流数量与每个流的输出完成时间。
+
+    也可单独启动供手动压测: python -m benchmarks.mock_llm --port 9000
+    """
+
+    def __init__(
+        self,
+        config: MockLLMConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.config = config or MockLLMConfig()
+        # 固定随机种子时错误/停顿注入可复现
+        self._random = random.Random(seed)
+        self.app = self._create_app()
+        self.server = LocalServer(self.app, host=host, port=port)
+        self.active_streams = 0
+        self.peak_streams = 0
+        self.finished: dict[str, float] = {}
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI 兼容接口地址(对应 OPENAI_BASE_URL)"""
+        return f"{self.server.url}/v1"
+
+    def reset_stats(self) -> None:
+        """清空流统计"""
+        self.peak_streams = self.active_streams
+        self.finished.clear()
+
+    @staticmethod
+    def _chunk(model: str, content: str | None, finish_reason: str | None = None) -> str:
+        delta = {"content": content} if content is not None else {}
+        return json.dumps({
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        })
+
+    async def _stream(self, model: str, config: MockLLMConfig) -> AsyncGenerator[bytes, None]:
+        chunk_size = max(config.chunk_size, 1)
+        chunks = (config.tokens + chunk_size - 1) // chunk_size
+        interval = chunk_size / config.token_rate if config.token_rate > 0 else 0
+        stall = self._random.random() < config.stall_rate
+        abort_at = (
+            self._random.randint(0, chunks - 1)
+            if self._random.random() < config.midstream_error_rate
+            else -1
+        )
+
+        self.active_streams += 1
+        self.peak_streams = max(self.peak_streams, self.active_streams)
+        try:
+            if config.ttft > 0:
+                await asyncio.sleep(config.ttft)
+            for index in range(chunks):
+                if index == abort_at:
+                    raise MockStreamAborted(f"模拟上游中途断开(第 {index} 个片段)")
+                if stall and index == config.stall_after:
+                    await asyncio.sleep(config.stall_seconds)
+                if index and interval:
+                    await asyncio.sleep(interval)
+                elif not interval:
+                    # 不限速时也让出事件循环，避免独占
+                    await asyncio.sleep(0)
+                start = index * chunk_size
+                content = "".join(
+                    f"tok{number} "
+                    for number in range(start, min(start + chunk_size, config.tokens))
+                )
+                yield f"data: {self._chunk(model, content)}\n\n".encode()
+            yield f"data: {self._chunk(model, None, 'stop')}\n\n".encode()
+            yield b"data: [DONE]\n\n"
+            if config.request_id:
+                self.finished[config.request_id] = time.perf_counter()
+        finally:
+            self.active_streams -= 1
+
+    def _create_app(self) -> FastAPI:
+        app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+        @app.post("/v1/chat/completions", response_model=None)
+        async def chat_completions(
+            body: Annotated[dict, Body()],
+        ) -> StreamingResponse | JSONResponse:
+            config = MockLLMConfig.merge(self.config, body.get("mock"))
+            model = str(body.get("model") or "mock")
+            if self._random.random() < config.error_rate:
+                return JSONResponse(
+                    {"error": {"message": "模拟上游错误", "type": "server_error"}},
+                    status_code=500,
+                )
+            if body.get("stream"):
+                return StreamingResponse(
+                    self._stream(model, config), media_type="text/event-stream"
+                )
+            if config.ttft > 0:
+                await asyncio.sleep(config.ttft)
+            if config.token_rate > 0:
+                await asyncio.sleep(config.tokens / config.token_rate)
+            content = "".join(f"tok{index} " for index in range(config.tokens))
+            return JSONResponse({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 0, "completion_tokens": config.tokens},
+            })
+
+        return app
+
+    async def start(self) -> None:
+        """在当前事件循环中启动服务"""
+        await self.server.start()
+
+    async def stop(self) -> None:
+        """停止服务"""
+        await self.server.stop()
+
+
+def main(
+    host: Annotated[str, typer.Option("--host", help="监听地址")] = "127.0.0.1",
+    port: Annotated[int, typer.Option("--port", help="监听端口")] = 9000,
+    tokens: Annotated[int, typer.Option("--tokens", help="输出 token 数")] = 64,
+    token_rate: Annotated[float, typer.Option("--token-rate", help="输出速率(token/s)")] = 200.0,
+    ttft: Annotated[float, typer.Option("--ttft", help="首 token 耗时(秒)")] = 0.0,
+    chunk_size: Annotated[int, typer.Option("--chunk-size", help="每个片段的 token 数")] = 1,
+    error_rate: Annotated[float, typer.Option("--error-rate", help="HTTP 500 概率")] = 0.0,
+    midstream_error_rate: Annotated[
+        float, typer.Option("--midstream-error-rate", help="中途断开概率")
+    ] = 0.0,
+    stall_rate: Annotated[float, typer.Option("--stall-rate", help="停顿概率")] = 0.0,
+    stall_seconds: Annotated[float, typer.Option("--stall-seconds", help="停顿时长(秒)")] = 30.0,
+) -> None:
+    """单独启动模拟大模型服务(OPENAI_BASE_URL 指向 http://<host>:<port>/v1)"""
+    config = MockLLMConfig(
+        tokens=tokens,
+        token_rate=token_rate,
+        ttft=ttft,
+        chunk_size=chunk_size,
+        error_rate=error_rate,
+        midstream_error_rate=midstream_error_rate,
+        stall_rate=stall_rate,
+        stall_seconds=stall_seconds,
+    )
+    server = MockLLMServer(config, host=host, port=port)
+    typer.echo(f"模拟大模型服务: {server.base_url}")
+
+    async def _run() -> None:
+        await server.start()
+        await server.server.wait()
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,254 @@
+import asyncio
+import dataclasses
+import fnmatch
+import gc
+import inspect
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import psutil
+from fastapi import FastAPI
+from rich import get_console
+from rich.table import Table
+
+from benchmarks.harness import DATA_DIR, BenchHarness, BenchOptions, prepare_environment
+from benchmarks.scenarios import SCENARIOS, Operation, page_scenarios
+from benchmarks.stats import Baseline, ScenarioResult
+from benchmarks.streams import STREAM_SCENARIOS
+
+console = get_console()
+
+
+async def measure_alloc_peak(operation: Operation) -> int:
+    """
+    统计单次操作的 Python 内存分配峰值(字节)。
+
+    参数:
+    - operation (Operation): 单次操作。
+
+    返回:
+    - int: 分配峰值，相对操作开始前的已分配内存。
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        await operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - start, 0)
+
+
+async def run_scenario(
+    name: str, operation: Operation, requests: int, concurrency: int, warmup: int
+) -> tuple[ScenarioResult, str | None]:
+    """
+    执行单个场景：预热、单次内存峰值统计、并发计时。
+
+    参数:
+    - name (str): 场景名称。
+    - operation (Operation): 单次操作。
+    - requests (int): 计时阶段请求次数。
+    - concurrency (int): 并发数。
+    - warmup (int): 预热次数(不计入结果)。
+
+    返回:
+    - tuple[ScenarioResult, str | None]: 测试结果与首个错误信息。
+    """
+    for _ in range(warmup):
+        await operation()
+    alloc_peak = await measure_alloc_peak(operation)
+
+    latencies: list[float] = []
+    errors = 0
+    items = 0
+    first_error: str | None = None
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors, items, first_error
+        while remaining > 0:
+            remaining -= 1
+            start_time = time.perf_counter()
+            try:
+                items += await operation()
+            except Exception as e:
+                errors += 1
+                first_error = first_error or f"{type(e).__name__}: {e}"
+            else:
+                latencies.append(time.perf_counter() - start_time)
+
+    process = psutil.Process()
+    gc.collect()
+    rss_start = process.memory_info().rss
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    duration = time.perf_counter() - start_time
+    rss_growth = max(process.memory_info().rss - rss_start, 0)
+
+    result = ScenarioResult.build(
+        name=name,
+        latencies=latencies,
+        concurrency=concurrency,
+        errors=errors,
+        duration=duration,
+        items=items,
+        alloc_peak=alloc_peak,
+        rss_growth=rss_growth,
+    )
+    return result, first_error
+
+
+def _selected(name: str, patterns: list[str] | None) -> bool:
+    return not patterns or any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def _render(results: list[ScenarioResult], regressions: dict[str, list[str]]) -> None:
+    table = Table(title="基准测试结果(耗时 ms，内存 MB)")
+    for column in (
+        "场景",
+        "请求",
+        "并发",
+        "失败",
+        "吞吐/s",
+        "条目/s",
+        "p50",
+        "p95",
+        "p99",
+        "max",
+        "分配峰值",
+        "RSS增长",
+        "附加指标",
+        "基线对比",
+    ):
+        table.add_column(
+            column, justify="left" if column in ("场景", "附加指标", "基线对比") else "right"
+        )
+    for result in results:
+        items = regressions.get(result.name)
+        table.add_row(
+            result.name,
+            str(result.requests),
+            str(result.concurrency),
+            str(result.errors),
+            f"{result.throughput:.1f}",
+            f"{result.items_per_second:.1f}",
+            f"{result.p50:.2f}",
+            f"{result.p95:.2f}",
+            f"{result.p99:.2f}",
+            f"{result.max:.2f}",
+            f"{result.alloc_peak_mb:.2f}",
+            f"{result.rss_growth_mb:.2f}",
+            " ".join(f"{key}={value}" for key, value in result.extra.items()),
+            "[red]" + "; ".join(items) + "[/red]" if items else "[green]OK[/green]",
+        )
+    console.print(table)
+
+
+async def _run(
+    create_app: Callable[[], FastAPI], options: BenchOptions
+) -> tuple[list[ScenarioResult], dict[str, str]]:
+    harness = BenchHarness(options)
+    # 必须在导入应用配置之前设置环境变量
+    prepare_environment(options, harness.llm.base_url)
+    results: list[ScenarioResult] = []
+    failures: dict[str, str] = {}
+    try:
+        await harness.setup(create_app)
+        for index, rows in enumerate(sorted(options.rows)):
+            await harness.seed_logs(rows)
+            # 分页场景按每档数据量执行，其余场景(含导出)只在最小一档执行
+            scenarios = page_scenarios(rows) + (SCENARIOS if index == 0 else [])
+            for scenario in scenarios:
+                if not _selected(scenario.name, options.scenarios):
+                    continue
+                console.print(f"[bold blue]▶ {scenario.name}[/bold blue] {scenario.description}")
+                operation = await scenario.build(harness)
+                requests = max(int(options.requests * scenario.scale), 3)
+                concurrency = min(options.concurrency, scenario.max_concurrency or sys.maxsize)
+                result, error = await run_scenario(
+                    scenario.name,
+                    operation,
+                    requests,
+                    concurrency,
+                    min(options.warmup, requests),
+                )
+                results.append(result)
+                if error:
+                    failures[scenario.name] = error
+            if index:
+                continue
+            for name, run_stream in STREAM_SCENARIOS.items():
+                if not _selected(name, options.scenarios):
+                    continue
+                description = (inspect.getdoc(run_stream) or "").splitlines()[0]
+                console.print(f"[bold blue]▶ {name}[/bold blue] {description}")
+                for result in await run_stream(harness):
+                    results.append(result)
+                    if result.errors:
+                        failures[result.name] = f"{result.errors} 个流未正常结束"
+    finally:
+        await harness.close()
+    return results, failures
+
+
+def run_benchmarks(
+    create_app: Callable[[], FastAPI],
+    options: BenchOptions,
+    baseline_path: Path,
+    save_baseline: bool = False,
+    tolerance: float = 0.2,
+) -> int:
+    """
+    运行基准测试并与基线对比。
+
+    参数:
+    - create_app (Callable[[], FastAPI]): 应用工厂函数。
+    - options (BenchOptions): 基准测试参数。
+    - baseline_path (Path): 基线文件路径。
+    - save_baseline (bool): 是否将本次结果保存为基线(存在失败请求时不保存)。
+    - tolerance (float): 允许的性能波动比例。
+
+    返回:
+    - int: 退出码，存在失败请求或(未保存基线时)性能回退时为 1。
+    """
+    results, failures = asyncio.run(_run(create_app, options))
+
+    comparer = Baseline(tolerance=tolerance, memory_tolerance=tolerance)
+    baseline = Baseline.load(baseline_path)
+    regressions = {
+        result.name: items
+        for result in results
+        if (items := comparer.compare(result, baseline.get(result.name)))
+    }
+    _render(results, regressions)
+
+    meta: dict[str, Any] = {
+        "created_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": psutil.cpu_count(),
+        "options": dataclasses.asdict(options),
+    }
+    Baseline.save(DATA_DIR / "last_run.json", results, meta)
+
+    for name, error in failures.items():
+        console.print(f"[red]✖ {name} 存在失败请求: {error}[/red]")
+    if not baseline:
+        console.print(f"[yellow]未找到基线文件 {baseline_path}，本次不做对比[/yellow]")
+    if save_baseline and not failures:
+        Baseline.save(baseline_path, results, meta)
+        console.print(f"[green]已保存基线: {baseline_path}[/green]")
+    # 保存基线时以本次结果为准，不因与旧基线的差异判定失败
+    if failures or (regressions and not save_baseline):
+        console.print("[bold red]❌ 基准测试未通过[/bold red]")
+        return 1
+    console.print("[bold green]✅ 基准测试通过[/bold green]")
+    return 0
@@ -0,0 +1,142 @@
+import dataclasses
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from benchmarks.harness import BenchHarness
+
+# 单次操作，返回处理的数据条数(如 SSE 片段数)
+Operation = Callable[[], Awaitable[int]]
+
+# 分页场景每页条数
+PAGE_SIZE = 10
+
+
+@dataclasses.dataclass
+class Scenario:
+    """
+    基准测试场景
+
+    - build: 根据运行环境构建单次操作；
+    - scale: 请求次数相对 --requests 的比例(登录、导出等重操作调低)；
+    - max_concurrency: 并发上限(为空时使用 --concurrency)。
+    """
+
+    name: str
+    description: str
+    build: Callable[[BenchHarness], Awaitable[Operation]]
+    scale: float = 1.0
+    max_concurrency: int | None = None
+
+
+def _check(response: httpx.Response) -> httpx.Response:
+    """非 2xx 响应视为失败"""
+    if response.status_code >= 400:
+        raise RuntimeError(f"{response.request.url.path} 返回 {response.status_code}")
+    return response
+
+
+def _get(harness: BenchHarness, path: str, **params: int | str) -> Operation:
+    async def operation() -> int:
+        assert harness.client is not None
+        _check(await harness.client.get(path, params=params, headers=harness.headers))
+        return 1
+
+    return operation
+
+
+async def build_login(harness: BenchHarness) -> Operation:
+    async def operation() -> int:
+        await harness.login()
+        return 1
+
+    return operation
+
+
+async def build_current_user(harness: BenchHarness) -> Operation:
+    return _get(harness, "/system/user/current/info")
+
+
+async def build_menu_tree(harness: BenchHarness) -> Operation:
+    return _get(harness, "/system/menu/tree")
+
+
+async def build_dict_lookup(harness: BenchHarness) -> Operation:
+    return _get(harness, "/system/dict/data/info/sys_user_sex")
+
+
+async def build_export(harness: BenchHarness) -> Operation:
+    async def operation() -> int:
+        assert harness.client is not None
+        response = _check(await harness.client.post("/system/log/export", headers=harness.headers))
+        return len(response.content)
+
+    return operation
+
+
+async def build_sse_relay(harness: BenchHarness) -> Operation:
+    body = {"model": "mock", "messages": [{"role": "user", "content": "benchmark"}]}
+
+    async def operation() -> int:
+        assert harness.client is not None
+        chunks = 0
+        async with harness.client.stream(
+            "POST",
+            "/v1/chat/completions",
+            params={"stream": "true"},
+            json=body,
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            _check(response)
+            async for line in response.aiter_lines():
+                if line.startswith("event: error"):
+                    raise RuntimeError("SSE 转发失败")
+                if line.startswith("data: ") and line != "data: [DONE]":
+                    chunks += 1
+        return chunks
+
+    return operation
+
+
+def _row_label(rows: int) -> str:
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1000 and rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+
+def page_scenarios(rows: int) -> list[Scenario]:
+    """
+    生成指定数据量下的分页场景(首页与末页，末页体现大偏移量的代价)。
+
+    参数:
+    - rows (int): 系统日志表数据条数。
+
+    返回:
+    - list[Scenario]: 分页场景列表。
+    """
+    label = _row_label(rows)
+    last_page = max((rows + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+
+    async def build_first(harness: BenchHarness) -> Operation:
+        return _get(harness, "/system/log/list", page_no=1, page_size=PAGE_SIZE)
+
+    async def build_deep(harness: BenchHarness) -> Operation:
+        return _get(harness, "/system/log/list", page_no=last_page, page_size=PAGE_SIZE)
+
+    return [
+        Scenario(f"page_first_{label}", f"日志分页首页({rows} 条)", build_first),
+        Scenario(f"page_deep_{label}", f"日志分页末页({rows} 条)", build_deep),
+    ]
+
+
+# 与数据量无关的场景(在第一档数据量下执行)
+SCENARIOS: list[Scenario] = [
+    Scenario("login", "登录(密码校验、签发令牌、写入在线会话)", build_login, scale=0.1),
+    Scenario("current_user", "当前用户鉴权与信息查询", build_current_user),
+    Scenario("menu_tree", "菜单树构建", build_menu_tree),
+    Scenario("dict_lookup", "字典数据查询(Redis 缓存)", build_dict_lookup),
+    Scenario("sse_relay", "/chat/completions SSE 转发", build_sse_relay),
+    Scenario("export", "日志导出 Excel", build_export, scale=0.05, max_concurrency=2),
+]
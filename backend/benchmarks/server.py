@@ -0,0 +1,66 @@
+import asyncio
+import socket
+
+import uvicorn
+from starlette.types import ASGIApp
+
+
+def get_free_port(host: str = "127.0.0.1") -> int:
+    """获取一个本机空闲端口"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class LocalServer:
+    """
+    在当前事件循环中运行的 uvicorn 服务
+
+    用于需要真实 HTTP 连接的场景(首字节耗时、流式背压)，ASGITransport 会缓冲完整响应体无法体现。
+    """
+
+    def __init__(self, app: ASGIApp, host: str = "127.0.0.1", port: int | None = None) -> None:
+        self.app = app
+        self.host = host
+        self.port = port or get_free_port(host)
+        self._server: uvicorn.Server | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """启动服务并等待端口就绪"""
+        if self._task is not None:
+            return
+        config = uvicorn.Config(
+            self.app,
+            host=self.host,
+            port=self.port,
+            log_level="warning",
+            lifespan="off",
+            backlog=4096,
+            timeout_graceful_shutdown=1,
+        )
+        self._server = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._task.done():
+                # 启动失败(如端口被占用)时抛出原始异常
+                self._task.result()
+                raise RuntimeError(f"本地服务启动失败: {self.url}")
+            await asyncio.sleep(0.01)
+
+    async def wait(self) -> None:
+        """等待服务退出(收到退出信号)"""
+        if self._task is not None:
+            await self._task
+
+    async def stop(self) -> None:
+        """停止服务"""
+        if self._server is not None and self._task is not None:
+            self._server.should_exit = True
+            await self._task
+            self._server = None
+            self._task = None
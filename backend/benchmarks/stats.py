@@ -0,0 +1,175 @@
+import dataclasses
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    计算分位数(线性插值)。
+
+    参数:
+    - sorted_values (list[float]): 已升序排列的样本。
+    - q (float): 分位(0~100)。
+
+    返回:
+    - float: 分位数，无样本时返回 0。
+    """
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclasses.dataclass
+class ScenarioResult:
+    """单个场景的测试结果(耗时单位毫秒，内存单位 MB)"""
+
+    name: str
+    requests: int
+    concurrency: int
+    errors: int
+    duration: float
+    throughput: float
+    items_per_second: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    alloc_peak_mb: float
+    rss_growth_mb: float
+    # 场景特有指标，如流式容量、单流内存
+    extra: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        name: str,
+        latencies: list[float],
+        concurrency: int,
+        errors: int,
+        duration: float,
+        items: int,
+        alloc_peak: int,
+        rss_growth: int,
+        extra: dict[str, float] | None = None,
+    ) -> "ScenarioResult":
+        """
+        由原始样本汇总测试结果。
+
+        参数:
+        - name (str): 场景名称。
+        - latencies (list[float]): 单次请求耗时(秒)。
+        - concurrency (int): 并发数。
+        - errors (int): 失败次数。
+        - duration (float): 计时阶段总耗时(秒)。
+        - items (int): 处理的数据条数(如 SSE 片段数)。
+        - alloc_peak (int): 单次请求的 Python 内存分配峰值(字节)。
+        - rss_growth (int): 计时阶段进程常驻内存增长(字节)。
+        - extra (dict[str, float] | None): 场景特有指标。
+
+        返回:
+        - ScenarioResult: 测试结果。
+        """
+        values = sorted(value * 1000 for value in latencies)
+        count = len(latencies) + errors
+        return cls(
+            name=name,
+            requests=count,
+            concurrency=concurrency,
+            errors=errors,
+            duration=round(duration, 3),
+            throughput=round(count / duration, 2) if duration > 0 else 0.0,
+            items_per_second=round(items / duration, 2) if duration > 0 else 0.0,
+            p50=round(percentile(values, 50), 3),
+            p95=round(percentile(values, 95), 3),
+            p99=round(percentile(values, 99), 3),
+            max=round(values[-1], 3) if values else 0.0,
+            alloc_peak_mb=round(alloc_peak / 1024 / 1024, 3),
+            rss_growth_mb=round(rss_growth / 1024 / 1024, 3),
+            extra=extra or {},
+        )
+
+
+class Baseline:
+    """
+    基线对比
+
+    - 延迟：p95/p99 超过基线 (1 + tolerance) 倍且差值超过 min_delta_ms 视为回退(忽略亚毫秒级抖动)；
+    - 吞吐量：低于基线 (1 - tolerance) 倍视为回退；
+    - 内存：单次请求分配峰值超过基线 (1 + memory_tolerance) 倍且差值超过 1MB 视为回退；
+    - 场景特有指标：HIGHER_IS_BETTER 中的指标低于基线 (1 - tolerance) 倍视为回退，其余指标越低越好(差值不超过 1 时忽略)；
+    - 基线中不存在的场景只输出结果，不参与对比。
+    """
+
+    HIGHER_IS_BETTER = frozenset({"capacity"})
+
+    def __init__(
+        self,
+        tolerance: float = 0.2,
+        memory_tolerance: float = 0.2,
+        min_delta_ms: float = 1.0,
+    ) -> None:
+        self.tolerance = tolerance
+        self.memory_tolerance = memory_tolerance
+        self.min_delta_ms = min_delta_ms
+
+    @staticmethod
+    def load(path: Path) -> dict[str, dict[str, Any]]:
+        """读取基线文件，不存在时返回空字典"""
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+    @staticmethod
+    def save(path: Path, results: list[ScenarioResult], meta: dict[str, Any]) -> None:
+        """将本次结果保存为基线"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "meta": meta,
+            "results": {result.name: dataclasses.asdict(result) for result in results},
+        }
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def compare(self, result: ScenarioResult, baseline: dict[str, Any] | None) -> list[str]:
+        """
+        对比单个场景与基线。
+
+        参数:
+        - result (ScenarioResult): 本次结果。
+        - baseline (dict[str, Any] | None): 基线结果。
+
+        返回:
+        - list[str]: 回退说明，为空表示未回退。
+        """
+        if not baseline:
+            return []
+        regressions = []
+        for field in ("p95", "p99"):
+            current, expected = getattr(result, field), baseline[field]
+            if current > expected * (1 + self.tolerance) and current - expected > self.min_delta_ms:
+                regressions.append(f"{field} {expected}ms -> {current}ms")
+        if result.throughput < baseline["throughput"] * (1 - self.tolerance):
+            regressions.append(f"吞吐量 {baseline['throughput']}/s -> {result.throughput}/s")
+        expected_memory = baseline["alloc_peak_mb"]
+        if (
+            result.alloc_peak_mb > expected_memory * (1 + self.memory_tolerance)
+            and result.alloc_peak_mb - expected_memory > 1
+        ):
+            regressions.append(f"内存峰值 {expected_memory}MB -> {result.alloc_peak_mb}MB")
+        for key, current in result.extra.items():
+            expected = baseline.get("extra", {}).get(key)
+            if expected is None:
+                continue
+            if key in self.HIGHER_IS_BETTER:
+                regressed = current < expected * (1 - self.tolerance)
+            else:
+                regressed = current > expected * (1 + self.tolerance) and current - expected > 1
+            if regressed:
+                regressions.append(f"{key} {expected} -> {current}")
+        return regressions
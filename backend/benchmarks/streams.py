@@ -0,0 +1,367 @@
+import asyncio
+import dataclasses
+import gc
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+import psutil
+
+from benchmarks.harness import BenchHarness
+from benchmarks.stats import ScenarioResult, percentile
+
+STREAM_BODY = {"model": "mock", "messages": [{"role": "user", "content": "benchmark"}]}
+
+# 单流内存场景：上游输出 1 个片段后停顿，保持连接打开
+HOLD_MOCK = {"stall_rate": 1, "stall_after": 1, "stall_seconds": 3600}
+# 背压场景：上游不限速输出约 3MB，客户端慢速读取
+BACKPRESSURE_MOCK = {"tokens": 512_000, "chunk_size": 256, "token_rate": 0, "ttft": 0}
+BACKPRESSURE_STREAMS = 10
+BACKPRESSURE_READ_DELAY = 0.001
+# 故障场景：HTTP 500、中途断开与停顿各 20%
+FAULT_MOCK = {
+    "error_rate": 0.2,
+    "midstream_error_rate": 0.2,
+    "stall_rate": 0.2,
+    "stall_after": 1,
+    "stall_seconds": 1.0,
+}
+FAULT_STREAMS = 50
+# 等待流结束或连接建立的超时时间(秒)
+STREAM_TIMEOUT = 60
+
+
+@dataclasses.dataclass
+class StreamOutcome:
+    """单个 SSE 流的结果(status: done 正常结束 / error 收到错误事件 / broken 连接异常或超时)"""
+
+    status: str
+    ttft: float | None
+    duration: float
+    chunks: int
+    finished_at: float
+
+
+async def relay_stream(
+    client: httpx.AsyncClient,
+    mock: dict[str, Any] | None = None,
+    read_delay: float = 0.0,
+    on_first_chunk: Callable[[], None] | None = None,
+) -> StreamOutcome:
+    """
+    通过 /v1/chat/completions 发起一次 SSE 流式请求并读取到结束。
+
+    参数:
+    - client (httpx.AsyncClient): 连接应用服务的客户端。
+    - mock (dict[str, Any] | None): 透传给模拟上游的按请求配置。
+    - read_delay (float): 每读取一个片段后的等待时间(秒)，模拟慢速客户端。
+    - on_first_chunk (Callable[[], None] | None): 收到首个数据片段时的回调。
+
+    返回:
+    - StreamOutcome: 流结果。
+    """
+    body = {**STREAM_BODY, "mock": mock} if mock else STREAM_BODY
+    start_time = time.perf_counter()
+    ttft: float | None = None
+    chunks = 0
+    status = "broken"
+    event: str | None = None
+    try:
+        async with client.stream(
+            "POST",
+            "/v1/chat/completions",
+            params={"stream": "true"},
+            json=body,
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            if response.status_code < 400:
+                async for line in response.aiter_lines():
+                    if line.startswith("event: "):
+                        event = line.removeprefix("event: ")
+                        continue
+                    if not line.startswith("data: "):
+                        continue
+                    if event in ("done", "error"):
+                        status = event
+                        break
+                    if ttft is None:
+                        ttft = time.perf_counter() - start_time
+                        if on_first_chunk is not None:
+                            on_first_chunk()
+                    chunks += 1
+                    if read_delay:
+                        await asyncio.sleep(read_delay)
+    except httpx.HTTPError:
+        status = "broken"
+    end_time = time.perf_counter()
+    return StreamOutcome(status, ttft, end_time - start_time, chunks, end_time)
+
+
+async def _stream_level(
+    harness: BenchHarness, client: httpx.AsyncClient, streams: int
+) -> ScenarioResult:
+    """同时打开指定数量的流，延迟分位数为首 token 耗时(TTFT)"""
+    process = psutil.Process()
+    gc.collect()
+    rss_start = process.memory_info().rss
+    start_time = time.perf_counter()
+    outcomes = await asyncio.gather(*(relay_stream(client) for _ in range(streams)))
+    duration = time.perf_counter() - start_time
+    done = [outcome for outcome in outcomes if outcome.status == "done"]
+    stream_durations = sorted(outcome.duration * 1000 for outcome in done)
+    return ScenarioResult.build(
+        name=f"stream_c{streams}",
+        latencies=[outcome.ttft for outcome in done if outcome.ttft is not None],
+        concurrency=streams,
+        errors=streams - len(done),
+        duration=duration,
+        items=sum(outcome.chunks for outcome in outcomes),
+        alloc_peak=0,
+        rss_growth=max(process.memory_info().rss - rss_start, 0),
+        extra={"stream_p95_ms": round(percentile(stream_durations, 95), 3)},
+    )
+
+
+async def run_stream_capacity(harness: BenchHarness) -> list[ScenarioResult]:
+    """
+    单 worker 流式容量：按 stream_levels 逐档增加并发流，
+    无失败且 TTFT p95 不超过 ttft_slo 的最高一档即为容量(全部达标时为测试上限)。
+
+    参数:
+    - harness (BenchHarness): 运行环境。
+
+    返回:
+    - list[ScenarioResult]: 各档结果与容量汇总。
+    """
+    client = await harness.serve_app()
+    # 预热连接与路由
+    await relay_stream(client)
+    results = []
+    capacity = 0
+    for streams in sorted(harness.options.stream_levels):
+        result = await _stream_level(harness, client, streams)
+        results.append(result)
+        if result.errors or result.p95 > harness.options.ttft_slo * 1000:
+            break
+        capacity = streams
+    results.append(
+        ScenarioResult.build(
+            name="stream_capacity",
+            latencies=[],
+            concurrency=capacity,
+            errors=0,
+            duration=0,
+            items=0,
+            alloc_peak=0,
+            rss_growth=0,
+            extra={"capacity": capacity},
+        )
+    )
+    return results
+
+
+def _traced_size(snapshot: tracemalloc.Snapshot, filters: list[tracemalloc.Filter]) -> int:
+    return sum(stat.size for stat in snapshot.filter_traces(filters).statistics("filename"))
+
+
+async def run_stream_memory(harness: BenchHarness) -> list[ScenarioResult]:
+    """
+    单流内存：保持 stream_hold 个流打开(上游停顿)，统计每个打开的流占用的内存，
+    客户端断开后检查上游连接是否被释放以及应用代码是否仍持有内存。
+
+    - app_kb_per_stream: 调用栈经过 app/ 代码的分配(应用侧转发链路)；
+    - total_kb_per_stream: 进程内全部分配(含压测客户端与模拟上游)；
+    - retained_kb_per_stream: 断开后应用侧仍未释放的分配；
+    - 失败数: 客户端断开后仍未释放的上游流数量与未建立的流数量。
+
+    参数:
+    - harness (BenchHarness): 运行环境。
+
+    返回:
+    - list[ScenarioResult]: 测试结果。
+    """
+    from app.config.path_conf import BASE_DIR
+
+    client = await harness.serve_app()
+    streams = harness.options.stream_hold
+    app_filters = [tracemalloc.Filter(True, f"{BASE_DIR / 'app'}/*", all_frames=True)]
+    opened = 0
+    all_opened = asyncio.Event()
+
+    def on_first_chunk() -> None:
+        nonlocal opened
+        opened += 1
+        if opened >= streams:
+            all_opened.set()
+
+    process = psutil.Process()
+    gc.collect()
+    tracemalloc.start(64)
+    try:
+        before = tracemalloc.take_snapshot()
+        total_before, _ = tracemalloc.get_traced_memory()
+        rss_before = process.memory_info().rss
+        start_time = time.perf_counter()
+        tasks = [
+            asyncio.create_task(relay_stream(client, mock=HOLD_MOCK, on_first_chunk=on_first_chunk))
+            for _ in range(streams)
+        ]
+        try:
+            await asyncio.wait_for(all_opened.wait(), timeout=STREAM_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        open_duration = time.perf_counter() - start_time
+        gc.collect()
+        during = tracemalloc.take_snapshot()
+        total_during, _ = tracemalloc.get_traced_memory()
+        rss_during = process.memory_info().rss
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 等待应用感知客户端断开并关闭上游连接
+        deadline = time.perf_counter() + 5
+        while harness.llm.active_streams and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    app_before = _traced_size(before, app_filters)
+    per_stream = max(opened, 1) * 1024
+    return [
+        ScenarioResult.build(
+            name="stream_memory",
+            latencies=[],
+            concurrency=streams,
+            errors=(streams - opened) + harness.llm.active_streams,
+            duration=open_duration,
+            items=opened,
+            alloc_peak=0,
+            rss_growth=max(rss_during - rss_before, 0),
+            extra={
+                "app_kb_per_stream": round(
+                    (_traced_size(during, app_filters) - app_before) / per_stream, 2
+                ),
+                "total_kb_per_stream": round((total_during - total_before) / per_stream, 2),
+                "retained_kb_per_stream": round(
+                    max(_traced_size(after, app_filters) - app_before, 0) / per_stream, 2
+                ),
+            },
+        )
+    ]
+
+
+async def run_stream_backpressure(harness: BenchHarness) -> list[ScenarioResult]:
+    """
+    背压：上游不限速输出、客户端慢速读取，观察应用是否将背压传递给上游。
+
+    - upstream_lead_ms: 上游输出完成早于客户端读取完成的平均时间，
+      能传递背压时受限于套接字缓冲区，否则接近客户端读取总耗时；
+    - buffered_kb_per_stream: 读取期间进程内存分配峰值(按流平均)，缓冲越多越高。
+
+    参数:
+    - harness (BenchHarness): 运行环境。
+
+    返回:
+    - list[ScenarioResult]: 测试结果。
+    """
+    client = await harness.serve_app()
+    request_ids = [uuid.uuid4().hex for _ in range(BACKPRESSURE_STREAMS)]
+    harness.llm.reset_stats()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_memory, _ = tracemalloc.get_traced_memory()
+        start_time = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(
+                relay_stream(
+                    client,
+                    mock={**BACKPRESSURE_MOCK, "request_id": request_id},
+                    read_delay=BACKPRESSURE_READ_DELAY,
+                )
+                for request_id in request_ids
+            )
+        )
+        duration = time.perf_counter() - start_time
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    leads = [
+        (outcome.finished_at - harness.llm.finished[request_id]) * 1000
+        for request_id, outcome in zip(request_ids, outcomes, strict=True)
+        if outcome.status == "done" and request_id in harness.llm.finished
+    ]
+    done = [outcome for outcome in outcomes if outcome.status == "done"]
+    return [
+        ScenarioResult.build(
+            name="stream_backpressure",
+            latencies=[outcome.duration for outcome in done],
+            concurrency=BACKPRESSURE_STREAMS,
+            errors=BACKPRESSURE_STREAMS - len(done),
+            duration=duration,
+            items=sum(outcome.chunks for outcome in outcomes),
+            alloc_peak=0,
+            rss_growth=0,
+            extra={
+                "upstream_lead_ms": round(sum(leads) / len(leads), 3) if leads else 0.0,
+                "buffered_kb_per_stream": round(
+                    (peak_memory - start_memory) / BACKPRESSURE_STREAMS / 1024, 2
+                ),
+            },
+        )
+    ]
+
+
+async def run_stream_faults(harness: BenchHarness) -> list[ScenarioResult]:
+    """
+    故障注入：上游返回 500、中途断开或停顿时，转发流应以 done/error 事件正常结束，
+    连接异常或超时未结束计为失败；延迟分位数为流结束耗时。
+
+    参数:
+    - harness (BenchHarness): 运行环境。
+
+    返回:
+    - list[ScenarioResult]: 测试结果。
+    """
+    client = await harness.serve_app()
+
+    async def guarded() -> StreamOutcome:
+        try:
+            return await asyncio.wait_for(
+                relay_stream(client, mock=FAULT_MOCK), timeout=STREAM_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return StreamOutcome("broken", None, STREAM_TIMEOUT, 0, time.perf_counter())
+
+    start_time = time.perf_counter()
+    outcomes = await asyncio.gather(*(guarded() for _ in range(FAULT_STREAMS)))
+    duration = time.perf_counter() - start_time
+    terminated = [outcome for outcome in outcomes if outcome.status != "broken"]
+    return [
+        ScenarioResult.build(
+            name="stream_faults",
+            latencies=[outcome.duration for outcome in terminated],
+            concurrency=FAULT_STREAMS,
+            errors=FAULT_STREAMS - len(terminated),
+            duration=duration,
+            items=sum(outcome.chunks for outcome in outcomes),
+            alloc_peak=0,
+            rss_growth=0,
+        )
+    ]
+
+
+# 流式场景(需要真实连接，在第一档数据量下执行)
+STREAM_SCENARIOS: dict[str, Callable[[BenchHarness], Awaitable[list[ScenarioResult]]]] = {
+    "stream_capacity": run_stream_capacity,
+    "stream_memory": run_stream_memory,
+    "stream_backpressure": run_stream_backpressure,
+    "stream_faults": run_stream_faults,
+}
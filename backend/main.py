@@ -95,6 +95,86 @@ def run(
         cleanup_logging()
 
 
+@fastapiadmin_cli.command(
+    name="worker",
+    help="启动定时任务工作进程(消费 stream 执行器投递的任务), 运行 python main.py worker --env=dev",
+)
+def worker(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+) -> None:
+    """启动定时任务工作进程"""
+    os.environ["ENVIRONMENT"] = env.value
+
+    import asyncio
+    import socket
+
+    from redis.asyncio import Redis
+
+    from app.config.setting import settings
+    from app.core.logger import cleanup_logging, setup_logging
+    from app.plugin.module_application.job.tools.job_worker import JobStreamWorker
+
+    setup_logging()
+
+    async def _run() -> None:
+        redis = Redis.from_url(url=settings.REDIS_URI, encoding="utf-8", decode_responses=True)
+        try:
+            await JobStreamWorker(
+                redis=redis, consumer_name=f"{socket.gethostname()}:{os.getpid()}"
+            ).run()
+        finally:
+            await redis.close()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        typer.echo("工作进程已停止")
+    finally:
+        cleanup_logging()
+
+
+@fastapiadmin_cli.command(
+    name="task-worker",
+    help="启动后台任务工作进程(执行导入、导出、代码生成等后台任务), 运行 python main.py task-worker --env=dev",
+)
+def task_worker(
+    env: Annotated[
+        EnvironmentEnum, typer.Option("--env", help="运行环境 (dev, prod)")
+    ] = EnvironmentEnum.DEV,
+) -> None:
+    """启动后台任务工作进程"""
+    os.environ["ENVIRONMENT"] = env.value
+
+    import asyncio
+    import socket
+
+    from redis.asyncio import Redis
+
+    from app.config.setting import settings
+    from app.core.logger import cleanup_logging, setup_logging
+    from app.core.task_queue import TaskWorker
+
+    setup_logging()
+
+    async def _run() -> None:
+        redis = Redis.from_url(url=settings.REDIS_URI, encoding="utf-8", decode_responses=True)
+        try:
+            await TaskWorker(
+                redis=redis, consumer_name=f"{socket.gethostname()}:{os.getpid()}"
+            ).run()
+        finally:
+            await redis.close()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        typer.echo("后台任务工作进程已停止")
+    finally:
+        cleanup_logging()
+
+
 @fastapiadmin_cli.command(
     name="revision",
     help="生成新的 Alembic 迁移脚本, 运行 python main.py revision --env=dev",
@@ -125,5 +205,87 @@ def upgrade(
     typer.echo("所有迁移已应用。")
 
 
+@fastapiadmin_cli.command(
+    name="bench",
+    help="运行核心链路基准测试(离线), 运行 python main.py bench --rows=10000,1000000 --save-baseline",
+)
+def bench(
+    db: Annotated[
+        str,
+        typer.Option("--db", help="数据库 (sqlite, postgres), postgres 使用 env 文件中的连接配置"),
+    ] = "sqlite",
+    db_name: Annotated[
+        str, typer.Option("--db-name", help="基准库名称(每次运行会重建, 切勿使用业务库)")
+    ] = "fastapiadmin_bench",
+    redis_url: Annotated[
+        str, typer.Option("--redis-url", help="本地 Redis 地址, 为空时使用 fakeredis")
+    ] = "",
+    rows: Annotated[str, typer.Option("--rows", help="分页场景数据量, 多档用逗号分隔")] = "10000",
+    requests: Annotated[int, typer.Option("--requests", help="每个场景的请求次数")] = 200,
+    concurrency: Annotated[int, typer.Option("--concurrency", help="并发数")] = 10,
+    scenario: Annotated[
+        str, typer.Option("--scenario", help="只运行匹配的场景(通配符, 逗号分隔)")
+    ] = "",
+    baseline: Annotated[
+        str, typer.Option("--baseline", help="基线文件路径")
+    ] = "benchmarks/baseline.json",
+    llm_tokens: Annotated[int, typer.Option("--llm-tokens", help="模拟大模型输出 token 数")] = 64,
+    llm_token_rate: Annotated[
+        float, typer.Option("--llm-token-rate", help="模拟大模型输出速率(token/s), 0 表示不限速")
+    ] = 200.0,
+    llm_ttft: Annotated[
+        float, typer.Option("--llm-ttft", help="模拟大模型首 token 耗时(秒)")
+    ] = 0.0,
+    llm_chunk_size: Annotated[
+        int, typer.Option("--llm-chunk-size", help="模拟大模型每个片段的 token 数")
+    ] = 1,
+    stream_levels: Annotated[
+        str, typer.Option("--stream-levels", help="流式容量场景的并发流档位, 逗号分隔")
+    ] = "10,50,100,200",
+    ttft_slo: Annotated[
+        float, typer.Option("--ttft-slo", help="流式容量判定的首 token 耗时 p95 上限(秒)")
+    ] = 0.5,
+    stream_hold: Annotated[
+        int, typer.Option("--stream-hold", help="单流内存场景同时保持打开的流数量")
+    ] = 100,
+    save_baseline: Annotated[
+        bool, typer.Option("--save-baseline", help="将本次结果保存为基线")
+    ] = False,
+    tolerance: Annotated[
+        float, typer.Option("--tolerance", help="允许的性能波动比例, 超出视为回退")
+    ] = 0.2,
+) -> None:
+    """运行基准测试，存在失败请求或性能回退时以非零状态退出"""
+    from pathlib import Path
+
+    from benchmarks.harness import BenchOptions
+    from benchmarks.runner import run_benchmarks
+
+    options = BenchOptions(
+        db=db,
+        db_name=db_name,
+        redis_url=redis_url or None,
+        rows=[int(value) for value in rows.split(",") if value.strip()],
+        requests=requests,
+        concurrency=concurrency,
+        scenarios=[value.strip() for value in scenario.split(",") if value.strip()] or None,
+        llm_tokens=llm_tokens,
+        llm_token_rate=llm_token_rate,
+        llm_ttft=llm_ttft,
+        llm_chunk_size=llm_chunk_size,
+        stream_levels=[int(value) for value in stream_levels.split(",") if value.strip()],
+        ttft_slo=ttft_slo,
+        stream_hold=stream_hold,
+    )
+    exit_code = run_benchmarks(
+        create_app,
+        options,
+        baseline_path=Path(baseline),
+        save_baseline=save_baseline,
+        tolerance=tolerance,
+    )
+    raise typer.Exit(code=exit_code)
+
+
 if __name__ == "__main__":
     fastapiadmin_cli()
@@ -1,12 +1,22 @@
+import asyncio
 import os
 import sys
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any
 
 import pytest
+from fakeredis import FakeAsyncRedis
 from fastapi.testclient import TestClient
+from sqlalchemy import MetaData
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 # 导入 main 模块，确保路径正确
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.user.model import UserModel
+from app.core.base_crud import CRUDBase
+from app.core.base_model import MappedBase
 from main import create_app
 
 # 创建测试客户端
@@ -17,3 +27,71 @@ app = create_app()
 def test_client():
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+def run() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    """
+    在测试独享的事件循环中执行协程并返回结果，同一测试的异步夹具共用该循环，
+    测试函数仍使用普通的 def 定义。
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+@pytest.fixture
+def db_metadata() -> list[MetaData]:
+    """建表使用的元数据，测试模块可覆盖该夹具以使用自定义模型"""
+    return [MappedBase.metadata]
+
+
+@pytest.fixture
+def db_engine(run, db_metadata: list[MetaData]) -> Iterator[AsyncEngine]:
+    """内存 SQLite 引擎(支持 RETURNING 与 ON CONFLICT)，已按 db_metadata 建表"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def create_all() -> None:
+        async with engine.begin() as conn:
+            for metadata in db_metadata:
+                await conn.run_sync(metadata.create_all)
+
+    run(create_all())
+    try:
+        yield engine
+    finally:
+        run(engine.dispose())
+
+
+@pytest.fixture
+def db_session(run, db_engine: AsyncEngine) -> Iterator[AsyncSession]:
+    """测试使用的数据库会话"""
+    session = AsyncSession(db_engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        run(session.close())
+
+
+@pytest.fixture
+def crud_for(db_session: AsyncSession) -> Callable[..., CRUDBase]:
+    """返回按模型创建 CRUDBase 的工厂，以无角色的普通用户身份操作(数据权限: 仅本人创建的数据)"""
+
+    def factory(model: type, user_id: int = 1) -> CRUDBase:
+        user = UserModel(id=user_id, username=f"user{user_id}", is_superuser=False)
+        return CRUDBase(model, AuthSchema(db=db_session, user=user, check_data_scope=True))
+
+    return factory
+
+
+@pytest.fixture
+def redis(run) -> Iterator[FakeAsyncRedis]:
+    """fakeredis 客户端(decode_responses=True，与应用一致)"""
+    client = FakeAsyncRedis(decode_responses=True)
+    try:
+        yield client
+    finally:
+        run(client.aclose())
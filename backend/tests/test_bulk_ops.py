@@ -0,0 +1,233 @@
+"""
+CRUDBase 批量写入测试(bulk_create / bulk_update / upsert)
+
+使用内存 SQLite(支持 RETURNING 与 ON CONFLICT)，数据权限按"仅本人"过滤。
+执行命令: pytest tests/test_bulk_ops.py
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import DateTime, Integer, MetaData, String, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.core.base_crud import UPSERT_KEEP_FIELDS
+from app.core.database import READONLY_KEY, on_commit
+from app.core.exceptions import CustomException
+from app.utils.common_util import uuid4_str
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "bulk_item"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    uuid: Mapped[str] = mapped_column(String(64), default=uuid4_str, unique=True)
+    code: Mapped[str] = mapped_column(String(50), unique=True)
+    name: Mapped[str] = mapped_column(String(50))
+    status: Mapped[str] = mapped_column(String(1), default="0")
+    description: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    created_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_time: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_time: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+
+@pytest.fixture
+def db_metadata() -> list[MetaData]:
+    return [Base.metadata]
+
+
+async def all_items(session: AsyncSession) -> list[Item]:
+    session.expunge_all()
+    return list((await session.execute(select(Item).order_by(Item.id))).scalars().all())
+
+
+def test_bulk_create_returns_ids_in_input_order(run, db_session: AsyncSession, crud_for) -> None:
+    async def main() -> None:
+        crud = crud_for(Item)
+        data = [{"code": f"c{i}", "name": f"n{i}"} for i in range(5)]
+        ids = await crud.bulk_create(data, batch_size=2)
+        items = await all_items(db_session)
+        assert ids == [item.id for item in items]
+        assert [item.code for item in items] == [row["code"] for row in data]
+        # 审计字段与 Python 端默认值均已填充
+        assert {item.created_id for item in items} == {1}
+        assert {item.updated_id for item in items} == {1}
+        assert all(item.uuid for item in items)
+
+    run(main())
+
+
+def test_bulk_create_heterogeneous_keys(run, db_session: AsyncSession, crud_for) -> None:
+    """各行字段不一致时按输入顺序返回主键，缺省字段使用默认值"""
+
+    async def main() -> None:
+        crud = crud_for(Item)
+        data = [
+            {"code": "a", "name": "A"},
+            {"code": "b", "name": "B", "status": "1", "description": "desc"},
+            {"code": "c", "name": "C"},
+            {"code": "d", "name": "D", "description": "only desc"},
+        ]
+        ids = await crud.bulk_create(data)
+        items = {item.id: item for item in await all_items(db_session)}
+        assert len(ids) == len(data)
+        assert [items[pk].code for pk in ids] == ["a", "b", "c", "d"]
+        assert [items[pk].status for pk in ids] == ["0", "1", "0", "0"]
+        assert [items[pk].description for pk in ids] == [None, "desc", None, "only desc"]
+
+    run(main())
+
+
+def test_bulk_create_without_returning_returns_empty_list(
+    run, db_session: AsyncSession, crud_for
+) -> None:
+    """不支持 executemany RETURNING 的数据库(MySQL)只写入，不返回主键"""
+
+    async def main() -> None:
+        dialect = db_session.get_bind().dialect
+        dialect.insert_executemany_returning = False
+        crud = crud_for(Item)
+        ids = await crud.bulk_create([{"code": "x", "name": "X"}, {"code": "y", "name": "Y"}])
+        assert ids == []
+        assert [item.code for item in await all_items(db_session)] == ["x", "y"]
+
+    run(main())
+
+
+def test_bulk_update_heterogeneous_keys(run, db_session: AsyncSession, crud_for) -> None:
+    async def main() -> None:
+        crud = crud_for(Item)
+        ids = await crud.bulk_create([{"code": f"c{i}", "name": f"n{i}"} for i in range(3)])
+        count = await crud.bulk_update([
+            {"id": ids[0], "name": "renamed"},
+            {"id": ids[1], "status": "1", "description": "d"},
+            {"id": ids[2], "name": "other", "status": "1"},
+        ])
+        assert count == 3
+        items = await all_items(db_session)
+        assert [(item.name, item.status, item.description) for item in items] == [
+            ("renamed", "0", None),
+            ("n1", "1", "d"),
+            ("other", "1", None),
+        ]
+
+    run(main())
+
+
+def test_bulk_update_rejects_ids_outside_data_scope(
+    run, db_session: AsyncSession, crud_for
+) -> None:
+    async def main() -> None:
+        own = await crud_for(Item, user_id=1).bulk_create([{"code": "mine", "name": "m"}])
+        other = await crud_for(Item, user_id=2).bulk_create([{"code": "theirs", "name": "t"}])
+
+        crud = crud_for(Item, user_id=1)
+        with pytest.raises(CustomException, match="无权限"):
+            await crud.bulk_update([
+                {"id": own[0], "name": "changed"},
+                {"id": other[0], "name": "changed"},
+            ])
+        # 不存在的主键同样拒绝
+        with pytest.raises(CustomException, match="不存在"):
+            await crud.bulk_update([{"id": 9999, "name": "changed"}])
+        with pytest.raises(CustomException, match="主键"):
+            await crud.bulk_update([{"name": "no id"}])
+        assert [item.name for item in await all_items(db_session)] == ["m", "t"]
+
+    run(main())
+
+
+def test_upsert_keeps_creation_fields(run, db_session: AsyncSession, crud_for) -> None:
+    """冲突时只更新普通字段与更新人，UPSERT_KEEP_FIELDS 保持不变"""
+    assert {"id", "uuid", "created_id", "created_time"} <= UPSERT_KEEP_FIELDS
+
+    async def main() -> None:
+        created_time = datetime(2020, 1, 1)
+        await crud_for(Item).bulk_create([
+            {"code": "a", "name": "A", "uuid": "uuid-a", "created_time": created_time}
+        ])
+        before = (await all_items(db_session))[0]
+
+        ids = await crud_for(Item).upsert(
+            [
+                {"code": "a", "name": "A2", "uuid": "uuid-new", "created_time": datetime.now()},
+                {"code": "b", "name": "B"},
+            ],
+            conflict=["code"],
+        )
+        items = await all_items(db_session)
+        assert sorted(ids) == [item.id for item in items]
+        existing, inserted = items
+        assert existing.id == before.id
+        assert existing.name == "A2"
+        assert existing.uuid == "uuid-a"
+        assert existing.created_time == created_time
+        assert existing.created_id == 1
+        assert inserted.code == "b" and inserted.created_id == 1
+
+    run(main())
+
+
+def test_upsert_update_fields_and_data_scope(run, db_session: AsyncSession, crud_for) -> None:
+    async def main() -> None:
+        await crud_for(Item, user_id=2).bulk_create([{"code": "t", "name": "T"}])
+        await crud_for(Item, user_id=1).bulk_create([{"code": "m", "name": "M"}])
+
+        crud = crud_for(Item, user_id=1)
+        # 冲突到其他用户的数据时拒绝整批
+        with pytest.raises(CustomException, match="无权限"):
+            await crud.upsert([{"code": "t", "name": "stolen"}], conflict=["code"])
+
+        # 只更新指定字段
+        await crud.upsert(
+            [{"code": "m", "name": "ignored", "status": "1"}],
+            conflict=["code"],
+            update_fields=["status"],
+        )
+        items = {item.code: item for item in await all_items(db_session)}
+        assert items["t"].name == "T"
+        assert (items["m"].name, items["m"].status) == ("M", "1")
+
+        with pytest.raises(CustomException, match="冲突字段无效"):
+            await crud.upsert([{"code": "m"}], conflict=["missing"])
+
+    run(main())
+
+
+def test_readonly_session_rejects_writes(run, db_session: AsyncSession, crud_for) -> None:
+    """读请求的只读会话(db_getter 标记)中所有写方法直接拒绝，读取不受影响"""
+
+    async def main() -> None:
+        crud = crud_for(Item)
+        ids = await crud.bulk_create([{"code": "a", "name": "A"}])
+        db_session.info[READONLY_KEY] = True
+
+        writes = [
+            crud.create({"code": "b", "name": "B"}),
+            crud.update(ids[0], {"name": "changed"}),
+            crud.delete(ids),
+            crud.clear(),
+            crud.set(ids, status="1"),
+            crud.bulk_create([{"code": "c", "name": "C"}]),
+            crud.bulk_update([{"id": ids[0], "name": "changed"}]),
+            crud.upsert([{"code": "a", "name": "changed"}], conflict=["code"]),
+        ]
+        for write in writes:
+            with pytest.raises(CustomException, match="只读请求"):
+                await write
+        with pytest.raises(CustomException, match="只读请求"):
+            on_commit(db_session, "noop", lambda: None)
+        assert [(item.code, item.name) for item in await all_items(db_session)] == [("a", "A")]
+
+    run(main())
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_bulk_ops.py"])
@@ -0,0 +1,256 @@
+"""
+数据字典缓存测试(DictCache)
+
+使用 fakeredis 与内存 SQLite：同一事务内的变更合并为一次重建、事务提交后才执行、
+回滚时丢弃，以及近端缓存按变更通知中的版本号淘汰。
+执行命令: pytest tests/test_dict_cache.py
+"""
+
+import asyncio
+import json
+from collections.abc import Iterator
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.dict import cache as dict_cache
+from app.api.v1.module_system.dict.cache import DICT_CHANGES_KEY, DictCache
+from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
+from app.common.enums import RedisInitKeyConfig
+from app.core.database import AFTER_COMMIT_KEY, run_commit_hooks
+
+VERSION_KEY = RedisInitKeyConfig.SYSTEM_DICT_VERSION.key
+
+
+@pytest.fixture(autouse=True)
+def dict_data(
+    run, db_engine: AsyncEngine, redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """写入字典类型与数据，缓存重建使用同一数据库的独立会话；测试结束后停止订阅任务"""
+
+    async def seed() -> None:
+        async with AsyncSession(db_engine) as session:
+            session.add_all([
+                DictTypeModel(id=1, dict_name="性别", dict_type="sys_gender"),
+                DictTypeModel(id=2, dict_name="状态", dict_type="sys_status"),
+                DictDataModel(
+                    dict_sort=1,
+                    dict_label="男",
+                    dict_value="0",
+                    dict_type="sys_gender",
+                    dict_type_id=1,
+                ),
+                DictDataModel(
+                    dict_sort=1,
+                    dict_label="正常",
+                    dict_value="0",
+                    dict_type="sys_status",
+                    dict_type_id=2,
+                ),
+            ])
+            await session.commit()
+
+    run(seed())
+    monkeypatch.setattr(dict_cache, "async_db_session", lambda: AsyncSession(db_engine))
+    try:
+        yield
+    finally:
+        run(DictCache.stop())
+
+
+async def cached_labels(redis: FakeAsyncRedis, dict_type: str) -> list[str] | None:
+    value = await redis.get(DictCache.key(dict_type))
+    return None if value is None else [row["dict_label"] for row in json.loads(value)]
+
+
+async def rename(session: AsyncSession, dict_type: str, label: str) -> None:
+    await session.execute(
+        update(DictDataModel).where(DictDataModel.dict_type == dict_type).values(dict_label=label)
+    )
+
+
+def test_changes_coalesce_into_one_rebuild(
+    run, db_session: AsyncSession, redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """同一事务内多次标记合并为一个回调，提交后一次重建全部受影响类型"""
+
+    async def main() -> None:
+        auth = AuthSchema(db=db_session, check_data_scope=False)
+        calls: list[set[str]] = []
+        rebuild = DictCache.rebuild
+
+        async def counting_rebuild(redis, dict_types, publish=True):
+            calls.append(set(dict_types))
+            return await rebuild(redis, dict_types, publish)
+
+        monkeypatch.setattr(DictCache, "rebuild", counting_rebuild)
+
+        async with db_session.begin():
+            await rename(db_session, "sys_gender", "男性")
+            DictCache.mark(auth, redis, "sys_gender")
+            DictCache.mark(auth, redis, "sys_gender", None, "sys_status")
+            DictCache.mark(auth, redis, "")
+            assert list(db_session.info[AFTER_COMMIT_KEY]) == [DICT_CHANGES_KEY]
+            assert db_session.info[DICT_CHANGES_KEY] == {"sys_gender", "sys_status"}
+        await run_commit_hooks(db_session)
+
+        assert calls == [{"sys_gender", "sys_status"}]
+        assert await redis.hgetall(VERSION_KEY) == {"sys_gender": "1", "sys_status": "1"}
+        assert await cached_labels(redis, "sys_gender") == ["男性"]
+        assert AFTER_COMMIT_KEY not in db_session.info
+
+        # 下一个事务只重建本事务标记的类型
+        async with db_session.begin():
+            DictCache.mark(auth, redis, "sys_status")
+        await run_commit_hooks(db_session)
+        assert calls[1:] == [{"sys_status"}]
+        assert await redis.hgetall(VERSION_KEY) == {"sys_gender": "1", "sys_status": "2"}
+
+    run(main())
+
+
+def test_rebuild_runs_after_commit(run, db_session: AsyncSession, redis: FakeAsyncRedis) -> None:
+    """提交前缓存保持不变，提交后重建读取到已提交的数据"""
+
+    async def main() -> None:
+        auth = AuthSchema(db=db_session, check_data_scope=False)
+        await DictCache.rebuild(redis, ["sys_gender"])
+        assert await cached_labels(redis, "sys_gender") == ["男"]
+
+        async with db_session.begin():
+            await rename(db_session, "sys_gender", "男性")
+            DictCache.mark(auth, redis, "sys_gender")
+            await db_session.flush()
+            assert await cached_labels(redis, "sys_gender") == ["男"]
+        assert await cached_labels(redis, "sys_gender") == ["男"]
+        await run_commit_hooks(db_session)
+        assert await cached_labels(redis, "sys_gender") == ["男性"]
+
+        # 类型已删除时删除缓存
+        async with db_session.begin():
+            await db_session.delete(await db_session.get(DictTypeModel, 2))
+            DictCache.mark(auth, redis, "sys_status")
+        await run_commit_hooks(db_session)
+        assert await cached_labels(redis, "sys_status") is None
+        assert await redis.hget(VERSION_KEY, "sys_status") == "1"
+
+    run(main())
+
+
+def test_hooks_discarded_on_rollback(run, db_session: AsyncSession, redis: FakeAsyncRedis) -> None:
+    """事务回滚时丢弃已登记的回调与变更集，后续事务不会重建回滚前标记的类型"""
+
+    async def main() -> None:
+        auth = AuthSchema(db=db_session, check_data_scope=False)
+        with pytest.raises(RuntimeError):
+            async with db_session.begin():
+                await rename(db_session, "sys_gender", "回滚")
+                DictCache.mark(auth, redis, "sys_gender")
+                raise RuntimeError
+        assert AFTER_COMMIT_KEY not in db_session.info
+        await run_commit_hooks(db_session)
+        assert await redis.hgetall(VERSION_KEY) == {}
+
+        async with db_session.begin():
+            DictCache.mark(auth, redis, "sys_status")
+        await run_commit_hooks(db_session)
+        assert await redis.hgetall(VERSION_KEY) == {"sys_status": "1"}
+        assert await cached_labels(redis, "sys_gender") is None
+
+        # 显式回滚同样丢弃
+        await db_session.begin()
+        DictCache.mark(auth, redis, "sys_gender")
+        await db_session.rollback()
+        await run_commit_hooks(db_session)
+        assert await redis.hget(VERSION_KEY, "sys_gender") is None
+
+        # 保存点回滚不影响外层事务的回调
+        async with db_session.begin():
+            DictCache.mark(auth, redis, "sys_gender")
+            with pytest.raises(RuntimeError):
+                async with db_session.begin_nested():
+                    raise RuntimeError
+        await run_commit_hooks(db_session)
+        assert await redis.hget(VERSION_KEY, "sys_gender") == "1"
+
+    run(main())
+
+
+def test_near_cache_evicted_by_version(
+    run, db_session: AsyncSession, redis: FakeAsyncRedis
+) -> None:
+    """近端缓存只在订阅期间使用，收到更高版本号的变更通知时淘汰"""
+
+    async def main() -> None:
+        await DictCache.rebuild(redis, ["sys_gender", "sys_status"])
+
+        # 未订阅时不写入近端缓存
+        assert [row["dict_label"] for row in await DictCache.get(redis, "sys_gender")] == ["男"]
+        assert DictCache._local == {}
+
+        DictCache._subscribed = True
+        await DictCache.get(redis, "sys_gender")
+        await DictCache.get(redis, "sys_status")
+        assert {key: version for key, (version, _) in DictCache._local.items()} == {
+            "sys_gender": 1,
+            "sys_status": 1,
+        }
+
+        # 旧版本或相同版本的通知不淘汰
+        DictCache._apply(json.dumps({"sys_gender": 1}))
+        assert "sys_gender" in DictCache._local
+        # 格式错误的通知忽略
+        DictCache._apply("not json")
+        DictCache._apply(None)
+
+        async with db_session.begin():
+            await rename(db_session, "sys_gender", "男性")
+        await DictCache.rebuild(redis, ["sys_gender"], publish=True)
+        DictCache._apply(json.dumps({"sys_gender": 2}))
+        assert "sys_gender" not in DictCache._local
+        assert "sys_status" in DictCache._local
+        assert [row["dict_label"] for row in await DictCache.get(redis, "sys_gender")] == ["男性"]
+        assert DictCache._local["sys_gender"][0] == 2
+
+        # 读取期间收到更新的通知时不缓存读到的旧数据
+        DictCache._apply(json.dumps({"sys_status": 5}))
+        await DictCache.get(redis, "sys_status")
+        assert "sys_status" not in DictCache._local
+
+    run(main())
+
+
+def test_listener_evicts_on_published_change(run, redis: FakeAsyncRedis) -> None:
+    """订阅任务收到 rebuild 发布的变更通知后淘汰近端缓存"""
+
+    async def main() -> None:
+        await DictCache.rebuild(redis, ["sys_gender"])
+        DictCache.start(redis)
+        for _ in range(100):
+            if DictCache._subscribed:
+                break
+            await asyncio.sleep(0.01)
+        assert DictCache._subscribed
+
+        await DictCache.get(redis, "sys_gender")
+        assert "sys_gender" in DictCache._local
+        await DictCache.rebuild(redis, ["sys_gender"])
+        for _ in range(100):
+            if "sys_gender" not in DictCache._local:
+                break
+            await asyncio.sleep(0.01)
+        assert "sys_gender" not in DictCache._local
+        assert DictCache._versions["sys_gender"] == 2
+
+        await DictCache.stop()
+        assert not DictCache._subscribed and DictCache._local == {}
+
+    run(main())
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_dict_cache.py"])
@@ -0,0 +1,186 @@
+"""
+DownloadUtil 请求级测试(Range / If-Range / If-None-Match)
+
+下载接口经过 CustomGZipMiddleware，确认支持字节范围的响应不会被压缩。
+执行命令: pytest tests/test_download_util.py
+"""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import CustomException
+from app.core.middlewares import CustomGZipMiddleware
+from app.utils.download_util import DownloadUtil
+
+CONTENT = bytes(range(256)) * 8  # 2048 字节
+SIZE = len(CONTENT)
+CONTENT_HASH = "a" * 64
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory: pytest.TempPathFactory):
+    file_path = tmp_path_factory.mktemp("download") / "data.bin"
+    file_path.write_bytes(CONTENT)
+
+    app = FastAPI()
+    app.add_middleware(CustomGZipMiddleware)
+
+    @app.get("/weak")
+    async def weak(request: Request) -> Response:
+        return await DownloadUtil.file_response(request, str(file_path), filename="数据.bin")
+
+    @app.get("/strong")
+    async def strong(request: Request) -> Response:
+        return await DownloadUtil.file_response(
+            request, str(file_path), filename="data.bin", content_hash=CONTENT_HASH
+        )
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def get(client: TestClient, path: str = "/strong", **headers: str):
+    return client.get(path, headers={"Accept-Encoding": "gzip", **headers})
+
+
+def test_full_download_is_not_compressed(client: TestClient) -> None:
+    response = get(client)
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == f'"{CONTENT_HASH}"'
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(SIZE)
+
+    weak = get(client, "/weak")
+    assert weak.headers["etag"].startswith('W/"')
+    assert "attachment" in weak.headers["content-disposition"]
+
+
+@pytest.mark.parametrize(
+    ("header", "start", "end"),
+    [
+        ("bytes=0-99", 0, 99),
+        ("bytes=100-", 100, SIZE - 1),
+        ("bytes=-10", SIZE - 10, SIZE - 1),
+        ("bytes=-99999", 0, SIZE - 1),  # 后缀超过文件大小时返回整个文件
+        ("bytes=2000-99999", 2000, SIZE - 1),  # 结束位置越界时截断
+        ("bytes=0-9,5-19", 0, 19),  # 重叠分段合并
+        ("bytes=0-9,10-19", 0, 19),  # 相邻分段合并
+        ("bytes=0-9,99999-", 0, 9),  # 忽略无法满足的分段
+    ],
+)
+def test_single_range(client: TestClient, header: str, start: int, end: int) -> None:
+    response = get(client, Range=header)
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{SIZE}"
+    assert response.headers["content-length"] == str(end - start + 1)
+    assert response.content == CONTENT[start : end + 1]
+    assert "content-encoding" not in response.headers
+
+
+def test_multi_range(client: TestClient) -> None:
+    response = get(client, Range="bytes=500-509, 0-4")
+    assert response.status_code == 206
+    media_type, _, boundary = response.headers["content-type"].partition("; boundary=")
+    assert media_type == "multipart/byteranges"
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(response.content))
+
+    parts = response.content.split(f"--{boundary}".encode())
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    bodies = []
+    for part in parts[1:-1]:
+        head, _, body = part.partition(b"\r\n\r\n")
+        assert b"Content-Type: application/octet-stream" in head
+        bodies.append((head.split(b"Content-Range: ")[1].decode(), body.removesuffix(b"\r\n")))
+    # 分段按起始位置排序
+    assert bodies == [
+        (f"bytes 0-4/{SIZE}", CONTENT[0:5]),
+        (f"bytes 500-509/{SIZE}", CONTENT[500:510]),
+    ]
+
+
+TOO_MANY_RANGES = "bytes=" + ",".join(
+    f"{i * 100}-{i * 100 + 1}" for i in range(DownloadUtil.MAX_RANGES + 1)
+)
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        f"bytes={SIZE}-",  # 起始位置越界
+        f"bytes={SIZE + 10}-{SIZE + 20}",
+        "bytes=100-50",  # 起始大于结束
+        "bytes=-0",
+        "items=0-10",  # 不支持的单位
+        "bytes=abc",
+        TOO_MANY_RANGES,  # 合并后分段数超过 MAX_RANGES
+    ],
+)
+def test_unsatisfiable_range(client: TestClient, header: str) -> None:
+    response = get(client, Range=header)
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{SIZE}"
+
+
+def test_if_none_match(client: TestClient) -> None:
+    etag = get(client).headers["etag"]
+    assert get(client, **{"If-None-Match": etag}).status_code == 304
+    # If-None-Match 使用弱比较
+    assert get(client, **{"If-None-Match": f'"x", W/{etag}'}).status_code == 304
+    assert get(client, **{"If-None-Match": "*"}).status_code == 304
+    assert get(client, **{"If-None-Match": '"other"'}).status_code == 200
+
+    weak_etag = get(client, "/weak").headers["etag"]
+    assert get(client, "/weak", **{"If-None-Match": weak_etag}).status_code == 304
+
+
+def test_if_range(client: TestClient) -> None:
+    etag = f'"{CONTENT_HASH}"'
+    # 强 ETag 一致时返回分段
+    response = get(client, Range="bytes=0-9", **{"If-Range": etag})
+    assert response.status_code == 206
+    # 弱比较不适用于 If-Range
+    response = get(client, Range="bytes=0-9", **{"If-Range": f"W/{etag}"})
+    assert response.status_code == 200 and response.content == CONTENT
+    # 文件已变更时返回完整文件
+    response = get(client, Range="bytes=0-9", **{"If-Range": '"stale"'})
+    assert response.status_code == 200 and response.content == CONTENT
+
+
+def test_if_range_weak_etag_and_date(client: TestClient) -> None:
+    full = get(client, "/weak")
+    weak_etag, last_modified = full.headers["etag"], full.headers["last-modified"]
+    # 资源只有弱 ETag 时，即使完全相同也不满足 If-Range
+    response = get(client, "/weak", Range="bytes=0-9", **{"If-Range": weak_etag})
+    assert response.status_code == 200
+    response = get(client, "/weak", Range="bytes=0-9", **{"If-Range": weak_etag[2:]})
+    assert response.status_code == 200
+    # 日期形式需与 Last-Modified 完全一致
+    response = get(client, "/weak", Range="bytes=0-9", **{"If-Range": last_modified})
+    assert response.status_code == 206
+    assert response.content == CONTENT[:10]
+    response = get(
+        client, "/weak", Range="bytes=0-9", **{"If-Range": "Thu, 01 Jan 1970 00:00:00 GMT"}
+    )
+    assert response.status_code == 200
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    app = FastAPI()
+
+    @app.get("/missing")
+    async def missing(request: Request) -> Response:
+        return await DownloadUtil.file_response(request, str(tmp_path / "missing.bin"))
+
+    with TestClient(app) as test_client, pytest.raises(CustomException, match="文件不存在"):
+        test_client.get("/missing")
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_download_util.py"])
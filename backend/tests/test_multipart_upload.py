@@ -0,0 +1,74 @@
+"""
+分片上传会话校验测试(MultipartUploadUtil)
+
+会话ID必须是 init 生成的 32 位十六进制串，且只有发起上传的用户可以查询、上传、合并或取消。
+执行命令: pytest tests/test_multipart_upload.py
+"""
+
+from pathlib import Path
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.config.setting import settings
+from app.core.exceptions import CustomException
+from app.utils.multipart_upload_util import MultipartUploadUtil
+
+
+@pytest.fixture
+def upload_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "upload"
+    root.mkdir()
+    (root / "keep.txt").write_text("keep")
+    monkeypatch.setattr(settings, "UPLOAD_FILE_PATH", root)
+    return root
+
+
+@pytest.mark.parametrize("upload_id", ["..", ".", "../..", "a" * 31, "A" * 32, "a" * 31 + "/"])
+def test_abort_rejects_invalid_upload_id(
+    run, redis: FakeAsyncRedis, upload_root: Path, upload_id: str
+) -> None:
+    async def main() -> None:
+        with pytest.raises(CustomException, match="上传会话ID不合法"):
+            await MultipartUploadUtil.abort_upload(redis, upload_id, user_id=1)
+
+    run(main())
+    assert (upload_root / "keep.txt").read_text() == "keep"
+
+
+def test_session_restricted_to_uploader(run, redis: FakeAsyncRedis, upload_root: Path) -> None:
+    async def main() -> None:
+        session = await MultipartUploadUtil.init_upload(
+            redis, "data.png", 10, "http://test/", user_id=1
+        )
+        upload_id = session["upload_id"]
+        parts_dir = upload_root / ".multipart" / upload_id
+        assert parts_dir.is_dir()
+
+        for call in (
+            MultipartUploadUtil.get_upload(redis, upload_id, user_id=2),
+            MultipartUploadUtil.complete_upload(redis, upload_id, "http://test/", user_id=2),
+            MultipartUploadUtil.abort_upload(redis, upload_id, user_id=2),
+            MultipartUploadUtil.abort_upload(redis, upload_id),
+        ):
+            with pytest.raises(CustomException, match="无权访问该上传会话"):
+                await call
+        assert parts_dir.is_dir()
+
+        assert (await MultipartUploadUtil.get_upload(redis, upload_id, user_id=1))[
+            "total_parts"
+        ] == 1
+        await MultipartUploadUtil.abort_upload(redis, upload_id, user_id=1)
+        assert not parts_dir.exists()
+        assert (upload_root / "keep.txt").exists()
+
+        # 会话不存在时不清理任何目录
+        with pytest.raises(CustomException, match="上传会话不存在或已过期"):
+            await MultipartUploadUtil.abort_upload(redis, upload_id, user_id=1)
+
+    run(main())
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_multipart_upload.py"])
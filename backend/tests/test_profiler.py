@@ -0,0 +1,56 @@
+"""
+RequestProfiler 采样标记测试
+
+采样剖析器同一时刻只运行一个；启动失败时请求照常处理，且不占用采样标记。
+执行命令: pytest tests/test_profiler.py
+"""
+
+import pytest
+from fastapi import Request, Response
+
+from app.core import profiler as profiler_module
+from app.core.profiler import RequestProfiler
+
+
+class BrokenProfiler:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def start(self) -> None:
+        raise RuntimeError("profiler already running")
+
+
+def make_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+async def ok(request: Request) -> Response:
+    return Response("ok")
+
+
+def test_sampling_flag_released_when_start_fails(run, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(RequestProfiler, "_sampling", False)
+    monkeypatch.setattr(profiler_module.settings, "PROFILE_SLOW_THRESHOLD", 60.0)
+    profiler_class = profiler_module.Profiler
+    monkeypatch.setattr(profiler_module, "Profiler", BrokenProfiler)
+
+    response = run(RequestProfiler.run(make_request(), ok, "sample"))
+    assert response.body == b"ok"
+    assert RequestProfiler._sampling is False
+
+    # 剖析器恢复后下一个请求可以正常采样，结束后释放标记
+    monkeypatch.setattr(profiler_module, "Profiler", profiler_class)
+    seen: list[bool] = []
+
+    async def handler(request: Request) -> Response:
+        seen.append(RequestProfiler._sampling)
+        return Response("ok")
+
+    run(RequestProfiler.run(make_request(), handler, "sample"))
+    assert seen == [True]
+    assert RequestProfiler._sampling is False
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_profiler.py"])
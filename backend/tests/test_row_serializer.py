@@ -0,0 +1,216 @@
+"""
+RowSerializer 测试
+
+按列编译的行序列化结果必须与 model_validate(obj).model_dump() 完全一致，
+无法按列还原的输出模型(computed_field、别名等)回退到 model_validate。
+执行命令: pytest tests/test_row_serializer.py
+"""
+
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from sqlalchemy import DateTime, ForeignKey, Integer, MetaData, String, Text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.core.base_crud import CRUDBase
+from app.core.row_serializer import RowSerializer
+from app.core.validator import DateTimeStr
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Author(Base):
+    __tablename__ = "rs_author"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    nickname: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+
+class Article(Base):
+    __tablename__ = "rs_article"
+    __deferred_columns__: list[str] = ["body"]
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str] = mapped_column(String(100))
+    status: Mapped[str] = mapped_column(String(1), default="0")
+    view_count: Mapped[int] = mapped_column(Integer, default=0)
+    body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_time: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    author_id: Mapped[int | None] = mapped_column(ForeignKey("rs_author.id"), nullable=True)
+    author: Mapped[Author | None] = relationship(lazy="raise")
+
+
+class AuthorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    nickname: str | None = None
+
+
+class ArticleOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    status: str = "0"
+    view_count: int = 0
+    body: str | None = None
+    created_time: DateTimeStr | None = None
+    author: AuthorOut | None = None
+    remark: str | None = Field(default=None, description="模型上不存在的字段，输出默认值")
+
+
+class ArticleComputedOut(ArticleOut):
+    @computed_field
+    @property
+    def display_title(self) -> str:
+        return f"[{self.status}] {self.title}"
+
+
+class ArticleAliasOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    # 从 ORM 的 author_id 读取，输出键为 writer
+    writer: int | None = Field(default=None, validation_alias="author_id")
+    # 字段名与列名相同，但按别名读取另一列
+    title: str = Field(validation_alias="status")
+
+
+@pytest.fixture
+def db_metadata() -> list[MetaData]:
+    return [Base.metadata]
+
+
+@pytest.fixture
+def articles(run, db_session: AsyncSession) -> list[Article]:
+    """写入测试数据，返回(预加载了作者的)文章列表"""
+
+    async def prepare() -> list[Article]:
+        db_session.add_all([
+            Author(id=1, name="alice", nickname="A"),
+            Author(id=2, name="bob", nickname=None),
+            Article(
+                id=1,
+                title="first",
+                status="1",
+                view_count=3,
+                body="x" * 100,
+                created_time=datetime(2024, 1, 2, 3, 4, 5),
+                author_id=1,
+            ),
+            Article(id=2, title="second", status="0", view_count=0, body=None, author_id=2),
+            Article(id=3, title="orphan", status="0", view_count=7, body="y", author_id=None),
+        ])
+        await db_session.commit()
+        result = await db_session.execute(
+            select(Article).options(selectinload(Article.author)).order_by(Article.id)
+        )
+        return list(result.scalars().all())
+
+    return run(prepare())
+
+
+async def _plan_dicts(session: AsyncSession, schema: type[BaseModel], fields=None) -> list[dict]:
+    plan = RowSerializer.get_plan(Article, schema, fields)
+    assert plan is not None
+    rows = (await session.execute(plan.statement().order_by(Article.id))).all()
+    return plan.to_dicts(rows)
+
+
+@pytest.fixture(autouse=True)
+def clear_plans():
+    RowSerializer._plans.clear()
+    yield
+    RowSerializer._plans.clear()
+
+
+def test_matches_model_dump_with_nested_relation(
+    run, db_session: AsyncSession, articles: list[Article]
+) -> None:
+    """多对一关系通过外连接还原，包括关联为空的行"""
+
+    async def main() -> None:
+        result = await _plan_dicts(db_session, ArticleOut)
+        expected = [ArticleOut.model_validate(obj).model_dump(exclude={"body"}) for obj in articles]
+        assert result == expected
+        assert result[0]["created_time"] == "2024-01-02 03:04:05"
+        assert result[0]["author"] == {"id": 1, "name": "alice", "nickname": "A"}
+        assert result[2]["author"] is None
+
+    run(main())
+
+
+def test_fields_projection(run, db_session: AsyncSession, articles: list[Article]) -> None:
+    """指定 fields 时只输出这些字段(包括大字段)，忽略输出模型中不存在的字段"""
+
+    async def main() -> None:
+        fields = ["id", "body", "author", "not_a_field"]
+        result = await _plan_dicts(db_session, ArticleOut, fields)
+        include = {"id", "body", "author"}
+        assert result == [
+            ArticleOut.model_validate(obj).model_dump(include=include) for obj in articles
+        ]
+
+    run(main())
+
+
+def test_computed_field_falls_back_to_model_validate(
+    run, db_session: AsyncSession, articles: list[Article]
+) -> None:
+    """computed_field 无法按列编译，list_dict 回退后结果仍与 model_dump 一致"""
+    assert RowSerializer.get_plan(Article, ArticleComputedOut) is None
+
+    async def main() -> None:
+        crud = CRUDBase(Article, AuthSchema(db=db_session, check_data_scope=False))
+        # 回退查询返回会话中已加载作者的同一批对象
+        result = await crud.list_dict(ArticleComputedOut, order_by=[{"id": "asc"}])
+        expected = [ArticleComputedOut.model_validate(obj).model_dump() for obj in articles]
+        assert result == expected
+        assert result[0]["display_title"] == "[1] first"
+
+    run(main())
+
+
+def test_validation_alias_reads_aliased_column(
+    run, db_session: AsyncSession, articles: list[Article]
+) -> None:
+    """validation_alias 按别名读取列，输出键仍为字段名"""
+
+    async def main() -> None:
+        result = await _plan_dicts(db_session, ArticleAliasOut)
+        assert result == [ArticleAliasOut.model_validate(obj).model_dump() for obj in articles]
+        assert result[0] == {"id": 1, "writer": 1, "title": "1"}
+
+    run(main())
+
+
+def test_plan_cache_evicts_at_capacity() -> None:
+    """缓存达到 PLAN_CACHE_SIZE 时整体清空后再写入新计划"""
+    size = RowSerializer.PLAN_CACHE_SIZE
+    assert size == 1024
+
+    RowSerializer._plans.update({
+        (Article, ArticleOut, frozenset({str(i)})): None for i in range(size - 1)
+    })
+    first = RowSerializer.get_plan(Article, ArticleOut)
+    assert len(RowSerializer._plans) == size
+    # 命中缓存时不触发清空
+    assert RowSerializer.get_plan(Article, ArticleOut) is first
+    assert len(RowSerializer._plans) == size
+
+    second = RowSerializer.get_plan(Article, ArticleOut, ["id"])
+    assert len(RowSerializer._plans) == 1
+    assert second is not None and [name for name, *_ in second.fields] == ["id"]
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_row_serializer.py"])
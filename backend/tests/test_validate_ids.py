@@ -0,0 +1,207 @@
+"""
+CRUDBase.validate_ids 测试
+
+单次查询校验主键存在且在数据权限范围内：区分不存在与无权限、重复主键只校验一次、按请求顺序返回；
+传入 fields 时未加载的属性访问即报错(raiseload)，调用方只能使用投影中的字段。
+执行命令: pytest tests/test_validate_ids.py
+"""
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import Integer, MetaData, String, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.api.v1.module_system.auth.schema import AuthSchema
+from app.api.v1.module_system.dict import cache as dict_cache
+from app.api.v1.module_system.dict.model import DictDataModel, DictTypeModel
+from app.api.v1.module_system.dict.service import DictDataService, DictTypeService
+from app.api.v1.module_system.user.model import UserModel
+from app.api.v1.module_system.user.service import UserService
+from app.core.base_model import MappedBase
+from app.core.base_schema import BatchSetAvailable
+from app.core.exceptions import CustomException
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "validate_item"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50))
+    description: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    created_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+@pytest.fixture
+def db_metadata() -> list[MetaData]:
+    return [Base.metadata, MappedBase.metadata]
+
+
+async def seed(session: AsyncSession) -> tuple[list[int], list[int]]:
+    """写入用户1与用户2的数据，返回各自的主键，并清空会话以免复用已加载的对象"""
+    own = [Item(name=f"own{i}", description="d", created_id=1) for i in range(3)]
+    other = [Item(name=f"other{i}", description="d", created_id=2) for i in range(2)]
+    session.add_all(own + other)
+    await session.commit()
+    ids = [item.id for item in own], [item.id for item in other]
+    session.expunge_all()
+    return ids
+
+
+def test_returns_objects_in_request_order_without_duplicates(
+    run, db_session: AsyncSession, crud_for
+) -> None:
+    async def main() -> None:
+        (a, b, c), _ = await seed(db_session)
+        crud = crud_for(Item)
+        objs = await crud.validate_ids([c, a, c, b, a])
+        assert [obj.id for obj in objs] == [c, a, b]
+        assert [obj.name for obj in objs] == ["own2", "own0", "own1"]
+        assert await crud.validate_ids([]) == []
+
+    run(main())
+
+
+def test_distinguishes_missing_and_forbidden(run, db_session: AsyncSession, crud_for) -> None:
+    async def main() -> None:
+        (a, _, _), (x, y) = await seed(db_session)
+        crud = crud_for(Item)
+
+        with pytest.raises(CustomException) as exc_info:
+            await crud.validate_ids([a, 9999, y, 8888, x, y], msg="删除失败")
+        # 按请求顺序列出，重复主键只出现一次
+        assert exc_info.value.msg == (
+            f"删除失败，ID为9999, 8888的数据不存在；ID为{y}, {x}的数据无权限访问"
+        )
+
+        with pytest.raises(CustomException) as exc_info:
+            await crud.validate_ids([a, 9999])
+        assert exc_info.value.msg == "操作失败，ID为9999的数据不存在"
+
+        with pytest.raises(CustomException) as exc_info:
+            await crud.validate_ids([x], msg="设置失败")
+        assert exc_info.value.msg == f"设置失败，ID为{x}的数据无权限访问"
+
+        # 数据权限放开后全部通过
+        crud.auth.check_data_scope = False
+        assert [obj.id for obj in await crud.validate_ids([x, a])] == [x, a]
+
+    run(main())
+
+
+def test_fields_leave_other_attributes_unloaded(run, db_session: AsyncSession, crud_for) -> None:
+    async def main() -> None:
+        (a, b, _), _ = await seed(db_session)
+        objs = await crud_for(Item).validate_ids([a, b], fields=["id", "name"])
+        assert [(obj.id, obj.name) for obj in objs] == [(a, "own0"), (b, "own1")]
+        with pytest.raises(InvalidRequestError):
+            _ = objs[0].description
+
+    run(main())
+
+
+async def seed_users(session: AsyncSession) -> UserModel:
+    """写入超级管理员(1)、已停用用户(2)、已启用用户(3)与操作用户(4)，返回操作用户"""
+    session.add_all([
+        UserModel(id=1, username="admin", password="x", name="admin", is_superuser=True),
+        UserModel(id=2, username="disabled", password="x", name="disabled", status="1"),
+        UserModel(id=3, username="enabled", password="x", name="enabled", status="0"),
+        UserModel(id=4, username="operator", password="x", name="operator"),
+    ])
+    await session.commit()
+    session.expunge_all()
+    return (await session.execute(select(UserModel).where(UserModel.id == 4))).scalar_one()
+
+
+def test_user_service_only_reads_projected_fields(run, db_session: AsyncSession) -> None:
+    """用户删除/批量设置状态只使用 validate_ids 投影的字段(user/service.py)"""
+
+    async def main() -> None:
+        operator = await seed_users(db_session)
+        auth = AuthSchema(db=db_session, user=operator, check_data_scope=False)
+
+        with pytest.raises(CustomException, match="超级管理员不能删除"):
+            await UserService.delete_user_service(auth, ids=[2, 1])
+        with pytest.raises(CustomException, match="用户已启用,不能删除"):
+            await UserService.delete_user_service(auth, ids=[3])
+        await UserService.set_user_available_service(auth, BatchSetAvailable(ids=[4], status="1"))
+        with pytest.raises(CustomException, match="不能删除当前登陆用户"):
+            await UserService.delete_user_service(auth, ids=[4])
+        with pytest.raises(CustomException, match="超级管理员状态不能修改"):
+            await UserService.set_user_available_service(
+                auth, BatchSetAvailable(ids=[3, 1], status="1")
+            )
+
+        await UserService.set_user_available_service(auth, BatchSetAvailable(ids=[3], status="1"))
+        await UserService.delete_user_service(auth, ids=[2, 3])
+        await db_session.commit()
+        db_session.expunge_all()
+        remaining = (await db_session.execute(select(UserModel.id).order_by(UserModel.id))).all()
+        assert [row.id for row in remaining] == [1, 4]
+
+    run(main())
+
+
+def test_dict_only_reads_projected_fields(
+    run,
+    db_engine: AsyncEngine,
+    db_session: AsyncSession,
+    redis: FakeAsyncRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """字典删除与缓存重建只使用投影的字段(dict/service.py、dict/cache.py)"""
+
+    async def main() -> None:
+        db_session.add_all([
+            DictTypeModel(id=1, dict_name="性别", dict_type="sys_gender"),
+            DictTypeModel(id=2, dict_name="空类型", dict_type="sys_empty"),
+            DictDataModel(
+                id=1,
+                dict_sort=1,
+                dict_label="男",
+                dict_value="0",
+                dict_type="sys_gender",
+                dict_type_id=1,
+                is_default=True,
+            ),
+            DictDataModel(
+                id=2,
+                dict_sort=2,
+                dict_label="女",
+                dict_value="1",
+                dict_type="sys_gender",
+                dict_type_id=1,
+            ),
+        ])
+        await db_session.commit()
+        db_session.expunge_all()
+        # 缓存重建使用独立会话
+        monkeypatch.setattr(dict_cache, "async_db_session", lambda: AsyncSession(db_engine))
+        auth = AuthSchema(db=db_session, check_data_scope=False)
+
+        grouped = await dict_cache.DictCache.rebuild(redis, ["sys_gender", "sys_empty"])
+        assert [row["dict_label"] for row in grouped["sys_gender"]] == ["男", "女"]
+        assert grouped["sys_empty"] == []
+
+        with pytest.raises(CustomException, match="ID为1的系统默认字典数据不允许删除"):
+            await DictDataService.delete_obj_service(auth, redis, ids=[2, 1])
+        with pytest.raises(CustomException, match="该数据字典类型下存在字典数据"):
+            await DictTypeService.delete_obj_service(auth, redis, ids=[1, 2])
+        await DictDataService.delete_obj_service(auth, redis, ids=[2])
+        await DictTypeService.delete_obj_service(auth, redis, ids=[2])
+        await db_session.commit()
+        db_session.expunge_all()
+        assert (await db_session.execute(select(DictTypeModel.id))).scalars().all() == [1]
+        assert (await db_session.execute(select(DictDataModel.id))).scalars().all() == [1]
+
+    run(main())
+
+
+# 运行所有测试
+if __name__ == "__main__":
+    pytest.main(["-v", "tests/test_validate_ids.py"])
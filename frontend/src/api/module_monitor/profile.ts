@@ -0,0 +1,72 @@
+import request from "@/utils/request";
+
+const API_PATH = "/monitor/profile";
+
+const ProfileAPI = {
+  // 查询请求剖析记录列表
+  listProfile(query: ProfilePageQuery) {
+    return request<ApiResponse<PageResult<ProfileTable[]>>>({
+      url: `${API_PATH}/list`,
+      method: "get",
+      params: query,
+    });
+  },
+
+  // 查询请求剖析详情
+  detailProfile(profileId: string) {
+    return request<ApiResponse<ProfileDetail>>({
+      url: `${API_PATH}/detail/${profileId}`,
+      method: "get",
+    });
+  },
+
+  // 下载火焰图
+  downloadFlamegraph(profileId: string) {
+    return request<Blob>({
+      url: `${API_PATH}/flamegraph/${profileId}`,
+      method: "get",
+      responseType: "blob",
+    });
+  },
+
+  // 清空请求剖析记录
+  clearProfile() {
+    return request<ApiResponse>({
+      url: `${API_PATH}/clear`,
+      method: "delete",
+    });
+  },
+};
+
+export default ProfileAPI;
+
+export interface ProfilePageQuery extends PageQuery {
+  path?: string;
+  method?: string;
+  min_duration?: number;
+}
+
+export interface ProfileTable {
+  id: string;
+  method: string;
+  path: string;
+  route?: string;
+  status_code: number;
+  trigger: string;
+  duration_ms: number;
+  totals_ms: Record<string, number>;
+  span_count: number;
+  has_flamegraph: boolean;
+  created_time: string;
+}
+
+export interface ProfileSpan {
+  kind: string;
+  name: string;
+  start_ms: number;
+  duration_ms: number;
+}
+
+export interface ProfileDetail extends ProfileTable {
+  spans: ProfileSpan[];
+}
@@ -58,10 +58,20 @@ export interface SysFile {
   usage: number;
 }
 
+export interface ServerHistory {
+  time: string[];
+  cpu_used: number[];
+  cpu_sys: number[];
+  mem_usage: number[];
+  py_memory_used: number[];
+}
+
 export interface ServerInfo {
   cpu: Cpu;
   mem: Memory;
   sys: System;
   py: Python;
   disks: SysFile[];
+  sample_time?: string;
+  history?: ServerHistory;
 }